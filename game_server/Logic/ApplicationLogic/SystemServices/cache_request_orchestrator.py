@@ -1,7 +1,11 @@
 # game_server/Logic/ApplicationLogic/SystemServices/cache_request_orchestrator.py
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Tuple
 from pydantic import BaseModel
 import inject
 
@@ -15,12 +19,31 @@ from ....contracts.shared_models.base_responses import ErrorDetail, ResponseStat
 from ....contracts.shared_models.websocket_base_models import WebSocketMessage, WebSocketResponsePayload
 
 from .handler.i_system_handler import ISystemServiceHandler
+from ....utils.metrics import UNKNOWN_LABEL, observe_command, record_cache_lookup
+from ....utils.tracing import trace_span
+
+
+# Ключ объединения запросов: (тип команды, нормализованный payload).
+CoalescingKey = Tuple[str, str]
+# Выполняющееся вычисление: (момент его начала в UTC, future с результатом).
+InFlightEntry = Tuple[datetime, asyncio.Future]
+
+# Выше этого числа записей устаревшие результаты вычищаются из памяти при каждой записи.
+_MEMO_PURGE_THRESHOLD = 1024
 
 
 class CacheRequestOrchestrator:
     """
     Оркестратор для запросов к кэшированным данным.
     Диспетчеризует команды на соответствующие обработчики, работающие с кэшем.
+
+    Одинаковые запросы (тот же тип команды и тот же payload), пришедшие, пока первый ещё
+    обрабатывается, не запускают обработчик повторно: все ждут одно вычисление (singleflight).
+    Запрос присоединяется только к вычислению, начатому не раньше его timestamp, — тогда результат
+    не старше самого запроса. Иначе запускается новое вычисление, к которому присоединяются следующие.
+    Если для команды задан memo_ttl_seconds, успешный результат ещё столько секунд отдаётся из памяти
+    по тому же правилу свежести.
+    Каждый запрос всё равно получает собственный ответ со своими correlation_id, client_id и трассировкой.
     """
     @inject.autoparams()
     def __init__(
@@ -34,6 +57,13 @@ class CacheRequestOrchestrator:
             command_name: inject.instance(info["handler"])
             for command_name, info in cache_request_config.CACHE_REQUEST_HANDLER_MAPPING.items()
         }
+        self.memo_ttls: Dict[str, float] = {
+            command_name: float(info.get("memo_ttl_seconds") or 0)
+            for command_name, info in cache_request_config.CACHE_REQUEST_HANDLER_MAPPING.items()
+        }
+        self._in_flight: Dict[CoalescingKey, InFlightEntry] = {}
+        # Запомненный результат: (срок годности по time.monotonic(), момент начала вычисления в UTC, результат).
+        self._memo: Dict[CoalescingKey, Tuple[float, datetime, BaseResultDTO]] = {}
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован с {len(self.handlers)} обработчиками.")
 
     # ✅ ИЗМЕНЕНИЕ: Сигнатура метода теперь соответствует другим оркестраторам
@@ -42,9 +72,11 @@ class CacheRequestOrchestrator:
         Главный метод-диспетчер. Получает DTO, находит обработчик и запускает его.
         """
         command_type = validated_dto.command
+        started_at = time.perf_counter()
         handler = self.handlers.get(command_type)
         
         if not handler:
+            observe_command("cache_request", UNKNOWN_LABEL, started_at, "error", "HANDLER_NOT_FOUND")
             self.logger.error(f"Обработчик для команды '{command_type}' не найден в {self.__class__.__name__}.")
             # ✅ ИЗМЕНЕНИЕ: Правильно формируем DTO с ошибкой
             error_result = BaseResultDTO(
@@ -59,10 +91,16 @@ class CacheRequestOrchestrator:
 
         self.logger.info(f"Делегирование команды '{command_type}' обработчику кэша...")
         
+        command_observed = False
         try:
-            result_dto = await handler.process(command_dto=validated_dto)
+            with trace_span("command.handle", orchestrator="cache_request", command=command_type):
+                result_dto = await self._process_coalesced(handler, validated_dto)
+            observe_command("cache_request", command_type, started_at, "success" if result_dto.success else "failure")
+            command_observed = True
             await self._publish_response(result_dto)
         except Exception as e:
+            if not command_observed:
+                observe_command("cache_request", command_type, started_at, "error", "SERVER_ERROR")
             self.logger.exception(f"Критическая ошибка при обработке команды '{command_type}'.")
             # ✅ ИЗМЕНЕНИЕ: Правильно формируем DTO с ошибкой
             error_result = BaseResultDTO(
@@ -74,6 +112,85 @@ class CacheRequestOrchestrator:
             )
             await self._publish_response(error_result)
 
+    async def _process_coalesced(self, handler: ISystemServiceHandler, validated_dto: BaseCommandDTO) -> BaseResultDTO:
+        """
+        Выполняет команду через общее вычисление для одинаковых запросов и адресует результат этому запросу.
+        """
+        command_type = validated_dto.command
+        key = self._coalescing_key(validated_dto)
+        requested_at = self._as_utc(validated_dto.timestamp)
+
+        memo_ttl = self.memo_ttls.get(command_type, 0)
+        if memo_ttl > 0:
+            memoized = self._memo.get(key)
+            hit = memoized is not None and memoized[0] > time.monotonic() and memoized[1] >= requested_at
+            record_cache_lookup("cache_request_memo", hit)
+            if hit:
+                return self._address_result(memoized[2], validated_dto)
+
+        entry = self._in_flight.get(key)
+        if entry is not None and entry[0] >= requested_at:
+            self.logger.debug(f"Команда '{command_type}' присоединена к уже выполняющемуся запросу.")
+            shared = entry[1]
+        else:
+            # Начатое раньше запроса вычисление могло не увидеть изменений, о которых он знает:
+            # запускаем новое, и дальше присоединяются уже к нему.
+            started_at = datetime.now(timezone.utc)
+            shared = asyncio.ensure_future(self._compute(handler, validated_dto, key, memo_ttl, started_at))
+            self._in_flight[key] = (started_at, shared)
+            shared.add_done_callback(lambda done, key=key: self._release(key, done))
+        # shield: отмена одного ожидающего не отменяет вычисление для остальных.
+        result_dto = await asyncio.shield(shared)
+        return self._address_result(result_dto, validated_dto)
+
+    async def _compute(self, handler: ISystemServiceHandler, validated_dto: BaseCommandDTO, key: CoalescingKey, memo_ttl: float, started_at: datetime) -> BaseResultDTO:
+        result_dto = await handler.process(command_dto=validated_dto)
+        if memo_ttl > 0 and result_dto.success:
+            self._remember(key, result_dto, memo_ttl, started_at)
+        return result_dto
+
+    def _release(self, key: CoalescingKey, done: asyncio.Future) -> None:
+        """Снимает регистрацию завершённого вычисления, если его ещё не сменило более новое."""
+        entry = self._in_flight.get(key)
+        if entry is not None and entry[1] is done:
+            del self._in_flight[key]
+
+    def _remember(self, key: CoalescingKey, result_dto: BaseResultDTO, memo_ttl: float, started_at: datetime) -> None:
+        now = time.monotonic()
+        if len(self._memo) >= _MEMO_PURGE_THRESHOLD:
+            self._memo = {k: v for k, v in self._memo.items() if v[0] > now}
+        current = self._memo.get(key)
+        if current is not None and current[0] > now and current[1] > started_at:
+            # Позже завершилось более раннее вычисление — не затираем результат свежего.
+            return
+        self._memo[key] = (now + memo_ttl, started_at, result_dto)
+
+    @staticmethod
+    def _as_utc(moment: datetime) -> datetime:
+        """timestamp без часового пояса считается UTC (так его формирует BaseCommandDTO)."""
+        return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _coalescing_key(validated_dto: BaseCommandDTO) -> CoalescingKey:
+        """Тип команды + payload в каноническом виде (порядок ключей не важен)."""
+        payload = validated_dto.payload
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump(mode="json")
+        return validated_dto.command, json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+    @staticmethod
+    def _address_result(result_dto: BaseResultDTO, validated_dto: BaseCommandDTO) -> BaseResultDTO:
+        """Копия общего результата, адресованная конкретному запросу (включая его трассировку)."""
+        addressing = {
+            "correlation_id": validated_dto.correlation_id,
+            "client_id": validated_dto.client_id,
+            "trace_id": validated_dto.trace_id,
+            "span_id": validated_dto.span_id,
+        }
+        if all(getattr(result_dto, field_name) == value for field_name, value in addressing.items()):
+            return result_dto
+        return result_dto.model_copy(update=addressing)
+
     async def _publish_response(self, result_dto: BaseResultDTO):
         """
         Стандартный метод для формирования и отправки ответа через RabbitMQ.
@@ -57,8 +57,8 @@ class MoveCharacterToLocationHandler(ISystemServiceHandler):
             character_id = payload.character_id
             target_location_id = payload.target_location_id
 
-            # 1. Получение текущего документа персонажа из MongoDB
-            character_document = await self._mongo_character_cache_repo.get_character_by_id(character_id)
+            # 1. Получение текущей локации персонажа из MongoDB (только поле 'location')
+            character_document = await self._mongo_character_cache_repo.get_character_fields(character_id, ["location"])
             if not character_document:
                 self.logger.warning(f"Персонаж ID {character_id} не найден в MongoDB для перемещения.")
                 return MoveToLocationResultDTO(
@@ -94,21 +94,44 @@ class MoveCharacterToLocationHandler(ISystemServiceHandler):
                     client_id=command_dto.client_id
                 )
 
-            location_summary = await self._location_state_orchestrator.update_player_location_state_and_get_summary(
-                old_location_id=old_current_location_id,
-                new_location_id=target_location_id,
-                character_id=character_id
-            )
-
-            # 3. Обновление поля 'location' в документе персонажа
+            # 2. Обновление только поля 'location' в документе персонажа.
+            # Условие на текущую локацию — оптимистичная проверка: параллельное перемещение не будет перезаписано.
             new_location_data = {
                 "current": {"location_id": target_location_id, "region_id": old_current_region_id},
                 "previous": {"location_id": old_current_location_id, "region_id": old_current_region_id}
             }
-            character_document["location"] = new_location_data
+            new_version = await self._mongo_character_cache_repo.update_character_fields(
+                character_id,
+                set_fields={"location": new_location_data},
+                expected_values={"location.current.location_id": old_current_location_id}
+            )
+            if new_version is None:
+                self.logger.warning(f"Персонаж ID {character_id} был перемещён параллельно, перемещение в {target_location_id} отклонено.")
+                return MoveToLocationResultDTO(
+                    correlation_id=command_dto.correlation_id,
+                    trace_id=command_dto.trace_id,
+                    span_id=command_dto.span_id,
+                    success=False,
+                    message="Состояние персонажа изменилось во время перемещения. Повторите действие.",
+                    error=ErrorDetail(code="CONCURRENT_UPDATE", message="Character location changed concurrently."),
+                    client_id=command_dto.client_id
+                )
 
-            # 4. Сохранение обновленного документа персонажа в MongoDB
-            await self._mongo_character_cache_repo.upsert_character(character_document)
+            # 3. Обновление состояния локаций
+            try:
+                location_summary = await self._location_state_orchestrator.update_player_location_state_and_get_summary(
+                    old_location_id=old_current_location_id,
+                    new_location_id=target_location_id,
+                    character_id=character_id
+                )
+            except Exception:
+                # Возвращаем персонажа в исходную локацию, если за это время его не переместили снова.
+                await self._mongo_character_cache_repo.update_character_fields(
+                    character_id,
+                    set_fields={"location": old_location_data},
+                    expected_values={"location.current.location_id": target_location_id}
+                )
+                raise
 
             self.logger.info(f"Персонаж ID {character_id} успешно перемещен в локацию {target_location_id} в MongoDB.")
 
@@ -1,8 +1,8 @@
 # game_server/Logic/ApplicationLogic/SystemServices/handler/world_map/get_world_data_handler.py
-# Version: 0.002
+# Version: 0.003
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import inject # ▼▼▼ НОВЫЙ ИМПОРТ: inject ▼▼▼
 
 from game_server.contracts.dtos.game_world.commands import GetWorldDataCommandDTO
@@ -10,7 +10,7 @@ from game_server.contracts.dtos.game_world.data_models import WorldLocationDataD
 from game_server.contracts.dtos.game_world.results import GetWorldDataResponseData
 from game_server.contracts.shared_models.base_commands_results import BaseCommandDTO, BaseResultDTO
 from game_server.Logic.ApplicationLogic.SystemServices.handler.i_system_handler import ISystemServiceHandler
-from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import IWorldStateRepository
+from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import IWorldSnapshotRepository, IWorldStateRepository
 
 
 class GetWorldDataHandler(ISystemServiceHandler):
@@ -18,12 +18,17 @@ class GetWorldDataHandler(ISystemServiceHandler):
     Обработчик команды 'get_world_data'.
     Отвечает за извлечение всего статического скелета игрового мира из MongoDB
     и формирование ответа для бота.
+    Если опубликован версионированный снимок карты, боту с известной версией отдаются только изменения
+    (или "not_modified"), а полный ответ собирается один раз на версию и переиспользуется.
     """
     # ▼▼▼ ИСПОЛЬЗУЕМ @inject.autoparams() И ЯВНО ОБЪЯВЛЯЕМ ЗАВИСИМОСТИ ▼▼▼
     @inject.autoparams()
-    def __init__(self, logger: logging.Logger, world_state_repo: IWorldStateRepository):
+    def __init__(self, logger: logging.Logger, world_state_repo: IWorldStateRepository, world_snapshot_repo: IWorldSnapshotRepository):
         self._logger = logger
         self.world_state_repo: IWorldStateRepository = world_state_repo
+        self.world_snapshot_repo: IWorldSnapshotRepository = world_snapshot_repo
+        # Полный ответ последней запрошенной версии снимка: (версия, data для BaseResultDTO).
+        self._full_response_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         self._logger.info("GetWorldDataHandler инициализирован.")
 
     # ▼▼▼ РЕАЛИЗАЦИЯ АБСТРАКТНОГО СВОЙСТВА logger ИЗ ISystemServiceHandler ▼▼▼
@@ -51,6 +56,24 @@ class GetWorldDataHandler(ISystemServiceHandler):
             )
 
         try:
+            current_version = await self.world_snapshot_repo.get_current_version()
+            if current_version:
+                response_data = await self._build_versioned_response(current_version, command_dto.known_version)
+                self.logger.info(
+                    f"Данные мира для 'get_world_data' (CorrID: {command_dto.correlation_id}): режим '{response_data['mode']}', "
+                    f"версия {response_data['version']} (у бота: {command_dto.known_version})."
+                )
+                return BaseResultDTO(
+                    correlation_id=command_dto.correlation_id,
+                    trace_id=command_dto.trace_id,
+                    span_id=command_dto.span_id,
+                    success=True,
+                    message="Статические данные игрового мира успешно получены.",
+                    data=response_data,
+                    client_id=command_dto.client_id
+                )
+
+            # Снимок ещё не опубликован: собираем полную карту из документов-регионов.
             # ▼▼▼ ИЗВЛЕЧЕНИЕ ДАННЫХ МИРА ИЗ MONGO DB ▼▼▼
             # Используем get_all_regions() для получения всех документов-регионов.
             # Каждый документ-регион содержит вложенный словарь 'locations'.
@@ -108,3 +131,34 @@ class GetWorldDataHandler(ISystemServiceHandler):
                 error={"code": "WORLD_DATA_FETCH_ERROR", "message": str(e)},
                 client_id=command_dto.client_id
             )
+
+    async def _build_versioned_response(self, current_version: int, known_version: Optional[int]) -> Dict[str, Any]:
+        """
+        Ответ по версионированному снимку. Локации в снимке уже провалидированы как WorldLocationDataDTO
+        при публикации, поэтому здесь повторно не валидируются.
+        """
+        if known_version == current_version:
+            return GetWorldDataResponseData(version=current_version, mode="not_modified").model_dump()
+
+        if known_version and 0 < known_version < current_version:
+            version, changed, removed = await self.world_snapshot_repo.get_changes_since(known_version)
+            return {
+                "version": version,
+                "mode": "delta",
+                "locations": changed,
+                "removed_location_ids": removed,
+            }
+
+        # Версия бота неизвестна или новее нашей (снимок пересоздан) — отдаём карту целиком.
+        cached = self._full_response_cache
+        if cached is not None and cached[0] == current_version:
+            return cached[1]
+        version, locations = await self.world_snapshot_repo.get_snapshot()
+        response_data = {
+            "version": version,
+            "mode": "full",
+            "locations": locations,
+            "removed_location_ids": [],
+        }
+        self._full_response_cache = (version, response_data)
+        return response_data
@@ -3,15 +3,25 @@
 # (Содержит конкретную логику перезагрузки)
 # =================================================================
 
+from typing import Optional
+
+import inject
+
+from game_server.Logic.CoreServices.services.location_graph_service import LocationGraphService
 from game_server.Logic.InfrastructureLogic.app_cache.services.reference_data.reference_data_cache_manager import ReferenceDataCacheManager
 from game_server.config.logging.logging_setup import app_logger as logger
 
-async def perform_location_connections_reload(cache_manager: ReferenceDataCacheManager) -> bool:
+async def perform_location_connections_reload(
+    cache_manager: ReferenceDataCacheManager,
+    location_graph: Optional[LocationGraphService] = None
+) -> bool:
     """
-    Конкретная функция, выполняющая перезагрузку кэша связей между локациями.
+    Конкретная функция, выполняющая перезагрузку кэша связей между локациями
+    и перестроение графа выходов в памяти процесса.
 
     Args:
         cache_manager: Экземпляр менеджера кэша, который умеет выполнять операцию.
+        location_graph: Граф выходов; по умолчанию берётся из DI-контейнера.
 
     Returns:
         True, если перезагрузка прошла успешно, иначе False.
@@ -21,6 +31,7 @@ async def perform_location_connections_reload(cache_manager: ReferenceDataCacheM
         # Вызываем публичный метод менеджера, который мы спроектировали ранее
         success = await cache_manager.reload_location_connections()
         if success:
+            await (location_graph or inject.instance(LocationGraphService)).rebuild()
             logger.info("ADMIN_COMMAND: Перезагрузка кэша location_connections успешно завершена.")
         else:
             logger.error("ADMIN_COMMAND: Ошибка во время перезагрузки кэша location_connections.")
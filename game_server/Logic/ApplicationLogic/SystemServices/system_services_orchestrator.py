@@ -2,6 +2,7 @@
 # Version: 0.007 # Увеличиваем версию для учета изменений в обработчиках и транзакциях
 
 import logging
+import time
 from typing import Dict, Any, Optional, Type, Callable # Добавлен Callable
 from pydantic import BaseModel
 
@@ -12,6 +13,8 @@ from game_server.contracts.shared_models.base_responses import ErrorDetail, Resp
 from game_server.contracts.shared_models.websocket_base_models import WebSocketMessage, WebSocketResponsePayload
 from game_server.game_services.command_center.system_services_command import system_services_config
 from game_server.Logic.ApplicationLogic.SystemServices.handler.i_system_handler import ISystemServiceHandler
+from game_server.utils.metrics import UNKNOWN_LABEL, observe_command
+from game_server.utils.tracing import trace_span
 
 
 
@@ -46,8 +49,10 @@ class SystemServicesOrchestrator:
         Транзакция управляется самим обработчиком (через @transactional).
         """
         command_type = validated_dto.command
+        started_at = time.perf_counter()
         handler = self.handlers.get(command_type)
         if not handler:
+            observe_command("system_services", UNKNOWN_LABEL, started_at, "error", "HANDLER_NOT_FOUND")
             self.logger.error(f"Обработчик для команды '{command_type}' не найден.")
             error_result = BaseResultDTO(
                 correlation_id=validated_dto.correlation_id,
@@ -64,11 +69,13 @@ class SystemServicesOrchestrator:
         self.logger.info(f"Делегирование команды '{command_type}' обработчику (CorrID: {validated_dto.correlation_id}).")
         
         result_dto: Optional[BaseResultDTO] = None 
+        error_code: Optional[str] = None
         
         # 🔥 ИЗМЕНЕНО: Просто вызываем process обработчика.
         # Декоратор @transactional на методе process обработчика позаботится о сессии и транзакции.
         try:
-            result_dto = await handler.process(command_dto=validated_dto) # <--- Вызываем без явной сессии
+            with trace_span("command.handle", orchestrator="system_services", command=command_type):
+                result_dto = await handler.process(command_dto=validated_dto) # <--- Вызываем без явной сессии
             self.logger.info(f"Команда '{command_type}' успешно обработана. Результат: {'Успех' if result_dto.success else 'Ошибка'}.")
             
         except Exception as e:
@@ -84,8 +91,11 @@ class SystemServicesOrchestrator:
                 client_id=validated_dto.client_id
             )
             result_dto = error_result
+            error_code = "SERVER_ERROR"
 
         finally:
+            status = "error" if error_code else ("success" if result_dto and result_dto.success else "failure")
+            observe_command("system_services", command_type, started_at, status, error_code)
             if result_dto:
                 await self._publish_response(result_dto)
 
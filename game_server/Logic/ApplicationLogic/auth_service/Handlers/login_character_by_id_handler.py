@@ -83,9 +83,10 @@ class LoginCharacterByIdHandler(IAuthHandler):
 
             # Сборка и запись в MongoDB не требуют сессии PostgreSQL
             mongo_document = await self._assembler.assemble_warm_cache_document(character_data, creature_type_name)
-            await self._mongo_repo.upsert_character(mongo_document)
+            # Пишутся только разделы, изменившиеся с прошлой синхронизации (повторный логин обычно не меняет почти ничего).
+            changed_sections = await self._mongo_repo.sync_character_document(mongo_document)
             
-            self._logger.info(f"Теплый кэш для персонажа ID {character_id} успешно сформирован и записан в MongoDB.")
+            self._logger.info(f"Теплый кэш для персонажа ID {character_id} успешно сформирован и записан в MongoDB (обновлено разделов: {len(changed_sections)}).")
 
             return BaseResultDTO(
                 success=True,
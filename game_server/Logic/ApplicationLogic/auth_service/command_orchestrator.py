@@ -2,6 +2,7 @@
 
 import logging
 import os
+import time
 from typing import Dict, Any, Callable # Добавлено Callable
 import inject
 from sqlalchemy.ext.asyncio import AsyncSession # Добавлено AsyncSession
@@ -21,6 +22,8 @@ from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessa
 from game_server.contracts.shared_models.base_commands_results import BaseCommandDTO, BaseResultDTO
 from game_server.contracts.shared_models.base_responses import ErrorDetail, ResponseStatus
 from game_server.contracts.shared_models.websocket_base_models import WebSocketMessage, WebSocketResponsePayload
+from game_server.utils.metrics import UNKNOWN_LABEL, observe_command
+from game_server.utils.tracing import trace_span
 
 # Импорты хендлеров
 from .Handlers.i_auth_handler import IAuthHandler
@@ -71,10 +74,16 @@ class AuthCommandOrchestrator:
         self.logger.info(f"INFO: Обработка обычной команды: '{command_type}'.")
         self.logger.debug(f"DEBUG: Полный DTO для команды '{command_type}': {validated_command_dto.model_dump_json()}")
 
+        started_at = time.perf_counter()
         handler = self.handlers.get(command_type)
         if handler:
+            # Ошибка публикации ответа не должна второй раз учитывать уже измеренную команду.
+            command_observed = False
             try:
-                result_dto: BaseResultDTO = await handler.process(validated_command_dto)
+                with trace_span("command.handle", orchestrator="auth", command=command_type):
+                    result_dto: BaseResultDTO = await handler.process(validated_command_dto)
+                observe_command("auth", command_type, started_at, "success" if result_dto.success else "failure")
+                command_observed = True
                 self.logger.info(f"INFO: Команда '{command_type}' обработана. Результат: {result_dto.success}, {result_dto.message}")
 
                 websocket_response_payload = WebSocketResponsePayload(
@@ -106,6 +115,8 @@ class AuthCommandOrchestrator:
                 self.logger.info(f"INFO: WebSocket-ответ для команды '{command_type}' опубликован в RabbitMQ с ключом '{standardized_routing_key}'.")
 
             except Exception as e:
+                if not command_observed:
+                    observe_command("auth", command_type, started_at, "error", "HANDLER_EXCEPTION")
                 self.logger.error(f"ERROR: Ошибка при выполнении обработчика для команды '{command_type}': {e}", exc_info=True)
                 error_response_payload = WebSocketResponsePayload(
                     request_id=validated_command_dto.correlation_id,
@@ -128,6 +139,7 @@ class AuthCommandOrchestrator:
                 )
                 raise
         else:
+            observe_command("auth", UNKNOWN_LABEL, started_at, "error", "UNKNOWN_COMMAND")
             self.logger.warning(f"WARNING: Неизвестная команда: '{command_type}'. DTO: {validated_command_dto.model_dump_json()}")
             unknown_command_response = WebSocketResponsePayload(
                 request_id=validated_command_dto.correlation_id,
@@ -12,6 +12,7 @@ from .Handlers.get_location_summary_handler import GetLocationSummaryHandler
 
 # Импортируем сервис для работы с очередью arq
 from game_server.Logic.InfrastructureLogic.arq_worker.arq_manager import ArqQueueService
+from game_server.utils.tracing import traced
 
 
 class LocationStateOrchestrator:
@@ -55,6 +56,7 @@ class LocationStateOrchestrator:
             except Exception as e:
                 self.logger.critical(f"Критическая ошибка при постановке задачи для локации {location_id}: {e}", exc_info=True)
 
+    @traced()
     async def update_player_location_state_and_get_summary(
         self,
         old_location_id: Optional[str],
@@ -82,6 +84,7 @@ class LocationStateOrchestrator:
 
         return summary
 
+    @traced()
     async def get_location_summary(self, location_id: str) -> LocationDynamicSummaryDTO:
         """
         Получает сводные данные о динамическом состоянии указанной локации.
@@ -0,0 +1,155 @@
+# game_server/Logic/ApplicationLogic/shared_logic/LocationStateManagement/location_summary_push_coalescer.py
+
+import asyncio
+import inject
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Set
+
+from game_server.config.provider import config
+from game_server.config.settings.rabbitmq.rabbitmq_names import Exchanges
+from game_server.contracts.shared_models.websocket_base_models import WebSocketEventPayload, WebSocketMessage
+from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_dinamic_location_manager import IDynamicLocationManager
+from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessageBus
+
+
+# Событие с пакетом изменённых сводок локаций: {"summaries": [{"location_id", "full", "fields"}, ...]}
+LOCATION_SUMMARIES_EVENT = "event.location.summaries"
+
+
+class LocationSummaryPushCoalescer:
+    """
+    Собирает изменённые локации за короткое окно и рассылает клиентам одно событие
+    со всеми изменениями вместо отдельного события (и ответного запроса сводки) на каждое изменение.
+
+    Для каждой локации отправляются только поля, отличающиеся от последней отправленной сводки;
+    если отправленной сводки нет, локация уходит целиком (full=True).
+    Сводки читаются из центрального кэша в момент отправки, поэтому событие содержит самое свежее состояние,
+    даже если задачи агрегации одной локации завершились не по порядку.
+    Если отправка не удалась, локации возвращаются в набор изменённых и отправка повторяется
+    с экспоненциально растущей задержкой (от окна до LOCATION_SUMMARY_PUSH_MAX_RETRY_DELAY_SECONDS).
+    """
+    @inject.autoparams()
+    def __init__(
+        self,
+        logger: logging.Logger,
+        dynamic_location_manager: IDynamicLocationManager,
+        message_bus: IMessageBus,
+    ):
+        self.logger = logger
+        self._location_manager = dynamic_location_manager
+        self._message_bus = message_bus
+        self._window = config.settings.runtime.LOCATION_SUMMARY_PUSH_WINDOW_SECONDS
+        self._max_batch = config.settings.runtime.LOCATION_SUMMARY_PUSH_MAX_BATCH
+        self._max_retry_delay = config.settings.runtime.LOCATION_SUMMARY_PUSH_MAX_RETRY_DELAY_SECONDS
+        # Число неудачных отправок подряд; пока оно больше нуля, отправку запускает только таймер повтора.
+        self._failed_flushes = 0
+        self._dirty: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # Отправки идут по одной, чтобы сравнение с последней отправленной сводкой не обгоняло её запись.
+        self._flush_lock = asyncio.Lock()
+        self.logger.info(
+            f"✅ {self.__class__.__name__} инициализирован. Окно: {self._window}с, максимум локаций в событии: {self._max_batch}."
+        )
+
+    def mark_dirty(self, location_id: str) -> None:
+        """Отмечает локацию как изменённую. Событие уйдёт по истечении окна или при заполнении пакета."""
+        if not location_id:
+            return
+        self._dirty.add(location_id)
+        if self._failed_flushes:
+            # Иначе заполненный пакет повторял бы неудачную отправку на каждое новое изменение.
+            return
+        if len(self._dirty) >= self._max_batch:
+            self._schedule_flush_now()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self._window, self._schedule_flush_now)
+
+    def _schedule_flush_now(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return
+        task = asyncio.create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """Отправляет накопленные изменения. Возвращает число локаций в отправленном событии."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        async with self._flush_lock:
+            return await self._flush_dirty()
+
+    async def _flush_dirty(self) -> int:
+        location_ids, self._dirty = self._dirty, set()
+        if not location_ids:
+            return 0
+
+        try:
+            summaries = await self._location_manager.get_location_summaries_for_push(location_ids)
+            entries: List[Dict[str, Any]] = []
+            pushed: Dict[str, Dict[str, str]] = {}
+            for location_id, (current, last_pushed) in summaries.items():
+                if not current:
+                    continue
+                if not last_pushed:
+                    entries.append({"location_id": location_id, "full": True, "fields": current})
+                else:
+                    changed = {field: value for field, value in current.items() if last_pushed.get(field) != value}
+                    if not changed:
+                        continue
+                    entries.append({"location_id": location_id, "full": False, "fields": changed})
+                pushed[location_id] = current
+
+            if not entries:
+                self._failed_flushes = 0
+                return 0
+
+            event_payload = WebSocketEventPayload(type=LOCATION_SUMMARIES_EVENT, payload={"summaries": entries})
+            websocket_message = WebSocketMessage(type="EVENT", correlation_id=uuid.uuid4(), payload=event_payload)
+            await self._message_bus.publish(
+                exchange_name=Exchanges.EVENTS,
+                routing_key=LOCATION_SUMMARIES_EVENT,
+                message=websocket_message.model_dump(mode='json')
+            )
+            # Отправленное состояние запоминается только после успешной публикации:
+            # при ошибке следующее событие по этим локациям снова будет посчитано от старой копии.
+            await self._location_manager.mark_location_summaries_pushed(pushed)
+            self._failed_flushes = 0
+            self.logger.info(f"Событие '{LOCATION_SUMMARIES_EVENT}' отправлено: {len(entries)} локаций.")
+            return len(entries)
+        except Exception as e:
+            self._dirty |= location_ids
+            self._failed_flushes += 1
+            retry_delay = self._schedule_retry()
+            self.logger.error(
+                f"❌ Не удалось отправить сводки локаций {sorted(location_ids)}: {e}. "
+                f"Повтор через {retry_delay:.1f}с (ошибка подряд: {self._failed_flushes}).",
+                exc_info=True
+            )
+            return 0
+
+    def _schedule_retry(self) -> float:
+        """Перезапускает таймер отправки с задержкой, удваивающейся после каждой ошибки подряд."""
+        retry_delay = min(self._window * 2 ** self._failed_flushes, self._max_retry_delay)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._flush_handle = loop.call_later(retry_delay, self._schedule_flush_now)
+        return retry_delay
+
+    async def shutdown(self) -> None:
+        """Отправляет оставшиеся изменения и дожидается незавершённых отправок."""
+        await self.flush()
+        if self._flush_tasks:
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+        if self._flush_handle is not None:
+            # Последняя отправка не удалась, а повторять её после остановки уже некому.
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self.logger.warning(f"⚠️ Остановка без отправки сводок локаций: {sorted(self._dirty)}.")
@@ -31,7 +31,7 @@ from game_server.config.constants.coordinator import (
     COMMAND_PROCESS_AUTO_EXPLORING,
     COMMAND_PROCESS_AUTO_LEVELING
 )
-from game_server.config.constants.redis_key import (
+from game_server.config.constants.redis import (
     REDIS_TASK_QUEUE_EXPLORATION,
     REDIS_TASK_QUEUE_TRAINING
 )
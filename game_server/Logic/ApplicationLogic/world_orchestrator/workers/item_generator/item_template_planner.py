@@ -15,6 +15,7 @@ from game_server.Logic.InfrastructureLogic.db_instance import AsyncSessionLocal
 from game_server.config.constants.item import DEFAULT_RARITY_LEVEL, MATERIAL_COMPATIBILITY_RULES
 from game_server.config.settings.process.prestart import ITEM_GENERATION_BATCH_SIZE, ITEM_GENERATION_LIMIT
 from game_server.config.settings.redis_setting import BATCH_TASK_TTL_SECONDS
+from game_server.contracts.dtos.orchestrator.data_models import ItemGenerationSpec
 
 # Импортируем наш новый модуль с stateless-логикой
 from . import item_template_planner_logic as item_logic
@@ -76,13 +77,8 @@ class ItemTemplatePlanner:
         materials = materials_res if materials_res is not None else {}
         suffixes = suffixes_res if suffixes_res is not None else {}
         
-        # 2. Строим эталонный пул
-        etalon_pool = item_logic.build_etalon_item_codes(
-            item_base_data=item_base, materials_data=materials, suffixes_data=suffixes,
-            default_rarity_level=self.default_rarity_level,
-            material_compatibility_rules=self.material_compatibility_rules,
-            logger=self.logger
-        )
+        # 2. Строим эталонный пул (инкрементально, если изменилась только часть справочников)
+        etalon_pool = await self._plan_etalon_pool(item_base, materials, suffixes)
         
         # 3. Получаем существующие коды из БД
         equipment_repo = self._equipment_template_repo_factory(session)
@@ -101,4 +97,51 @@ class ItemTemplatePlanner:
             logger=self.logger
         )
         
-        return item_tasks
\ No newline at end of file
+        return item_tasks
+
+    async def _plan_etalon_pool(self, item_base: dict, materials: dict, suffixes: dict) -> dict:
+        """
+        Возвращает эталонный пул, переиспользуя закэшированный там, где справочники не менялись.
+        """
+        source_fingerprints = item_logic.calculate_source_fingerprints(
+            item_base, materials, suffixes,
+            default_rarity_level=self.default_rarity_level,
+            material_compatibility_rules=self.material_compatibility_rules,
+        )
+        fingerprint_hash = item_logic._get_current_data_fingerprint(source_fingerprints)
+        cached_pool, cached_hash, cached_fingerprints = await item_logic._get_cached_etalon_pool(self._central_redis_client)
+
+        if cached_pool is not None and cached_hash == fingerprint_hash:
+            self.logger.info(f"✅ Справочники не менялись (хэш: {fingerprint_hash[:8]}...). Используем закэшированный эталонный пул.")
+            return {code: ItemGenerationSpec(**spec) for code, spec in cached_pool.items()}
+
+        etalon_pool = None
+        plan_report = {"mode": "full", "reason": "no cached pool"}
+        if cached_pool is not None and cached_fingerprints:
+            etalon_pool, plan_report = item_logic.rebuild_etalon_pool_incremental(
+                cached_pool=cached_pool,
+                cached_fingerprints=cached_fingerprints,
+                current_fingerprints=source_fingerprints,
+                item_base_data=item_base, materials_data=materials, suffixes_data=suffixes,
+                default_rarity_level=self.default_rarity_level,
+                material_compatibility_rules=self.material_compatibility_rules,
+                logger=self.logger
+            )
+
+        if etalon_pool is None:
+            self.logger.info(f"🔄 Полное перепланирование эталонного пула: {plan_report.get('reason')}.")
+            etalon_pool = item_logic.build_etalon_item_codes(
+                item_base_data=item_base, materials_data=materials, suffixes_data=suffixes,
+                default_rarity_level=self.default_rarity_level,
+                material_compatibility_rules=self.material_compatibility_rules,
+                logger=self.logger
+            )
+            plan_report["pool_size"] = len(etalon_pool)
+
+        plan_report["fingerprint"] = fingerprint_hash
+        await item_logic._cache_etalon_pool(
+            {code: spec.model_dump() for code, spec in etalon_pool.items()},
+            fingerprint_hash, source_fingerprints, plan_report,
+            self._central_redis_client, self.logger
+        )
+        return etalon_pool
@@ -22,51 +22,81 @@ from game_server.Logic.InfrastructureLogic.arq_worker.utils.task_batch_dispatche
 # Прямой импорт констант
 from game_server.config.constants.arq import KEY_ITEM_GENERATION_TASK
 from game_server.config.settings.process.prestart import ETALON_POOL_TTL_SECONDS
-from game_server.config.constants.redis_key.reference_data_keys import (
-    REDIS_KEY_GENERATOR_ITEM_BASE,
-    REDIS_KEY_GENERATOR_MATERIALS,
-    REDIS_KEY_GENERATOR_SUFFIXES,
-)
 from game_server.config.constants.redis import (
     REDIS_KEY_ETALON_ITEM_POOL,
     REDIS_KEY_ETALON_ITEM_FINGERPRINT,
+    REDIS_KEY_ETALON_ITEM_ROW_FINGERPRINTS,
+    REDIS_KEY_ETALON_ITEM_PLAN_REPORT,
 )
 from game_server.contracts.dtos.orchestrator.data_models import ItemGenerationSpec
 
 
 # === Функции-помощники (ранее были приватными методами) ===
 
-async def _get_current_data_fingerprint(central_redis_client: CentralRedisClient) -> str:
-    dependency_keys = [
-        REDIS_KEY_GENERATOR_ITEM_BASE,
-        REDIS_KEY_GENERATOR_MATERIALS,
-        REDIS_KEY_GENERATOR_SUFFIXES,
-    ]
-    versions = await DataVersionManager.get_redis_fingerprint(central_redis_client, dependency_keys)
-    fingerprint_str = json.dumps(versions, sort_keys=True)
+# Источники справочных данных, от которых зависит эталонный пул.
+# Порядок важен только для читаемости отчёта.
+ETALON_POOL_SOURCES: Tuple[str, ...] = ("item_base", "materials", "suffixes")
+# Псевдо-источник для констант генерации: их изменение всегда ведёт к полному перепланированию.
+ETALON_POOL_CONFIG_SOURCE = "config"
+
+
+def calculate_source_fingerprints(
+    item_base_data: Dict[str, Any],
+    materials_data: Dict[str, Any],
+    suffixes_data: Dict[str, Any],
+    default_rarity_level: int,
+    material_compatibility_rules: dict,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Строит построчные отпечатки для каждого источника эталонного пула.
+    """
+    return {
+        "item_base": DataVersionManager.calculate_row_fingerprints(item_base_data),
+        "materials": DataVersionManager.calculate_row_fingerprints(materials_data),
+        "suffixes": DataVersionManager.calculate_row_fingerprints(suffixes_data),
+        ETALON_POOL_CONFIG_SOURCE: DataVersionManager.calculate_row_fingerprints({
+            "default_rarity_level": default_rarity_level,
+            "material_compatibility_rules": material_compatibility_rules,
+        }),
+    }
+
+
+def _get_current_data_fingerprint(source_fingerprints: Dict[str, Dict[str, str]]) -> str:
+    fingerprint_str = json.dumps(source_fingerprints, sort_keys=True)
     return hashlib.sha256(fingerprint_str.encode('utf-8')).hexdigest()
 
-async def _get_cached_etalon_pool(central_redis_client: CentralRedisClient) -> Tuple[Optional[Dict], Optional[str]]:
+async def _get_cached_etalon_pool(
+    central_redis_client: CentralRedisClient
+) -> Tuple[Optional[Dict], Optional[str], Optional[Dict[str, Dict[str, str]]]]:
     try:
         async with central_redis_client.pipeline() as pipe:
             pipe.get(REDIS_KEY_ETALON_ITEM_POOL)
             pipe.get(REDIS_KEY_ETALON_ITEM_FINGERPRINT)
+            pipe.get(REDIS_KEY_ETALON_ITEM_ROW_FINGERPRINTS)
             results = await pipe.execute()
-        pool_json, fingerprint_hash = results[0], results[1]
+        pool_json, fingerprint_hash, row_fingerprints_json = results[0], results[1], results[2]
         if not pool_json or not fingerprint_hash:
-            return None, None
-        return json.loads(pool_json), fingerprint_hash
+            return None, None, None
+        row_fingerprints = json.loads(row_fingerprints_json) if row_fingerprints_json else None
+        return json.loads(pool_json), fingerprint_hash, row_fingerprints
     except Exception:
-        return None, None
+        return None, None, None
 
-async def _cache_etalon_pool(pool: Dict, fingerprint_hash: str, central_redis_client: CentralRedisClient, logger: logging.Logger):
+async def _cache_etalon_pool(
+    pool: Dict,
+    fingerprint_hash: str,
+    source_fingerprints: Dict[str, Dict[str, str]],
+    plan_report: Dict[str, Any],
+    central_redis_client: CentralRedisClient,
+    logger: logging.Logger
+):
     try:
         pool_json = json.dumps(pool, ensure_ascii=False)
         async with central_redis_client.pipeline() as pipe:
-            pipe.set(REDIS_KEY_ETALON_ITEM_POOL, pool_json)
-            pipe.set(REDIS_KEY_ETALON_ITEM_FINGERPRINT, fingerprint_hash)
-            pipe.expire(REDIS_KEY_ETALON_ITEM_POOL, ETALON_POOL_TTL_SECONDS)
-            pipe.expire(REDIS_KEY_ETALON_ITEM_FINGERPRINT, ETALON_POOL_TTL_SECONDS)
+            pipe.set(REDIS_KEY_ETALON_ITEM_POOL, pool_json, ex=ETALON_POOL_TTL_SECONDS)
+            pipe.set(REDIS_KEY_ETALON_ITEM_FINGERPRINT, fingerprint_hash, ex=ETALON_POOL_TTL_SECONDS)
+            pipe.set(REDIS_KEY_ETALON_ITEM_ROW_FINGERPRINTS, json.dumps(source_fingerprints), ex=ETALON_POOL_TTL_SECONDS)
+            pipe.set(REDIS_KEY_ETALON_ITEM_PLAN_REPORT, json.dumps(plan_report, ensure_ascii=False))
             await pipe.execute()
         logger.info(f"✅ Эталонный пул предметов успешно кэширован (хэш: {fingerprint_hash[:8]}...).")
     except Exception as e:
@@ -125,6 +155,91 @@ def build_etalon_item_codes(
     return etalon_item_data_specs
 
 
+def rebuild_etalon_pool_incremental(
+    cached_pool: Dict[str, Dict[str, Any]],
+    cached_fingerprints: Dict[str, Dict[str, str]],
+    current_fingerprints: Dict[str, Dict[str, str]],
+    item_base_data: Dict[str, Any],
+    materials_data: Dict[str, Any],
+    suffixes_data: Dict[str, Any],
+    default_rarity_level: int,
+    material_compatibility_rules: dict,
+    logger: logging.Logger,
+) -> Tuple[Optional[Dict[str, ItemGenerationSpec]], Dict[str, Any]]:
+    """
+    Перестраивает только ту часть эталонного пула, которая зависит от изменившихся строк справочников.
+    Спецификация зависит ровно от одной строки каждого источника (base_code, material_code, suffix_code),
+    поэтому достаточно выбросить спецификации, ссылающиеся на изменённые/удалённые строки,
+    и заново вывести комбинации, в которых участвует хотя бы одна изменённая строка.
+
+    Возвращает (новый пул или None, если нужен полный пересчёт; отчёт о проделанной работе).
+    """
+    report: Dict[str, Any] = {"mode": "incremental", "changed": {}, "removed": {}}
+
+    if cached_fingerprints.get(ETALON_POOL_CONFIG_SOURCE) != current_fingerprints.get(ETALON_POOL_CONFIG_SOURCE):
+        report["mode"] = "full"
+        report["reason"] = "generation config changed"
+        return None, report
+    if any(source not in cached_fingerprints for source in ETALON_POOL_SOURCES):
+        report["mode"] = "full"
+        report["reason"] = "cached fingerprints are incomplete"
+        return None, report
+
+    changed: Dict[str, Set[str]] = {}
+    removed: Dict[str, Set[str]] = {}
+    for source in ETALON_POOL_SOURCES:
+        changed[source], removed[source] = DataVersionManager.diff_row_fingerprints(
+            cached_fingerprints[source], current_fingerprints[source]
+        )
+        report["changed"][source] = sorted(changed[source])
+        report["removed"][source] = sorted(removed[source])
+
+    stale_bases = changed["item_base"] | removed["item_base"]
+    stale_materials = changed["materials"] | removed["materials"]
+    stale_suffixes = changed["suffixes"] | removed["suffixes"]
+
+    start_time = time.time()
+    pool: Dict[str, ItemGenerationSpec] = {}
+    dropped = 0
+    for item_code, spec_data in cached_pool.items():
+        if (spec_data.get("base_code") in stale_bases
+                or spec_data.get("material_code") in stale_materials
+                or spec_data.get("suffix_code") in stale_suffixes):
+            dropped += 1
+            continue
+        pool[item_code] = ItemGenerationSpec(**spec_data)
+
+    # Каждый срез — декартово произведение, где хотя бы одна ось ограничена изменёнными строками.
+    slices = []
+    if changed["item_base"]:
+        slices.append(({k: item_base_data[k] for k in changed["item_base"]}, materials_data, suffixes_data))
+    if changed["materials"]:
+        slices.append((item_base_data, {k: materials_data[k] for k in changed["materials"]}, suffixes_data))
+    if changed["suffixes"]:
+        slices.append((item_base_data, materials_data, {k: suffixes_data[k] for k in changed["suffixes"]}))
+
+    rederived = 0
+    for base_slice, materials_slice, suffixes_slice in slices:
+        slice_specs = build_etalon_item_codes(
+            item_base_data=base_slice, materials_data=materials_slice, suffixes_data=suffixes_slice,
+            default_rarity_level=default_rarity_level,
+            material_compatibility_rules=material_compatibility_rules,
+            logger=logger,
+        )
+        rederived += len(slice_specs)
+        pool.update(slice_specs)
+
+    report["dropped_specs"] = dropped
+    report["rederived_specs"] = rederived
+    report["pool_size"] = len(pool)
+    report["elapsed_seconds"] = round(time.time() - start_time, 4)
+    logger.info(
+        f"Logic: Инкрементальное перепланирование пула: выброшено {dropped}, выведено заново {rederived}, "
+        f"итого {len(pool)} item_code за {report['elapsed_seconds']:.2f} секунд."
+    )
+    return pool, report
+
+
 def find_missing_specs(etalon_specs: Dict[str, ItemGenerationSpec], existing_codes: Set[str]) -> List[ItemGenerationSpec]:
     return [spec for item_code, spec in etalon_specs.items() if item_code not in existing_codes]
 
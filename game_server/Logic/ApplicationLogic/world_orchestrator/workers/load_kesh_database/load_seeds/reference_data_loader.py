@@ -1,5 +1,6 @@
 # game_server/Logic/ApplicationLogic/world_orchestrator/pre_start/data_loaders/reference_data_loader.py
 
+import asyncio
 import logging
 import inject
 from typing import Dict, Any, List, Optional, Union, Callable
@@ -71,9 +72,15 @@ class ReferenceDataLoader:
                     "ItemBase": (ItemBaseLoader(), REDIS_KEY_GENERATOR_ITEM_BASE, self._process_item_base_data),
                     "LocationConnections": (LocationConnectionsLoader(), REDIS_KEY_WORLD_CONNECTIONS, self._process_location_connections_data)
                 }
-                for name, (loader, redis_key, processor) in yaml_loaders.items():
+                # YAML-источники независимы: парсим их одновременно, кэшируем по очереди.
+                raw_results = await asyncio.gather(
+                    *(loader.load_all() for loader, _, _ in yaml_loaders.values()),
+                    return_exceptions=True
+                )
+                for (name, (loader, redis_key, processor)), raw_data in zip(yaml_loaders.items(), raw_results):
                     try:
-                        raw_data = await loader.load_all()
+                        if isinstance(raw_data, BaseException):
+                            raise raw_data
                         processed_data = await processor(raw_data, name)
                         if processed_data is not None:
                             await self._conditional_cache(session, redis_key, processed_data, name, is_hash=True if name == "ItemBase" else False)
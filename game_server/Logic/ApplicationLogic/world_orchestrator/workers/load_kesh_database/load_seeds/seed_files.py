@@ -0,0 +1,67 @@
+# game_server/Logic/ApplicationLogic/world_orchestrator/workers/load_kesh_database/load_seeds/seed_files.py
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from game_server.config.constants.seeds import FILE_LOAD_ORDER, SEEDS_DIR
+
+
+def convert_filename_to_model(filename: str) -> str:
+    """'001_creature_type.yml' -> 'CreatureType'."""
+    name = filename.replace('.yml', '')
+    if '_' in name and name.split('_')[0].isdigit():
+        name = '_'.join(name.split('_')[1:])
+    return ''.join(word.capitalize() for word in name.split('_'))
+
+
+def collect_seed_files(logger: logging.Logger) -> List[Path]:
+    """
+    Собирает seed-файлы из SEEDS_DIR: сначала в порядке FILE_LOAD_ORDER, затем остальные по имени.
+    """
+    logger.info(f"📌 Ищем seed-файлы внутри {SEEDS_DIR}...")
+    all_yml_files = list(SEEDS_DIR.rglob('*.yml'))
+    ordered_files = []
+    ordered_file_names = set(FILE_LOAD_ORDER)
+    file_paths_by_name = {f.name: f for f in all_yml_files}
+
+    critical_files_missing = False
+    for name in FILE_LOAD_ORDER:
+        if name in file_paths_by_name:
+            ordered_files.append(file_paths_by_name[name])
+        else:
+            logger.critical(f"🚨 Критическая ошибка: Файл '{name}' из FILE_LOAD_ORDER не найден. Без него продолжение невозможно.")
+            critical_files_missing = True
+
+    if critical_files_missing:
+        raise RuntimeError("Критические seed-файлы отсутствуют. Процесс загрузки прерван.")
+
+    remaining_files = sorted([f for f in all_yml_files if f.name not in ordered_file_names], key=lambda x: x.name)
+    final_file_list = ordered_files + remaining_files
+
+    if not final_file_list:
+        logger.critical("🚨 Критическая ошибка: Нет .yml файлов в SEEDS_DIR. Загрузка сидов невозможна.")
+        raise RuntimeError("Отсутствуют YML-файлы сидов.")
+
+    logger.info(f"✅ Найдено {len(final_file_list)} seed-файлов для загрузки.")
+    return final_file_list
+
+
+def group_seed_files_by_table(seed_files: List[Path], models_module: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Группирует seed-файлы по таблицам ORM-моделей, сохраняя порядок загрузки.
+    Возвращает {table_name: {'model': model, 'files': [Path, ...]}}.
+    """
+    grouped_data: Dict[str, Dict[str, Any]] = {}
+    for file_path in seed_files:
+        model_name = convert_filename_to_model(file_path.name)
+        model = getattr(models_module, model_name, None)
+
+        if not model:
+            raise RuntimeError(f"Модель '{model_name}' для файла '{file_path}' не найдена. Импорт прерван.")
+
+        table_name = model.__tablename__
+        if table_name not in grouped_data:
+            grouped_data[table_name] = {'model': model, 'files': []}
+        grouped_data[table_name]['files'].append(file_path)
+    return grouped_data
@@ -25,6 +25,7 @@ from game_server.Logic.CoreServices.utils.yaml_readers import YamlReader # Уб
 
 
 from game_server.Logic.CoreServices.utils.seed_utils import get_pk_column_name
+from game_server.Logic.InfrastructureLogic.app_post.utils.table_reconciler import TableReconciler
 from game_server.config.settings.process.prestart import SEEDING_DELETION_BATCH_SIZE
 
 from game_server.contracts.dtos.orchestrator.data_models import AbilityData, BackgroundStoryData, CreatureTypeData, CreatureTypeInitialSkillData, GameLocationData, MaterialData, ModifierLibraryData, PersonalityData, SkillData, StaticItemTemplateData, SuffixData
@@ -123,18 +124,11 @@ class SeedLoader:
         self.logger.debug(f"Successfully validated {len(validated_items)} elements for model {model.__name__} from file {file_path.name}.")
         return validated_items
 
-    # 🔥 ИЗМЕНЕНИЕ: upsert_data теперь принимает конкретный репозиторий и сессию
-    async def upsert_data(self, session: Any, repository: Any, model: Type[Base], items_to_process: List[BaseModel]) -> Tuple[int, int]:
+    @staticmethod
+    def prepare_rows(model: Type[Base], items_to_process: List[BaseModel]) -> List[Dict[str, Any]]:
         """
-        Вставляет или обновляет данные в базу данных, используя переданный репозиторий.
+        Преобразует DTO в словари, содержащие только колонки ORM-модели.
         """
-        inserted_count = 0
-        updated_count = 0
-
-        if not items_to_process:
-            self.logger.info(f"ℹ️ No data to UPSERT for model {model.__name__}.")
-            return 0, 0
-
         transformed_data_list: List[Dict[str, Any]] = []
 
         orm_columns = [c.name for c in model.__table__.columns]
@@ -154,10 +148,19 @@ class SeedLoader:
                         transformed_item[col_name] = value
 
             transformed_data_list.append(transformed_item)
+        return transformed_data_list
 
-        total_affected_count = 0
-        inserted_count = 0
-        updated_count = 0
+    # 🔥 ИЗМЕНЕНИЕ: upsert_data теперь принимает конкретный репозиторий и сессию
+    async def upsert_data(self, session: Any, repository: Any, model: Type[Base], items_to_process: List[BaseModel]) -> Tuple[int, int]:
+        """
+        Вставляет или обновляет данные в базу данных, используя переданный репозиторий.
+        Если репозиторий не умеет upsert_many, выполняется один многострочный UPSERT через TableReconciler.
+        """
+        if not items_to_process:
+            self.logger.info(f"ℹ️ No data to UPSERT for model {model.__name__}.")
+            return 0, 0
+
+        transformed_data_list = self.prepare_rows(model, items_to_process)
 
         try:
             if hasattr(repository, 'upsert_many'):
@@ -165,36 +168,9 @@ class SeedLoader:
                 inserted_count = total_affected_count
                 updated_count = 0
             else:
-                self.logger.warning(f"Batch UPSERT for {model.__name__} not implemented in repository. Performing single UPSERT.")
-                pk_column_name = get_pk_column_name(model) # Получаем PK здесь, если нужен для single upsert
-
-                for item_data in transformed_data_list:
-                    pk_value = item_data.get(pk_column_name) # Получаем PK из данных
-                    if pk_value is None:
-                        self.logger.warning(f"Пропущен элемент без PK для модели {model.__name__} в single UPSERT: {item_data}")
-                        continue
-
-                    # Проверяем, существует ли запись, если репозиторий поддерживает get_by_pk
-                    existing_record = None
-                    if hasattr(repository, 'get_by_pk'):
-                        existing_record = await repository.get_by_pk(pk_value)
-
-                    if existing_record:
-                        if hasattr(repository, 'update_by_pk'):
-                            await repository.update_by_pk(pk_value, item_data)
-                            updated_count += 1
-                        else:
-                            self.logger.error(f"Репозиторий {model.__name__} не поддерживает update_by_pk для single UPSERT.")
-                            raise NotImplementedError(f"Update by PK for model {model.__name__} not implemented.")
-                    else:
-                        if hasattr(repository, 'create'):
-                            await repository.create(item_data)
-                            inserted_count += 1
-                        else:
-                            self.logger.error(f"Репозиторий {model.__name__} не поддерживает create для single UPSERT.")
-                            raise NotImplementedError(f"Create for model {model.__name__} not implemented.")
-
-                    total_affected_count += 1
+                self.logger.warning(f"Batch UPSERT for {model.__name__} not implemented in repository. Using generic multi-row UPSERT.")
+                inserted_count, updated_count = await TableReconciler(session).upsert_many(model, transformed_data_list)
+                total_affected_count = inserted_count + updated_count
 
             self.logger.info(f"✅ UPSERT completed for {model.__name__}. Affected rows: {total_affected_count}. (Inserted: {inserted_count}, Updated: {updated_count}).")
             return inserted_count, updated_count
@@ -0,0 +1,200 @@
+# game_server/Logic/ApplicationLogic/world_orchestrator/workers/load_kesh_database/load_seeds/seed_snapshot.py
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+import inject
+import msgpack
+
+from game_server.Logic.CoreServices.services.data_version_manager import DataVersionManager
+from game_server.config.constants.seeds import SEED_SNAPSHOT_PATH, SEEDS_DIR
+from game_server.contracts.dtos.orchestrator import data_models as orchestrator_dtos
+from game_server.contracts.dtos.state_entity import data_models as state_entity_dtos
+from game_server.database.models import models as db_models
+
+from . import seed_loader as seed_loader_module
+from .seed_files import collect_seed_files, group_seed_files_by_table
+from .seed_loader import SeedLoader
+
+
+# Увеличивается при любом несовместимом изменении структуры снапшота.
+SEED_SNAPSHOT_FORMAT_VERSION = 2
+
+# Код, от которого зависят строки снапшота: ORM-модели, DTO валидации сидов и их подготовка в SeedLoader.
+# Изменение любого из модулей (новое поле, default, валидатор) делает снапшот недействительным.
+_SCHEMA_SOURCE_MODULES: Tuple[ModuleType, ...] = (db_models, orchestrator_dtos, state_entity_dtos, seed_loader_module)
+
+
+@dataclass
+class SeedSnapshotTable:
+    """
+    Скомпилированные данные одной таблицы.
+    Строки хранятся отдельным msgpack-блобом и распаковываются только если таблицу нужно синхронизировать.
+    """
+    table_name: str
+    model_name: str
+    data_hash: str
+    row_count: int
+    rows_blob: bytes
+
+    def load_rows(self) -> List[Dict[str, Any]]:
+        return msgpack.unpackb(self.rows_blob, raw=False)
+
+
+@dataclass
+class SeedSnapshot:
+    format_version: int
+    # {путь seed-файла относительно SEEDS_DIR: sha256 его байтов}
+    source_digests: Dict[str, str]
+    # sha256 исходников моделей и DTO, которыми снапшот был собран (compute_schema_digest).
+    schema_digest: str
+    # Порядок таблиц совпадает с порядком загрузки сидов.
+    tables: Dict[str, SeedSnapshotTable] = field(default_factory=dict)
+
+
+def _source_key(file_path: Path) -> str:
+    try:
+        return file_path.relative_to(SEEDS_DIR).as_posix()
+    except ValueError:
+        return file_path.as_posix()
+
+
+def compute_source_digests(seed_files: List[Path]) -> Dict[str, str]:
+    """
+    Считает sha256 сырых байтов seed-файлов. Это на порядки дешевле парсинга YAML
+    и позволяет проверить, что снапшот собран из текущих исходников.
+    """
+    return {_source_key(path): hashlib.sha256(path.read_bytes()).hexdigest() for path in seed_files}
+
+
+def compute_schema_digest(modules: Tuple[ModuleType, ...] = _SCHEMA_SOURCE_MODULES) -> str:
+    """
+    sha256 исходников моделей и DTO: YAML-файлы могут не меняться, а код, который превращает их
+    в строки таблиц, — меняться. Хэш кода не требует помнить о ручном повышении версии.
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(module.__name__.encode())
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def write_seed_snapshot(snapshot: SeedSnapshot, path: Path = SEED_SNAPSHOT_PATH) -> None:
+    payload = {
+        "format_version": snapshot.format_version,
+        "source_digests": snapshot.source_digests,
+        "schema_digest": snapshot.schema_digest,
+        "tables": [
+            {
+                "table_name": table.table_name,
+                "model_name": table.model_name,
+                "data_hash": table.data_hash,
+                "row_count": table.row_count,
+                "rows_blob": table.rows_blob,
+            }
+            for table in snapshot.tables.values()
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(msgpack.packb(payload, use_bin_type=True))
+    tmp_path.replace(path)
+
+
+def read_seed_snapshot(path: Path = SEED_SNAPSHOT_PATH) -> Optional[SeedSnapshot]:
+    """
+    Читает снапшот. Возвращает None, если файла нет или его формат не поддерживается.
+    """
+    if not path.exists():
+        return None
+    payload = msgpack.unpackb(path.read_bytes(), raw=False)
+    if payload.get("format_version") != SEED_SNAPSHOT_FORMAT_VERSION:
+        return None
+    snapshot = SeedSnapshot(
+        format_version=payload["format_version"],
+        source_digests=payload["source_digests"],
+        schema_digest=payload["schema_digest"],
+    )
+    for table in payload["tables"]:
+        snapshot.tables[table["table_name"]] = SeedSnapshotTable(**table)
+    return snapshot
+
+
+async def load_valid_seed_snapshot(
+    seed_files: List[Path],
+    logger: logging.Logger,
+    path: Path = SEED_SNAPSHOT_PATH,
+) -> Optional[SeedSnapshot]:
+    """
+    Возвращает снапшот, только если он собран ровно из текущего набора seed-файлов
+    текущей версией моделей и DTO. Чтение и хэширование выполняются вне event loop.
+    """
+    try:
+        snapshot = await asyncio.to_thread(read_seed_snapshot, path)
+        if snapshot is None:
+            logger.info(f"ℹ️ Скомпилированный снапшот сидов '{path}' отсутствует или устарел по формату. Используем YAML.")
+            return None
+        current_digests = await asyncio.to_thread(compute_source_digests, seed_files)
+        current_schema_digest = await asyncio.to_thread(compute_schema_digest)
+    except Exception as e:
+        logger.warning(f"⚠️ Не удалось прочитать снапшот сидов '{path}': {e}. Используем YAML.")
+        return None
+
+    if current_digests != snapshot.source_digests:
+        logger.warning(f"⚠️ Снапшот сидов '{path}' не соответствует текущим YAML-файлам. Пересоберите его. Используем YAML.")
+        return None
+    if current_schema_digest != snapshot.schema_digest:
+        logger.warning(f"⚠️ Снапшот сидов '{path}' собран другой версией моделей/DTO. Пересоберите его. Используем YAML.")
+        return None
+    return snapshot
+
+
+class SeedSnapshotCompiler:
+    """
+    Шаг сборки: парсит и валидирует все seed-файлы один раз и сохраняет результат
+    в бинарный снапшот с заранее посчитанными хэшами таблиц.
+    """
+    @inject.autoparams()
+    def __init__(self, loader: SeedLoader, logger: logging.Logger):
+        self.loader = loader
+        self.logger = logger
+
+    async def compile(self, models_module: Any, output_path: Path = SEED_SNAPSHOT_PATH) -> SeedSnapshot:
+        seed_files = collect_seed_files(self.logger)
+        grouped_data = group_seed_files_by_table(seed_files, models_module)
+
+        snapshot = SeedSnapshot(
+            format_version=SEED_SNAPSHOT_FORMAT_VERSION,
+            source_digests=compute_source_digests(seed_files),
+            schema_digest=compute_schema_digest(),
+        )
+
+        for table_name, data_info in grouped_data.items():
+            model = data_info['model']
+            all_items = []
+            for file_path in data_info['files']:
+                items_from_file = await self.loader.load_and_prepare_data_from_yaml(file_path, model)
+                if items_from_file is None:
+                    raise RuntimeError(f"Критическая ошибка при загрузке данных из файла {file_path.name}. Компиляция прервана.")
+                all_items.extend(items_from_file)
+
+            # Хэш считается так же, как в SeedsManager, чтобы совпадать с версиями в data_versions.
+            data_hash = DataVersionManager._calculate_data_hash([item.model_dump(by_alias=True) for item in all_items])
+            rows = [item.model_dump(mode='json', by_alias=True) for item in all_items]
+            snapshot.tables[table_name] = SeedSnapshotTable(
+                table_name=table_name,
+                model_name=model.__name__,
+                data_hash=data_hash,
+                row_count=len(rows),
+                rows_blob=msgpack.packb(rows, use_bin_type=True),
+            )
+            self.logger.info(f"📦 '{table_name}': {len(rows)} строк, хэш {data_hash[:8]}...")
+
+        await asyncio.to_thread(write_seed_snapshot, snapshot, output_path)
+        self.logger.info(f"✅ Снапшот сидов ({len(snapshot.tables)} таблиц) записан в '{output_path}'.")
+        return snapshot
@@ -0,0 +1,77 @@
+# game_server/Logic/ApplicationLogic/world_orchestrator/workers/tasks/arq_auto_leveling.py
+
+import logging
+from typing import Dict, Any, List, Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from game_server.Logic.InfrastructureLogic.app_post.utils.transactional_decorator import transactional
+from game_server.Logic.InfrastructureLogic.db_instance import AsyncSessionLocal
+
+from game_server.Logic.InfrastructureLogic.app_post.repository_groups.world_state.auto_session.interfaces_auto_session import IXpTickDataRepository
+from game_server.Logic.InfrastructureLogic.app_post.repository_groups.character.interfaces_character import ICharacterSkillRepository
+from game_server.Logic.InfrastructureLogic.app_cache.services.task_queue.redis_batch_store import RedisBatchStore
+from game_server.Logic.DomainLogic.world_orchestrator_logic.auto_leveling_engine import build_cumulative_xp_table, compute_auto_leveling
+from game_server.config.constants.arq import KEY_AUTO_LEVELING_BATCH
+
+
+# Таблица порогов опыта неизменна — считается один раз на процесс воркера.
+_CUMULATIVE_XP = build_cumulative_xp_table()
+
+
+@transactional(AsyncSessionLocal)
+async def process_auto_leveling_batch_task(
+    session: AsyncSession,  # <--- Сессия от @transactional
+    ctx: Dict[str, Any],    # <--- Контекст ARQ
+    batch_id: str,          # <--- batch_id от AutoLevelingHandler
+    **kwargs,
+) -> None:
+    """
+    ARQ-задача автопрокачки для батча персонажей.
+    Тики всех персонажей батча загружаются одним запросом, опыт и уровни навыков считаются
+    на массивах (auto_leveling_engine), результат пишется одним UPDATE в character_skills
+    и одним DELETE обработанных тиков. Вся операция — одна транзакция.
+    """
+    logger: logging.Logger = ctx["logger"]
+    redis_batch_store: RedisBatchStore = ctx["redis_batch_store"]
+    xp_tick_data_repo_factory: Callable[[AsyncSession], IXpTickDataRepository] = ctx["xp_tick_data_repo_factory"]
+    character_skill_repo_factory: Callable[[AsyncSession], ICharacterSkillRepository] = ctx["character_skill_repo_factory"]
+
+    log_prefix = f"AUTO_LEVELING_TASK_ID({batch_id}):"
+    logger.info(f"{log_prefix} Запуск ARQ-задачи автопрокачки (транзакционно).")
+
+    try:
+        batch_data = await redis_batch_store.load_batch(key_template=KEY_AUTO_LEVELING_BATCH, batch_id=batch_id)
+        if not batch_data or 'specs' not in batch_data:
+            logger.warning(f"{log_prefix} Не удалось получить данные батча '{batch_id}' или они не содержат 'specs'.")
+            return
+
+        character_ids: List[int] = sorted({int(spec["character_id"]) for spec in batch_data['specs'] if spec.get("character_id") is not None})
+        if not character_ids:
+            logger.warning(f"{log_prefix} Батч не содержит ID персонажей.")
+            return
+
+        xp_tick_data_repo = xp_tick_data_repo_factory(session)
+        character_skill_repo = character_skill_repo_factory(session)
+
+        rows = await xp_tick_data_repo.get_xp_ticks_with_skill_state(character_ids)
+        result = compute_auto_leveling(rows, _CUMULATIVE_XP)
+
+        updated = await character_skill_repo.bulk_update_skill_progress(
+            result.character_ids, result.skill_keys, result.levels, result.xps
+        )
+        await xp_tick_data_repo.delete_xp_ticks_by_ids(result.consumed_tick_ids)
+
+        await redis_batch_store.update_fields(
+            key_template=KEY_AUTO_LEVELING_BATCH,
+            batch_id=batch_id,
+            fields={"status": "completed", "processed_ticks": len(result.consumed_tick_ids), "updated_skills": updated}
+        )
+        logger.info(
+            f"{log_prefix} Персонажей: {len(character_ids)}, тиков: {len(result.consumed_tick_ids)} "
+            f"(без навыка: {result.orphan_ticks}), обновлено навыков: {updated}, "
+            f"повышений уровня: {result.level_ups}, понижений: {result.level_downs}."
+        )
+
+    except Exception as e:
+        logger.critical(f"{log_prefix} КРИТИЧЕСКАЯ ОШИБКА в ARQ-задаче: {e}", exc_info=True)
+        raise
@@ -10,7 +10,7 @@ from game_server.Logic.InfrastructureLogic.app_post.utils.transactional_decorato
 # Импорты классов/интерфейсов, которые будут получены из ctx
 from game_server.Logic.ApplicationLogic.world_orchestrator.workers.world_map_generator.world_map_generator import WorldMapGenerator
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.world_state.core_world.interfaces_core_world import IGameLocationRepository
-from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import ILocationStateRepository, IWorldStateRepository
+from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import ILocationStateRepository, IWorldSnapshotRepository, IWorldStateRepository
 
 
 from game_server.Logic.InfrastructureLogic.db_instance import AsyncSessionLocal
@@ -31,6 +31,7 @@ async def generate_world_map_task(
     pg_location_repo_factory: Callable[[AsyncSession], IGameLocationRepository] = ctx["pg_location_repo_factory"]
     mongo_world_repo: IWorldStateRepository = ctx["mongo_world_repo"]
     location_state_repo: ILocationStateRepository = ctx["location_state_repo"]
+    world_snapshot_repo: IWorldSnapshotRepository = ctx["world_snapshot_repo"]
     # --- УДАЛЕНО ---: Больше не получаем redis_reader из ctx
     # redis_reader: ReferenceDataReader = ctx["redis_reader"]
 
@@ -46,7 +47,8 @@ async def generate_world_map_task(
             pg_location_repo=pg_location_repo,
             mongo_world_repo=mongo_world_repo,
             location_state_repo=location_state_repo,
-            logger=logger
+            logger=logger,
+            world_snapshot_repo=world_snapshot_repo
         )
 
         # 3. Запускаем процесс сборки и сохранения
@@ -5,11 +5,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.world_state.core_world.interfaces_core_world import IGameLocationRepository
-from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import ILocationStateRepository, IWorldStateRepository
+from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import ILocationStateRepository, IWorldSnapshotRepository, IWorldStateRepository
 # --- УДАЛЕНО ---: Больше не нужен Redis Reader для выходов
 # from game_server.Logic.InfrastructureLogic.app_cache.services.reference_data.reference_data_reader import ReferenceDataReader
 
 from game_server.contracts.db_models.mongo.world_map.data_models import ActiveLocationDocument, LocationExit, StaticLocationData, WorldRegionDocument
+from game_server.contracts.dtos.game_world.data_models import WorldLocationDataDTO
 from game_server.contracts.dtos.orchestrator.data_models import GameLocationData
 from game_server.database.models.models import GameLocation 
 from pydantic import BaseModel
@@ -21,19 +22,22 @@ class WorldMapGenerator:
     1. Читает данные из PostgreSQL.
     2. Собирает в иерархическую структуру регионов (выходы берутся из тех же данных).
     3. Сохраняет результат в MongoDB.
-    4. Инициализирует пустые динамические документы локаций.
+    4. Публикует версионированный снимок локаций для синхронизации бота (если передан world_snapshot_repo).
+    5. Инициализирует пустые динамические документы локаций.
     """
     def __init__(self,
                  pg_location_repo: IGameLocationRepository,
                  mongo_world_repo: IWorldStateRepository,
                  location_state_repo: ILocationStateRepository,
                  # --- УДАЛЕНО ---: redis_reader больше не передается
-                 logger: logging.Logger):
+                 logger: logging.Logger,
+                 world_snapshot_repo: Optional[IWorldSnapshotRepository] = None):
         self.pg_location_repo = pg_location_repo
         self.mongo_world_repo = mongo_world_repo
         self.location_state_repo = location_state_repo
         # --- УДАЛЕНО ---: self.redis_reader = redis_reader
         self.logger = logger
+        self.world_snapshot_repo = world_snapshot_repo
 
     async def generate_and_store_world_map(self) -> bool:
         """Основной метод, запускающий весь процесс."""
@@ -78,7 +82,11 @@ class WorldMapGenerator:
                     f"✅ Успешно сохранено/обновлено: {getattr(result, 'upserted_count', 0) + getattr(result, 'modified_count', 0)} регионов."
                 )
             
-            # 4. Инициализация динамических локаций (без изменений)
+            # 4. Снимок для бота: локации уже в формате ответа get_world_data
+            if self.world_snapshot_repo is not None:
+                await self._publish_world_snapshot(world_regions)
+
+            # 5. Инициализация динамических локаций (без изменений)
             self.logger.info("🚀 Начало инициализации динамических документов локаций...")
             await self._initialize_and_store_dynamic_locations(all_pg_locations_dtos)
             
@@ -88,6 +96,18 @@ class WorldMapGenerator:
             self.logger.critical(f"🚨 Критическая ошибка во время генерации карты мира: {e}", exc_info=True)
             return False
 
+    async def _publish_world_snapshot(self, world_regions: List[WorldRegionDocument]) -> None:
+        """Валидирует локации всех регионов как WorldLocationDataDTO и публикует их новой версией снимка."""
+        snapshot_locations: Dict[str, Dict[str, Any]] = {}
+        for region in world_regions:
+            for location_id, static_data in region.locations.items():
+                try:
+                    snapshot_locations[location_id] = WorldLocationDataDTO(**static_data.model_dump()).model_dump()
+                except Exception as e:
+                    self.logger.warning(f"Локация '{location_id}' не попала в снимок карты: {e}")
+        version = await self.world_snapshot_repo.publish_snapshot(snapshot_locations)
+        self.logger.info(f"✅ Снимок карты для бота актуален: версия {version}, {len(snapshot_locations)} локаций.")
+
     async def _build_regions(self, all_pg_locations: List[GameLocationData]) -> List[WorldRegionDocument]:
         """Собирает плоский список локаций в иерархию регионов."""
         locations_by_access_key = WorldMapBuilderUtils.get_location_by_access_key(all_pg_locations)
@@ -4,7 +4,7 @@ from datetime import datetime
 import json
 import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 from uuid import UUID
 import msgpack
 import inject
@@ -88,6 +88,29 @@ class DataVersionManager:
             logging.getLogger(__name__).critical(f"Критическая ошибка при вычислении хэша данных: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def calculate_row_fingerprints(data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Вычисляет SHA256 хэш для каждой строки справочника, заданного как {pk: row}.
+        В отличие от _calculate_data_hash, позволяет понять, КАКИЕ именно строки изменились.
+        """
+        return {
+            str(pk): hashlib.sha256(
+                json.dumps(row, sort_keys=True, default=_custom_json_serializer_for_hash).encode('utf-8')
+            ).hexdigest()
+            for pk, row in data.items()
+        }
+
+    @staticmethod
+    def diff_row_fingerprints(old: Dict[str, str], new: Dict[str, str]) -> Tuple[Set[str], Set[str]]:
+        """
+        Сравнивает два набора построчных отпечатков.
+        Возвращает (добавленные или изменённые ключи, удалённые ключи).
+        """
+        changed = {pk for pk, row_hash in new.items() if old.get(pk) != row_hash}
+        removed = set(old) - set(new)
+        return changed, removed
+
     async def get_db_version(self, table_name: str) -> Optional[str]:
         async with self._session_factory() as session:
             try:
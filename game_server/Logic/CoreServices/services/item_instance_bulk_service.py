@@ -0,0 +1,78 @@
+# game_server/Logic/CoreServices/services/item_instance_bulk_service.py
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+import inject
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from game_server.database.models.models import InstancedItem
+from game_server.Logic.InfrastructureLogic.app_post.repository_groups.active_game_data.interfaces_active_game_data import IItemInstanceRepository
+from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_item_cache import IItemCacheManager
+
+
+def item_instance_to_cache_dict(item: InstancedItem) -> Dict[str, Any]:
+    """Данные экземпляра предмета в том виде, в котором они лежат в кэше (все столбцы таблицы)."""
+    return {column.key: getattr(item, column.key) for column in InstancedItem.__table__.columns}
+
+
+class ItemInstanceBulkService:
+    """
+    Пакетные операции с экземплярами предметов (выпадение лута, обмен, удаление персонажа)
+    со сквозной записью в кэш: одна SQL-команда на всю пачку и один запрос к Redis.
+
+    Методы принимают активную сессию извне и не управляют транзакцией (как IdentifiersServise).
+    Кэш обновляется после flush; если вызывающий код затем откатывает транзакцию,
+    он должен вызвать evict_from_cache для затронутых ID.
+    """
+    @inject.autoparams()
+    def __init__(
+        self,
+        logger: logging.Logger,
+        item_instance_repo_factory: Callable[[AsyncSession], IItemInstanceRepository],
+        item_cache_manager: IItemCacheManager,
+    ):
+        self.logger = logger
+        self._item_instance_repo_factory = item_instance_repo_factory
+        self._item_cache = item_cache_manager
+        self.logger.debug("✨ ItemInstanceBulkService инициализирован.")
+
+    async def create_many(self, session: AsyncSession, data_list: List[Dict[str, Any]]) -> List[InstancedItem]:
+        """Создает пачку предметов и кладет их в кэш."""
+        created = await self._item_instance_repo_factory(session).create_item_instances(data_list)
+        await self.write_through(created)
+        return created
+
+    async def transfer_many(self, session: AsyncSession, transfers: List[Dict[str, Any]]) -> List[InstancedItem]:
+        """Перемещает пачку предметов (см. IItemInstanceRepository.transfer_many) и обновляет их в кэше."""
+        moved = await self._item_instance_repo_factory(session).transfer_many(transfers)
+        await self.write_through(moved)
+        return moved
+
+    async def delete_by_owner(
+        self,
+        session: AsyncSession,
+        owner_id: int,
+        owner_type: str,
+        instance_ids: Optional[List[int]] = None,
+        location_type: Optional[str] = None
+    ) -> List[int]:
+        """Удаляет предметы владельца и убирает их из кэша."""
+        deleted_ids = await self._item_instance_repo_factory(session).delete_items_by_owner(
+            owner_id, owner_type, instance_ids=instance_ids, location_type=location_type
+        )
+        await self.evict_from_cache(deleted_ids)
+        return deleted_ids
+
+    async def write_through(self, items: List[InstancedItem]) -> None:
+        """Записывает предметы в кэш одним pipeline."""
+        if not items:
+            return
+        await self._item_cache.set_multiple_item_instances_data(
+            {str(item.instance_id): item_instance_to_cache_dict(item) for item in items}
+        )
+
+    async def evict_from_cache(self, instance_ids: List[int]) -> None:
+        """Удаляет предметы из кэша одним pipeline."""
+        if not instance_ids:
+            return
+        await self._item_cache.delete_multiple_item_instances_data([str(instance_id) for instance_id in instance_ids])
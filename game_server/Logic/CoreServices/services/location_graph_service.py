@@ -0,0 +1,326 @@
+# game_server/Logic/CoreServices/services/location_graph_service.py
+
+import asyncio
+import heapq
+import logging
+import time
+from array import array
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import inject
+
+from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_reference_data_reader import IReferenceDataReader
+
+
+# Через столько секунд граф сверяется со связями в Redis (перезагрузку мог выполнить другой процесс).
+LOCATION_GRAPH_REFRESH_SECONDS: float = 60.0
+
+
+class LocationGraphIndex:
+    """
+    Неизменяемый индекс графа выходов между локациями в формате CSR.
+
+    ID локаций интернируются в плотные номера 0..n-1. Выходы узла i лежат в
+    targets[offsets[i]:offsets[i + 1]], поэтому получение соседей не требует поиска,
+    а весь граф занимает два компактных массива. Номера компонент сильной связности
+    (из любой локации компоненты можно дойти до любой другой и вернуться) считаются при построении.
+    """
+    __slots__ = ("_ids", "_index", "_offsets", "_targets", "_labels", "_components", "_component_count")
+
+    def __init__(self, ids: Tuple[str, ...], offsets: array, targets: array, labels: Tuple[str, ...]):
+        self._ids = ids
+        self._index: Dict[str, int] = {location_id: i for i, location_id in enumerate(ids)}
+        self._offsets = offsets
+        self._targets = targets
+        self._labels = labels
+        self._components, self._component_count = self._strongly_connected_components()
+
+    @classmethod
+    def from_connections(cls, connections: Iterable[Dict[str, Any]]) -> "LocationGraphIndex":
+        """
+        Строит индекс из связей в формате LocationConnectionData.model_dump(by_alias=True):
+        {"from": ..., "to": ..., "description": ...}. Повторяющиеся связи схлопываются.
+        """
+        ids: List[str] = []
+        index: Dict[str, int] = {}
+
+        def intern(location_id: Any) -> int:
+            key = str(location_id)
+            position = index.get(key)
+            if position is None:
+                position = index[key] = len(ids)
+                ids.append(key)
+            return position
+
+        edges: Dict[Tuple[int, int], str] = {}
+        for connection in connections:
+            source = connection.get("from", connection.get("from_location"))
+            target = connection.get("to", connection.get("to_location"))
+            if source is None or target is None:
+                continue
+            edges.setdefault((intern(source), intern(target)), connection.get("description") or "")
+
+        # Сортировка по (источник, цель) раскладывает рёбра по строкам CSR.
+        ordered = sorted(edges.items())
+        offsets = array("i", [0] * (len(ids) + 1))
+        for (source, _), _ in ordered:
+            offsets[source + 1] += 1
+        for i in range(len(ids)):
+            offsets[i + 1] += offsets[i]
+        targets = array("i", (target for (_, target), _ in ordered))
+        labels = tuple(label for _, label in ordered)
+        return cls(tuple(ids), offsets, targets, labels)
+
+    # --- Базовые запросы ---
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, location_id: Any) -> bool:
+        return str(location_id) in self._index
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._targets)
+
+    @property
+    def location_ids(self) -> Tuple[str, ...]:
+        return self._ids
+
+    def neighbours(self, location_id: Any) -> Tuple[str, ...]:
+        """ID локаций, куда ведут выходы из location_id."""
+        i = self._index.get(str(location_id))
+        if i is None:
+            return ()
+        return tuple(self._ids[t] for t in self._targets[self._offsets[i]:self._offsets[i + 1]])
+
+    def exits(self, location_id: Any) -> Tuple[Tuple[str, str], ...]:
+        """Выходы из location_id: (ID цели, описание)."""
+        i = self._index.get(str(location_id))
+        if i is None:
+            return ()
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return tuple((self._ids[self._targets[e]], self._labels[e]) for e in range(start, end))
+
+    def has_exit(self, from_location_id: Any, to_location_id: Any) -> bool:
+        source = self._index.get(str(from_location_id))
+        target = self._index.get(str(to_location_id))
+        if source is None or target is None:
+            return False
+        return target in self._targets[self._offsets[source]:self._offsets[source + 1]]
+
+    # --- Пути ---
+
+    def shortest_path(self, from_location_id: Any, to_location_id: Any) -> Optional[List[str]]:
+        """Кратчайший по числу переходов путь (BFS), включая начальную и конечную локации. None — пути нет."""
+        source = self._index.get(str(from_location_id))
+        goal = self._index.get(str(to_location_id))
+        if source is None or goal is None:
+            return None
+        if source == goal:
+            return [self._ids[source]]
+
+        parents = array("i", [-1] * len(self._ids))
+        parents[source] = source
+        queue = deque((source,))
+        offsets, targets = self._offsets, self._targets
+        while queue:
+            node = queue.popleft()
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if parents[target] != -1:
+                    continue
+                parents[target] = node
+                if target == goal:
+                    return self._unwind(parents, source, goal)
+                queue.append(target)
+        return None
+
+    def find_path(
+        self,
+        from_location_id: Any,
+        to_location_id: Any,
+        heuristic: Optional[Callable[[str], float]] = None,
+        edge_cost: Optional[Callable[[str, str], float]] = None,
+    ) -> Optional[Tuple[List[str], float]]:
+        """
+        Путь A*: (локации пути, стоимость). edge_cost(откуда, куда) — стоимость перехода (по умолчанию 1),
+        heuristic(локация) — допустимая (не завышающая) оценка остатка пути до цели (по умолчанию 0).
+        Без обоих параметров результат совпадает с shortest_path.
+        """
+        source = self._index.get(str(from_location_id))
+        goal = self._index.get(str(to_location_id))
+        if source is None or goal is None:
+            return None
+
+        ids, offsets, targets = self._ids, self._offsets, self._targets
+        estimate = (lambda i: heuristic(ids[i])) if heuristic else (lambda i: 0.0)
+        best: Dict[int, float] = {source: 0.0}
+        parents = array("i", [-1] * len(ids))
+        parents[source] = source
+        closed = bytearray(len(ids))
+        heap: List[Tuple[float, float, int]] = [(estimate(source), 0.0, source)]
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if closed[node]:
+                continue
+            if node == goal:
+                return self._unwind(parents, source, goal), cost
+            closed[node] = 1
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if closed[target]:
+                    continue
+                step = edge_cost(ids[node], ids[target]) if edge_cost else 1.0
+                new_cost = cost + step
+                if new_cost < best.get(target, float("inf")):
+                    best[target] = new_cost
+                    parents[target] = node
+                    heapq.heappush(heap, (new_cost + estimate(target), new_cost, target))
+        return None
+
+    def reachable_within(self, from_location_id: Any, max_steps: int) -> Dict[str, int]:
+        """Локации, достижимые не более чем за max_steps переходов: {ID: число переходов}. Включает начальную."""
+        source = self._index.get(str(from_location_id))
+        if source is None or max_steps < 0:
+            return {}
+        distances = array("i", [-1] * len(self._ids))
+        distances[source] = 0
+        result = {self._ids[source]: 0}
+        queue = deque((source,))
+        offsets, targets = self._offsets, self._targets
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]
+            if distance >= max_steps:
+                continue
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if distances[target] == -1:
+                    distances[target] = distance + 1
+                    result[self._ids[target]] = distance + 1
+                    queue.append(target)
+        return result
+
+    # --- Компоненты связности ---
+
+    @property
+    def component_count(self) -> int:
+        return self._component_count
+
+    def component_of(self, location_id: Any) -> Optional[int]:
+        """Номер компоненты сильной связности локации."""
+        i = self._index.get(str(location_id))
+        return None if i is None else self._components[i]
+
+    def are_mutually_reachable(self, first_location_id: Any, second_location_id: Any) -> bool:
+        """Можно ли дойти из одной локации в другую и вернуться обратно (O(1))."""
+        first = self.component_of(first_location_id)
+        return first is not None and first == self.component_of(second_location_id)
+
+    def components(self) -> List[List[str]]:
+        """Компоненты сильной связности, от больших к меньшим."""
+        grouped: List[List[str]] = [[] for _ in range(self._component_count)]
+        for i, component in enumerate(self._components):
+            grouped[component].append(self._ids[i])
+        return sorted(grouped, key=len, reverse=True)
+
+    # --- Внутреннее ---
+
+    def _unwind(self, parents: array, source: int, goal: int) -> List[str]:
+        path = [goal]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+        return [self._ids[i] for i in reversed(path)]
+
+    def _strongly_connected_components(self) -> Tuple[array, int]:
+        """Итеративный алгоритм Тарьяна (без рекурсии: глубина графа не ограничена стеком Python)."""
+        n = len(self._ids)
+        offsets, targets = self._offsets, self._targets
+        order = array("i", [-1] * n)
+        low = array("i", [0] * n)
+        components = array("i", [-1] * n)
+        on_stack = bytearray(n)
+        stack: List[int] = []
+        counter = 0
+        component_count = 0
+
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            work: List[Tuple[int, int]] = [(root, offsets[root])]
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while work:
+                node, edge = work[-1]
+                if edge < offsets[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    target = targets[edge]
+                    if order[target] == -1:
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        work.append((target, offsets[target]))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], order[target])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        components[member] = component_count
+                        if member == node:
+                            break
+                    component_count += 1
+        return components, component_count
+
+
+class LocationGraphService:
+    """
+    Держит в памяти процесса LocationGraphIndex, построенный из связей локаций в Redis
+    (REDIS_KEY_WORLD_CONNECTIONS). Индекс перестраивается при перезагрузке связей
+    (rebuild) и сверяется с Redis не чаще раза в LOCATION_GRAPH_REFRESH_SECONDS —
+    на случай, если перезагрузку выполнил другой процесс.
+    """
+    @inject.autoparams()
+    def __init__(self, reference_data_reader: IReferenceDataReader, logger: logging.Logger):
+        self.reference_data_reader = reference_data_reader
+        self.logger = logger
+        self._index: Optional[LocationGraphIndex] = None
+        self._source: Optional[List[Dict[str, Any]]] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self.logger.info("✅ LocationGraphService инициализирован.")
+
+    async def get_index(self) -> LocationGraphIndex:
+        """Актуальный индекс графа (при первом обращении строится из Redis)."""
+        if self._index is None or time.monotonic() - self._checked_at >= LOCATION_GRAPH_REFRESH_SECONDS:
+            await self.rebuild(force=False)
+        return self._index
+
+    async def rebuild(self, force: bool = True) -> LocationGraphIndex:
+        """
+        Перечитывает связи из Redis и перестраивает индекс.
+        Без force индекс перестраивается, только если связи изменились.
+        """
+        async with self._lock:
+            connections = await self.reference_data_reader.get_world_connections_data() or []
+            self._checked_at = time.monotonic()
+            if not force and self._index is not None and connections == self._source:
+                return self._index
+
+            index = LocationGraphIndex.from_connections(connections)
+            # Замена одним присваиванием: читатели видят либо старый, либо новый индекс целиком.
+            self._index = index
+            self._source = connections
+            self.logger.info(
+                f"🗺️ LocationGraphService: граф перестроен — {len(index)} локаций, {index.edge_count} выходов, "
+                f"компонент сильной связности: {index.component_count}."
+            )
+            return index
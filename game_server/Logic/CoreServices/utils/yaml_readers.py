@@ -1,23 +1,34 @@
 # game_server/utils/load_seeds/yaml_readers.py
 
+import asyncio
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Sequence, Tuple
 from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.config.settings.process.prestart import YAML_PARSE_CONCURRENCY
+
+# C-ускоренный загрузчик (libyaml), если PyYAML собран с ним; иначе чистый Python.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml_file(file_path: Path) -> Any:
+    with open(str(file_path), 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlSafeLoader)
+
 
 class YamlReader:
     @staticmethod
     async def read_and_parse_yaml(file_path: Path) -> Optional[Dict[str, Any]]:
         """
         Базовая функция для чтения и парсинга YAML-файла.
+        Чтение и парсинг выполняются в пуле потоков, чтобы не блокировать event loop.
         В случае ошибки возвращает None и логирует проблему.
         """
         try:
             logger.info(f"📂 Чтение YAML-файла: {file_path.name}")
-            with open(str(file_path), 'r', encoding='utf-8') as f:
-                loaded_data = yaml.safe_load(f)
-                logger.info(f"✅ Успешно загружены данные из '{file_path.name}'.")
-                return loaded_data
+            loaded_data = await asyncio.to_thread(_parse_yaml_file, file_path)
+            logger.info(f"✅ Успешно загружены данные из '{file_path.name}'.")
+            return loaded_data
         except FileNotFoundError:
             logger.error(f"❌ Файл не найден: {file_path}")
             return None
@@ -28,6 +39,24 @@ class YamlReader:
             logger.error(f"❌ Неизвестная ошибка при чтении {file_path}: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    async def iter_parsed_yaml(
+        file_paths: Sequence[Path],
+        max_concurrency: int = YAML_PARSE_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[Path, Optional[Dict[str, Any]]]]:
+        """
+        Парсит файлы параллельно (не более max_concurrency одновременно) и отдаёт
+        пары (путь, данные) по мере готовности, а не в исходном порядке.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _read(path: Path) -> Tuple[Path, Optional[Dict[str, Any]]]:
+            async with semaphore:
+                return path, await YamlReader.read_and_parse_yaml(path)
+
+        for next_done in asyncio.as_completed([_read(path) for path in file_paths]):
+            yield await next_done
+
     @staticmethod
     async def get_items_from_yaml(file_path: Path, pk_column_name: str) -> List[Dict[str, Any]]:
         """
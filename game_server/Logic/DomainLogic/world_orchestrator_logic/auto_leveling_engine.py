@@ -0,0 +1,124 @@
+# game_server/Logic/DomainLogic/world_orchestrator_logic/auto_leveling_engine.py
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from game_server.config.constants.game_rules import SKILL_XP_PER_LEVEL
+
+
+# Строка тика, как её отдаёт IXpTickDataRepository.get_xp_ticks_with_skill_state:
+# (tick_id, character_id, skill_key, xp_generated, level, xp, progress_state, max_level).
+# Тик без навыка у персонажа приходит с level = -1.
+XpTickRow = Tuple[int, int, str, int, int, int, str, int]
+
+PROGRESS_PLUS = "PLUS"
+PROGRESS_MINUS = "MINUS"
+
+
+def build_cumulative_xp_table(xp_per_level: Dict[int, int] = SKILL_XP_PER_LEVEL) -> np.ndarray:
+    """
+    Суммарный опыт, необходимый для каждого уровня: table[L] — опыт для уровня L, table[0] = 0.
+    Уровень по опыту — последний L, для которого table[L] <= xp (np.searchsorted).
+    """
+    top_level = max(xp_per_level) if xp_per_level else 0
+    per_level = np.array([xp_per_level.get(level, 0) for level in range(1, top_level + 1)], dtype=np.int64)
+    return np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(per_level)))
+
+
+@dataclass(frozen=True)
+class AutoLevelingResult:
+    """
+    Результат расчёта тика автопрокачки в колоночном виде.
+    Строки character_ids/skill_keys/levels/xps — только навыки, у которых изменились уровень или опыт.
+    """
+    consumed_tick_ids: List[int]
+    character_ids: List[int]
+    skill_keys: List[str]
+    levels: List[int]
+    xps: List[int]
+    level_ups: int
+    level_downs: int
+    orphan_ticks: int
+
+    @property
+    def updated_skills(self) -> int:
+        return len(self.character_ids)
+
+
+def compute_auto_leveling(rows: Sequence[XpTickRow], cumulative_xp: np.ndarray) -> AutoLevelingResult:
+    """
+    Применяет тики опыта к навыкам персонажей целиком на массивах, без цикла по персонажам.
+
+    - Тики одного навыка персонажа суммируются.
+    - progress_state навыка задаёт знак: PLUS — опыт растёт, MINUS — убывает (навык деградирует,
+      уровень может понизиться), PAUSE — тики поглощаются без эффекта.
+    - xp в character_skills — суммарный опыт навыка. Если он меньше порога текущего уровня
+      (навык выдан сразу с уровнем), расчёт ведётся от порога уровня.
+    - Уровень ограничен max_level навыка и таблицей SKILL_XP_PER_LEVEL; опыт сверх порога
+      максимального уровня не копится.
+    - Тики навыков, которых у персонажа нет, поглощаются и учитываются в orphan_ticks.
+    """
+    if not rows:
+        return AutoLevelingResult([], [], [], [], [], 0, 0, 0)
+
+    tick_ids, character_ids, skill_keys, gains, levels, xps, states, max_levels = zip(*rows)
+    consumed_tick_ids = list(tick_ids)
+
+    level = np.fromiter(levels, dtype=np.int64, count=len(rows))
+    valid = level >= 0
+    orphan_ticks = int(np.count_nonzero(~valid))
+    if not valid.any():
+        return AutoLevelingResult(consumed_tick_ids, [], [], [], [], 0, 0, orphan_ticks)
+
+    character = np.fromiter(character_ids, dtype=np.int64, count=len(rows))[valid]
+    skill = np.array(skill_keys, dtype=str)[valid]
+    gain = np.fromiter(gains, dtype=np.int64, count=len(rows))[valid]
+    level = level[valid]
+    xp = np.fromiter(xps, dtype=np.int64, count=len(rows))[valid]
+    state = np.array(states, dtype=str)[valid]
+    max_level = np.fromiter(max_levels, dtype=np.int64, count=len(rows))[valid]
+
+    # Группировка тиков по (персонаж, навык): сортировка и суммирование отрезков одной пары.
+    _, skill_code = np.unique(skill, return_inverse=True)
+    order = np.lexsort((skill_code, character))
+    character, skill_code = character[order], skill_code[order]
+    is_start = np.ones(len(order), dtype=bool)
+    is_start[1:] = (character[1:] != character[:-1]) | (skill_code[1:] != skill_code[:-1])
+    starts = np.flatnonzero(is_start)
+
+    total_gain = np.add.reduceat(gain[order], starts)
+    first = order[starts]
+    group_character = character[starts]
+    group_skill = skill[first]
+    old_level, old_xp, group_state = level[first], xp[first], state[first]
+
+    top_level = len(cumulative_xp) - 1
+    cap_level = np.clip(max_level[first], 0, top_level)
+    sign = np.select([group_state == PROGRESS_PLUS, group_state == PROGRESS_MINUS], [1, -1], 0)
+
+    base_xp = np.maximum(old_xp, cumulative_xp[np.clip(old_level, 0, top_level)])
+    new_xp = base_xp + sign * total_gain
+    # Рост ограничен порогом максимального уровня (но уже накопленное не отнимается).
+    new_xp = np.where(sign > 0, np.minimum(new_xp, np.maximum(cumulative_xp[cap_level], base_xp)), new_xp)
+    new_xp = np.maximum(new_xp, 0)
+    new_level = np.minimum(np.searchsorted(cumulative_xp, new_xp, side="right") - 1, cap_level)
+    # Навык, уже стоящий выше предела, не понижается ростом опыта.
+    new_level = np.where(sign > 0, np.maximum(new_level, old_level), new_level)
+    # PAUSE: навык не трогаем.
+    paused = sign == 0
+    new_xp = np.where(paused, old_xp, new_xp)
+    new_level = np.where(paused, old_level, new_level)
+
+    changed = (new_xp != old_xp) | (new_level != old_level)
+    return AutoLevelingResult(
+        consumed_tick_ids=consumed_tick_ids,
+        character_ids=group_character[changed].tolist(),
+        skill_keys=group_skill[changed].tolist(),
+        levels=new_level[changed].tolist(),
+        xps=new_xp[changed].tolist(),
+        level_ups=int(np.count_nonzero(new_level > old_level)),
+        level_downs=int(np.count_nonzero(new_level < old_level)),
+        orphan_ticks=orphan_ticks,
+    )
@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 import uuid
 import msgpack
 import redis.asyncio as redis_asyncio
@@ -10,6 +10,9 @@ import datetime # Импортирован для обработки datetime в
 
 
 from game_server.config.settings_core import REDIS_PASSWORD, REDIS_POOL_SIZE, REDIS_URL
+from game_server.utils import redis_scan
+from game_server.utils.metrics import instrument_redis_client
+from game_server.utils.redis_scan import DEFAULT_SCAN_COUNT
 
 
 class CentralRedisClient:
@@ -58,6 +61,10 @@ class CentralRedisClient:
                     socket_connect_timeout=5,
                 )
 
+                # Каждая команда и пайплайн попадают в метрики storage_call_latency_seconds{backend="redis"}.
+                instrument_redis_client(self.redis, backend="redis")
+                instrument_redis_client(self.redis_raw, backend="redis")
+
                 await self.redis.ping()
                 await self.redis_raw.ping()
                 self.logger.info(f"✅ Подключение к центральному Redis успешно установлено: {self._redis_url}")
@@ -168,14 +175,17 @@ class CentralRedisClient:
         encoded_keys = [k.encode('utf-8') for k in keys] # Кодируем ключи
         return await self.redis_raw.exists(*encoded_keys)
 
-    async def keys(self, pattern: str = "*") -> List[str]:
+    async def keys(self, pattern: str = "*", count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> List[str]:
         """
         Получает ключи, соответствующие паттерну.
-        Использует self.redis_raw и декодирует вручную, чтобы избежать UnicodeDecodeError.
+        Реализовано через SCAN (KEYS блокирует сервер на время обхода всего пространства ключей);
+        для больших выборок используйте scan_iter/scan_batches, не собирающие результат в память.
         """
         if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return []
-        raw_keys = await self.redis_raw.keys(pattern.encode('utf-8')) # Паттерн тоже кодируем
-        return [k.decode('utf-8', errors='ignore') for k in raw_keys]
+        result: List[str] = []
+        async for batch in self.scan_batches(pattern, count=count, type_=type_):
+            result.extend(batch)
+        return result
         
     async def mget(self, keys: List[str]) -> List[Optional[str]]:
         """
@@ -187,14 +197,51 @@ class CentralRedisClient:
         raw_values = await self.redis_raw.mget(encoded_keys)      
         return [v.decode('utf-8', errors='ignore') if v is not None else None for v in raw_values]
     
-    async def scan_iter(self, pattern: str = "*", count: Optional[int] = None):
+    async def scan_iter(self, pattern: str = "*", count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> AsyncIterator[str]:
         """
-        Итерирует по ключам, соответствующим паттерну.
+        Итерирует по ключам, соответствующим паттерну (SCAN).
         Использует self.redis_raw и декодирует вручную.
         """
+        async for batch in self.scan_batches(pattern, count=count, type_=type_):
+            for key in batch:
+                yield key
+
+    async def scan_batches(self, pattern: str = "*", count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> AsyncIterator[List[str]]:
+        """Ключи под паттерн пачками по одному шагу SCAN; type_ — фильтр по типу значения."""
+        if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return
+        async for raw_batch in redis_scan.scan_key_batches(self.redis_raw, match=pattern.encode('utf-8'), count=count, type_=type_):
+            yield [k.decode('utf-8', errors='ignore') for k in raw_batch]
+
+    async def hscan_iter(self, name: str, match: Optional[str] = None, count: int = DEFAULT_SCAN_COUNT) -> AsyncIterator[Tuple[str, str]]:
+        """Курсорный обход хэша (HSCAN) без загрузки всех полей одним HGETALL."""
+        if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return
+        encoded_match = match.encode('utf-8') if match is not None else None
+        async for raw_items in redis_scan.hscan_batches(self.redis_raw, name.encode('utf-8'), match=encoded_match, count=count):
+            for k, v in raw_items.items():
+                yield k.decode('utf-8', errors='ignore'), v.decode('utf-8', errors='ignore')
+
+    async def sscan_iter(self, name: str, match: Optional[str] = None, count: int = DEFAULT_SCAN_COUNT) -> AsyncIterator[str]:
+        """Курсорный обход множества (SSCAN)."""
         if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return
-        async for key_bytes in self.redis_raw.scan_iter(pattern.encode('utf-8'), count=count): # Паттерн кодируем
-            yield key_bytes.decode('utf-8', errors='ignore')
+        encoded_match = match.encode('utf-8') if match is not None else None
+        async for raw_members in redis_scan.sscan_batches(self.redis_raw, name.encode('utf-8'), match=encoded_match, count=count):
+            for member in raw_members:
+                yield member.decode('utf-8', errors='ignore')
+
+    async def delete_by_pattern(self, pattern: str, count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> int:
+        """Удаляет ключи под паттерн: SCAN + UNLINK пачками. Возвращает число удалённых ключей."""
+        if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return 0
+        return await redis_scan.delete_matching(self.redis_raw, pattern.encode('utf-8'), count=count, type_=type_)
+
+    async def expire_by_pattern(self, pattern: str, ttl: int, count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> int:
+        """Выставляет TTL ключам под паттерн: SCAN + pipeline EXPIRE пачками."""
+        if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return 0
+        return await redis_scan.expire_matching(self.redis_raw, pattern.encode('utf-8'), ttl, count=count, type_=type_)
+
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Удаляет произвольное число ключей пачками (UNLINK), не собирая их в одну огромную команду."""
+        if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return 0
+        return await redis_scan.delete_keys(self.redis_raw, (k.encode('utf-8') for k in keys))
 
     async def rpush(self, key: str, *values: Any):
         if self.redis_raw is None: self.logger.error("Redis-соединение (сырое) не инициализировано."); return
@@ -1,7 +1,7 @@
 # game_server/Logic/InfrastructureLogic/app_cache/interfaces/interfaces_dinamic_location_manager.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 class IDynamicLocationManager(ABC):
     """
@@ -22,4 +22,19 @@ class IDynamicLocationManager(ABC):
         Получает хэш с сводными данными для указанной локации.
         Возвращает словарь в случае успеха или None, если ключ не найден.
         """
+        pass
+
+    @abstractmethod
+    async def get_location_summaries_for_push(
+        self, location_ids: Iterable[str]
+    ) -> Dict[str, Tuple[Dict[str, str], Dict[str, str]]]:
+        """
+        Для каждой локации возвращает (текущая сводка, сводка на момент последней отправки клиентам).
+        Читается одним pipeline.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_location_summaries_pushed(self, summaries: Dict[str, Dict[str, str]]) -> None:
+        """Запоминает сводки как отправленные клиентам."""
         pass
\ No newline at end of file
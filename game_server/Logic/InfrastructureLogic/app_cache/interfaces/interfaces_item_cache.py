@@ -14,4 +14,12 @@ class IItemCacheManager(ABC):
     async def delete_item_instance_data(self, item_uuid: str): pass
 
     @abstractmethod
-    async def get_multiple_item_instances_data(self, item_uuids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]: pass
\ No newline at end of file
+    async def get_multiple_item_instances_data(self, item_uuids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]: pass
+    @abstractmethod
+    async def set_multiple_item_instances_data(self, items: Dict[str, Dict[str, Any]], ttl_seconds: Optional[int] = None): pass
+
+    @abstractmethod
+    async def delete_multiple_item_instances_data(self, item_uuids: List[str]): pass
+
+    @abstractmethod
+    async def apply_item_instances_changes(self, upserts: Optional[Dict[str, Dict[str, Any]]] = None, deletes: Optional[List[str]] = None, ttl_seconds: Optional[int] = None): pass
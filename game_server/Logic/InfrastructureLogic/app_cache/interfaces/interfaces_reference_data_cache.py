@@ -26,6 +26,15 @@ class IReferenceDataCacheManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def reload_location_connections(self) -> bool:
+        """
+        Перечитывает связи между локациями из YAML и перезаписывает их в Redis.
+        Returns:
+            bool: True, если связи загружены и записаны.
+        """
+        pass
+
     # Все остальные абстрактные методы, которые ранее были здесь (такие как _perform_caching,
     # _cache_from_db_with_version_check, _cache_item_base_from_yaml, cache_all_reference_data),
     # удалены, так как они относятся к логике ЗАГРУЗКИ данных, а не кэширования.
@@ -32,4 +32,7 @@ class IReferenceDataReader(ABC):
     async def get_all_personalities(self) -> Dict[str, Any]: pass
 
     @abstractmethod
-    async def get_all_inventory_rules(self) -> Dict[str, Any]: pass
\ No newline at end of file
+    async def get_all_inventory_rules(self) -> Dict[str, Any]: pass
+
+    @abstractmethod
+    async def get_world_connections_data(self) -> List[Dict[str, Any]]: pass
\ No newline at end of file
@@ -8,6 +8,7 @@ import inject
 
 from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
 from game_server.config.settings.redis_setting import DEFAULT_TTL_CHARACTER_SNAPSHOT_OFFLINE, DEFAULT_TTL_CHARACTER_SNAPSHOT_ONLINE
+from game_server.utils.metrics import record_cache_lookup
 from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_character_cache import ICharacterCacheManager
 
 # 🔥 ИЗМЕНЕНИЕ: Импортируем новые, структурированные ключи
@@ -40,6 +41,7 @@ class CharacterCacheManager(ICharacterCacheManager):
         key = KEY_CHARACTER_DATA.format(account_id=account_id, character_id=character_id)
         # Получаем значение поля 'snapshot' из Hash'а
         snapshot_str = await self.redis.hget(key, FIELD_CHARACTER_SNAPSHOT)
+        record_cache_lookup("character_snapshot", bool(snapshot_str))
         if snapshot_str:
             logger.debug(f"Получен снапшот персонажа {character_id} (аккаунт {account_id}) из Redis.")
             return json.loads(snapshot_str)
@@ -7,6 +7,7 @@ import inject # 🔥 ДОБАВЛЕНО: Импортируем inject
 
 from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
 from game_server.config.settings.redis_setting import DEFAULT_TTL_ITEM_INSTANCE_CACHE
+from game_server.utils.metrics import record_cache_lookup
 from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_item_cache import IItemCacheManager
 
 # 🔥 ИЗМЕНЕНИЕ: Импортируем новые, структурированные ключи
@@ -32,6 +33,7 @@ class ItemCacheManager(IItemCacheManager):
         key = KEY_ITEM_INSTANCE_DATA.format(item_uuid=item_uuid)
         # 🔥 ИЗМЕНЕНИЕ: Получаем конкретное поле 'data' из Hash
         item_data_str = await self.redis.hget(key, FIELD_ITEM_INSTANCE_DATA)
+        record_cache_lookup("item_instance", bool(item_data_str))
         
         if item_data_str:
             logger.debug(f"Получены данные экземпляра предмета {item_uuid} из Redis.")
@@ -73,6 +75,7 @@ class ItemCacheManager(IItemCacheManager):
         items_map = {}
         for i, data_str in enumerate(results):
             item_uuid = item_uuids[i]
+            record_cache_lookup("item_instance", bool(data_str))
             if data_str:
                 try:
                     items_map[item_uuid] = json.loads(data_str)
@@ -84,3 +87,37 @@ class ItemCacheManager(IItemCacheManager):
         
         logger.debug(f"Получены данные для {len(items_map)} из {len(item_uuids)} запрошенных предметов.")
         return items_map
+
+    async def set_multiple_item_instances_data(self, items: Dict[str, Dict[str, Any]], ttl_seconds: Optional[int] = DEFAULT_TTL_ITEM_INSTANCE_CACHE):
+        """Сохраняет данные нескольких экземпляров предметов за один запрос к Redis (HSET + EXPIRE в pipeline)."""
+        await self.apply_item_instances_changes(upserts=items, ttl_seconds=ttl_seconds)
+
+    async def delete_multiple_item_instances_data(self, item_uuids: List[str]):
+        """Удаляет данные нескольких экземпляров предметов за один запрос к Redis."""
+        await self.apply_item_instances_changes(deletes=item_uuids)
+
+    async def apply_item_instances_changes(
+        self,
+        upserts: Optional[Dict[str, Dict[str, Any]]] = None,
+        deletes: Optional[List[str]] = None,
+        ttl_seconds: Optional[int] = DEFAULT_TTL_ITEM_INSTANCE_CACHE
+    ):
+        """
+        Применяет к кэшу пачку изменений предметов одним pipeline (MULTI/EXEC):
+        записывает upserts и удаляет deletes. Читатели видят либо старое, либо новое состояние всей пачки.
+        """
+        if not upserts and not deletes:
+            return
+
+        pipe = self.redis.pipeline()
+        for item_uuid, item_data in (upserts or {}).items():
+            key = KEY_ITEM_INSTANCE_DATA.format(item_uuid=item_uuid)
+            pipe.hset(key, FIELD_ITEM_INSTANCE_DATA, json.dumps(item_data))
+            if ttl_seconds is not None:
+                pipe.expire(key, ttl_seconds)
+        if deletes:
+            pipe.unlink(*(KEY_ITEM_INSTANCE_DATA.format(item_uuid=item_uuid) for item_uuid in deletes))
+        await pipe.execute()
+        logger.debug(
+            f"Кэш предметов обновлён одним pipeline: записано {len(upserts or {})}, удалено {len(deletes or [])}."
+        )
@@ -2,11 +2,12 @@
 
 import logging
 import inject
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
 from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_dinamic_location_manager import IDynamicLocationManager
-from game_server.config.constants.redis_key.location_dinamic import LOCATION_SUMMARY_HASH
+from game_server.config.constants.redis_key.location_dinamic import LOCATION_SUMMARY_HASH, LOCATION_SUMMARY_PUSHED_HASH
+from game_server.utils.metrics import record_cache_lookup
 
 
 
@@ -44,6 +45,7 @@ class DynamicLocationManager(IDynamicLocationManager):
         try:
             redis_key = LOCATION_SUMMARY_HASH.format(location_id=location_id)
             summary_data = await self._redis.redis.hgetall(redis_key)
+            record_cache_lookup("location_summary", bool(summary_data))
             
             if not summary_data:
                 self._logger.warning(f"Кэш для локации {location_id} (ключ: {redis_key}) не найден или пуст.")
@@ -53,4 +55,37 @@ class DynamicLocationManager(IDynamicLocationManager):
             return summary_data
         except Exception as e:
             self._logger.error(f"Ошибка при чтении кэша локации {location_id}: {e}", exc_info=True)
-            return None
\ No newline at end of file
+            return None
+
+    async def get_location_summaries_for_push(
+        self, location_ids: Iterable[str]
+    ) -> Dict[str, Tuple[Dict[str, str], Dict[str, str]]]:
+        """
+        Читает текущие и последние отправленные сводки всех локаций одним pipeline.
+        """
+        location_ids = list(location_ids)
+        if not location_ids:
+            return {}
+        async with self._redis.redis.pipeline(transaction=False) as pipe:
+            for location_id in location_ids:
+                pipe.hgetall(LOCATION_SUMMARY_HASH.format(location_id=location_id))
+                pipe.hgetall(LOCATION_SUMMARY_PUSHED_HASH.format(location_id=location_id))
+            results = await pipe.execute()
+        return {
+            location_id: (results[2 * i] or {}, results[2 * i + 1] or {})
+            for i, location_id in enumerate(location_ids)
+        }
+
+    async def mark_location_summaries_pushed(self, summaries: Dict[str, Dict[str, str]]) -> None:
+        """
+        Перезаписывает копии отправленных сводок одним pipeline (DEL + HSET на каждую локацию).
+        """
+        if not summaries:
+            return
+        async with self._redis.redis.pipeline(transaction=False) as pipe:
+            for location_id, summary in summaries.items():
+                pushed_key = LOCATION_SUMMARY_PUSHED_HASH.format(location_id=location_id)
+                pipe.delete(pushed_key)
+                if summary:
+                    pipe.hset(pushed_key, mapping=summary)
+            await pipe.execute()
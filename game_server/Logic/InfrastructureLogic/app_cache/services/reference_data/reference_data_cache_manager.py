@@ -9,6 +9,7 @@ import inject # 🔥 КРИТИЧЕСКИ ВАЖНО: Убедитесь, что
 
 from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
 from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_reference_data_cache import IReferenceDataCacheManager
+from game_server.config.constants.redis_key.reference_data_keys import REDIS_KEY_WORLD_CONNECTIONS
 # 🔥 УДАЛЕНО: from game_server.config.logging.logging_setup import app_logger as logger (логгер будет инжектирован)
 
 # DataVersionManager здесь не нужен, так как логика хэширования перенесена в ReferenceDataLoader
@@ -92,6 +93,19 @@ class ReferenceDataCacheManager(IReferenceDataCacheManager):
             self.logger.critical(f"🚨 Критическая ошибка при кэшировании {model_name} данных: {e}", exc_info=True)
             raise
 
+    async def reload_location_connections(self) -> bool:
+        """
+        Перечитывает связи между локациями из YAML и перезаписывает список в REDIS_KEY_WORLD_CONNECTIONS.
+        """
+        # Загрузчик YAML живёт в слое приложения и сам зависит от инфраструктуры — импорт в момент вызова.
+        from game_server.Logic.ApplicationLogic.world_orchestrator.workers.load_kesh_database.load_seeds.generic_redis.location_connections_loader import LocationConnectionsLoader
+
+        connections = await LocationConnectionsLoader().load_all()
+        if not connections:
+            self.logger.error("❌ Перезагрузка связей локаций: YAML не вернул ни одной связи, кэш не изменён.")
+            return False
+        return await self.cache_data_with_prep(REDIS_KEY_WORLD_CONNECTIONS, connections, "LocationConnections", is_hash=False)
+
     # Метод get_cached_data, который был здесь, должен быть в ReferenceDataReader,
     # так как он отвечает за чтение. ReferenceDataReader уже существует.
 
@@ -8,6 +8,7 @@ import inject
 import msgpack
 
 from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
+from game_server.utils.metrics import record_cache_lookup
 
 
 from pydantic import BaseModel
@@ -73,6 +74,7 @@ class ReferenceDataReader(IReferenceDataReader):
                 cached_data = await self.redis.hgetall_msgpack(redis_key)
             else:
                 cached_data = await self.redis.get_msgpack(redis_key)
+            record_cache_lookup("reference_data", bool(cached_data))
             
             if cached_data:
                 self.logger.debug(f"Кэшированные данные для '{redis_key}' найдены.")
@@ -169,6 +171,7 @@ class ReferenceDataReader(IReferenceDataReader):
 
     async def get_by_id_from_hash(self, redis_key: str, item_id: str) -> Optional[Any]:
         raw_value = await self.redis.hget(redis_key, item_id)
+        record_cache_lookup("reference_data", bool(raw_value))
         if raw_value:
             try:
                 # Предполагаем, что значение закодировано в msgpack
@@ -5,6 +5,9 @@ from typing import Dict, Any
 
 # Импортируем функции для работы с клиентом MongoDB
 from game_server.Logic.InfrastructureLogic.app_mongo.mongo_client import get_mongo_database, init_mongo_client, close_mongo_client # 🔥 ДОБАВЛЕНО: close_mongo_client
+from game_server.Logic.InfrastructureLogic.app_mongo.mongo_indexes import bootstrap_mongo_indexes
+from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.character_cache.mongo_character_cache_repository_impl import MongoCharacterCacheRepositoryImpl
+from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.world_state_repository_mongo_impl import MongoLocationStateRepositoryImpl, MongoWorldSnapshotRepositoryImpl, MongoWorldStateRepositoryImpl
 
 # 🔥 УДАЛЕНО: Импорты интерфейсов и реализаций репозиториев больше не нужны здесь,
 # так как они используются только в DI-модулях для связывания.
@@ -12,6 +15,15 @@ from game_server.Logic.InfrastructureLogic.app_mongo.mongo_client import get_mon
 # from .repository_groups.world_state.world_state_repository_mongo_impl import MongoWorldStateRepositoryImpl, MongoLocationStateRepositoryImpl
 
 from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.config.settings_core import MONGO_ENSURE_INDEXES, MONGO_VERIFY_QUERY_PLANS
+
+# Репозитории, чьи объявления индексов (INDEX_DECLARATION) применяются при старте.
+_INDEXED_REPOSITORIES = (
+    MongoWorldStateRepositoryImpl,
+    MongoLocationStateRepositoryImpl,
+    MongoWorldSnapshotRepositoryImpl,
+    MongoCharacterCacheRepositoryImpl,
+)
 
 # 🔥 УДАЛЕНО: Глобальный словарь для хранения экземпляров репозиториев больше не нужен.
 # _initialized_repositories: Dict[str, Any] = {}
@@ -25,6 +37,14 @@ async def initialize_mongo_repositories() -> bool:
     try:
         # 🔥 ИЗМЕНЕНИЕ: Вызываем инициализацию клиента MongoDB
         await init_mongo_client()
+
+        if MONGO_ENSURE_INDEXES or MONGO_VERIFY_QUERY_PLANS:
+            await bootstrap_mongo_indexes(
+                get_mongo_database(),
+                [repo.INDEX_DECLARATION for repo in _INDEXED_REPOSITORIES if repo.INDEX_DECLARATION],
+                ensure_indexes=MONGO_ENSURE_INDEXES,
+                verify_plans=MONGO_VERIFY_QUERY_PLANS,
+            )
         
         # � УДАЛЕНО: Логика создания и сохранения экземпляров репозиториев перенесена в DI-контейнер.
         # db = get_mongo_database()
@@ -3,11 +3,16 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 from typing import Optional, Dict, Any, List
 
+from game_server.Logic.InfrastructureLogic.app_mongo.mongo_indexes import MongoCollectionIndexes
+
 class BaseMongoRepository:
     """
     Базовый класс для всех репозиториев MongoDB.
     Содержит универсальные CRUD-методы.
     """
+    # Индексы и горячие запросы коллекции; создаются и проверяются при старте (app_mongo_initializer).
+    INDEX_DECLARATION: Optional[MongoCollectionIndexes] = None
+
     def __init__(self, db: AsyncIOMotorDatabase, collection_name: str):
         """
         При инициализации мы получаем клиент базы данных и имя коллекции.
@@ -7,6 +7,7 @@ from game_server.config.logging.logging_setup import app_logger as logger
 
 # Импортируем настройки MongoDB из settings_core
 from game_server.config.settings_core import MONGO_URI, MONGO_DB_NAME # ДОБАВЛЕНО
+from game_server.utils.metrics import create_mongo_command_listener
 
 
 
@@ -22,7 +23,7 @@ async def init_mongo_client():
     global mongo_client, mongo_database
     try:
         # Создаем асинхронный клиент Motor
-        mongo_client = AsyncIOMotorClient(MONGO_URI)
+        mongo_client = AsyncIOMotorClient(MONGO_URI, event_listeners=[create_mongo_command_listener()])
         
         # Проверяем подключение, выполнив простую команду ping
         await mongo_client.admin.command('ping')
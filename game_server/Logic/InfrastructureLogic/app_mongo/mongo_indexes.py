@@ -0,0 +1,166 @@
+# game_server/Logic/InfrastructureLogic/app_mongo/mongo_indexes.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure, PyMongoError
+
+from game_server.config.logging.logging_setup import app_logger as logger
+
+
+# Коды ошибок createIndexes: индекс с тем же именем/ключами уже существует с другими опциями.
+_INDEX_CONFLICT_CODES = {85, 86}
+
+
+@dataclass(frozen=True)
+class MongoIndexSpec:
+    """
+    Индекс, который требуется репозиторию. Создаётся идемпотентно при старте приложения.
+    """
+    name: str
+    keys: Tuple[Tuple[str, int], ...]
+    unique: bool = False
+    sparse: bool = False
+    partial_filter: Optional[Dict[str, Any]] = None
+    expire_after_seconds: Optional[int] = None
+
+    def to_index_model(self) -> IndexModel:
+        options: Dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.sparse:
+            options["sparse"] = True
+        if self.partial_filter:
+            options["partialFilterExpression"] = self.partial_filter
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return IndexModel(list(self.keys), **options)
+
+
+@dataclass(frozen=True)
+class MongoHotQuery:
+    """
+    Горячий запрос репозитория: при старте для него выполняется explain,
+    и полный просмотр коллекции (COLLSCAN) в выигравшем плане попадает в лог.
+    Значения фильтра — заглушки нужного типа, на выбор плана они не влияют.
+    """
+    name: str
+    filter: Dict[str, Any]
+    sort: Optional[Sequence[Tuple[str, int]]] = None
+
+
+@dataclass(frozen=True)
+class MongoCollectionIndexes:
+    """Индексы и горячие запросы одной коллекции, как их объявляет репозиторий."""
+    collection_name: str
+    indexes: Tuple[MongoIndexSpec, ...] = ()
+    hot_queries: Tuple[MongoHotQuery, ...] = ()
+
+
+def asc(*fields: str) -> Tuple[Tuple[str, int], ...]:
+    """Ключи индекса по возрастанию для перечисленных полей."""
+    return tuple((name, ASCENDING) for name in fields)
+
+
+async def ensure_collection_indexes(db: AsyncIOMotorDatabase, declaration: MongoCollectionIndexes) -> List[str]:
+    """
+    Создаёт объявленные индексы коллекции. Повторный вызов ничего не меняет.
+    Индекс, конфликтующий с уже существующим, пропускается с предупреждением: пересоздание
+    индекса на рабочей коллекции — решение для миграции, а не для старта приложения.
+    """
+    if not declaration.indexes:
+        return []
+    collection = db[declaration.collection_name]
+    try:
+        created = await collection.create_indexes([spec.to_index_model() for spec in declaration.indexes])
+        logger.info(f"🗂️ MongoDB: индексы коллекции '{declaration.collection_name}' на месте: {', '.join(created)}.")
+        return created
+    except OperationFailure as e:
+        if e.code not in _INDEX_CONFLICT_CODES:
+            raise
+
+    # Пакетное создание прервано конфликтом: создаём по одному, чтобы остальные индексы всё же появились.
+    created: List[str] = []
+    for spec in declaration.indexes:
+        try:
+            created.extend(await collection.create_indexes([spec.to_index_model()]))
+        except OperationFailure as e:
+            if e.code not in _INDEX_CONFLICT_CODES:
+                raise
+            logger.warning(
+                f"⚠️ MongoDB: индекс '{spec.name}' коллекции '{declaration.collection_name}' "
+                f"конфликтует с существующим и не создан: {e.details.get('errmsg') if e.details else e}"
+            )
+    return created
+
+
+def _plan_stages(plan: Any) -> Iterable[str]:
+    """Все стадии плана выполнения (классический и SBE-формат explain)."""
+    if isinstance(plan, dict):
+        stage = plan.get("stage")
+        if isinstance(stage, str):
+            yield stage
+        for key in ("inputStage", "queryPlan", "winningPlan"):
+            if key in plan:
+                yield from _plan_stages(plan[key])
+        for child in plan.get("inputStages") or ():
+            yield from _plan_stages(child)
+    elif isinstance(plan, list):
+        for child in plan:
+            yield from _plan_stages(child)
+
+
+async def explain_hot_query(db: AsyncIOMotorDatabase, collection_name: str, query: MongoHotQuery) -> List[str]:
+    """Возвращает стадии выигравшего плана запроса."""
+    cursor = db[collection_name].find(query.filter)
+    if query.sort:
+        cursor = cursor.sort(list(query.sort))
+    explanation = await cursor.explain()
+    return list(_plan_stages((explanation.get("queryPlanner") or {}).get("winningPlan")))
+
+
+async def verify_collection_query_plans(db: AsyncIOMotorDatabase, declaration: MongoCollectionIndexes) -> List[str]:
+    """
+    Прогоняет explain для горячих запросов коллекции. Возвращает имена запросов с COLLSCAN.
+    """
+    collscan_queries: List[str] = []
+    for query in declaration.hot_queries:
+        try:
+            stages = await explain_hot_query(db, declaration.collection_name, query)
+        except PyMongoError as e:
+            logger.warning(f"⚠️ MongoDB: не удалось выполнить explain для '{declaration.collection_name}.{query.name}': {e}")
+            continue
+        if "COLLSCAN" in stages:
+            collscan_queries.append(query.name)
+            logger.warning(
+                f"🐢 MongoDB: запрос '{declaration.collection_name}.{query.name}' ({query.filter}) выполняется полным просмотром "
+                f"коллекции (COLLSCAN). План: {' <- '.join(stages)}."
+            )
+        else:
+            logger.debug(f"MongoDB: план '{declaration.collection_name}.{query.name}': {' <- '.join(stages)}.")
+    return collscan_queries
+
+
+async def bootstrap_mongo_indexes(
+    db: AsyncIOMotorDatabase,
+    declarations: Iterable[MongoCollectionIndexes],
+    ensure_indexes: bool = True,
+    verify_plans: bool = True,
+) -> None:
+    """
+    Создаёт индексы всех объявленных коллекций и проверяет планы их горячих запросов.
+    Ошибка по одной коллекции не мешает остальным и не останавливает старт приложения.
+    """
+    collscan_total = 0
+    for declaration in declarations:
+        try:
+            if ensure_indexes:
+                await ensure_collection_indexes(db, declaration)
+            if verify_plans:
+                collscan_total += len(await verify_collection_query_plans(db, declaration))
+        except PyMongoError as e:
+            logger.error(f"❌ MongoDB: ошибка подготовки индексов коллекции '{declaration.collection_name}': {e}", exc_info=True)
+    if verify_plans and collscan_total:
+        logger.warning(f"⚠️ MongoDB: горячих запросов с COLLSCAN: {collscan_total}. Проверьте объявления индексов репозиториев.")
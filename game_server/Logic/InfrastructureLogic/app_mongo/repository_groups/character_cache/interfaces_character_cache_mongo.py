@@ -1,7 +1,7 @@
 # game_server/Logic/InfrastructureLogic/app_mongo/repository_groups/character_cache/interfaces_character_cache_mongo.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
 
 class IMongoCharacterCacheRepository(ABC):
     """
@@ -18,6 +18,48 @@ class IMongoCharacterCacheRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_character_fields(self, character_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Читает только перечисленные поля документа персонажа (projection) и его версию.
+
+        :param character_id: Уникальный ID персонажа.
+        :param fields: Пути полей, например ["location"] или ["vitals.current_hp"].
+        :return: Частичный документ (с '_id' и 'cache_version') или None, если персонаж не найден.
+        """
+        pass
+
+    @abstractmethod
+    async def update_character_fields(
+        self,
+        character_id: int,
+        set_fields: Optional[Dict[str, Any]] = None,
+        inc_fields: Optional[Dict[str, Any]] = None,
+        expected_version: Optional[int] = None,
+        expected_values: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
+        """
+        Точечно обновляет поля документа ($set/$inc) и увеличивает его версию.
+
+        :param set_fields: Пути и новые значения для $set.
+        :param inc_fields: Пути и приращения для $inc.
+        :param expected_version: Обновить, только если версия документа равна этой.
+        :param expected_values: Обновить, только если поля документа имеют эти значения.
+        :return: Новая версия документа или None, если документ не найден или условие не выполнено.
+        """
+        pass
+
+    @abstractmethod
+    async def sync_character_document(self, character_document: Dict[str, Any]) -> List[str]:
+        """
+        Приводит документ в MongoDB к переданному, записывая только изменившиеся разделы
+        (верхнеуровневые поля) с проверкой версии. Новый документ записывается целиком.
+
+        :param character_document: Полный документ персонажа с полем '_id'.
+        :return: Список записанных разделов.
+        """
+        pass
+
     @abstractmethod
     async def upsert_character(self, character_document: Dict[str, Any]) -> None:
         """
@@ -1,22 +1,48 @@
 # game_server/Logic/InfrastructureLogic/app_mongo/repository_groups/character_cache/mongo_character_cache_repository_impl.py
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
 import inject
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 from pymongo.results import UpdateResult, DeleteResult
 from pymongo.errors import PyMongoError
 
 from .interfaces_character_cache_mongo import IMongoCharacterCacheRepository
+from game_server.Logic.InfrastructureLogic.app_mongo.mongo_indexes import MongoCollectionIndexes, MongoHotQuery, MongoIndexSpec, asc
+from game_server.Logic.InfrastructureLogic.app_mongo.utils.document_digest import document_digest
 
 # Используем ваш логгер
 from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.utils.tracing import traced
+
+# Служебные поля документа: счётчик версий для оптимистичных проверок и дайджесты разделов
+# (верхнеуровневых полей), по которым синхронизация при логине пишет только изменившиеся разделы.
+VERSION_FIELD = "cache_version"
+DIGESTS_FIELD = "section_digests"
+_SERVICE_FIELDS = ("_id", VERSION_FIELD, DIGESTS_FIELD)
+# Повторы синхронизации при конфликте версий, после которых документ пишется целиком.
+_SYNC_MAX_ATTEMPTS = 3
+
 
 class MongoCharacterCacheRepositoryImpl(IMongoCharacterCacheRepository):
     """
     Реализация репозитория для "тёплого кэша" персонажей в MongoDB.
+    Помимо чтения/записи документа целиком поддерживает чтение отдельных полей (projection)
+    и точечные $set/$inc с оптимистичной проверкой версии (поле cache_version).
     """
     _collection_name = "characters_warm_cache"
+    INDEX_DECLARATION = MongoCollectionIndexes(
+        collection_name=_collection_name,
+        indexes=(
+            # Индекс по текущей локации: выборка персонажей локации без просмотра всей коллекции.
+            MongoIndexSpec(name="location_current_location_id", keys=asc("location.current.location_id")),
+        ),
+        hot_queries=(
+            MongoHotQuery("character_by_id", {"_id": 0}),
+            MongoHotQuery("characters_in_location", {"location.current.location_id": ""}),
+        ),
+    )
     
     @inject.autoparams()
     def __init__(self, db_instance: AsyncIOMotorDatabase):
@@ -25,9 +51,10 @@ class MongoCharacterCacheRepositoryImpl(IMongoCharacterCacheRepository):
         logger.info(f"✅ {self.__class__.__name__} инициализирован с коллекцией '{self._collection_name}'.")
 
 
+    @traced()
     async def get_character_by_id(self, character_id: int) -> Optional[Dict[str, Any]]:
         try:
-            document = await self.collection.find_one({"_id": character_id})
+            document = await self.collection.find_one({"_id": character_id}, projection={DIGESTS_FIELD: 0})
             if document:
                 logger.debug(f"Документ для персонажа ID {character_id} найден в MongoDB.")
             else:
@@ -37,16 +64,117 @@ class MongoCharacterCacheRepositoryImpl(IMongoCharacterCacheRepository):
             logger.error(f"Ошибка MongoDB при получении персонажа ID {character_id}: {e}", exc_info=True)
             raise
 
+    @traced()
+    async def get_character_fields(self, character_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        projection = {field: 1 for field in fields}
+        projection[VERSION_FIELD] = 1
+        try:
+            return await self.collection.find_one({"_id": character_id}, projection=projection)
+        except PyMongoError as e:
+            logger.error(f"Ошибка MongoDB при чтении полей {list(fields)} персонажа ID {character_id}: {e}", exc_info=True)
+            raise
+
+    @traced()
+    async def update_character_fields(
+        self,
+        character_id: int,
+        set_fields: Optional[Dict[str, Any]] = None,
+        inc_fields: Optional[Dict[str, Any]] = None,
+        expected_version: Optional[int] = None,
+        expected_values: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
+        if not set_fields and not inc_fields:
+            raise ValueError("update_character_fields: не переданы поля для $set/$inc.")
+
+        query: Dict[str, Any] = {"_id": character_id}
+        if expected_version is not None:
+            query[VERSION_FIELD] = expected_version
+        if expected_values:
+            query.update(expected_values)
+
+        update: Dict[str, Any] = {"$inc": {**(inc_fields or {}), VERSION_FIELD: 1}}
+        if set_fields:
+            update["$set"] = set_fields
+        # Изменённые разделы больше не совпадают с дайджестом последней синхронизации.
+        touched_sections = {path.split(".", 1)[0] for path in [*(set_fields or {}), *(inc_fields or {})]}
+        update["$unset"] = {f"{DIGESTS_FIELD}.{section}": "" for section in touched_sections}
+
+        try:
+            result = await self.collection.find_one_and_update(
+                query,
+                update,
+                projection={VERSION_FIELD: 1},
+                return_document=ReturnDocument.AFTER,
+            )
+        except PyMongoError as e:
+            logger.error(f"Ошибка MongoDB при частичном обновлении персонажа ID {character_id}: {e}", exc_info=True)
+            raise
+
+        if result is None:
+            logger.debug(
+                f"Частичное обновление персонажа ID {character_id} не применено: документ не найден "
+                f"или не выполнено условие (версия {expected_version}, значения {expected_values})."
+            )
+            return None
+        return result.get(VERSION_FIELD)
+
+    @traced()
+    async def sync_character_document(self, character_document: Dict[str, Any]) -> List[str]:
+        character_id = character_document.get("_id")
+        if not character_id:
+            raise ValueError("Документ персонажа должен содержать поле '_id'.")
+
+        digests = {
+            section: document_digest(value)
+            for section, value in character_document.items() if section not in _SERVICE_FIELDS
+        }
+        for _ in range(_SYNC_MAX_ATTEMPTS):
+            stored = await self.get_character_fields(character_id, [DIGESTS_FIELD])
+            if stored is None:
+                await self.upsert_character(character_document)
+                return list(digests)
+
+            stored_digests = stored.get(DIGESTS_FIELD) or {}
+            changed = [section for section, digest in digests.items() if stored_digests.get(section) != digest]
+            if not changed:
+                logger.debug(f"Документ персонажа ID {character_id} в MongoDB актуален, запись не требуется.")
+                return []
+
+            set_fields = {section: character_document[section] for section in changed}
+            set_fields.update({f"{DIGESTS_FIELD}.{section}": digests[section] for section in changed})
+            try:
+                result: UpdateResult = await self.collection.update_one(
+                    # Документ без поля версии (записан до его появления) совпадает с фильтром по None.
+                    {"_id": character_id, VERSION_FIELD: stored.get(VERSION_FIELD)},
+                    {"$set": set_fields, "$inc": {VERSION_FIELD: 1}},
+                )
+            except PyMongoError as e:
+                logger.error(f"Ошибка MongoDB при синхронизации персонажа ID {character_id}: {e}", exc_info=True)
+                raise
+            if result.matched_count:
+                logger.info(f"Документ персонажа ID {character_id} синхронизирован, обновлены разделы: {changed}.")
+                return changed
+            logger.debug(f"Конфликт версий при синхронизации персонажа ID {character_id}, повтор.")
+
+        logger.warning(f"Синхронизация персонажа ID {character_id} не удалась из-за конкурентных изменений, документ записывается целиком.")
+        await self.upsert_character(character_document)
+        return list(digests)
+
+    @traced()
     async def upsert_character(self, character_document: Dict[str, Any]) -> None:
         character_id = character_document.get("_id")
         if not character_id:
             logger.error("Попытка upsert документа персонажа без '_id'.")
             raise ValueError("Документ персонажа должен содержать поле '_id'.")
 
+        sections = {key: value for key, value in character_document.items() if key not in _SERVICE_FIELDS}
+        set_fields = dict(sections)
+        set_fields[DIGESTS_FIELD] = {section: document_digest(value) for section, value in sections.items()}
+
         try:
             result: UpdateResult = await self.collection.update_one(
                 {"_id": character_id},
-                {"$set": character_document},
+                {"$set": set_fields, "$inc": {VERSION_FIELD: 1}},
                 upsert=True
             )
             if result.upserted_id:
@@ -59,6 +187,7 @@ class MongoCharacterCacheRepositoryImpl(IMongoCharacterCacheRepository):
             raise
 
 
+    @traced()
     async def delete_character(self, character_id: int) -> bool:
         try:
             result: DeleteResult = await self.collection.delete_one({"_id": character_id})
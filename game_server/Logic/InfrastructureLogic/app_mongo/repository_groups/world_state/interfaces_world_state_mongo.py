@@ -1,7 +1,7 @@
 # game_server/Logic/InfrastructureLogic/app_mongo/repository_groups/world_state/interfaces_world_state_mongo.py
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pymongo.results import BulkWriteResult
 
 # --- ОБНОВЛЕННЫЙ ИНТЕРФЕЙС ДЛЯ РЕГИОНОВ МИРА ---
@@ -58,4 +58,37 @@ class ILocationStateRepository(ABC):
         """
         Массово сохраняет (или обновляет) документы активных локаций.
         """
-        pass
\ No newline at end of file
+        pass
+
+
+# --- Интерфейс для версионированного снимка статической карты (для синхронизации бота) ---
+
+class IWorldSnapshotRepository(ABC):
+    """
+    Интерфейс для репозитория версионированного снимка статической карты мира.
+    Каждая локация хранится отдельным документом с номером версии, в которой она последний раз менялась;
+    удалённые локации остаются как "надгробия" с версией удаления.
+    Версия снимка становится видимой читателям только после того, как записаны все её локации.
+    """
+    @abstractmethod
+    async def get_current_version(self) -> int:
+        """Текущая версия снимка (0, если снимок ещё не публиковался)."""
+        pass
+
+    @abstractmethod
+    async def get_snapshot(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        """Возвращает (версия, все локации)."""
+        pass
+
+    @abstractmethod
+    async def get_changes_since(self, version: int) -> Tuple[int, Dict[str, Dict[str, Any]], List[str]]:
+        """Возвращает (текущая версия, изменённые локации, ID удалённых локаций) после указанной версии."""
+        pass
+
+    @abstractmethod
+    async def publish_snapshot(self, locations: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Сравнивает локации с опубликованным снимком и, если есть отличия, записывает их под новой версией.
+        Возвращает актуальную версию снимка. Если снимок одновременно публикует другой процесс — RuntimeError.
+        """
+        pass
@@ -2,25 +2,36 @@
 
 import inject
 import logging
+import uuid
+from datetime import datetime, timedelta, timezone
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pymongo import ReplaceOne, UpdateOne 
+from pymongo.errors import DuplicateKeyError
 from pymongo.results import BulkWriteResult
 
 from game_server.Logic.InfrastructureLogic.app_mongo.base_repository import BaseMongoRepository
+from game_server.Logic.InfrastructureLogic.app_mongo.mongo_indexes import MongoCollectionIndexes, MongoHotQuery, MongoIndexSpec, asc
+from game_server.Logic.InfrastructureLogic.app_mongo.utils.document_digest import document_digest
 
 
-from .interfaces_world_state_mongo import IWorldStateRepository, ILocationStateRepository
+from .interfaces_world_state_mongo import IWorldStateRepository, ILocationStateRepository, IWorldSnapshotRepository
 
 logger = logging.getLogger(__name__) # Используем логгер для этого модуля
 
 # --- Репозиторий для статических регионов мира ---
 
 class MongoWorldStateRepositoryImpl(BaseMongoRepository, IWorldStateRepository):
-    
+    _collection_name = "static_world_regions"
+    # Регионы читаются только по _id или целиком.
+    INDEX_DECLARATION = MongoCollectionIndexes(
+        collection_name=_collection_name,
+        hot_queries=(MongoHotQuery("region_by_id", {"_id": ""}),),
+    )
+
     @inject.autoparams()
     def __init__(self, db: AsyncIOMotorDatabase):
-        super().__init__(db, collection_name="static_world_regions")
+        super().__init__(db, collection_name=self._collection_name)
 
     async def get_region_by_id(self, region_id: str) -> Optional[Dict[str, Any]]:
         """Получает один документ-регион по его ID."""
@@ -83,10 +94,22 @@ class MongoWorldStateRepositoryImpl(BaseMongoRepository, IWorldStateRepository):
 # --- Репозиторий для "живых" локаций (ДОБАВЛЕН bulk_save_active_locations) ---
 
 class MongoLocationStateRepositoryImpl(BaseMongoRepository, ILocationStateRepository):
+    _collection_name = "active_locations"
+    INDEX_DECLARATION = MongoCollectionIndexes(
+        collection_name=_collection_name,
+        indexes=(
+            # Мультиключевой индекс по игрокам: поиск локации игрока без просмотра всех локаций.
+            MongoIndexSpec(name="players_player_id", keys=asc("players.player_id")),
+        ),
+        hot_queries=(
+            MongoHotQuery("location_by_id", {"_id": ""}),
+            MongoHotQuery("location_by_player", {"players.player_id": ""}),
+        ),
+    )
 
     @inject.autoparams()
     def __init__(self, db: AsyncIOMotorDatabase):
-        super().__init__(db, collection_name="active_locations")
+        super().__init__(db, collection_name=self._collection_name)
 
     async def get_location_by_id(self, location_id: str) -> Optional[Dict[str, Any]]:
         """Получает одну активную локацию по ID."""
@@ -97,9 +120,9 @@ class MongoLocationStateRepositoryImpl(BaseMongoRepository, ILocationStateReposi
         return await self.get_all()
 
     async def add_player_to_location(self, location_id: str, player_data: Dict[str, Any]) -> bool:
-        """Добавляет игрока в массив 'players'."""
+        """Добавляет игрока в массив 'players', если его там ещё нет."""
         result = await self.collection.update_one(
-            {"_id": location_id},
+            {"_id": location_id, "players.player_id": {"$ne": player_data.get("player_id")}},
             {"$push": {"players": player_data}}
         )
         return result.modified_count > 0
@@ -128,4 +151,211 @@ class MongoLocationStateRepositoryImpl(BaseMongoRepository, ILocationStateReposi
                 UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True)
             )
         
-        return await self.collection.bulk_write(operations)
\ No newline at end of file
+        return await self.collection.bulk_write(operations)
+
+
+# --- Версионированный снимок статической карты ---
+
+class MongoWorldSnapshotRepositoryImpl(BaseMongoRepository, IWorldSnapshotRepository):
+    """
+    Документы локаций: {_id: location_id, version, digest, deleted, data, prev}.
+    data — уже провалидированный WorldLocationDataDTO в виде словаря, готовый к отправке боту.
+
+    Опубликованная версия хранится в документе-маркере {_id: "__meta__", version}. Публикация сначала
+    записывает локации под версией marker + 1, сохраняя предыдущее опубликованное состояние локации в prev,
+    и только после успешного bulk_write поднимает маркер. Читатели видят документ, если его version <= маркера,
+    иначе — его prev, поэтому частично записанная (или прерванная) публикация не видна.
+    Одновременные публикации исключаются захватом маркера условным обновлением.
+    """
+    _collection_name = "static_world_snapshot"
+    META_ID = "__meta__"
+    # Захват публикации, не снятый за это время (упавший публикатор), может перехватить другой процесс.
+    PUBLISH_CLAIM_TIMEOUT_SECONDS = 300
+    # Сколько раз чтение повторяется, если во время него была опубликована новая версия.
+    READ_ATTEMPTS = 3
+    INDEX_DECLARATION = MongoCollectionIndexes(
+        collection_name=_collection_name,
+        indexes=(
+            MongoIndexSpec(name="version", keys=asc("version")),
+        ),
+        hot_queries=(
+            MongoHotQuery("snapshot_marker", {"_id": ""}),
+            MongoHotQuery("changes_since_version", {"version": {"$gt": 0}}),
+        ),
+    )
+
+    @inject.autoparams()
+    def __init__(self, db: AsyncIOMotorDatabase):
+        super().__init__(db, collection_name=self._collection_name)
+
+    async def _get_marker(self) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"_id": self.META_ID})
+
+    async def _get_committed_version(self) -> int:
+        marker = await self._get_marker()
+        if marker is not None:
+            return int(marker.get("version") or 0)
+        # Снимок, опубликованный до появления маркера: версия — максимальная среди локаций.
+        doc = await self.collection.find_one({"_id": {"$ne": self.META_ID}}, projection={"version": 1}, sort=[("version", -1)])
+        return int(doc["version"]) if doc else 0
+
+    @staticmethod
+    def _committed_state(doc: Dict[str, Any], committed_version: int) -> Optional[Dict[str, Any]]:
+        """Состояние локации, видимое на опубликованной версии, или None, если локации в ней ещё нет."""
+        if int(doc.get("version") or 0) <= committed_version:
+            return doc
+        prev = doc.get("prev") or {}
+        if prev.get("version") is not None and int(prev["version"]) <= committed_version:
+            return prev
+        return None
+
+    async def get_current_version(self) -> int:
+        return await self._get_committed_version()
+
+    async def get_snapshot(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        for _ in range(self.READ_ATTEMPTS):
+            version = await self._get_committed_version()
+            locations: Dict[str, Dict[str, Any]] = {}
+            cursor = self.collection.find({"_id": {"$ne": self.META_ID}}, projection={"version": 1, "deleted": 1, "data": 1, "prev": 1})
+            async for doc in cursor:
+                state = self._committed_state(doc, version)
+                if state is not None and not state.get("deleted"):
+                    locations[doc["_id"]] = state.get("data") or {}
+            if await self._get_committed_version() == version:
+                break
+        return version, locations
+
+    async def get_changes_since(self, version: int) -> Tuple[int, Dict[str, Dict[str, Any]], List[str]]:
+        for _ in range(self.READ_ATTEMPTS):
+            current_version = await self._get_committed_version()
+            changed: Dict[str, Dict[str, Any]] = {}
+            removed: List[str] = []
+            if current_version <= version:
+                return version, changed, removed
+            # Незакоммиченная запись тоже попадает под фильтр (её version больше), видимое состояние берётся из prev.
+            cursor = self.collection.find(
+                {"_id": {"$ne": self.META_ID}, "version": {"$gt": version}},
+                projection={"version": 1, "deleted": 1, "data": 1, "prev": 1}
+            )
+            async for doc in cursor:
+                state = self._committed_state(doc, current_version)
+                if state is None or int(state.get("version") or 0) <= version:
+                    continue
+                if state.get("deleted"):
+                    removed.append(doc["_id"])
+                else:
+                    changed[doc["_id"]] = state.get("data") or {}
+            if await self._get_committed_version() == current_version:
+                break
+        return current_version, changed, removed
+
+    async def _claim_publish(self, committed_version: int, has_marker: bool, token: str) -> None:
+        """Захватывает маркер под публикацию следующей версии; при конкурентной публикации — RuntimeError."""
+        now = datetime.now(timezone.utc)
+        claim_filter = {
+            "_id": self.META_ID,
+            "version": committed_version,
+            "$or": [
+                {"writer": {"$exists": False}},
+                {"claimed_at": {"$lt": now - timedelta(seconds=self.PUBLISH_CLAIM_TIMEOUT_SECONDS)}},
+            ],
+        }
+        try:
+            result = await self.collection.update_one(
+                claim_filter,
+                {"$set": {"writer": token, "claimed_at": now}},
+                # Первая публикация создаёт маркер; если его успел создать другой процесс — DuplicateKeyError.
+                upsert=not has_marker,
+            )
+        except DuplicateKeyError:
+            result = None
+        if result is None or (result.matched_count == 0 and result.upserted_id is None):
+            raise RuntimeError("Снимок статической карты уже публикуется другим процессом или его версия изменилась.")
+
+    async def _release_publish(self, token: str, new_version: Optional[int] = None) -> bool:
+        """Снимает захват маркера; с new_version — заодно публикует эту версию."""
+        update: Dict[str, Any] = {"$unset": {"writer": "", "claimed_at": ""}}
+        if new_version is not None:
+            update["$set"] = {"version": new_version}
+        result = await self.collection.update_one({"_id": self.META_ID, "writer": token}, update)
+        return result.matched_count > 0
+
+    def _staged_write(self, location_id: str, committed_version: int, fields: Dict[str, Any], unset: Tuple[str, ...] = ()) -> UpdateOne:
+        """
+        Запись локации под новой версией. Если документ опубликован (version <= маркера), он сохраняется в prev;
+        иначе это остаток прерванной публикации, и prev уже содержит опубликованное состояние.
+        """
+        pipeline: List[Dict[str, Any]] = [
+            {"$set": {"prev": {"$cond": [
+                {"$gt": ["$version", committed_version]},
+                "$prev",
+                {"version": "$version", "digest": "$digest", "deleted": "$deleted", "data": "$data"},
+            ]}}},
+            {"$set": {key: {"$literal": value} for key, value in fields.items()}},
+        ]
+        if unset:
+            pipeline.append({"$unset": list(unset)})
+        return UpdateOne({"_id": location_id}, pipeline, upsert=True)
+
+    async def publish_snapshot(self, locations: Dict[str, Dict[str, Any]]) -> int:
+        marker = await self._get_marker()
+        current_version = await self._get_committed_version()
+        token = uuid.uuid4().hex
+        await self._claim_publish(current_version, marker is not None, token)
+
+        new_version: Optional[int] = None
+        try:
+            digests = {location_id: document_digest(data) for location_id, data in locations.items()}
+            existing = {
+                doc["_id"]: doc
+                async for doc in self.collection.find(
+                    {"_id": {"$ne": self.META_ID}},
+                    projection={"version": 1, "digest": 1, "deleted": 1, "prev.version": 1, "prev.digest": 1, "prev.deleted": 1}
+                )
+            }
+            committed = {location_id: self._committed_state(doc, current_version) for location_id, doc in existing.items()}
+            # Документы прерванной публикации переписываются всегда: иначе они стали бы видны под новой версией.
+            unfinished = {location_id for location_id, doc in existing.items() if int(doc.get("version") or 0) > current_version}
+
+            changed_ids = [
+                location_id for location_id, digest in digests.items()
+                if location_id in unfinished
+                or committed.get(location_id) is None
+                or committed[location_id].get("deleted")
+                or committed[location_id].get("digest") != digest
+            ]
+            removed_ids = [
+                location_id for location_id in existing
+                if location_id not in digests and (
+                    location_id in unfinished
+                    or (committed[location_id] is not None and not committed[location_id].get("deleted"))
+                )
+            ]
+            if not changed_ids and not removed_ids:
+                logger.info(f"Снимок статической карты не изменился (версия {current_version}).")
+                return current_version
+
+            staged_version = current_version + 1
+            operations = [
+                self._staged_write(
+                    location_id, current_version,
+                    {"version": staged_version, "digest": digests[location_id], "deleted": False, "data": locations[location_id]}
+                )
+                for location_id in changed_ids
+            ]
+            operations.extend(
+                self._staged_write(location_id, current_version, {"version": staged_version, "deleted": True}, unset=("data", "digest"))
+                for location_id in removed_ids
+            )
+            await self.collection.bulk_write(operations, ordered=False)
+            new_version = staged_version
+        finally:
+            # Маркер поднимается только после успешной записи всех локаций.
+            released = await self._release_publish(token, new_version)
+
+        if not released:
+            raise RuntimeError(f"Захват публикации снимка карты перехвачен другим процессом; версия {new_version} не опубликована.")
+        logger.info(
+            f"Снимок статической карты опубликован: версия {new_version}, изменено {len(changed_ids)}, удалено {len(removed_ids)} локаций."
+        )
+        return new_version
@@ -0,0 +1,14 @@
+# game_server/Logic/InfrastructureLogic/app_mongo/utils/document_digest.py
+
+import hashlib
+import json
+from typing import Any
+
+
+def document_digest(value: Any) -> str:
+    """
+    Короткий дайджест содержимого (под)документа для сравнения версий без чтения самих данных.
+    Ключи сортируются, поэтому порядок полей в словаре на результат не влияет.
+    """
+    payload = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
@@ -15,6 +15,12 @@ class IItemInstanceRepository(ABC):
     async def delete_item_instance(self, instance_id: int) -> bool: pass
     @abstractmethod
     async def transfer_item_instance(self, instance_id: int, new_owner_id: int, new_owner_type: str, new_location_type: str, new_location_slot: Optional[str] = None) -> Optional[InstancedItem]: pass
+    @abstractmethod
+    async def create_item_instances(self, data_list: List[Dict[str, Any]]) -> List[InstancedItem]: pass
+    @abstractmethod
+    async def transfer_many(self, transfers: List[Dict[str, Any]]) -> List[InstancedItem]: pass
+    @abstractmethod
+    async def delete_items_by_owner(self, owner_id: int, owner_type: str, instance_ids: Optional[List[int]] = None, location_type: Optional[str] = None) -> List[int]: pass
 
 class IUsedCharacterArchiveRepository(ABC): 
     @abstractmethod
@@ -3,7 +3,7 @@
 import logging
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession # Принимает активную сессию
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, insert, values, column, Integer, String
 
 # Импорт вашей модели InstancedItem
 from game_server.database.models.models import InstancedItem
@@ -11,6 +11,9 @@ from game_server.database.models.models import InstancedItem
 # Импорт интерфейса репозитория
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.active_game_data.interfaces_active_game_data import IItemInstanceRepository
 
+# Столбцы, которые меняет перемещение предмета (transfer_item_instance / transfer_many)
+_TRANSFER_COLUMNS = ("owner_id", "owner_type", "location_type", "location_slot")
+
 # Используем ваш уникальный логгер
 from game_server.config.logging.logging_setup import app_logger as logger
 
@@ -92,3 +95,93 @@ class ItemInstanceRepositoryImpl(IItemInstanceRepository):
         await self.db_session.flush() # flush, но НЕ commit
         logger.info(f"Экземпляр предмета (ID: {instance_id}) передан в сессии.")
         return result.scalars().first()
+
+    # --- Пакетные операции (одна SQL-команда на весь набор предметов) ---
+
+    async def create_item_instances(self, data_list: List[Dict[str, Any]]) -> List[InstancedItem]:
+        """
+        Создает пачку экземпляров предметов одним INSERT ... RETURNING.
+        :param data_list: Список словарей с данными экземпляров.
+        :return: Созданные объекты InstancedItem (с instance_id) в порядке data_list.
+        """
+        if not data_list:
+            return []
+        stmt = insert(InstancedItem).returning(InstancedItem, sort_by_parameter_order=True)
+        result = await self.db_session.scalars(stmt, data_list)
+        created = list(result.all())
+        await self.db_session.flush() # flush, но НЕ commit
+        logger.info(f"В сессию добавлено экземпляров предметов: {len(created)}.")
+        return created
+
+    async def transfer_many(self, transfers: List[Dict[str, Any]]) -> List[InstancedItem]:
+        """
+        Перемещает пачку экземпляров предметов одним UPDATE ... FROM (VALUES ...).
+        :param transfers: Список словарей с ключами instance_id, new_owner_id, new_owner_type,
+                          new_location_type и необязательным new_location_slot.
+        :return: Перемещенные объекты InstancedItem (несуществующие ID пропускаются).
+        """
+        if not transfers:
+            return []
+
+        # Последняя запись по одному instance_id побеждает: иначе строка совпала бы с VALUES дважды.
+        rows: Dict[int, tuple] = {}
+        for transfer in transfers:
+            rows[int(transfer["instance_id"])] = (
+                int(transfer["instance_id"]),
+                transfer["new_owner_id"],
+                transfer["new_owner_type"],
+                transfer["new_location_type"],
+                transfer.get("new_location_slot"),
+            )
+
+        moves = values(
+            column("instance_id", Integer),
+            column("owner_id", Integer),
+            column("owner_type", String),
+            column("location_type", String),
+            column("location_slot", String),
+            name="moves",
+        ).data(list(rows.values()))
+
+        stmt = (
+            update(InstancedItem)
+            .where(InstancedItem.instance_id == moves.c.instance_id)
+            .values({name: moves.c[name] for name in _TRANSFER_COLUMNS})
+            .returning(InstancedItem)
+            # UPDATE ... FROM не вычисляется на стороне Python: объекты в сессии обновляются из RETURNING.
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db_session.scalars(stmt)
+        moved = list(result.all())
+        await self.db_session.flush() # flush, но НЕ commit
+        logger.info(f"Перемещено экземпляров предметов: {len(moved)} из {len(rows)} запрошенных.")
+        return moved
+
+    async def delete_items_by_owner(
+        self,
+        owner_id: int,
+        owner_type: str,
+        instance_ids: Optional[List[int]] = None,
+        location_type: Optional[str] = None
+    ) -> List[int]:
+        """
+        Удаляет одним DELETE ... RETURNING предметы владельца: все, только из location_type
+        или только перечисленные instance_ids. Чужие предметы из instance_ids не затрагиваются.
+        :return: ID удаленных экземпляров.
+        """
+        if instance_ids is not None and not instance_ids:
+            return []
+        stmt = delete(InstancedItem).where(
+            InstancedItem.owner_id == owner_id,
+            InstancedItem.owner_type == owner_type
+        )
+        if instance_ids is not None:
+            stmt = stmt.where(InstancedItem.instance_id.in_(instance_ids))
+        if location_type:
+            stmt = stmt.where(InstancedItem.location_type == location_type)
+        stmt = stmt.returning(InstancedItem.instance_id).execution_options(synchronize_session=False)
+        result = await self.db_session.scalars(stmt)
+        deleted_ids = list(result.all())
+        await self.db_session.flush() # flush, но НЕ commit
+        logger.info(f"Удалено экземпляров предметов владельца {owner_type}:{owner_id}: {len(deleted_ids)}.")
+        return deleted_ids
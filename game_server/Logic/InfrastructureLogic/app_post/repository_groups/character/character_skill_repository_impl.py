@@ -3,7 +3,8 @@
 import logging
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, insert # Добавлен insert
+from sqlalchemy import select, update, delete, insert, func, literal, Integer, BigInteger, String # Добавлен insert
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from game_server.database.models.models import CharacterSkills, Skills
 from .interfaces_character import ICharacterSkillRepository
@@ -103,3 +104,29 @@ class CharacterSkillRepositoryImpl(ICharacterSkillRepository):
         await self.db_session.execute(stmt, skills_to_insert)
         await self.db_session.flush() # flush, но НЕ commit
         logger.info(f"Пакетная вставка {len(skills_to_insert)} навыков для персонажа ID {character_id} добавлена в сессию.")
+
+    async def bulk_update_skill_progress(self, character_ids: List[int], skill_keys: List[str], levels: List[int], xps: List[int]) -> int:
+        """
+        Обновляет уровень и опыт пачки навыков (разных персонажей) одним UPDATE ... FROM unnest(...).
+        Параметры — колонки одинаковой длины: i-я строка задаёт навык skill_keys[i] персонажа character_ids[i].
+        Четыре параметра-массива вместо параметра на каждое значение: размер пачки не упирается в лимит параметров.
+        """
+        if not character_ids:
+            return 0
+        progress = func.unnest(
+            literal(list(character_ids), ARRAY(Integer)),
+            literal(list(skill_keys), ARRAY(String)),
+            literal(list(levels), ARRAY(Integer)),
+            literal(list(xps), ARRAY(BigInteger)),
+        ).table_valued("character_id", "skill_key", "level", "xp").render_derived(name="progress")
+        stmt = update(CharacterSkills).where(
+            CharacterSkills.character_id == progress.c.character_id,
+            CharacterSkills.skill_key == progress.c.skill_key
+        ).values(
+            level=progress.c.level,
+            xp=progress.c.xp
+        ).execution_options(synchronize_session=False)
+        result = await self.db_session.execute(stmt)
+        await self.db_session.flush() # flush, но НЕ commit
+        logger.info(f"Прогресс {result.rowcount} навыков обновлён одним запросом в сессии.")
+        return result.rowcount
@@ -34,6 +34,8 @@ class ICharacterSkillRepository(ABC):
     @abstractmethod
     async def bulk_create_skills(self, character_id: int, skills_data: List[Dict[str, Any]]) -> None:
         pass
+    @abstractmethod
+    async def bulk_update_skill_progress(self, character_ids: List[int], skill_keys: List[str], levels: List[int], xps: List[int]) -> int: pass
 
 
 class ICharacterSpecialRepository(ABC):
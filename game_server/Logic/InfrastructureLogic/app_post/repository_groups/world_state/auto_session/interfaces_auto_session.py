@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from game_server.database.models.models import AutoSession, XpTickData
 
 class IAutoSessionRepository(ABC):
@@ -22,4 +22,8 @@ class IXpTickDataRepository(ABC):
     @abstractmethod
     async def get_all_xp_data_for_character(self, character_id: int) -> List[XpTickData]: pass
     @abstractmethod
-    async def delete_all_xp_data_for_character(self, character_id: int) -> bool: pass
\ No newline at end of file
+    async def delete_all_xp_data_for_character(self, character_id: int) -> bool: pass
+    @abstractmethod
+    async def get_xp_ticks_with_skill_state(self, character_ids: List[int]) -> List[Tuple]: pass
+    @abstractmethod
+    async def delete_xp_ticks_by_ids(self, tick_ids: List[int]) -> int: pass
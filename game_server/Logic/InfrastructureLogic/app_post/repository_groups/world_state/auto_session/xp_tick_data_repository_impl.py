@@ -1,11 +1,12 @@
 # game_server/Logic/InfrastructureLogic/DataAccessLogic/app_post/repository_groups/world_state/auto_session/xp_tick_data_repository_impl.py
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession # Принимает активную сессию
-from sqlalchemy import select, delete, insert
+from sqlalchemy import select, delete, insert, func, and_, any_, literal, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from game_server.database.models.models import XpTickData
+from game_server.database.models.models import XpTickData, Skills, CharacterSkills
 
 # Импорт интерфейса репозитория
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.world_state.auto_session.interfaces_auto_session import IXpTickDataRepository
@@ -61,3 +62,48 @@ class XpTickDataRepositoryImpl(IXpTickDataRepository):
         else:
             logger.warning(f"Записи XP тиков для персонажа {character_id} не найдены для удаления.")
             return False
+
+    async def get_xp_ticks_with_skill_state(self, character_ids: List[int]) -> List[Tuple]:
+        """
+        Одним запросом загружает тики всех переданных персонажей вместе с текущим состоянием навыка:
+        (tick_id, character_id, skill_key, xp_generated, level, xp, progress_state, max_level).
+        Если навыка у персонажа нет, level = -1. Строки тиков блокируются (SKIP LOCKED),
+        поэтому параллельная задача по тем же персонажам их не увидит и не начислит повторно.
+        """
+        if not character_ids:
+            return []
+        stmt = (
+            select(
+                XpTickData.tick_id,
+                XpTickData.character_id,
+                func.coalesce(Skills.skill_key, ""),
+                func.coalesce(XpTickData.xp_generated, 0),
+                func.coalesce(CharacterSkills.level, -1),
+                func.coalesce(CharacterSkills.xp, 0),
+                func.coalesce(CharacterSkills.progress_state, "PAUSE"),
+                func.coalesce(Skills.max_level, 0),
+            )
+            .select_from(XpTickData)
+            .outerjoin(Skills, Skills.skill_id == XpTickData.skill_id)
+            .outerjoin(CharacterSkills, and_(
+                CharacterSkills.character_id == XpTickData.character_id,
+                CharacterSkills.skill_key == Skills.skill_key
+            ))
+            # Один параметр-массив вместо IN (...) с параметром на каждый ID.
+            .where(XpTickData.character_id == any_(literal(list(character_ids), ARRAY(Integer))))
+            .with_for_update(of=XpTickData, skip_locked=True)
+        )
+        result = await self._session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def delete_xp_ticks_by_ids(self, tick_ids: List[int]) -> int:
+        """Удаляет обработанные тики одним DELETE в рамках переданной сессии. Возвращает число удалённых строк."""
+        if not tick_ids:
+            return 0
+        stmt = delete(XpTickData).where(
+            XpTickData.tick_id == any_(literal(list(tick_ids), ARRAY(Integer)))
+        ).execution_options(synchronize_session=False)
+        result = await self._session.execute(stmt)
+        await self._session.flush() # flush, но НЕ commit
+        logger.info(f"Обработанные записи XP тиков ({result.rowcount}) помечены для удаления в сессии.")
+        return result.rowcount
@@ -10,6 +10,7 @@ from game_server.config.settings_core import DATABASE_URL
 # 🔥 ИСПРАВЛЕНИЕ: Импортируем 'config' (экземпляр LoggerConfig) из logging_setup.py
 # Файл logging_config.py больше не содержит класса loggerConfig, он был перенесен.
 from game_server.config.logging.logging_setup import config as logging_config_instance 
+from game_server.utils.metrics import instrument_sqlalchemy_engine
 
 # Используем ваш уникальный логгер
 
@@ -25,6 +26,8 @@ engine = create_async_engine(
     poolclass=NullPool,  # <--- КЛЮЧЕВОЕ ИЗМЕНЕНИЕ: используем NullPool
     future=True
 )
+# Время каждого SQL-запроса в метриках storage_call_latency_seconds{backend="postgres"}
+instrument_sqlalchemy_engine(engine)
 
 # engine_read (если используется) также будет здесь, используя _logger_config_instance.sql_echo
 # engine_read = create_async_engine(
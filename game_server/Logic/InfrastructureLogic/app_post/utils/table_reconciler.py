@@ -0,0 +1,191 @@
+# game_server/Logic/InfrastructureLogic/app_post/utils/table_reconciler.py
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import JSON, Column, MetaData, Table, and_, cast, delete, exists, insert, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from game_server.config.constants.seeds import MODEL_PK_OVERRIDES
+from game_server.config.logging.logging_setup import app_logger as logger
+
+
+@dataclass
+class ReconciliationReport:
+    """
+    Итог сверки таблицы с желаемым набором строк.
+    В режиме dry_run счётчики означают "было бы", а списки ключей заполнены для просмотра диффа.
+    """
+    table_name: str
+    dry_run: bool
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    inserted_keys: List[Any] = field(default_factory=list)
+    updated_keys: List[Any] = field(default_factory=list)
+    deleted_keys: List[Any] = field(default_factory=list)
+
+    def summary(self) -> str:
+        prefix = "[dry-run] " if self.dry_run else ""
+        return (f"{prefix}'{self.table_name}': +{self.inserted} ~{self.updated} "
+                f"-{self.deleted} ={self.unchanged}")
+
+
+class TableReconciler:
+    """
+    Таблично-независимая сверка таблицы с желаемым состоянием одним набором SQL-операций:
+    желаемые строки заливаются во временную таблицу, затем
+      - DELETE ... WHERE NOT EXISTS удаляет лишние строки,
+      - один INSERT ... SELECT ... ON CONFLICT DO UPDATE вставляет новые и обновляет только изменившиеся.
+    Поддерживает составные первичные ключи. Работает в рамках переданной сессии и не коммитит.
+    """
+    def __init__(self, db_session: AsyncSession):
+        self._session = db_session
+
+    @staticmethod
+    def get_key_columns(model: Type[Any]) -> List[str]:
+        override = MODEL_PK_OVERRIDES.get(model.__name__)
+        if override:
+            return [override]
+        return [column.name for column in model.__table__.primary_key.columns]
+
+    async def reconcile(
+        self,
+        model: Type[Any],
+        rows: List[Dict[str, Any]],
+        delete_missing: bool = True,
+        dry_run: bool = False,
+    ) -> ReconciliationReport:
+        """
+        Приводит таблицу модели к набору rows (словари с именами колонок ORM).
+        """
+        target: Table = model.__table__
+        key_columns = self.get_key_columns(model)
+        report = ReconciliationReport(table_name=target.name, dry_run=dry_run)
+
+        if not rows and not delete_missing:
+            return report
+
+        data_columns = self._resolve_data_columns(target, key_columns, rows)
+        stage = await self._create_stage_table(target, data_columns)
+        if rows:
+            await self._session.execute(insert(stage), [{c: row.get(c) for c in data_columns} for row in rows])
+
+        key_match = and_(*[stage.c[c] == target.c[c] for c in key_columns])
+        value_columns = [c for c in data_columns if c not in key_columns]
+        is_changed = or_(*[self._comparable(target.c[c]).is_distinct_from(self._comparable(stage.c[c])) for c in value_columns]) \
+            if value_columns else None
+
+        if dry_run:
+            await self._fill_dry_run_report(report, target, stage, key_columns, key_match, is_changed, delete_missing)
+        else:
+            if delete_missing:
+                result = await self._session.execute(
+                    delete(target).where(~exists(select(literal_column("1")).select_from(stage).where(key_match)))
+                )
+                report.deleted = result.rowcount or 0
+            if rows:
+                report.inserted, report.updated = await self._upsert_from_stage(target, stage, key_columns, data_columns, value_columns)
+            report.unchanged = len(rows) - report.inserted - report.updated
+
+        await self._session.execute(text(f'DROP TABLE IF EXISTS "{stage.name}"'))
+        await self._session.flush()
+        logger.info(f"🔁 Сверка таблицы {report.summary()}")
+        return report
+
+    async def upsert_many(self, model: Type[Any], rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Один многострочный UPSERT без удаления лишних строк. Возвращает (вставлено, обновлено).
+        """
+        report = await self.reconcile(model, rows, delete_missing=False)
+        return report.inserted, report.updated
+
+    @staticmethod
+    def _resolve_data_columns(target: Table, key_columns: List[str], rows: List[Dict[str, Any]]) -> List[str]:
+        if not rows:
+            return list(key_columns)
+        present = set(rows[0].keys())
+        missing_keys = [c for c in key_columns if c not in present]
+        if missing_keys:
+            raise ValueError(f"Строки для '{target.name}' не содержат ключевые колонки: {missing_keys}.")
+        return [column.name for column in target.columns if column.name in present]
+
+    async def _create_stage_table(self, target: Table, data_columns: List[str]) -> Table:
+        stage = Table(
+            f"_reconcile_{target.name}_{uuid.uuid4().hex[:8]}",
+            MetaData(),
+            *[Column(c, target.c[c].type) for c in data_columns],
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
+        connection = await self._session.connection()
+        await connection.run_sync(stage.create)
+        return stage
+
+    @staticmethod
+    def _comparable(column_expr: Any) -> Any:
+        # У типа json нет оператора сравнения в PostgreSQL, сравниваем как jsonb.
+        if isinstance(column_expr.type, JSON) and not isinstance(column_expr.type, JSONB):
+            return cast(column_expr, JSONB)
+        return column_expr
+
+    async def _upsert_from_stage(
+        self, target: Table, stage: Table, key_columns: List[str], data_columns: List[str], value_columns: List[str]
+    ) -> Tuple[int, int]:
+        insert_stmt = pg_insert(target).from_select(data_columns, select(*[stage.c[c] for c in data_columns]))
+        if value_columns:
+            upsert_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=[target.c[c] for c in key_columns],
+                set_={c: insert_stmt.excluded[c] for c in value_columns},
+                where=or_(*[self._comparable(target.c[c]).is_distinct_from(self._comparable(insert_stmt.excluded[c])) for c in value_columns]),
+            )
+        else:
+            upsert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=[target.c[c] for c in key_columns])
+
+        # xmax = 0 у только что вставленной строки, у обновлённой — id транзакции.
+        result = await self._session.execute(upsert_stmt.returning(literal_column("(xmax = 0)").label("inserted")))
+        flags = [row.inserted for row in result]
+        inserted = sum(1 for flag in flags if flag)
+        return inserted, len(flags) - inserted
+
+    async def _fill_dry_run_report(
+        self,
+        report: ReconciliationReport,
+        target: Table,
+        stage: Table,
+        key_columns: List[str],
+        key_match: Any,
+        is_changed: Optional[Any],
+        delete_missing: bool,
+    ) -> None:
+        def as_key(row: Any) -> Any:
+            return tuple(row) if len(key_columns) > 1 else row[0]
+
+        if delete_missing:
+            result = await self._session.execute(
+                select(*[target.c[c] for c in key_columns])
+                .where(~exists(select(literal_column("1")).select_from(stage).where(key_match)))
+            )
+            report.deleted_keys = [as_key(row) for row in result]
+
+        result = await self._session.execute(
+            select(*[stage.c[c] for c in key_columns])
+            .where(~exists(select(literal_column("1")).select_from(target).where(key_match)))
+        )
+        report.inserted_keys = [as_key(row) for row in result]
+
+        if is_changed is not None:
+            result = await self._session.execute(
+                select(*[stage.c[c] for c in key_columns]).select_from(stage.join(target, key_match)).where(is_changed)
+            )
+            report.updated_keys = [as_key(row) for row in result]
+
+        total_staged = (await self._session.execute(select(literal_column("count(*)")).select_from(stage))).scalar_one()
+        report.deleted = len(report.deleted_keys)
+        report.inserted = len(report.inserted_keys)
+        report.updated = len(report.updated_keys)
+        report.unchanged = total_staged - report.inserted - report.updated
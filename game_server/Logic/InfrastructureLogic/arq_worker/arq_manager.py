@@ -5,6 +5,8 @@ import inject
 from typing import Any, Dict
 from arq.connections import create_pool, RedisSettings
 from game_server.config.settings_core import REDIS_CACHE_URL
+from game_server.config.constants.arq import TASKS
+from game_server.utils.tracing import trace_context_kwargs
 
 class ArqQueueService: # <--- Переименовываем для ясности
     """
@@ -26,6 +28,9 @@ class ArqQueueService: # <--- Переименовываем для ясност
 
         try:
             # Вся логика создания пула теперь здесь, в одном месте.
+            if task_name in TASKS:
+                # Задачи из TASKS обёрнуты trace_arq_job и продолжают текущую трассу.
+                kwargs.update(trace_context_kwargs())
             async with await create_pool(self.redis_settings) as arq_client:
                 job = await arq_client.enqueue_job(task_name, *args, **kwargs)
             
@@ -3,24 +3,33 @@
 import asyncio
 import logging
 from arq.connections import RedisSettings
+from arq.utils import import_string
+from arq.worker import func
 from typing import Dict, Any, Callable
 from sqlalchemy.ext.asyncio import AsyncSession 
 
 from game_server.Logic.InfrastructureLogic.app_cache.interfaces.interfaces_dinamic_location_manager import IDynamicLocationManager
 from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessageBus
+from game_server.Logic.ApplicationLogic.shared_logic.LocationStateManagement.location_summary_push_coalescer import LocationSummaryPushCoalescer
 from game_server.core.di_container import initialize_di_container, shutdown_di_container
 
 from game_server.config.constants.arq import TASKS
-from game_server.config.settings_core import REDIS_CACHE_URL
+from game_server.config.settings_core import REDIS_CACHE_URL, ARQ_WORKER_METRICS_PORT
 from game_server.config.logging.logging_setup import app_logger as logger
 from game_server.config.provider import config
+from game_server.utils.tracing import trace_arq_job
+from game_server.utils.metrics import start_metrics_server
 
 # ИМПОРТЫ ЗАВИСИМОСТЕЙ ДЛЯ DI
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.world_state.core_world.interfaces_core_world import IGameLocationRepository
-from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import ILocationStateRepository, IWorldStateRepository
+from game_server.Logic.InfrastructureLogic.app_mongo.repository_groups.world_state.interfaces_world_state_mongo import ILocationStateRepository, IWorldSnapshotRepository, IWorldStateRepository
 from game_server.Logic.InfrastructureLogic.app_cache.services.reference_data.reference_data_reader import ReferenceDataReader
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.meta_data_1lvl.interfaces_meta_data_1lvl import IEquipmentTemplateRepository, ICharacterPoolRepository
+from game_server.Logic.InfrastructureLogic.app_post.repository_groups.world_state.auto_session.interfaces_auto_session import IXpTickDataRepository
+from game_server.Logic.InfrastructureLogic.app_post.repository_groups.character.interfaces_character import ICharacterSkillRepository
 from game_server.Logic.InfrastructureLogic.app_cache.services.task_queue.redis_batch_store import RedisBatchStore
+from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
+from game_server.Logic.InfrastructureLogic.arq_worker.utils.periodic_scheduler import PeriodicScheduler
 
 
 
@@ -33,7 +42,8 @@ class WorkerSettings:
     Теперь большинство зависимостей для задач будут передаваться через ctx.
     """
     redis_settings = RedisSettings.from_dsn(REDIS_CACHE_URL)
-    functions = TASKS
+    # Имена задач совпадают с путями из TASKS, поэтому постановка через ArqQueueService не меняется.
+    functions = [func(trace_arq_job(import_string(task_path), task_path), name=task_path) for task_path in TASKS]
     cron_jobs = []
     
     # ctx будет содержать все основные зависимости, инжектированные через DI
@@ -45,6 +55,8 @@ class WorkerSettings:
         Инициализирует DI-контейнер и помещает основные зависимости в ctx.
         """
         logger.info("🔧 ARQ Worker startup: Инициализация DI-контейнера и контекста ARQ...")
+        # У воркера нет FastAPI-приложения: метрики задач, хранилищ и планировщика отдаёт отдельный exporter.
+        start_metrics_server(ARQ_WORKER_METRICS_PORT)
         try:
             await initialize_di_container()
             
@@ -57,16 +69,21 @@ class WorkerSettings:
             ctx["pg_location_repo_factory"] = inject.instance(Callable[[AsyncSession], IGameLocationRepository])
             ctx["equipment_template_repo_factory"] = inject.instance(Callable[[AsyncSession], IEquipmentTemplateRepository])
             ctx["character_pool_repo_factory"] = inject.instance(Callable[[AsyncSession], ICharacterPoolRepository])
+            ctx["xp_tick_data_repo_factory"] = inject.instance(Callable[[AsyncSession], IXpTickDataRepository])
+            ctx["character_skill_repo_factory"] = inject.instance(Callable[[AsyncSession], ICharacterSkillRepository])
             
             # Mongo репозитории
             ctx["mongo_world_repo"] = inject.instance(IWorldStateRepository)
             ctx["location_state_repo"] = inject.instance(ILocationStateRepository)
+            ctx["world_snapshot_repo"] = inject.instance(IWorldSnapshotRepository)
 
             # ✅ НОВЫЕ ЗАВИСИМОСТИ для задачи aggregate_location_state
             ctx["dynamic_location_manager"] = inject.instance(IDynamicLocationManager)
             ctx["message_bus"] = inject.instance(IMessageBus)
+            ctx["location_summary_pusher"] = inject.instance(LocationSummaryPushCoalescer)
             
             WorkerSettings.ctx.update(ctx)
+            ctx["periodic_task"] = asyncio.create_task(WorkerSettings.run_periodic_task(ctx))
             ctx["logger"].info("✅ ARQ Worker startup: DI-контейнер и зависимости успешно инициализированы.")
 
         except Exception as e:
@@ -95,24 +112,41 @@ class WorkerSettings:
 
     @staticmethod
     async def run_periodic_task(ctx: dict):
-        """Периодическая задача для выполнения фоновых операций."""
-        
-        from game_server.Logic.ApplicationLogic.world_orchestrator.workers.autosession_watcher.tick_AutoSession_Watcher import collect_and_dispatch_sessions
-        
-        periodic_task_instance = inject.instance(collect_and_dispatch_sessions)
+        """
+        Периодическая задача для выполнения фоновых операций.
+        Тики идут по границам настенного времени, а выполняет их только реплика-лидер
+        (аренда в Redis), поэтому дополнительные воркеры не дублируют сбор сессий.
+        """
+        task_logger = ctx.get("logger", logger)
+        try:
+            from game_server.Logic.ApplicationLogic.world_orchestrator.workers.autosession_watcher.tick_AutoSession_Watcher import collect_and_dispatch_sessions
+
+            runtime = config.settings.runtime
+
+            scheduler = PeriodicScheduler(
+                name="collect_and_dispatch_sessions",
+                # Зависимости задачи подставляет @inject.autoparams при каждом вызове.
+                job=collect_and_dispatch_sessions,
+                interval_seconds=runtime.PERIODIC_TASK_INTERVAL_SECONDS,
+                redis_client=inject.instance(CentralRedisClient),
+                logger=task_logger,
+                lease_ttl_seconds=runtime.PERIODIC_TASK_LEASE_TTL_SECONDS,
+                overrun_policy=runtime.PERIODIC_TASK_OVERRUN_POLICY,
+                max_catch_up=runtime.PERIODIC_TASK_MAX_CATCH_UP_TICKS,
+                retry_interval_seconds=runtime.PERIODIC_TASK_ERROR_INTERVAL_SECONDS,
+            )
+        except Exception as e:
+            # Без этого ошибка импорта или настройки осталась бы в необработанном исключении фоновой задачи.
+            task_logger.critical(f"🚨 Не удалось запустить планировщик периодической задачи: {e}", exc_info=True)
+            return
 
-        while True:
-            try:
-                ctx["logger"].info("⏱️ Запуск периодической задачи...")
-                await periodic_task_instance()
-                ctx["logger"].info("✅ Периодическая задача успешно выполнена.")
-                await asyncio.sleep(config.settings.runtime.PERIODIC_TASK_INTERVAL_SECONDS)
-            except asyncio.CancelledError:
-                ctx["logger"].info("🛑 Периодическая задача отменена.")
-                break
-            except Exception as e:
-                ctx["logger"].error(f"❌ Ошибка в периодической задаче: {e}", exc_info=True)
-                await asyncio.sleep(config.settings.runtime.PERIODIC_TASK_ERROR_INTERVAL_SECONDS)
+        try:
+            task_logger.info("⏱️ Запуск планировщика периодической задачи...")
+            await scheduler.run()
+        except asyncio.CancelledError:
+            task_logger.info("🛑 Периодическая задача отменена.")
+        except Exception as e:
+            task_logger.critical(f"🚨 Планировщик периодической задачи остановлен из-за ошибки: {e}", exc_info=True)
 
     @staticmethod
     async def on_shutdown(ctx: dict):
@@ -124,9 +158,19 @@ class WorkerSettings:
             periodic_task.cancel()
             try:
                 await periodic_task
-            except asyncio.CancelledError:
-                pass
+            except (asyncio.CancelledError, Exception) as e:
+                # Ошибка фоновой задачи не должна прерывать освобождение остальных ресурсов.
+                if not isinstance(e, asyncio.CancelledError):
+                    logger.error(f"❌ Периодическая задача завершилась с ошибкой: {e}", exc_info=True)
             logger.info("✅ Периодическая задача остановлена.")
+
+        location_summary_pusher = ctx.get("location_summary_pusher")
+        if location_summary_pusher:
+            # Изменения, накопленные за последнее окно, отправляются до закрытия шины сообщений.
+            try:
+                await location_summary_pusher.shutdown()
+            except Exception as e:
+                logger.error(f"❌ Не удалось отправить накопленные сводки локаций: {e}", exc_info=True)
         
         await shutdown_di_container()
         
@@ -0,0 +1,253 @@
+# game_server/Logic/InfrastructureLogic/arq_worker/utils/periodic_scheduler.py
+
+import asyncio
+import logging
+import math
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+from game_server.Logic.InfrastructureLogic.app_cache.central_redis_client import CentralRedisClient
+from game_server.config.constants.arq import KEY_PERIODIC_FENCE, KEY_PERIODIC_LAST_TICK, KEY_PERIODIC_LEASE
+from game_server.utils.metrics import PERIODIC_LEADER, PERIODIC_TICK_DURATION, PERIODIC_TICK_LAG, PERIODIC_TICKS_TOTAL
+
+
+# Политики при переполнении (тик выполнялся дольше интервала):
+# skip — пропущенные границы не выполняются, следующий тик на ближайшей будущей границе;
+# catch_up — пропущенные тики выполняются подряд (не больше max_catch_up), затем расписание выравнивается.
+OVERRUN_SKIP = "skip"
+OVERRUN_CATCH_UP = "catch_up"
+
+# Захват или продление аренды. Значение ключа — "<владелец>:<fencing-токен>".
+# Новый владелец получает следующий токен (INCR), продление возвращает уже выданный. 0 — аренда у другого процесса.
+_ACQUIRE_LEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    local fence = redis.call('INCR', KEYS[2])
+    redis.call('SET', KEYS[1], ARGV[1] .. ':' .. fence, 'PX', ARGV[2])
+    return fence
+end
+local sep = string.find(current, ':', 1, true)
+if sep and string.sub(current, 1, sep - 1) == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return tonumber(string.sub(current, sep + 1))
+end
+return 0
+"""
+
+# Освобождение аренды только её владельцем.
+_RELEASE_LEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and string.sub(current, 1, string.len(ARGV[1]) + 1) == ARGV[1] .. ':' then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Закрепление тика: проходит, только если токен — последний выданный (после истечения аренды
+# новый лидер получил больший) и этот слот расписания ещё не выполнялся.
+# Отсекает процесс, потерявший аренду во время паузы, даже если новый лидер ещё не запускал тиков.
+_CLAIM_TICK_SCRIPT = """
+local fence = tonumber(ARGV[1])
+local slot = tonumber(ARGV[2])
+local issued = tonumber(redis.call('GET', KEYS[2]) or '0')
+if fence < issued then
+    return 0
+end
+local last_slot = redis.call('HGET', KEYS[1], 'slot')
+if last_slot and slot <= tonumber(last_slot) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'fence', fence, 'slot', slot, 'started_at', ARGV[3])
+return 1
+"""
+
+
+class RedisLease:
+    """
+    Аренда в Redis для выбора лидера среди реплик воркера.
+    Каждому новому владельцу выдаётся возрастающий fencing-токен: по нему хранилище
+    отличает действия текущего лидера от действий процесса, аренда которого уже истекла.
+    """
+    def __init__(self, redis_client: CentralRedisClient, name: str, ttl_seconds: float):
+        self.redis_client = redis_client
+        self.lease_key = KEY_PERIODIC_LEASE.format(job=name)
+        self.fence_key = KEY_PERIODIC_FENCE.format(job=name)
+        self.ttl_ms = max(1, int(ttl_seconds * 1000))
+        self.owner = uuid.uuid4().hex
+
+    async def acquire(self) -> int:
+        """Захватывает или продлевает аренду. Возвращает fencing-токен или 0, если лидер — другой процесс."""
+        result = await self.redis_client.redis.eval(
+            _ACQUIRE_LEASE_SCRIPT, 2, self.lease_key, self.fence_key, self.owner, self.ttl_ms
+        )
+        return int(result or 0)
+
+    async def release(self) -> bool:
+        result = await self.redis_client.redis.eval(_RELEASE_LEASE_SCRIPT, 1, self.lease_key, self.owner)
+        return bool(result)
+
+
+class PeriodicScheduler:
+    """
+    Периодическая задача, выполняемая ровно одной репликой ARQ-воркера.
+
+    - Тики стартуют на фиксированных границах настенного времени (кратных интервалу),
+      поэтому длительность тика не сдвигает расписание, а все реплики считают одни и те же слоты.
+    - Лидер выбирается арендой в Redis (RedisLease), которая продлевается отдельной задачей.
+      Каждый тик закрепляется в Redis с fencing-токеном и номером слота: слот выполняется один раз,
+      а процесс, потерявший аренду, тик не запустит.
+    - Переполнение обрабатывается по политике overrun_policy (skip / catch_up).
+    - Задержка старта тика относительно границы пишется в метрику periodic_tick_lag_seconds.
+      Метрики планировщика отдаёт exporter ARQ-воркера (scrape-цель arq_worker в prometheus.yml).
+    """
+    def __init__(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[Any]],
+        interval_seconds: float,
+        redis_client: CentralRedisClient,
+        logger: logging.Logger,
+        lease_ttl_seconds: Optional[float] = None,
+        overrun_policy: str = OVERRUN_SKIP,
+        max_catch_up: int = 3,
+        retry_interval_seconds: float = 5.0,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds должен быть больше нуля.")
+        if overrun_policy not in (OVERRUN_SKIP, OVERRUN_CATCH_UP):
+            raise ValueError(f"Неизвестная политика переполнения: {overrun_policy}")
+        self.name = name
+        self.job = job
+        self.interval = float(interval_seconds)
+        self.redis_client = redis_client
+        self.logger = logger
+        self.overrun_policy = overrun_policy
+        self.max_catch_up = max(0, max_catch_up)
+        self.retry_interval = retry_interval_seconds
+        # Аренда переживает минимум два интервала, а продлевается втрое чаще своего срока.
+        self.lease = RedisLease(redis_client, name, lease_ttl_seconds or self.interval * 2)
+        self.renew_interval = self.lease.ttl_ms / 3000
+        self.last_tick_key = KEY_PERIODIC_LAST_TICK.format(job=name)
+        self._fence = 0
+        self._lease_valid_until = 0.0
+        # Серии появляются в exporter сразу, а не после первого тика: реплики-последователи тоже видны.
+        PERIODIC_LEADER.labels(job=name).set(0)
+        for result in ("success", "error", "skipped", "fenced"):
+            PERIODIC_TICKS_TOTAL.labels(job=name, result=result)
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fence > 0 and time.monotonic() < self._lease_valid_until
+
+    def _slot_of(self, timestamp: float) -> int:
+        return math.floor(timestamp / self.interval)
+
+    async def run(self) -> None:
+        """Основной цикл: держит аренду и запускает тики, пока задачу не отменят."""
+        renew_task = asyncio.create_task(self._keep_lease())
+        try:
+            await self._tick_loop()
+        finally:
+            renew_task.cancel()
+            try:
+                await renew_task
+            except asyncio.CancelledError:
+                pass
+            await self._release()
+
+    async def _keep_lease(self) -> None:
+        while True:
+            requested_at = time.monotonic()
+            try:
+                fence = await self.lease.acquire()
+                if fence and not self._fence:
+                    self.logger.info(f"👑 Планировщик '{self.name}': процесс стал лидером (fencing-токен {fence}).")
+                elif self._fence and not fence:
+                    self.logger.warning(f"Планировщик '{self.name}': аренда лидера утрачена.")
+                self._fence = fence
+                # Срок отсчитывается от момента запроса: ответ мог прийти с задержкой.
+                self._lease_valid_until = requested_at + self.lease.ttl_ms / 1000 if fence else 0.0
+                PERIODIC_LEADER.labels(job=self.name).set(1 if fence else 0)
+                await asyncio.sleep(self.renew_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"❌ Планировщик '{self.name}': ошибка продления аренды: {e}", exc_info=True)
+                await asyncio.sleep(self.retry_interval)
+
+    async def _tick_loop(self) -> None:
+        next_slot = self._slot_of(time.time()) + 1
+        while True:
+            boundary = next_slot * self.interval
+            delay = boundary - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self.is_leader:
+                await self._run_tick(next_slot, boundary)
+
+            now_slot = self._slot_of(time.time())
+            if now_slot <= next_slot:
+                next_slot += 1
+                continue
+
+            # Переполнение: за время тика прошла одна или несколько границ (слоты next_slot+1..now_slot).
+            missed = now_slot - next_slot
+            if self.overrun_policy == OVERRUN_CATCH_UP:
+                # Догоняем не больше max_catch_up последних пропущенных тиков, более старые отбрасываем.
+                first_slot = max(next_slot + 1, now_slot - self.max_catch_up + 1)
+            else:
+                first_slot = now_slot + 1
+            skipped = first_slot - next_slot - 1
+            next_slot = first_slot
+            if skipped and self.is_leader:
+                PERIODIC_TICKS_TOTAL.labels(job=self.name, result="skipped").inc(skipped)
+                self.logger.warning(
+                    f"Планировщик '{self.name}': тик длился дольше интервала, пропущено тиков: {skipped} из {missed}."
+                )
+
+    async def _run_tick(self, slot: int, boundary: float) -> None:
+        try:
+            claimed = await self.redis_client.redis.eval(
+                _CLAIM_TICK_SCRIPT, 2, self.last_tick_key, self.lease.fence_key, self._fence, slot, f"{time.time():.3f}"
+            )
+        except Exception as e:
+            self.logger.error(f"❌ Планировщик '{self.name}': не удалось закрепить тик {slot}: {e}", exc_info=True)
+            return
+        if not claimed:
+            # Слот уже выполнен или у другого процесса более новый токен.
+            PERIODIC_TICKS_TOTAL.labels(job=self.name, result="fenced").inc()
+            self.logger.info(f"Планировщик '{self.name}': тик {slot} отклонён (устаревший токен или слот уже выполнен).")
+            return
+
+        started_at = time.time()
+        lag = started_at - boundary
+        PERIODIC_TICK_LAG.labels(job=self.name).observe(lag)
+        if lag > self.interval:
+            self.logger.warning(f"Планировщик '{self.name}': тик {slot} запущен с опозданием {lag:.2f}с.")
+
+        result = "success"
+        try:
+            await self.job()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = "error"
+            self.logger.error(f"❌ Планировщик '{self.name}': ошибка в тике {slot}: {e}", exc_info=True)
+        finally:
+            PERIODIC_TICK_DURATION.labels(job=self.name).observe(time.time() - started_at)
+            PERIODIC_TICKS_TOTAL.labels(job=self.name, result=result).inc()
+
+    async def _release(self) -> None:
+        if not self._fence:
+            return
+        try:
+            # Следующий лидер заберёт аренду сразу, не дожидаясь её истечения.
+            await self.lease.release()
+            self.logger.info(f"Планировщик '{self.name}': аренда лидера освобождена.")
+        except Exception as e:
+            self.logger.warning(f"Планировщик '{self.name}': не удалось освободить аренду: {e}")
+        finally:
+            self._fence = 0
+            PERIODIC_LEADER.labels(job=self.name).set(0)
@@ -1,6 +1,7 @@
 # game_server/Logic/InfrastructureLogic/messaging/rabbitmq_message_bus.py
 
 import asyncio
+import time
 import uuid
 import msgpack
 from typing import Dict, Any, Optional, Callable
@@ -16,6 +17,11 @@ from .message_format import create_message # 🔥 Убедитесь, что cre
 
 
 from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.utils.metrics import (
+    BUS_CONSUME_LATENCY, BUS_MESSAGES_PUBLISHED_TOTAL, BUS_PUBLISH_LATENCY, BUS_QUEUE_LAG, BUS_RPC_LATENCY,
+    PUBLISHED_AT_HEADER,
+)
+from game_server.utils.tracing import extract_trace_headers, inject_trace_headers, trace_span
 
 
 # 🔥 НОВАЯ ФУНКЦИЯ: Кастомный сериализатор для msgpack
@@ -115,12 +121,26 @@ class RabbitMQMessageBus(IMessageBus):
         # 🔥 ИЗМЕНЕНИЕ: Используем кастомный default для msgpack.dumps для обработки UUID и datetime
         message_body = msgpack.dumps(full_message, default=msgpack_default, use_bin_type=True) 
 
-        exchange = await self.channel.get_exchange(exchange_name)
-        
-        await exchange.publish(
-            aio_pika.Message(body=message_body, content_type="application/msgpack"), 
-            routing_key=routing_key
-        )
+        started_at = time.perf_counter()
+        status = "success"
+        try:
+            with trace_span("bus.publish", exchange=exchange_name, routing_key=routing_key):
+                exchange = await self.channel.get_exchange(exchange_name)
+
+                await exchange.publish(
+                    aio_pika.Message(
+                        body=message_body,
+                        content_type="application/msgpack",
+                        headers=inject_trace_headers({PUBLISHED_AT_HEADER: time.time()}),
+                    ), 
+                    routing_key=routing_key
+                )
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            BUS_PUBLISH_LATENCY.labels(exchange=exchange_name).observe(time.perf_counter() - started_at)
+            BUS_MESSAGES_PUBLISHED_TOTAL.labels(exchange=exchange_name, status=status).inc()
         logger.debug(f"Сообщение опубликовано в exchange '{exchange_name}' с ключом '{routing_key}' (MsgPack)")
 
     async def consume(self, queue_name: str, callback: callable):
@@ -135,12 +155,39 @@ class RabbitMQMessageBus(IMessageBus):
         logger.info(f"Начинаем потребление из очереди: {queue_name}")
 
         consumer_task = asyncio.create_task(
-            queue.consume(callback, no_ack=False) 
+            queue.consume(self._instrument_callback(queue_name, callback), no_ack=False) 
         )
         self._consumer_tasks.append(consumer_task) 
 
         logger.info(f"Потребитель для очереди '{queue_name}' запущен в фоновом режиме.")
 
+    @staticmethod
+    def _instrument_callback(queue_name: str, callback: Callable) -> Callable:
+        """
+        Оборачивает колбэк потребителя: задержка в очереди (по заголовку времени публикации)
+        и время обработки сообщения пишутся в метрики с меткой очереди.
+        """
+        async def instrumented_callback(message: IncomingMessage):
+            headers = message.headers or {}
+            published_at = headers.get(PUBLISHED_AT_HEADER)
+            if isinstance(published_at, (int, float)):
+                BUS_QUEUE_LAG.labels(queue=queue_name).observe(max(0.0, time.time() - published_at))
+
+            started_at = time.perf_counter()
+            status = "success"
+            try:
+                # Спан продолжает трассу публикатора, только если она записывается (есть заголовки).
+                trace_id, parent_span_id = extract_trace_headers(headers)
+                with trace_span("bus.consume", trace_id=trace_id, parent_span_id=parent_span_id, queue=queue_name):
+                    return await callback(message)
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                BUS_CONSUME_LATENCY.labels(queue=queue_name, status=status).observe(time.perf_counter() - started_at)
+
+        return instrumented_callback
+
     async def declare_queue(self, name: str, durable: bool = True, arguments: Optional[Dict[str, Any]] = None):
         """Объявляет очередь."""
         if not self.channel: raise ConnectionError("Канал RabbitMQ не активен.")
@@ -198,27 +245,34 @@ class RabbitMQMessageBus(IMessageBus):
 
         logger.debug(f"Выполнение RPC-вызова в очередь '{queue_name}' с correlation_id: {correlation_id}")
 
-        await self.channel.default_exchange.publish(
-            Message(
-                body=message_body,
-                content_type="application/msgpack",
-                correlation_id=correlation_id,
-                reply_to=self._rpc_callback_queue.name,
-            ),
-            routing_key=queue_name,
-        )
-
+        started_at = time.perf_counter()
+        status = "success"
         try:
-            result_body = await asyncio.wait_for(future, timeout=timeout)
+            with trace_span("bus.rpc", queue=queue_name):
+                await self.channel.default_exchange.publish(
+                    Message(
+                        body=message_body,
+                        content_type="application/msgpack",
+                        correlation_id=correlation_id,
+                        reply_to=self._rpc_callback_queue.name,
+                        headers=inject_trace_headers({PUBLISHED_AT_HEADER: time.time()}),
+                    ),
+                    routing_key=queue_name,
+                )
+                result_body = await asyncio.wait_for(future, timeout=timeout)
             return msgpack.unpackb(result_body, raw=False)
         except asyncio.TimeoutError:
+            status = "timeout"
             self._rpc_futures.pop(correlation_id, None)
             logger.error(f"Таймаут RPC-вызова к очереди '{queue_name}' (correlation_id: {correlation_id})")
             raise TimeoutError(f"RPC call to '{queue_name}' timed out")
         except Exception as e:
+            status = "error"
             self._rpc_futures.pop(correlation_id, None)
             logger.error(f"Ошибка во время RPC-вызова: {e}", exc_info=True)
             raise
+        finally:
+            BUS_RPC_LATENCY.labels(queue=queue_name, status=status).observe(time.perf_counter() - started_at)
 
     # ... (publish_rpc_response) ...
     async def publish_rpc_response(self, reply_to: str, response_data: Dict[str, Any], correlation_id: str):
@@ -33,6 +33,8 @@ class BackendEventRouter(commands.Cog):
         mock_interaction.data = {'custom_id': custom_id}
         # Добавляем "заглушки" для методов, которые может вызвать роутер,
         mock_interaction.is_background_event = True
+        # Данные события — для обработчиков, которым не хватает параметров из custom_id.
+        mock_interaction.event_data = data
         # чтобы избежать ошибок.
         mock_interaction.response = MagicMock()
         mock_interaction.response.is_done.return_value = True
@@ -3,15 +3,17 @@
 import discord
 import logging # <-- Добавлено для типизации
 import inject # <-- Добавлено для inject.autoparams
-from typing import Optional, Dict, Any, Union, List
+from typing import Iterable, Optional, Dict, Any, Union
 from discord import Forbidden, Guild, CategoryChannel, HTTPException, Member, TextChannel, ForumChannel, VoiceChannel, ChannelType, utils, PermissionOverwrite, Role
 
 # Импорт новой конфигурации каналов
 from game_server.app_discord_bot.config.assets.data.channels_config import CHANNELS_CONFIG
 # Импорт NameFormatter
 from game_server.app_discord_bot.app.services.utils.name_formatter import NameFormatter
-
-
+# Планировщик операций вынесен в отдельный модуль; имена реэкспортируются для сервисов лейаутов.
+from game_server.app_discord_bot.app.services.core_services.admin.discord_operation_scheduler import (
+    DiscordOperation, DiscordOperationProgress, DiscordOperationReport, DiscordOperationScheduler,
+)
 
 
 class BaseDiscordOperations:
@@ -27,6 +29,25 @@ class BaseDiscordOperations:
         self.bot = bot
         self.logger = logger
         self.name_formatter = name_formatter
+        # Один планировщик на процесс: параллельные развёртывания делят rate-limit bucket'ы.
+        self.scheduler = DiscordOperationScheduler(logger)
+
+    async def run_operations(
+        self, operations: Iterable[DiscordOperation], progress: Optional[DiscordOperationProgress] = None, label: str = ""
+    ) -> DiscordOperationReport:
+        """
+        Выполняет план операций Discord с учётом зависимостей и rate-limit.
+        Без своего обработчика прогресса пишет в лог примерно каждые 10% выполненных операций.
+        """
+        operations = list(operations)
+        if progress is None and operations:
+            step = max(1, len(operations) // 10)
+
+            def progress(done: int, total: int, op: DiscordOperation, status: str) -> None:
+                if done % step == 0 or done == total or status != "done":
+                    self.logger.info(f"📦 {label or 'Операции Discord'}: {done}/{total} ({status}: {op.description or op.key}).")
+
+        return await self.scheduler.run(operations, progress)
 
 
     async def get_guild_by_id(self, guild_id: int) -> Optional[Guild]:
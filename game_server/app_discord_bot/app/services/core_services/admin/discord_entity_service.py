@@ -7,6 +7,7 @@ import uuid
 import inject
 
 from game_server.app_discord_bot.app.services.core_services.admin.article_management_service import ArticleManagementService
+from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations, DiscordOperation
 from game_server.app_discord_bot.app.services.core_services.admin.game_server_layout_service import GameServerLayoutService
 from game_server.app_discord_bot.app.services.core_services.admin.hub_layout_service import HubLayoutService
 from game_server.app_discord_bot.app.services.core_services.admin.message_login import send_login_message_to_reception_channel
@@ -15,6 +16,7 @@ from game_server.app_discord_bot.app.services.utils.name_formatter import NameFo
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
 from game_server.app_discord_bot.app.services.utils.request_helper import RequestHelper
 from game_server.app_discord_bot.storage.cache.managers.guild_config_manager import GuildConfigManager
+from game_server.app_discord_bot.storage.cache.interfaces.account_data_manager_interface import IAccountDataManager
 from game_server.contracts.api_models.discord.entity_management_requests import GetDiscordEntitiesRequest, UnifiedEntityBatchDeleteRequest
 from game_server.contracts.shared_models.base_responses import ResponseStatus
 from game_server.contracts.shared_models.websocket_base_models import WebSocketMessage, WebSocketResponsePayload
@@ -29,7 +31,9 @@ class DiscordEntityService:
     def __init__(
         self,
         bot: discord.Client,
+        base_ops: BaseDiscordOperations,
         guild_config_manager: GuildConfigManager,
+        account_data_manager: IAccountDataManager,
         request_helper: RequestHelper,
         name_formatter: NameFormatter,
         cache_sync_manager: CacheSyncManager,
@@ -41,8 +45,10 @@ class DiscordEntityService:
         logger: logging.Logger,
     ):
         self.bot = bot
+        self.base_ops = base_ops
         self.logger = logger
         self.guild_config_manager = guild_config_manager
+        self.account_data_manager = account_data_manager
         self.request_helper = request_helper
         self.name_formatter = name_formatter
         self.cache_sync_manager = cache_sync_manager
@@ -130,6 +136,31 @@ class DiscordEntityService:
         # Шаг 2: Создаем лейаут, передавая созданные роли
         return await self.hub_layout_service.setup_hub_layout(guild_id, roles=synced_roles)
 
+    def _build_delete_operation(
+        self, guild: discord.Guild, discord_id: Any, entity_type: str, description: str,
+        depends_on: tuple = ()
+    ) -> DiscordOperation:
+        """
+        Операция удаления канала/категории или роли по ID. Результат — discord_id
+        (в том числе если сущности уже нет в Discord), чтобы удалить её и из БД.
+        """
+        async def _delete(_: Dict[str, Any]) -> Any:
+            entity = guild.get_role(int(discord_id)) if entity_type == "role" else guild.get_channel(int(discord_id))
+            if entity:
+                await self.base_ops.delete_discord_entity(entity)
+            else:
+                self.logger.warning(f"Сущность {description} (ID: {discord_id}) не найдена на сервере, пропущена.")
+            return discord_id
+
+        bucket = f"guild:{guild.id}:roles" if entity_type == "role" else f"channel:{discord_id}"
+        return DiscordOperation(
+            key=f"{entity_type}:{discord_id}",
+            run=_delete,
+            bucket=bucket,
+            depends_on=depends_on,
+            description=description,
+        )
+
     async def teardown_discord_layout(self, guild_id: int, shard_type: str) -> Dict[str, Any]:
         """
         Удаляет все сущности Discord для гильдии.
@@ -148,92 +179,39 @@ class DiscordEntityService:
         # =====================================================================
         self.logger.info(f"Поиск и удаление персональных каналов и ролей игроков для гильдии {guild_id} (тип: {shard_type})...")
         
-        # Получаем список всех зарегистрированных Discord ID для данного шарда
-        registered_player_ids_json = await self.guild_config_manager.get_field(
-            guild_id=guild_id,
-            shard_type=shard_type,
-            field_name=RedisKeys.FIELD_REGISTERED_PLAYER_IDS
-        )
-
-        player_discord_ids: List[str] = []
-        if registered_player_ids_json:
-            try:
-                # get_field уже декодирует JSON, поэтому тут просто проверка типа
-                if isinstance(registered_player_ids_json, list):
-                    player_discord_ids = [str(pid) for pid in registered_player_ids_json] # Приводим все к строкам
-                else:
-                    self.logger.warning(f"Поле '{RedisKeys.FIELD_REGISTERED_PLAYER_IDS}' для гильдии {guild_id} не является списком. Пропускаем удаление персональных данных.")
-            except Exception as e:
-                self.logger.error(f"Ошибка при парсинге списка игроков из Redis для гильдии {guild_id}: {e}", exc_info=True)
-        
-        if player_discord_ids:
-            self.logger.info(f"Найдено {len(player_discord_ids)} зарегистрированных игроков для гильдии {guild_id}. Начинаем удаление их персональных сущностей.")
+        # Реестр игроков обходится курсором (SSCAN) пачками; данные аккаунтов каждой пачки читаются
+        # и удаляются одним round trip, поэтому память и число запросов не растут с населением шарда.
+        processed_players = 0
+        async for player_discord_ids in self.guild_config_manager.iter_registered_player_ids(guild_id, shard_type):
+            players_data = await self.account_data_manager.get_account_data_bulk(guild_id, player_discord_ids)
+            # Персональные каналы и роли всей пачки удаляются одним планом: каналы — каждый в своём
+            # rate-limit bucket, роли — в общем bucket ролей гильдии.
+            operations: Dict[str, DiscordOperation] = {}
             for player_discord_id in player_discord_ids:
-                try:
-                    # Формируем ключ для данных аккаунта игрока
-                    player_account_key = RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(
-                        shard_id=guild_id, # Здесь guild_id используется как shard_id
-                        discord_user_id=player_discord_id
-                    )
-                    
-                    # Получаем все данные аккаунта игрока
-                    # Если AccountDataManager предоставляет get_full_account_data_for_shard, то лучше использовать его
-                    player_data_from_redis = await self.guild_config_manager.redis_client.hgetall(player_account_key)
-                    
-                    if player_data_from_redis:
-                        discord_channels_str = player_data_from_redis.get(RedisKeys.FIELD_DISCORD_CHANNELS.encode('utf-8'))
-                        discord_roles_str = player_data_from_redis.get(RedisKeys.FIELD_DISCORD_ROLES.encode('utf-8'))
-
-                        # Удаление персональных каналов
-                        if discord_channels_str:
-                            try:
-                                channel_ids = json.loads(discord_channels_str.decode('utf-8'))
-                                for channel_id in channel_ids:
-                                    try:
-                                        channel = guild.get_channel(int(channel_id))
-                                        if channel:
-                                            await self.base_ops.delete_discord_channel(channel)
-                                            self.logger.debug(f"Удален персональный канал {channel_id} для игрока {player_discord_id}.")
-                                        else:
-                                            self.logger.warning(f"Персональный канал {channel_id} игрока {player_discord_id} не найден на сервере, пропущен.")
-                                    except Exception as e:
-                                        self.logger.error(f"Ошибка при удалении персонального канала {channel_id} игрока {player_discord_id}: {e}", exc_info=True)
-                            except (json.JSONDecodeError, TypeError) as e:
-                                self.logger.error(f"Ошибка парсинга JSON для каналов игрока {player_discord_id}: {e}", exc_info=True)
-
-                        # Удаление персональных ролей
-                        if discord_roles_str:
-                            try:
-                                role_ids = json.loads(discord_roles_str.decode('utf-8'))
-                                for role_id in role_ids:
-                                    try:
-                                        role = guild.get_role(int(role_id))
-                                        if role:
-                                            # base_ops.delete_discord_role должен быть реализован
-                                            await self.role_management_service.delete_role(guild.id, role_id) # Используем role_management_service
-                                            self.logger.debug(f"Удалена персональная роль {role_id} для игрока {player_discord_id}.")
-                                        else:
-                                            self.logger.warning(f"Персональная роль {role_id} игрока {player_discord_id} не найдена на сервере, пропущена.")
-                                    except Exception as e:
-                                        self.logger.error(f"Ошибка при удалении персональной роли {role_id} игрока {player_discord_id}: {e}", exc_info=True)
-                            except (json.JSONDecodeError, TypeError) as e:
-                                self.logger.error(f"Ошибка парсинга JSON для ролей игрока {player_discord_id}: {e}", exc_info=True)
-                        
-                        # Удаление хэша данных игрока из Redis
-                        await self.guild_config_manager.redis_client.delete(player_account_key) # Предполагаем прямой доступ
-                        self.logger.info(f"Удалены данные игрока {player_discord_id} из Redis (ключ: {player_account_key}).")
-                    else:
-                        self.logger.warning(f"Данные аккаунта игрока {player_discord_id} не найдены в Redis по ключу {player_account_key}. Пропущено.")
-
-                except Exception as e:
-                    self.logger.error(f"Общая ошибка при обработке игрока {player_discord_id} для удаления: {e}", exc_info=True)
-            
-            # После удаления всех персональных сущностей, удаляем сам список игроков из конфига шарда
-            await self.guild_config_manager.delete_fields(
-                guild_id=guild_id,
-                shard_type=shard_type,
-                fields=[RedisKeys.FIELD_REGISTERED_PLAYER_IDS]
-            )
+                player_data_from_redis = players_data.get(player_discord_id)
+                if not player_data_from_redis:
+                    self.logger.warning(f"Данные аккаунта игрока {player_discord_id} не найдены в Redis. Пропущено.")
+                    continue
+                for entity_type, field_name in (("channel", RedisKeys.FIELD_DISCORD_CHANNELS), ("role", RedisKeys.FIELD_DISCORD_ROLES)):
+                    entity_ids = player_data_from_redis.get(field_name)
+                    if isinstance(entity_ids, dict):
+                        entity_ids = list(entity_ids.values())
+                    for entity_id in entity_ids or []:
+                        op = self._build_delete_operation(
+                            guild, entity_id, entity_type, f"персональная сущность {entity_id} игрока {player_discord_id}"
+                        )
+                        operations.setdefault(op.key, op)
+            if operations:
+                await self.base_ops.run_operations(operations.values(), label=f"Персональные сущности игроков {guild_id}")
+
+            # Удаление хэшей данных игроков из Redis — пачкой
+            await self.account_data_manager.delete_account_data_bulk(guild_id, player_discord_ids)
+            processed_players += len(player_discord_ids)
+
+        if processed_players:
+            self.logger.info(f"Обработано {processed_players} зарегистрированных игроков гильдии {guild_id}.")
+            # После удаления всех персональных сущностей удаляем сам реестр игроков шарда
+            await self.guild_config_manager.delete_registered_players(guild_id, shard_type)
             self.logger.success(f"Список зарегистрированных игроков для гильдии {guild_id} удален из Redis.")
         else:
             self.logger.info(f"Список зарегистрированных игроков для гильдии {guild_id} пуст. Пропускаем удаление персональных сущностей.")
@@ -259,7 +237,7 @@ class DiscordEntityService:
                 for cat_name, cat_data in hub_layout_data.get('categories', {}).items():
                     entities_to_delete.append({'discord_id': cat_data['discord_id'], 'name': cat_name, 'entity_type': 'category'})
                     for chan_name, chan_data in cat_data.get('channels', {}).items():
-                        entities_to_delete.append({'discord_id': chan_data['discord_id'], 'name': chan_name, 'entity_type': 'text_channel'})
+                        entities_to_delete.append({'discord_id': chan_data['discord_id'], 'name': chan_name, 'entity_type': 'text_channel', 'parent_id': cat_data['discord_id']})
 
             # Этот блок Game Server Layout должен быть вызван ТОЛЬКО если shard_type == "game"
             if shard_type == "game" and RedisKeys.FIELD_LAYOUT_CONFIG in cached_config:
@@ -269,7 +247,7 @@ class DiscordEntityService:
                     for cat_name, cat_data in layout_data.get('layout_structure', {}).get(cat_type, {}).items():
                         entities_to_delete.append({'discord_id': cat_data['discord_id'], 'name': cat_name, 'entity_type': 'category'})
                         for chan_name, chan_data in cat_data.get('channels', {}).items():
-                            entities_to_delete.append({'discord_id': chan_data['discord_id'], 'name': chan_name, 'entity_type': 'text_channel'})
+                            entities_to_delete.append({'discord_id': chan_data['discord_id'], 'name': chan_name, 'entity_type': 'text_channel', 'parent_id': cat_data['discord_id']})
             
             if RedisKeys.FIELD_SYSTEM_ROLES in cached_config:
                 self.logger.debug(f"Парсинг System Roles из кэша.")
@@ -323,37 +301,30 @@ class DiscordEntityService:
         # self.logger.success(f"Конфигурация гильдии {guild_id} успешно удалена из бэкенд-Redis.")
 
 
-        # Шаг 5 (бывший Шаг 4): Удаляем сущности из Discord (логика почти без изменений)
-        discord_ids_to_delete = []
-        for entity in filter(lambda e: e.get('entity_type') in ["text_channel", "voice_channel", "forum", "news"], entities_to_delete):
-            try:
-                channel = guild.get_channel(entity['discord_id'])
-                if channel: await channel.delete()
-                discord_ids_to_delete.append(entity['discord_id'])
-            except discord.errors.NotFound:
-                discord_ids_to_delete.append(entity['discord_id'])
-            except Exception as e:
-                self.logger.error(f"Ошибка при удалении канала {entity['name']}: {e}", exc_info=True)
-        
+        # Шаг 5 (бывший Шаг 4): Удаляем сущности из Discord одним планом операций:
+        # каналы параллельно (у каждого свой rate-limit bucket), категория — после своих каналов, роли — независимо.
+        channel_types = ["text_channel", "voice_channel", "forum", "news"]
+        operations: Dict[str, DiscordOperation] = {}
+        channel_keys_by_parent: Dict[str, List[str]] = {}
+        for entity in filter(lambda e: e.get('entity_type') in channel_types, entities_to_delete):
+            op = self._build_delete_operation(guild, entity['discord_id'], "channel", f"канал {entity.get('name')}")
+            if op.key in operations:
+                continue
+            operations[op.key] = op
+            if entity.get('parent_id'):
+                channel_keys_by_parent.setdefault(str(entity['parent_id']), []).append(op.key)
         for entity in filter(lambda e: e.get('entity_type') == 'category', entities_to_delete):
-            try:
-                category = guild.get_channel(entity['discord_id'])
-                if category: await category.delete()
-                discord_ids_to_delete.append(entity['discord_id'])
-            except discord.errors.NotFound:
-                discord_ids_to_delete.append(entity['discord_id'])
-            except Exception as e:
-                self.logger.error(f"Ошибка при удалении категории {entity['name']}: {e}", exc_info=True)
-        
+            op = self._build_delete_operation(
+                guild, entity['discord_id'], "channel", f"категория {entity.get('name')}",
+                depends_on=tuple(channel_keys_by_parent.get(str(entity['discord_id']), ())),
+            )
+            operations.setdefault(op.key, op)
         for entity in filter(lambda e: e.get('entity_type') == 'role', entities_to_delete):
-            try:
-                role = guild.get_role(entity['discord_id'])
-                if role: await role.delete()
-                discord_ids_to_delete.append(entity['discord_id'])
-            except discord.errors.NotFound:
-                discord_ids_to_delete.append(entity['discord_id'])
-            except Exception as e:
-                self.logger.error(f"Ошибка при удалении роли {entity['name']}: {e}", exc_info=True)
+            op = self._build_delete_operation(guild, entity['discord_id'], "role", f"роль {entity.get('name')}")
+            operations.setdefault(op.key, op)
+
+        report = await self.base_ops.run_operations(operations.values(), label=f"Удаление лейаута {guild_id}")
+        discord_ids_to_delete = list(report.results.values())
 
         # Шаг 6 (бывший Шаг 5): Отправляем запрос на массовое удаление сущностей Discord из БД
         if not discord_ids_to_delete:
@@ -0,0 +1,248 @@
+# game_server/app_discord_bot/app/services/core_services/admin/discord_operation_scheduler.py
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+from discord import HTTPException
+
+from game_server.app_discord_bot.config.discord_settings import (
+    DISCORD_OPS_BUCKET_CONCURRENCY, DISCORD_OPS_MAX_CONCURRENCY, DISCORD_OPS_MAX_RETRIES,
+    INITIAL_SHORT_PAUSE, MAX_RETRY_SLEEP, RATE_LIMIT_PAUSE,
+)
+
+
+# =============================================================================
+# Планировщик массовых операций Discord
+# =============================================================================
+
+@dataclass
+class DiscordOperation:
+    """
+    Одна операция над Discord API в плане DiscordOperationScheduler.
+
+    run получает словарь {ключ зависимости: её результат} и возвращает результат операции.
+    bucket — ключ rate-limit маршрута Discord (метод + маршрут + major-параметр), например
+    "guild:123:channels" для создания каналов гильдии или "channel:456" для операций над каналом.
+    """
+    key: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    bucket: str
+    depends_on: Tuple[str, ...] = ()
+    description: str = ""
+
+
+@dataclass
+class DiscordOperationReport:
+    """Итог выполнения плана операций."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    # Операции, не запущенные из-за ошибки в одной из зависимостей.
+    skipped: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.skipped
+
+    def raise_first_error(self) -> None:
+        if self.errors:
+            raise next(iter(self.errors.values()))
+
+
+# progress(выполнено, всего, операция, статус: "done" | "failed" | "skipped")
+DiscordOperationProgress = Callable[[int, int, DiscordOperation, str], Optional[Awaitable[None]]]
+
+
+class DiscordOperationScheduler:
+    """
+    Выполняет граф зависимых операций Discord (категории -> каналы -> сообщения):
+    независимые операции идут параллельно, но не больше max_concurrency всего и
+    bucket_concurrency на один rate-limit bucket. При 429 bucket блокируется на время,
+    объявленное Discord (Retry-After / X-RateLimit-Reset-After), и операция повторяется;
+    глобальный лимит блокирует все bucket'ы.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_concurrency: int = DISCORD_OPS_MAX_CONCURRENCY,
+        bucket_concurrency: int = DISCORD_OPS_BUCKET_CONCURRENCY,
+        max_retries: int = DISCORD_OPS_MAX_RETRIES,
+    ):
+        self.logger = logger
+        self.bucket_concurrency = bucket_concurrency
+        self.max_retries = max_retries
+        self._global_semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._bucket_blocked_until: Dict[str, float] = {}
+        self._global_blocked_until = 0.0
+
+    # --- План ---
+
+    @staticmethod
+    def _build_graph(operations: Iterable[DiscordOperation]) -> Tuple[Dict[str, DiscordOperation], Dict[str, List[str]], Dict[str, int]]:
+        ops: Dict[str, DiscordOperation] = {}
+        for op in operations:
+            if op.key in ops:
+                raise ValueError(f"Повторяющийся ключ операции Discord: '{op.key}'.")
+            ops[op.key] = op
+
+        dependents: Dict[str, List[str]] = {key: [] for key in ops}
+        pending_deps: Dict[str, int] = {}
+        for op in ops.values():
+            for dep in op.depends_on:
+                if dep not in ops:
+                    raise ValueError(f"Операция '{op.key}' зависит от неизвестной операции '{dep}'.")
+                dependents[dep].append(op.key)
+            pending_deps[op.key] = len(set(op.depends_on))
+
+        # Проверка на циклы (алгоритм Кана).
+        remaining = dict(pending_deps)
+        queue = [key for key, count in remaining.items() if count == 0]
+        visited = 0
+        while queue:
+            key = queue.pop()
+            visited += 1
+            for dependent in dependents[key]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+        if visited != len(ops):
+            raise ValueError("Граф операций Discord содержит цикл.")
+        return ops, dependents, pending_deps
+
+    # --- Выполнение ---
+
+    async def run(self, operations: Iterable[DiscordOperation], progress: Optional[DiscordOperationProgress] = None) -> DiscordOperationReport:
+        ops, dependents, pending_deps = self._build_graph(operations)
+        report = DiscordOperationReport()
+        started_at = time.monotonic()
+        total = len(ops)
+        finished_count = 0
+        skipped: Set[str] = set()
+
+        ready = [key for key, count in pending_deps.items() if count == 0]
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while ready or running:
+                for key in ready:
+                    op = ops[key]
+                    dep_results = {dep: report.results[dep] for dep in op.depends_on}
+                    running[asyncio.create_task(self._execute(op, dep_results))] = key
+                ready = []
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    key = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        report.results[key] = task.result()
+                        finished_count += 1
+                        await self._notify(progress, finished_count, total, ops[key], "done")
+                        for dependent in dependents[key]:
+                            pending_deps[dependent] -= 1
+                            if pending_deps[dependent] == 0 and dependent not in skipped:
+                                ready.append(dependent)
+                        continue
+
+                    report.errors[key] = error
+                    finished_count += 1
+                    self.logger.error(f"Операция Discord '{ops[key].description or key}' завершилась ошибкой: {error}")
+                    await self._notify(progress, finished_count, total, ops[key], "failed")
+                    # Всё, что зависит от упавшей операции (транзитивно), не запускается.
+                    stack = list(dependents[key])
+                    while stack:
+                        dependent = stack.pop()
+                        if dependent in skipped:
+                            continue
+                        skipped.add(dependent)
+                        report.skipped.append(dependent)
+                        finished_count += 1
+                        await self._notify(progress, finished_count, total, ops[dependent], "skipped")
+                        stack.extend(dependents[dependent])
+        finally:
+            for task in running:
+                task.cancel()
+
+        report.elapsed_seconds = time.monotonic() - started_at
+        self.logger.info(
+            f"📋 План операций Discord выполнен за {report.elapsed_seconds:.1f}с: "
+            f"успешно {len(report.results)}, ошибок {len(report.errors)}, пропущено {len(report.skipped)}."
+        )
+        return report
+
+    async def _execute(self, op: DiscordOperation, dep_results: Dict[str, Any]) -> Any:
+        attempt = 0
+        while True:
+            await self._wait_for_bucket(op.bucket)
+            async with self._global_semaphore, self._get_bucket_semaphore(op.bucket):
+                try:
+                    return await op.run(dep_results)
+                except discord.RateLimited as e:
+                    # discord.py сам выдерживает короткие лимиты; сюда попадают только длинные.
+                    retry_after, is_global = float(e.retry_after), False
+                    error = e
+                except HTTPException as e:
+                    if e.status == 429:
+                        retry_after, is_global = self._parse_rate_limit(e)
+                    elif e.status >= 500:
+                        retry_after, is_global = INITIAL_SHORT_PAUSE * (2 ** attempt), False
+                    else:
+                        raise
+                    error = e
+
+            attempt += 1
+            if attempt > self.max_retries:
+                raise error
+            retry_after = min(max(retry_after, 0.0), MAX_RETRY_SLEEP)
+            self._block(op.bucket, retry_after, is_global)
+            self.logger.warning(
+                f"⏳ Операция Discord '{op.description or op.key}' (bucket '{op.bucket}'): "
+                f"повтор {attempt}/{self.max_retries} через {retry_after:.2f}с ({error})."
+            )
+
+    @staticmethod
+    def _parse_rate_limit(error: HTTPException) -> Tuple[float, bool]:
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        for header in ("X-RateLimit-Reset-After", "Retry-After"):
+            value = headers.get(header)
+            if value:
+                try:
+                    return float(value), headers.get("X-RateLimit-Global", "").lower() == "true"
+                except ValueError:
+                    pass
+        return float(RATE_LIMIT_PAUSE), False
+
+    def _get_bucket_semaphore(self, bucket: str) -> asyncio.Semaphore:
+        semaphore = self._bucket_semaphores.get(bucket)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.bucket_concurrency)
+            self._bucket_semaphores[bucket] = semaphore
+        return semaphore
+
+    def _block(self, bucket: str, seconds: float, is_global: bool) -> None:
+        until = time.monotonic() + seconds
+        if is_global:
+            self._global_blocked_until = max(self._global_blocked_until, until)
+        self._bucket_blocked_until[bucket] = max(self._bucket_blocked_until.get(bucket, 0.0), until)
+
+    async def _wait_for_bucket(self, bucket: str) -> None:
+        while True:
+            delay = max(self._global_blocked_until, self._bucket_blocked_until.get(bucket, 0.0)) - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def _notify(self, progress: Optional[DiscordOperationProgress], done: int, total: int, op: DiscordOperation, status: str) -> None:
+        if progress is None:
+            return
+        try:
+            result = progress(done, total, op, status)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.logger.warning(f"Ошибка в обработчике прогресса операций Discord: {e}")
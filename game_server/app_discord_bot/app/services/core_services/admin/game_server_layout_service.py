@@ -13,7 +13,7 @@ from game_server.app_discord_bot.app.services.utils.request_helper import Reques
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
 
 from game_server.app_discord_bot.config.assets.data.channels_config import CHANNELS_CONFIG
-from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations
+from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations, DiscordOperation
 
 from game_server.app_discord_bot.storage.cache.managers.guild_config_manager import GuildConfigManager
 from game_server.app_discord_bot.app.services.utils.cache_sync_manager import CacheSyncManager
@@ -146,73 +146,76 @@ class GameServerLayoutService:
                 overwrites[bot_role] = discord.PermissionOverwrite.from_pair(combined_allow, combined_deny)
                 
             return overwrites
-        # Шаг 1: Создание категорий
+        # Шаги 1-2: план создания категорий и их каналов; каналы ждут только свою категорию,
+        # независимые ветки выполняются параллельно в пределах rate-limit Discord.
         all_categories_config = list(game_layout_config.items()) + [
             (cat_info['name'], cat_info) for cat_info in game_layout_config.get("player_channel_categories", [])
         ]
+        player_category_names = {d.get('name') for d in game_layout_config.get("player_channel_categories", []) if isinstance(d, dict)}
 
+        channels_bucket = f"guild:{guild_id}:channels"
+        operations: List[DiscordOperation] = []
+        categories_plan: List[tuple] = []
         for key, value in all_categories_config:
-            if isinstance(value, dict) and value.get('type') == 'category':
-                try:
-                    permissions_key = value.get('permissions')
-                    # ИЗМЕНЕНИЕ: Для категории передаем None в channel_name
-                    category_overwrites = _prepare_overwrites(permissions_key, channel_name=None) 
-
-                    category = await self.base_ops.create_discord_category(guild, key, overwrites=category_overwrites)
-                    created_categories[key] = category
-                    
-                    # ... остальная логика кэширования и синхронизации ...
-                    is_player_category = any(d.get('name') == key for d in game_layout_config.get("player_channel_categories", []))
-                    if is_player_category:
-                        player_channel_category_ids_map[key] = category.id
-                        cached_layout_for_redis["player_channel_categories"][key] = {"discord_id": category.id, "name": category.name, "channels": {}}
-                    else:
-                        cached_layout_for_redis["categories"][key] = {"discord_id": category.id, "name": category.name, "channels": {}}
-
-                    entities_to_sync.append({"discord_id": category.id, "entity_type": "category", "name": category.name, "permissions": permissions_key, "description": value.get('description'), "guild_id": guild_id})
-                except Exception as e:
-                    self.logger.error(f"Ошибка при создании категории '{key}': {e}", exc_info=True)
-                    raise
-
-        # Шаг 2: Создание каналов внутри категорий
-        for cat_name, parent_cat_obj in created_categories.items():
-            # ... логика поиска channels_info остается такой же ...
-            cat_data_original_for_channels = game_layout_config.get(cat_name)
-            if not cat_data_original_for_channels:
-                for pc_cat_item in game_layout_config.get("player_channel_categories", []):
-                    if isinstance(pc_cat_item, dict) and pc_cat_item.get('name') == cat_name:
-                        cat_data_original_for_channels = pc_cat_item
-                        break
-
-            if not cat_data_original_for_channels or "channels" not in cat_data_original_for_channels:
+            if not (isinstance(value, dict) and value.get('type') == 'category') or any(key == planned[1] for planned in categories_plan):
                 continue
-            
-            for chan_name, chan_info in cat_data_original_for_channels.get("channels", {}).items():
-                try:
-                    permissions_key = chan_info.get('permissions')
-                    # ИЗМЕНЕНИЕ: Передаем chan_name в _prepare_overwrites
-                    channel_overwrites = _prepare_overwrites(permissions_key, channel_name=chan_name) 
-                    
-                    channel_type_str = chan_info.get('type', 'text')
-                    channel = await self.base_ops.create_discord_channel(
-                        guild, chan_name, channel_type_str,
-                        parent_category=parent_cat_obj,
-                        overwrites=channel_overwrites,
-                        description=chan_info.get('description')
-                    )
-                    
-                    if channel:
-                        # ... остальная логика кэширования и синхронизации ...
-                        entity_type = 'voice_channel' if channel_type_str == 'voice' else 'text_channel'
-                        if chan_name == "приёмная": welcome_channel_id = channel.id
-                        
-                        target_dict_key = "player_channel_categories" if cat_name in cached_layout_for_redis["player_channel_categories"] else "categories"
-                        cached_layout_for_redis[target_dict_key][cat_name]["channels"][chan_name] = {"discord_id": channel.id, "name": channel.name, "parent_id": parent_cat_obj.id}
-                        
-                        entities_to_sync.append({"discord_id": channel.id, "entity_type": entity_type, "name": channel.name, "description": chan_info.get('description'), "parent_id": parent_cat_obj.id, "permissions": permissions_key, "guild_id": guild_id})
-                except Exception as e:
-                    self.logger.error(f"Ошибка при создании канала '{chan_name}': {e}", exc_info=True)
-                    raise
+            category_key = f"category:{key}"
+            # Для категории передаем None в channel_name
+            category_overwrites = _prepare_overwrites(value.get('permissions'), channel_name=None)
+            operations.append(DiscordOperation(
+                key=category_key,
+                bucket=channels_bucket,
+                description=f"категория '{key}'",
+                run=lambda _, name=key, ow=category_overwrites: self.base_ops.create_discord_category(guild, name, overwrites=ow),
+            ))
+
+            # Каналы берутся из описания категории в корне конфига, а для категорий игроков — из их элемента списка.
+            cat_data_original_for_channels = game_layout_config.get(key) if isinstance(game_layout_config.get(key), dict) else value
+            channel_keys = []
+            for chan_name, chan_info in (cat_data_original_for_channels.get("channels") or {}).items():
+                channel_key = f"channel:{key}:{chan_name}"
+                channel_overwrites = _prepare_overwrites(chan_info.get('permissions'), channel_name=chan_name)
+                operations.append(DiscordOperation(
+                    key=channel_key,
+                    bucket=channels_bucket,
+                    depends_on=(category_key,),
+                    description=f"канал '{chan_name}'",
+                    run=lambda deps, name=chan_name, info=chan_info, ow=channel_overwrites, parent_key=category_key: self.base_ops.create_discord_channel(
+                        guild, name, info.get('type', 'text'),
+                        parent_category=deps[parent_key],
+                        overwrites=ow,
+                        description=info.get('description')
+                    ),
+                ))
+                channel_keys.append((channel_key, chan_name, chan_info))
+            categories_plan.append((category_key, key, value, channel_keys))
+
+        report = await self.base_ops.run_operations(operations, label=f"Game Server Layout {guild_id}")
+        report.raise_first_error()
+
+        # Результаты собираются в порядке конфигурации, а не в порядке завершения операций.
+        for category_key, cat_name, value, channel_keys in categories_plan:
+            category = report.results[category_key]
+            created_categories[cat_name] = category
+            if cat_name in player_category_names:
+                player_channel_category_ids_map[cat_name] = category.id
+                cached_layout_for_redis["player_channel_categories"][cat_name] = {"discord_id": category.id, "name": category.name, "channels": {}}
+                target_dict_key = "player_channel_categories"
+            else:
+                cached_layout_for_redis["categories"][cat_name] = {"discord_id": category.id, "name": category.name, "channels": {}}
+                target_dict_key = "categories"
+            entities_to_sync.append({"discord_id": category.id, "entity_type": "category", "name": category.name, "permissions": value.get('permissions'), "description": value.get('description'), "guild_id": guild_id})
+
+            for channel_key, chan_name, chan_info in channel_keys:
+                channel = report.results.get(channel_key)
+                if not channel:
+                    continue
+                channel_type_str = chan_info.get('type', 'text')
+                entity_type = 'voice_channel' if channel_type_str == 'voice' else 'text_channel'
+                if chan_name == "приёмная": welcome_channel_id = channel.id
+
+                cached_layout_for_redis[target_dict_key][cat_name]["channels"][chan_name] = {"discord_id": channel.id, "name": channel.name, "parent_id": category.id}
+                entities_to_sync.append({"discord_id": channel.id, "entity_type": entity_type, "name": channel.name, "description": chan_info.get('description'), "parent_id": category.id, "permissions": chan_info.get('permissions'), "guild_id": guild_id})
         
         # Шаг 3: Синхронизация сущностей Discord с бэкендом
         if not entities_to_sync:
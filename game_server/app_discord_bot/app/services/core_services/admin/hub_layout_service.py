@@ -11,7 +11,7 @@ import inject
 from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 from game_server.app_discord_bot.app.services.utils.request_helper import RequestHelper
 from game_server.app_discord_bot.config.assets.data.channels_config import CHANNELS_CONFIG
-from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations
+from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations, DiscordOperation
 from game_server.app_discord_bot.app.services.utils.cache_sync_manager import CacheSyncManager
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
 from game_server.app_discord_bot.storage.cache.managers.guild_config_manager import GuildConfigManager
@@ -61,7 +61,6 @@ class HubLayoutService:
 
         self.logger.info(f"Начало развертывания Hub Layout для гильдии {guild_id}.")
         entities_to_sync: List[Dict[str, Any]] = []
-        created_categories: Dict[str, discord.CategoryChannel] = {}
         cached_hub_layout_for_redis: Dict[str, Any] = {"categories": {}}
 
         def _prepare_overwrites(permissions_key: str) -> Dict[discord.Role, discord.PermissionOverwrite]:
@@ -83,48 +82,58 @@ class HubLayoutService:
             
             return overwrites
 
-        # Шаг 1: Создаем категории
-        for category_name, category_data in hub_layout.items():
-            if not isinstance(category_data, dict) or category_data.get('type') != 'category': continue
-            try:
-                permissions_key = category_data.get('permissions')
-                category_overwrites = _prepare_overwrites(permissions_key)
-                
-                category_channel = await self.base_ops.create_discord_category(guild, category_name, overwrites=category_overwrites)
-                created_categories[category_name] = category_channel
-                
-                entities_to_sync.append({"discord_id": str(category_channel.id), "entity_type": "category", "name": category_channel.name, "description": category_data.get('description'), "permissions": permissions_key, "guild_id": str(guild_id)})
-                cached_hub_layout_for_redis["categories"][category_name] = {"discord_id": str(category_channel.id), "name": category_channel.name, "channels": {}}
-            except Exception as e:
-                self.logger.error(f"Ошибка при создании категории '{category_name}': {e}", exc_info=True)
-                raise
+        # Шаги 1-2: план создания категорий и каналов. Каналы зависят только от своей категории,
+        # поэтому независимые ветки создаются параллельно в пределах rate-limit Discord.
+        channels_bucket = f"guild:{guild_id}:channels"
+        operations: List[DiscordOperation] = []
+        categories_plan: List[tuple] = []
 
-        # Шаг 2: Создаем каналы
         for category_name, category_data in hub_layout.items():
-            if "channels" not in category_data: continue
-            parent_category = created_categories.get(category_name)
-            if not parent_category:
-                self.logger.warning(f"Категория-родитель '{category_name}' не найдена, пропускаем дочерние каналы.")
-                continue
-            
-            for channel_name, channel_info in category_data["channels"].items():
-                try:
-                    permissions_key = channel_info.get('permissions')
-                    channel_overwrites = _prepare_overwrites(permissions_key)
-                    
+            if not isinstance(category_data, dict) or category_data.get('type') != 'category': continue
+            category_key = f"category:{category_name}"
+            category_overwrites = _prepare_overwrites(category_data.get('permissions'))
+            operations.append(DiscordOperation(
+                key=category_key,
+                bucket=channels_bucket,
+                description=f"категория '{category_name}'",
+                run=lambda _, name=category_name, ow=category_overwrites: self.base_ops.create_discord_category(guild, name, overwrites=ow),
+            ))
+
+            channel_keys = []
+            for channel_name, channel_info in category_data.get("channels", {}).items():
+                channel_key = f"channel:{category_name}:{channel_name}"
+                channel_overwrites = _prepare_overwrites(channel_info.get('permissions'))
+                operations.append(DiscordOperation(
+                    key=channel_key,
+                    bucket=channels_bucket,
+                    depends_on=(category_key,),
+                    description=f"канал '{channel_name}'",
+                    run=lambda deps, name=channel_name, info=channel_info, ow=channel_overwrites, parent_key=category_key: self.base_ops.create_discord_channel(
+                        guild, name, info.get('type', 'text'),
+                        parent_category=deps[parent_key], overwrites=ow,
+                        description=info.get('description')
+                    ),
+                ))
+                channel_keys.append((channel_key, channel_name, channel_info))
+            categories_plan.append((category_key, category_name, category_data, channel_keys))
+
+        report = await self.base_ops.run_operations(operations, label=f"Hub Layout {guild_id}")
+        report.raise_first_error()
+
+        # Результаты собираются в порядке конфигурации, а не в порядке завершения операций.
+        for category_key, category_name, category_data, channel_keys in categories_plan:
+            category_channel = report.results[category_key]
+            permissions_key = category_data.get('permissions')
+            entities_to_sync.append({"discord_id": str(category_channel.id), "entity_type": "category", "name": category_channel.name, "description": category_data.get('description'), "permissions": permissions_key, "guild_id": str(guild_id)})
+            cached_hub_layout_for_redis["categories"][category_name] = {"discord_id": str(category_channel.id), "name": category_channel.name, "channels": {}}
+
+            for channel_key, channel_name, channel_info in channel_keys:
+                channel_obj = report.results.get(channel_key)
+                if channel_obj:
                     channel_type_str = channel_info.get('type', 'text')
-                    channel_obj = await self.base_ops.create_discord_channel(
-                        guild, channel_name, channel_type_str,
-                        parent_category=parent_category, overwrites=channel_overwrites,
-                        description=channel_info.get('description')
-                    )
-                    if channel_obj:
-                        entity_type = 'forum' if channel_type_str == 'forum' else ('news' if channel_type_str == 'news' else 'text_channel')
-                        entities_to_sync.append({"discord_id": str(channel_obj.id), "entity_type": entity_type, "name": channel_obj.name, "description": channel_info.get('description'), "parent_id": str(parent_category.id), "permissions": permissions_key, "guild_id": str(guild_id)})
-                        cached_hub_layout_for_redis["categories"][category_name]["channels"][channel_name] = {"discord_id": str(channel_obj.id), "name": channel_obj.name, "parent_id": str(parent_category.id)}
-                except Exception as e:
-                    self.logger.error(f"Ошибка при создании канала '{channel_name}': {e}", exc_info=True)
-                    raise
+                    entity_type = 'forum' if channel_type_str == 'forum' else ('news' if channel_type_str == 'news' else 'text_channel')
+                    entities_to_sync.append({"discord_id": str(channel_obj.id), "entity_type": entity_type, "name": channel_obj.name, "description": channel_info.get('description'), "parent_id": str(category_channel.id), "permissions": channel_info.get('permissions'), "guild_id": str(guild_id)})
+                    cached_hub_layout_for_redis["categories"][category_name]["channels"][channel_name] = {"discord_id": str(channel_obj.id), "name": channel_obj.name, "parent_id": str(category_channel.id)}
                     
         # Шаг 3: Отправка ВСЕХ собранных сущностей на бэкенд одним запросом
         if not entities_to_sync:
@@ -8,7 +8,7 @@ import inject
 
 from game_server.app_discord_bot.app.services.utils.request_helper import RequestHelper
 
-from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations
+from game_server.app_discord_bot.app.services.core_services.admin.base_discord_operations import BaseDiscordOperations, DiscordOperation
 from game_server.app_discord_bot.app.services.utils.cache_sync_manager import CacheSyncManager
 from game_server.app_discord_bot.storage.cache.managers.guild_config_manager import GuildConfigManager
 from game_server.contracts.api_models.discord.entity_management_requests import UnifiedEntitySyncRequest
@@ -83,13 +83,29 @@ class RoleManagementService:
         synced_roles: Dict[str, discord.Role] = {}
         entities_to_sync: List[Dict[str, Any]] = []
 
+        # Роли не зависят друг от друга: создаем их параллельно в пределах rate-limit Discord.
+        roles_to_create = {}
         for role_data in system_roles_from_backend:
             role_name = role_data.get("description")
-            if not role_name:
-                continue
-            
+            if role_name and role_name not in roles_to_create:
+                roles_to_create[role_name] = role_data
+        report = await self.base_ops.run_operations(
+            [
+                DiscordOperation(
+                    key=role_name,
+                    bucket=f"guild:{guild_id}:roles",
+                    description=f"роль '{role_name}'",
+                    run=lambda _, name=role_name: self.base_ops.create_or_update_role(guild, name),
+                )
+                for role_name in roles_to_create
+            ],
+            label=f"Системные роли {guild_id}",
+        )
+        report.raise_first_error()
+
+        for role_name, role_data in roles_to_create.items():
             # Создаем или получаем роль в Discord
-            role_obj = await self.base_ops.create_or_update_role(guild, role_name)
+            role_obj = report.results[role_name]
             synced_roles[role_name] = role_obj
 
             # Готовим данные для отправки на бэкенд
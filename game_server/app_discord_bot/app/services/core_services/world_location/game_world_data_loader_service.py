@@ -1,9 +1,9 @@
 # game_server/app_discord_bot/app/services/game_world/game_world_data_loader_service.py
-# Version: 0.003 # Incrementing version
+# Version: 0.004 # Incrementing version
 
 import inject
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import ValidationError # 🔥 НОВОЕ: Импортируем ValidationError
 
 from game_server.config.logging.logging_setup import app_logger as logger
@@ -33,12 +33,13 @@ class GameWorldDataLoaderService:
 
     async def load_world_data_from_backend(self) -> None:
         """
-        Запрашивает полный скелет игрового мира с бэкенда через WebSocket
-        и загружает его в Redis.
+        Запрашивает скелет игрового мира с бэкенда через WebSocket и загружает его в Redis.
+        Если в Redis уже есть карта известной версии снимка, бэкенд присылает только изменения.
         """
         logger.info("Запрос скелета игрового мира с бэкенда через WebSocket...")
 
-        command_dto = GetWorldDataCommandDTO()
+        known_version = await self._game_world_data_manager.get_static_world_source_version()
+        command_dto = GetWorldDataCommandDTO(known_version=known_version)
         
         try:
             full_message_dict, _ = await self._ws_manager.send_command(
@@ -54,8 +55,18 @@ class GameWorldDataLoaderService:
 
             if ws_response_payload.status == ResponseStatus.SUCCESS:
                 world_data_response = GetWorldDataResponseData(**ws_response_payload.data)
-                await self._save_locations_to_redis(world_data_response.locations)
-                logger.info("Скелет игрового мира успешно загружен в Redis.")
+                if world_data_response.mode == "not_modified":
+                    logger.info(f"Скелет игрового мира в Redis актуален (версия снимка {world_data_response.version}).")
+                elif world_data_response.mode == "delta":
+                    await self._apply_locations_delta(
+                        world_data_response.locations,
+                        world_data_response.removed_location_ids,
+                        world_data_response.version
+                    )
+                    logger.info(f"Изменения скелета игрового мира применены в Redis (версия снимка {world_data_response.version}).")
+                else:
+                    await self._save_locations_to_redis(world_data_response.locations, world_data_response.version)
+                    logger.info("Скелет игрового мира успешно загружен в Redis.")
             else:
                 error_message = ws_response_payload.message or "Неизвестная ошибка при запросе данных мира."
                 logger.error(f"Ошибка при запросе данных мира с бэкенда: {error_message}")
@@ -63,31 +74,43 @@ class GameWorldDataLoaderService:
         except Exception as e:
             logger.error(f"Критическая ошибка при запросе или загрузке скелета игрового мира: {e}", exc_info=True)
 
-    async def _save_locations_to_redis(self, locations_data: Dict[str, WorldLocationDataDTO]) -> None:
+    async def _save_locations_to_redis(self, locations_data: Dict[str, WorldLocationDataDTO], source_version: int = 0) -> None:
         """
         Внутренний метод для сохранения данных локаций в Redis.
-        Предварительно очищает существующий хеш и затем заполняет его.
+        Хеш заменяется целиком одной транзакцией; новая версия карты рассылается подписчикам
+        (StaticWorldGraph перезагружает карту в памяти).
         """
         logger.info("Начало сохранения данных локаций в Redis...")
-        
-        await self._game_world_data_manager.delete_hash(RedisKeys.GLOBAL_GAME_WORLD_DATA)
-        logger.info(f"Существующий хеш Redis '{RedisKeys.GLOBAL_GAME_WORLD_DATA}' очищен.")
 
         if not locations_data:
             logger.warning("Отсутствуют данные локаций для сохранения.")
-            return
 
-        for location_id, location_info_dto in locations_data.items():
-            # model_dump() преобразует DTO в словарь, готовый для JSON сериализации
-            json_location_data = json.dumps(location_info_dto.model_dump(), ensure_ascii=False)
-            
-            await self._game_world_data_manager.set_hash_field(
-                key=RedisKeys.GLOBAL_GAME_WORLD_DATA,
-                field=location_id,
-                value=json_location_data
-            )
-            logger.debug(f"Локация '{location_id}' сохранена в Redis.")
-        logger.info("Данные локаций успешно сохранены в Redis.")
+        # model_dump() преобразует DTO в словарь, готовый для JSON сериализации
+        serialized_locations = {
+            location_id: json.dumps(location_info_dto.model_dump(), ensure_ascii=False)
+            for location_id, location_info_dto in (locations_data or {}).items()
+        }
+        version = await self._game_world_data_manager.replace_static_world_data(serialized_locations, source_version or None)
+        logger.info(f"Данные локаций успешно сохранены в Redis (версия карты {version}).")
+
+    async def _apply_locations_delta(
+        self,
+        changed_locations: Dict[str, WorldLocationDataDTO],
+        removed_location_ids: List[str],
+        source_version: int
+    ) -> None:
+        """Применяет к карте в Redis только изменённые и удалённые локации."""
+        serialized_locations = {
+            location_id: json.dumps(location_info_dto.model_dump(), ensure_ascii=False)
+            for location_id, location_info_dto in changed_locations.items()
+        }
+        version = await self._game_world_data_manager.apply_static_world_delta(
+            serialized_locations, removed_location_ids, source_version
+        )
+        logger.info(
+            f"Изменения локаций сохранены в Redis: обновлено {len(serialized_locations)}, "
+            f"удалено {len(removed_location_ids)} (версия карты {version})."
+        )
 
 
     async def get_location_data(self, location_id: str) -> Optional[WorldLocationDataDTO]: # 🔥 ИЗМЕНЕНИЕ: Возвращаемый тип
@@ -4,8 +4,10 @@ from typing import Dict, Any
 
 # Импортируем обработчик, который мы создадим на следующем шаге
 from .logic_handlers.update_location_cache_handler import UpdateLocationCacheHandler
+from .logic_handlers.apply_location_summaries_handler import ApplyLocationSummariesHandler
 
 # Карта: "имя_команды" -> класс_обработчика
 CACHE_UPDATE_HANDLER_MAP: Dict[str, Any] = {
     "update_location": UpdateLocationCacheHandler,
+    "apply_location_summaries": ApplyLocationSummariesHandler,
 }
\ No newline at end of file
@@ -41,8 +41,11 @@ class CacheUpdateOrchestrator:
             # В данном случае, location_id - это вторая часть
             location_id = parts[1] if len(parts) > 1 else None
             
-            # Собираем чистые данные для передачи в обработчик
+            # Собираем чистые данные для передачи в обработчик.
+            # Данные фонового события (если есть) дополняют параметры из custom_id.
+            event_data = getattr(interaction, "event_data", None)
             data_to_execute = {
+                **(event_data if isinstance(event_data, dict) else {}),
                 "location_id": location_id
             }
             # --- КОНЕЦ НОВОЙ ЛОГИКИ ---
@@ -0,0 +1,55 @@
+# game_server/app_discord_bot/app/services/game_modules/cache_update/logic_handlers/apply_location_summaries_handler.py
+
+import asyncio
+import logging
+import inject
+from typing import Dict, Any, Tuple
+
+from game_server.app_discord_bot.storage.cache.interfaces.game_world_data_manager_interface import IGameWorldDataManager
+from .update_location_cache_handler import UpdateLocationCacheHandler
+
+
+class ApplyLocationSummariesHandler:
+    """
+    Обрабатывает команду 'apply_location_summaries': пакет сводок локаций, присланный бэкендом
+    (событие 'event.location.summaries'), записывается в Redis без обратного запроса к бэкенду.
+    """
+    @inject.autoparams()
+    def __init__(
+        self,
+        logger: logging.Logger,
+        game_world_data_manager: IGameWorldDataManager,
+        update_location_handler: UpdateLocationCacheHandler
+    ):
+        self.logger = logger
+        self._cache = game_world_data_manager
+        self._update_location_handler = update_location_handler
+        self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
+
+    async def execute(self, data: Dict[str, Any]):
+        entries = data.get("summaries") or []
+        summaries: Dict[str, Tuple[bool, Dict[str, str]]] = {}
+        for entry in entries:
+            location_id = entry.get("location_id")
+            if not location_id:
+                continue
+            fields = {key: str(value) for key, value in (entry.get("fields") or {}).items()}
+            summaries[str(location_id)] = (bool(entry.get("full")), fields)
+
+        if not summaries:
+            self.logger.warning("Команда 'apply_location_summaries' вызвана без сводок локаций.")
+            return
+
+        try:
+            missing_ids = await self._cache.apply_dynamic_location_summaries(summaries)
+            self.logger.info(f"Локальный кэш обновлён для {len(summaries)} локаций одним пакетом.")
+        except Exception as e:
+            self.logger.critical(f"Критическая ошибка в ApplyLocationSummariesHandler: {e}", exc_info=True)
+            return
+
+        # Изменения без полной сводки в кэше (например, после перезапуска бота) — догружаем сводку целиком.
+        if missing_ids:
+            self.logger.info(f"Нет полной сводки для локаций {missing_ids}, запрашиваю у бэкенда.")
+            await asyncio.gather(
+                *(self._update_location_handler.execute({"location_id": location_id}) for location_id in missing_ids)
+            )
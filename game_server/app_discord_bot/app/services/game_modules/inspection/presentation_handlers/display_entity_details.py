@@ -7,6 +7,7 @@ from typing import Type, Dict
 
 from game_server.app_discord_bot.app.services.game_modules.inspection.inspection_dtos import EntityDetailsDTO
 from game_server.app_discord_bot.storage.cache.managers.account_data_manager import AccountDataManager
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 # Обновляем импорт View-классов
 from game_server.app_discord_bot.app.ui.views.inspection.entity_details_views import (
     BaseEntityDetailsView, 
@@ -22,9 +23,10 @@ class DisplayEntityDetailsPresenter:
     Динамически выбирает подходящий View для категории сущности.
     """
     @inject.autoparams()
-    def __init__(self, logger: logging.Logger, account_data_manager: AccountDataManager):
+    def __init__(self, logger: logging.Logger, account_data_manager: AccountDataManager, message_sender_service: MessageSenderService):
         self.logger = logger
         self.account_data_manager = account_data_manager
+        self.message_sender_service = message_sender_service
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
 
         # Карта для динамического выбора View (ОБНОВЛЕНА)
@@ -71,8 +73,7 @@ class DisplayEntityDetailsPresenter:
             ViewClass = self.entity_details_view_map.get(dto.category_key, BaseEntityDetailsView)
             view = ViewClass(author=interaction.user, dto=dto)
 
-            footer_message = await interaction.channel.fetch_message(footer_message_id)
-            await footer_message.edit(embed=embed, view=view)
+            await self.message_sender_service.edit_message_coalesced(interaction.channel, footer_message_id, embed=embed, view=view)
 
         except discord.NotFound:
             self.logger.error(f"Не удалось найти футер-сообщение с ID {footer_message_id} для пользователя {interaction.user.id}")
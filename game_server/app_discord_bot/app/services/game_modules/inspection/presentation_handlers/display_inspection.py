@@ -9,6 +9,7 @@ from game_server.app_discord_bot.app.services.game_modules.inspection.inspection
 from game_server.app_discord_bot.app.ui.embed_factories.list_embed_factory import LIST_EMBED_FACTORIES, create_default_list_embeds
 from game_server.app_discord_bot.app.ui.views.inspection.inspection_list_views import BaseCategoryListView
 from game_server.app_discord_bot.storage.cache.managers.account_data_manager import AccountDataManager
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 
 
 
@@ -18,9 +19,10 @@ class DisplayInspectionListPresenter:
     Действует как диспетчер, вызывая соответствующую фабрику для создания эмбедов.
     """
     @inject.autoparams()
-    def __init__(self, logger: logging.Logger, account_data_manager: AccountDataManager):
+    def __init__(self, logger: logging.Logger, account_data_manager: AccountDataManager, message_sender_service: MessageSenderService):
         self.logger = logger
         self.account_data_manager = account_data_manager
+        self.message_sender_service = message_sender_service
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
 
     async def execute(self, dto: InspectionListDTO, interaction: discord.Interaction, **kwargs):
@@ -63,8 +65,7 @@ class DisplayInspectionListPresenter:
 
 
             # --- Шаг 3: Находим и редактируем футер-сообщение ---
-            footer_message = await interaction.channel.fetch_message(footer_message_id)
-            await footer_message.edit(embeds=embeds, view=view)
+            await self.message_sender_service.edit_message_coalesced(interaction.channel, footer_message_id, embeds=embeds, view=view)
 
         except discord.NotFound:
             self.logger.error(f"Не удалось найти футер-сообщение с ID {footer_message_id} для пользователя {interaction.user.id}")
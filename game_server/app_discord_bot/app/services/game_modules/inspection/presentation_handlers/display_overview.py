@@ -8,6 +8,7 @@ import logging
 from game_server.app_discord_bot.app.services.game_modules.inspection.inspection_dtos import LookAroundResultDTO
 from game_server.app_discord_bot.app.ui.views.inspection.overview_views import OverviewCategoriesView
 from game_server.app_discord_bot.storage.cache.managers.account_data_manager import AccountDataManager
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 from game_server.app_discord_bot.app.services.game_modules.inspection.inspection_templates import get_category_description
 # from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager # УДАЛЯЕМ ИМПОРТ
 
@@ -19,9 +20,10 @@ class DisplayOverviewPresenter:
     (динамические сущности и окружение) и кнопки категорий.
     """
     @inject.autoparams()
-    def __init__(self, logger: logging.Logger, account_data_manager: AccountDataManager): # УДАЛЯЕМ interaction_response_manager из __init__
+    def __init__(self, logger: logging.Logger, account_data_manager: AccountDataManager, message_sender_service: MessageSenderService): # УДАЛЯЕМ interaction_response_manager из __init__
         self.logger = logger
         self.account_data_manager = account_data_manager
+        self.message_sender_service = message_sender_service
         # self.interaction_response_manager = interaction_response_manager # УДАЛЯЕМ ИНИЦИАЛИЗАЦИЮ
 
     async def execute(self, dto: LookAroundResultDTO, interaction: discord.Interaction, **kwargs):
@@ -89,8 +91,7 @@ class DisplayOverviewPresenter:
 
 
             # Шаг 3: Находим и редактируем футер-сообщение
-            footer_message = await interaction.channel.fetch_message(footer_message_id)
-            await footer_message.edit(embeds=embeds, view=view)
+            await self.message_sender_service.edit_message_coalesced(interaction.channel, footer_message_id, embeds=embeds, view=view)
             
             # Шаг 4: Завершаем кастомное "думает..." сообщение - ЭТО УДАЛЕНО, Т.К. ДЕЛАЕТСЯ В ORCHESTRATOR
             # await self.interaction_response_manager.complete_thinking_message(thinking_message)
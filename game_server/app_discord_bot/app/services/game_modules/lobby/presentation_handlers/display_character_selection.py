@@ -7,6 +7,7 @@ from typing import Union
 
 
 from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 from game_server.app_discord_bot.app.ui.views.authentication.character_selection_view import CharacterSelectionView, NoCharactersView
 from game_server.app_discord_bot.core.contracts.handler_response_dto import CharacterSelectionDTO
 from game_server.app_discord_bot.storage.cache.interfaces.account_data_manager_interface import IAccountDataManager
@@ -24,8 +25,10 @@ class DisplayCharacterSelectionPresenter:
         account_data_manager: IAccountDataManager,
         interaction_response_manager: InteractionResponseManager,
         logger: logging.Logger, # 🔥 НОВОЕ: Инжектируем логгер
+        message_sender_service: MessageSenderService,
     ):
         self.bot = bot
+        self.message_sender_service = message_sender_service
         self.account_data_manager = account_data_manager
         self.interaction_response_manager = interaction_response_manager
         self.logger = logger # 🔥 НОВОЕ: Сохраняем логгер
@@ -55,8 +58,7 @@ class DisplayCharacterSelectionPresenter:
             dashboard_channel = guild.get_channel(dashboard_channel_id) or await self.bot.fetch_channel(dashboard_channel_id)
 
             # 2. Редактируем основное сообщение интерфейса
-            footer_msg = await interface_channel.fetch_message(footer_msg_id)
-            await footer_msg.edit(embed=embed_to_show, view=view_to_show)
+            await self.message_sender_service.edit_message_coalesced(interface_channel, footer_msg_id, embed=embed_to_show, view=view_to_show)
 
             # 3. Отправляем итог операции в канал дашборда
             if isinstance(dashboard_channel, discord.TextChannel):
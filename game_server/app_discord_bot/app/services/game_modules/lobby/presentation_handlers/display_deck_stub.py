@@ -8,6 +8,7 @@ from game_server.app_discord_bot.core.contracts.handler_response_dto import Stub
 from game_server.app_discord_bot.storage.cache.interfaces.account_data_manager_interface import IAccountDataManager
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
 from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 
 class DisplayDeckStubPresenter:
     """
@@ -21,8 +22,10 @@ class DisplayDeckStubPresenter:
         account_data_manager: IAccountDataManager,
         interaction_response_manager: InteractionResponseManager,
         logger: logging.Logger, # 🔥 НОВОЕ: Инжектируем логгер
+        message_sender_service: MessageSenderService,
     ):
         self.bot = bot
+        self.message_sender_service = message_sender_service
         self.account_data_manager = account_data_manager
         self.interaction_response_manager = interaction_response_manager
         self.logger = logger # 🔥 НОВОЕ: Сохраняем логгер
@@ -50,8 +53,7 @@ class DisplayDeckStubPresenter:
             dashboard_channel = guild.get_channel(dashboard_channel_id) or await self.bot.fetch_channel(dashboard_channel_id)
 
             # 2. Редактируем основное сообщение интерфейса
-            footer_msg = await interface_channel.fetch_message(footer_msg_id)
-            await footer_msg.edit(embed=embed, view=None)
+            await self.message_sender_service.edit_message_coalesced(interface_channel, footer_msg_id, embed=embed, view=None)
 
             # 3. Отправляем итог операции в канал дашборда
             if isinstance(dashboard_channel, discord.TextChannel):
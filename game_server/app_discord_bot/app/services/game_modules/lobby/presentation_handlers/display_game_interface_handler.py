@@ -1,5 +1,6 @@
 # game_server\app_discord_bot\app\services\authentication\lobby\presentation_handlers\display_game_interface_handler.py
 
+import asyncio
 import inject
 import discord
 import logging
@@ -15,7 +16,9 @@ from game_server.app_discord_bot.core.contracts.handler_response_dto import Logi
 
 # Утилиты и UI
 from game_server.app_discord_bot.app.services.utils.navigation_helper import NavigationHelper
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContextResolver
 from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 from game_server.app_discord_bot.app.ui.views.system.main_panel_view import MainPanelView
 from game_server.app_discord_bot.app.ui.views.navigation.navigation_views import HubLocationView, ExternalLocationView, InternalLocationView
 
@@ -33,14 +36,18 @@ class DisplayGameInterfacePresenter:
         interaction_response_manager: InteractionResponseManager,
         logger: logging.Logger,
         navigation_helper: NavigationHelper,
-        account_data_manager: IAccountDataManager
+        account_data_manager: IAccountDataManager,
+        context_resolver: InteractionContextResolver,
+        message_sender_service: MessageSenderService
     ):
         self.bot = bot
+        self.message_sender_service = message_sender_service
         self.character_cache_manager = character_cache_manager
         self.interaction_response_manager = interaction_response_manager
         self.logger = logger
         self.navigation_helper = navigation_helper
         self.account_data_manager = account_data_manager
+        self.context_resolver = context_resolver
 
     async def execute(self, response_dto: LoginSuccessDTO, interaction: discord.Interaction, helpers, response_message_object: discord.Message | None = None):
         user = interaction.user
@@ -50,15 +57,13 @@ class DisplayGameInterfacePresenter:
             # --- 1. Получение данных из кэша ---
             self.logger.info(f"Начало отрисовки игрового интерфейса для {user.name}.")
             
-            character_id = await self.character_cache_manager.get_active_character_id(user.id)
-            if not character_id:
+            # Сессия, данные аккаунта и текущая локация — одним обращением к Redis.
+            context = await self.context_resolver.resolve(user.id, guild.id)
+            if not context.character_id:
                 raise ValueError("Не найдена активная сессия персонажа для отрисовки.")
+            character_session = context.require_session()
 
-            character_session = await self.character_cache_manager.get_character_session(character_id, guild.id)
-            if not character_session:
-                raise ValueError(f"Не найден кэш для сессии персонажа {character_id}.")
-
-            location_details = await self.navigation_helper.get_current_location_details_for_user(user)
+            location_details = await self.navigation_helper.get_current_location_details_for_user(user, context)
             
             # --- 2. Сборка UI ---
             main_panel_view = MainPanelView(author=user, character_core_data=character_session)
@@ -81,20 +86,14 @@ class DisplayGameInterfacePresenter:
 
             # --- 3. Обновление сообщений в Discord ---
 
-            # Шаг 3.1: Получаем ID канала
-            channels_data_json = await self.account_data_manager.get_hash_field(
-                RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(shard_id=guild.id, discord_user_id=user.id),
-                RedisKeys.FIELD_DISCORD_CHANNELS
-            )
-            channels_data = json.loads(channels_data_json)
+            # Шаг 3.1: ID канала и сообщений из контекста
+            if not context.discord_channels or not context.message_ids:
+                raise ValueError("Не найдены данные каналов или сообщений интерфейса в кэше аккаунта.")
+            channels_data = context.discord_channels
             interface_channel_id = int(channels_data["interface_channel_id"])
 
-            # Шаг 3.2: Получаем ID сообщений
-            message_ids_data_json = await self.account_data_manager.get_hash_field(
-                RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(shard_id=guild.id, discord_user_id=user.id),
-                RedisKeys.FIELD_MESSAGES
-            )
-            message_ids_data = json.loads(message_ids_data_json)
+            # Шаг 3.2: ID сообщений
+            message_ids_data = context.message_ids
             header_msg_id = int(message_ids_data["top_id"])
             footer_msg_id = int(message_ids_data["footer_id"])
 
@@ -102,11 +101,11 @@ class DisplayGameInterfacePresenter:
             if not interface_channel:
                 raise ValueError(f"Не удалось найти канал интерфейса с ID: {interface_channel_id}")
             
-            header_msg = await interface_channel.fetch_message(header_msg_id)
-            footer_msg = await interface_channel.fetch_message(footer_msg_id)
-            
-            await header_msg.edit(content="", embed=header_embed, view=main_panel_view)
-            await footer_msg.edit(content="", embed=footer_embed, view=navigation_view)
+            # Правки по ID без fetch_message; оба сообщения редактируются параллельно.
+            await asyncio.gather(
+                self.message_sender_service.edit_message_coalesced(interface_channel, header_msg_id, content="", embed=header_embed, view=main_panel_view),
+                self.message_sender_service.edit_message_coalesced(interface_channel, footer_msg_id, content="", embed=footer_embed, view=navigation_view),
+            )
             
             self.logger.info(f"Игровой интерфейс для {user.name} успешно отрисован/обновлен.")
 
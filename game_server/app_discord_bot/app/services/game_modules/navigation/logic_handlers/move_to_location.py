@@ -24,6 +24,7 @@ from game_server.contracts.dtos.game_commands.navigation_commands import MoveToL
 
 # Хелперы и сервисы (используем WebSocketManager)
 from game_server.app_discord_bot.app.services.utils.navigation_helper import NavigationHelper
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContext, InteractionContextResolver
 from game_server.app_discord_bot.transport.websocket_client.ws_manager import WebSocketManager
 
 # Импортируем ShowNavigationHandler для последующего вызова
@@ -47,6 +48,7 @@ class MoveToLocationHandler:
         ws_manager: WebSocketManager,
         show_navigation_handler: ShowNavigationHandler,
         game_world_data_manager: IGameWorldDataManager,
+        context_resolver: InteractionContextResolver,
         logger: logging.Logger
     ):
         self.character_cache_manager = character_cache_manager
@@ -55,16 +57,18 @@ class MoveToLocationHandler:
         self.ws_manager = ws_manager
         self.show_navigation_handler = show_navigation_handler
         self.game_world_data_manager = game_world_data_manager
+        self.context_resolver = context_resolver
         self.logger = logger
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
 
-    async def execute(self, command_str: str, interaction: discord.Interaction) -> NavigationDisplayDataDTO:
+    async def execute(self, command_str: str, interaction: discord.Interaction, context: Optional[InteractionContext] = None) -> NavigationDisplayDataDTO:
         """
         Выполняет логику перемещения персонажа.
 
         Args:
             command_str (str): Строка команды (ожидается "move_to:<target_location_id>" или "back").
             interaction (discord.Interaction): Объект взаимодействия Discord.
+            context (InteractionContext): Контекст игрока, разрешённый оркестратором для этого взаимодействия.
 
         Returns:
             NavigationDisplayDataDTO: DTO с данными для отображения новой локации.
@@ -79,6 +83,9 @@ class MoveToLocationHandler:
         target_location_id: Optional[str] = None
         
         try:
+            if context is None:
+                context = await self.context_resolver.resolve_for_interaction(interaction)
+
             # 1. Определение целевой локации на основе command_str
             if command_str.startswith("move_to:"):
                 parts = command_str.split(":")
@@ -88,15 +95,11 @@ class MoveToLocationHandler:
                 self.logger.debug(f"Команда 'move_to' с целевой локацией: {target_location_id}")
             elif command_str == "back":
                 self.logger.debug(f"Обработка команды 'back' для пользователя {user.name}.")
-                character_id_for_back = await self.character_cache_manager.get_active_character_id(user.id)
-                if not character_id_for_back:
+                if not context.character_id:
                     raise ValueError(f"Не найден активный персонаж для пользователя {user.name} для команды 'back'.")
 
-                char_session_for_back = await self.character_cache_manager.get_character_session(character_id_for_back, guild.id)
-                previous_location_data = char_session_for_back.get("location", {}).get("previous", {})
-                
-                if previous_location_data and previous_location_data.get("location_id"):
-                    target_location_id = previous_location_data["location_id"]
+                if context.previous_location_id:
+                    target_location_id = context.previous_location_id
                     self.logger.info(f"Команда 'back': перемещение в предыдущую локацию: {target_location_id}.")
                 else:
                     raise ValueError("Невозможно вернуться назад: нет данных о предыдущей локации.")
@@ -106,29 +109,19 @@ class MoveToLocationHandler:
             if not target_location_id:
                 raise ValueError("Не удалось определить целевую локацию для перемещения.")
 
-            # 2. Получаем ID персонажа и аккаунта (общая логика для move_to и back)
-            character_id = await self.character_cache_manager.get_active_character_id(user.id)
-            if not character_id:
-                raise ValueError(f"Не найден активный персонаж для пользователя {user.name}.")
-            
-            active_session_data = await self.character_cache_manager._redis.hgetall(
-                RedisKeys.ACTIVE_USER_SESSION_HASH.format(discord_id=user.id)
-            )
-            account_id_str = active_session_data.get(RedisKeys.FIELD_SESSION_ACCOUNT_ID)
-            if not account_id_str:
-                raise ValueError(f"Не найден account_id для пользователя {user.name} в активной сессии.")
-            account_id = int(account_id_str)
-
-            # Получаем текущую локацию для обновления поля 'previous'
-            character_session = await self.character_cache_manager.get_character_session(character_id, guild.id)
-            current_location_data = character_session.get("location", {}).get("current", {})
+            # 2. ID персонажа и аккаунта (общая логика для move_to и back) — из контекста взаимодействия
+            character_id = context.require_character()
+            account_id = context.require_account()
+
+            # Текущая локация нужна для обновления поля 'previous'
+            current_location_data = context.location_block.get("current") or {}
             old_location_id = current_location_data.get("location_id")
             old_region_id = current_location_data.get("region_id")
 
 
             if old_location_id == target_location_id:
                 self.logger.info(f"Персонаж {character_id} уже находится в локации {target_location_id}. Обновление не требуется.")
-                return await self.show_navigation_handler.execute("show_navigation", interaction)
+                return await self.show_navigation_handler.execute("show_navigation", interaction, context=context)
 
             # 3. Формируем DTO для бэкенда
             payload = MoveToLocationPayloadDTO(
@@ -191,6 +184,7 @@ class MoveToLocationHandler:
             }
             char_session_key = RedisKeys.CHARACTER_SESSION_HASH.format(guild_id=guild.id, character_id=character_id)
             await self.character_cache_manager._redis.hset(char_session_key, "location", json.dumps(updated_location_data))
+            context.apply_location(updated_location_data)
             
             self.logger.debug(f"Redis сессии персонажа обновлен: персонаж {character_id} теперь в {target_location_id}, предыдущая: {old_location_id}.")
 
@@ -216,7 +210,7 @@ class MoveToLocationHandler:
 
 
             # 7. Вызываем ShowNavigationHandler для отображения новой локации
-            return await self.show_navigation_handler.execute("show_navigation", interaction)
+            return await self.show_navigation_handler.execute("show_navigation", interaction, context=context)
 
         except ValueError as e:
             self.logger.error(f"Ошибка перемещения для пользователя {user.name}: {e}")
@@ -3,7 +3,7 @@
 import inject
 import discord
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Импортируем наш новый словарь с описаниями
 from game_server.app_discord_bot.config.assets.descriptions_text.location_descriptions import LOCATION_DESCRIPTIONS
@@ -11,6 +11,7 @@ from game_server.app_discord_bot.config.assets.descriptions_text.location_descri
 # Менеджеры кэша
 from game_server.app_discord_bot.app.services.game_modules.navigation.dtos import NavigationDisplayDataDTO
 from game_server.app_discord_bot.app.services.utils.navigation_helper import NavigationHelper
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContext, InteractionContextResolver
 from game_server.app_discord_bot.storage.cache.interfaces.character_cache_manager_interface import ICharacterCacheDiscordManager # Импортируем для доступа к сессии персонажа
 
 class ShowNavigationHandler:
@@ -19,55 +20,32 @@ class ShowNavigationHandler:
     Получает данные о текущей локации и подготавливает их для презентации.
     """
     @inject.autoparams()
-    def __init__(self, navigation_helper: NavigationHelper, character_cache_manager: ICharacterCacheDiscordManager, logger: logging.Logger): # Добавляем character_cache_manager
+    def __init__(self, navigation_helper: NavigationHelper, character_cache_manager: ICharacterCacheDiscordManager, context_resolver: InteractionContextResolver, logger: logging.Logger): # Добавляем character_cache_manager
         self.navigation_helper = navigation_helper
         self.character_cache_manager = character_cache_manager # Инициализируем
+        self.context_resolver = context_resolver
         self.logger = logger
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
 
-    async def execute(self, command_str: str, interaction: discord.Interaction) -> NavigationDisplayDataDTO:
+    async def execute(self, command_str: str, interaction: discord.Interaction, context: Optional[InteractionContext] = None) -> NavigationDisplayDataDTO:
         user = interaction.user
-        guild = interaction.guild # Добавляем guild для доступа к сессии
         self.logger.debug(f"Выполняется ShowNavigationHandler для пользователя {user.name} с командой: {command_str}")
 
         try:
-            # 1. Получаем детали текущей локации с помощью хелпера
-            location_details: Dict[str, Any] = await self.navigation_helper.get_current_location_details_for_user(user)
+            if context is None:
+                context = await self.context_resolver.resolve_for_interaction(interaction)
+
+            # 1. Узел текущей локации из статической карты в памяти (без обращения к Redis)
+            location_node = await self.navigation_helper.get_current_location_node(user, context)
+            location_details: Dict[str, Any] = location_node.details
             current_location_id = location_details.get("access_key", "") # Используем access_key как location_id
 
-            # 🔥 НОВОЕ: Получаем ID предыдущей локации из сессии персонажа 🔥
-            character_id = await self.character_cache_manager.get_active_character_id(user.id)
-            if not character_id:
-                raise ValueError(f"Не найден активный персонаж для пользователя {user.name}.")
-            
-            char_session = await self.character_cache_manager.get_character_session(character_id, guild.id)
-            previous_location_data = char_session.get("location", {}).get("previous", {})
-            previous_location_id = previous_location_data.get("location_id") if previous_location_data else None
-
-            # 2. Подготавливаем данные для полей эмбеда (Fields) - без изменений, т.к. они берутся из exits
-            location_fields: List[Dict[str, Any]] = []
-            exits_data = location_details.get("exits", []) 
-
-            if exits_data:
-                location_fields.append({
-                    "name": "🗺️ Доступные пути:",
-                    "value": "Вы можете пойти:",
-                    "inline": False
-                })
-                for i, exit_info in enumerate(exits_data):
-                    label = exit_info.get("label", f"Путь {i+1}")
-                    target_id = exit_info.get("target_location_id", "???")
-                    location_fields.append({
-                        "name": f"➡ {label}",
-                        "value": f"(ID: {target_id})",
-                        "inline": True
-                    })
-            else:
-                location_fields.append({
-                    "name": "🚫 Путей нет",
-                    "value": "Из этой локации нет явных выходов.",
-                    "inline": False
-                })
+            # 🔥 НОВОЕ: ID предыдущей локации берём из уже прочитанной сессии персонажа 🔥
+            previous_location_id = context.previous_location_id
+
+            # 2. Поля эмбеда (Fields) по выходам локации посчитаны заранее при загрузке карты
+            location_fields: List[Dict[str, Any]] = list(location_node.embed_fields)
+            exits_data = list(location_node.exits)
 
             # 3. 🔥 НОВОЕ: Определяем описание локации на основе контекста 🔥
             location_name = location_details.get("name", "Неизвестная локация")
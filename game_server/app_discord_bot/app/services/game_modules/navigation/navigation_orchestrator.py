@@ -8,12 +8,14 @@ import logging
 
 from .navigation_config import LOGIC_HANDLER_MAP, PRESENTATION_HANDLER_MAP
 from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContextResolver
 
 class NavigationOrchestrator:
     """Оркестратор для сервиса Navigation."""
     @inject.autoparams()
-    def __init__(self, interaction_response_manager: InteractionResponseManager, logger: logging.Logger):
+    def __init__(self, interaction_response_manager: InteractionResponseManager, context_resolver: InteractionContextResolver, logger: logging.Logger):
         self.interaction_response_manager = interaction_response_manager
+        self.context_resolver = context_resolver
         self.logger = logger
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
 
@@ -26,8 +28,11 @@ class NavigationOrchestrator:
             self.logger.warning(f"Логический обработчик для команды '{command_name}' не найден в NavigationOrchestrator.")
             return
 
+        # Контекст игрока разрешается один раз на взаимодействие и передаётся всем обработчикам.
+        context = await self.context_resolver.resolve_for_interaction(interaction)
+
         logic_handler_instance = inject.instance(LogicHandlerClass)
-        data_dto = await logic_handler_instance.execute(command_str, interaction)
+        data_dto = await logic_handler_instance.execute(command_str, interaction, context=context)
 
         if data_dto is None:
             self.logger.info(f"Логический обработчик для команды '{command_name}' вернул None.")
@@ -40,4 +45,4 @@ class NavigationOrchestrator:
             return
 
         presentation_handler_instance = inject.instance(PresentationHandlerClass)
-        await presentation_handler_instance.execute(data_dto, interaction, helpers=None, response_message_object=response_message_object)
\ No newline at end of file
+        await presentation_handler_instance.execute(data_dto, interaction, helpers=None, response_message_object=response_message_object, context=context)
\ No newline at end of file
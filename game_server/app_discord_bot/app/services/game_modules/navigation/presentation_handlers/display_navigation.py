@@ -15,6 +15,8 @@ from game_server.app_discord_bot.storage.cache.constant.constant_key import Redi
 
 # Утилиты
 from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContext
+from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 
 # Представления (Views)
 from game_server.app_discord_bot.app.ui.views.navigation.navigation_views import (
@@ -35,11 +37,13 @@ class DisplayNavigationPresenter:
         bot: discord.Client,
         interaction_response_manager: InteractionResponseManager,
         account_data_manager: IAccountDataManager,
+        message_sender_service: MessageSenderService,
         logger: logging.Logger,
     ):
         self.bot = bot
         self.interaction_response_manager = interaction_response_manager
         self.account_data_manager = account_data_manager
+        self.message_sender_service = message_sender_service
         self.logger = logger
         self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
 
@@ -48,7 +52,8 @@ class DisplayNavigationPresenter:
         data_dto: NavigationDisplayDataDTO, 
         interaction: discord.Interaction, 
         helpers=None,
-        response_message_object: discord.Message | None = None
+        response_message_object: discord.Message | None = None,
+        context: InteractionContext | None = None
     ):
         user = interaction.user
         guild = interaction.guild
@@ -94,29 +99,19 @@ class DisplayNavigationPresenter:
             footer_text = data_dto.format_ambient_footer_text()
             footer_embed.set_footer(text=footer_text)
             
-            # 5. Получаем ID канала и ID сообщения для нижнего окна
-            channels_data_json = await self.account_data_manager.get_hash_field(
-                RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(shard_id=guild.id, discord_user_id=user.id),
-                RedisKeys.FIELD_DISCORD_CHANNELS
-            )
-            channels_data = json.loads(channels_data_json)
+            # 5. Получаем ID канала и ID сообщения для нижнего окна (из контекста взаимодействия, если он есть)
+            channels_data, message_ids_data = await self._get_interface_ids(guild.id, user.id, context)
             interface_channel_id = int(channels_data["interface_channel_id"])
-
-            message_ids_data_json = await self.account_data_manager.get_hash_field(
-                RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(shard_id=guild.id, discord_user_id=user.id),
-                RedisKeys.FIELD_MESSAGES
-            )
-            message_ids_data = json.loads(message_ids_data_json)
             footer_msg_id = int(message_ids_data["footer_id"])
 
             interface_channel = guild.get_channel(interface_channel_id)
             if not interface_channel:
                 raise ValueError(f"Не удалось найти канал интерфейса с ID: {interface_channel_id}")
             
-            footer_msg = await interface_channel.fetch_message(footer_msg_id)
-            
-            # 6. Обновляем нижнее сообщение в Discord
-            await footer_msg.edit(content="", embed=footer_embed, view=navigation_view)
+            # 6. Обновляем нижнее сообщение в Discord (по ID, без fetch; серия быстрых кликов склеивается в одну правку)
+            await self.message_sender_service.edit_message_coalesced(
+                interface_channel, footer_msg_id, content="", embed=footer_embed, view=navigation_view
+            )
             
             self.logger.info(f"Навигационный интерфейс для {user.name} успешно отрисован/обновлен.")
 
@@ -134,4 +129,15 @@ class DisplayNavigationPresenter:
             if response_message_object:
                 await self.interaction_response_manager.edit_thinking_message(response_message_object, "Произошла критическая ошибка при отображении навигации.")
             else:
-                await self.interaction_response_manager.send_personal_notification_message(interaction, "Произошла критическая ошибка при отображении навигации.")
\ No newline at end of file
+                await self.interaction_response_manager.send_personal_notification_message(interaction, "Произошла критическая ошибка при отображении навигации.")
+
+    async def _get_interface_ids(self, guild_id: int, user_id: int, context: InteractionContext | None):
+        if context is not None and context.discord_channels and context.message_ids:
+            return context.discord_channels, context.message_ids
+
+        account_key = RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(shard_id=guild_id, discord_user_id=user_id)
+        channels_data_json = await self.account_data_manager.get_hash_field(account_key, RedisKeys.FIELD_DISCORD_CHANNELS)
+        message_ids_data_json = await self.account_data_manager.get_hash_field(account_key, RedisKeys.FIELD_MESSAGES)
+        if not channels_data_json or not message_ids_data_json:
+            raise ValueError("Не найдены данные каналов или сообщений интерфейса в кэше аккаунта.")
+        return json.loads(channels_data_json), json.loads(message_ids_data_json)
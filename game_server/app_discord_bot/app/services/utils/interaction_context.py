@@ -0,0 +1,124 @@
+# game_server/app_discord_bot/app/services/utils/interaction_context.py
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import discord
+import inject
+
+from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
+from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
+from game_server.app_discord_bot.storage.cache.managers.character_cache_manager import decode_character_session_hash
+from game_server.app_discord_bot.storage.cache.static_world_graph import WorldLocationNode
+
+
+def _loads_or_none(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+@dataclass
+class InteractionContext:
+    """
+    Данные игрока, разрешённые один раз на одно взаимодействие (клик по кнопке, команду)
+    и передаваемые вниз по логическим и презентационным обработчикам.
+    """
+    user_id: int
+    guild_id: int
+    account_id: Optional[int] = None
+    character_id: Optional[int] = None
+    character_session: Optional[Dict[str, Any]] = None
+    discord_channels: Optional[Dict[str, Any]] = None
+    message_ids: Optional[Dict[str, Any]] = None
+    # Узел текущей локации из StaticWorldGraph; заполняется NavigationHelper при первом обращении.
+    location_node: Optional[WorldLocationNode] = None
+
+    def require_character(self) -> int:
+        if not self.character_id:
+            raise ValueError(f"Не найден активный персонаж для пользователя {self.user_id}.")
+        return self.character_id
+
+    def require_account(self) -> int:
+        if not self.account_id:
+            raise ValueError(f"Не найден account_id для пользователя {self.user_id} в активной сессии.")
+        return self.account_id
+
+    def require_session(self) -> Dict[str, Any]:
+        self.require_character()
+        if not self.character_session:
+            raise ValueError(f"Не найден кэш для сессии персонажа {self.character_id}.")
+        return self.character_session
+
+    @property
+    def location_block(self) -> Dict[str, Any]:
+        return (self.character_session or {}).get("location") or {}
+
+    @property
+    def current_location_id(self) -> Optional[str]:
+        return (self.location_block.get("current") or {}).get("location_id")
+
+    @property
+    def previous_location_id(self) -> Optional[str]:
+        return (self.location_block.get("previous") or {}).get("location_id")
+
+    def apply_location(self, location_data: Dict[str, Any]) -> None:
+        """Отражает в контексте записанную в Redis новую локацию персонажа."""
+        if self.character_session is None:
+            self.character_session = {}
+        previous_location_id = self.current_location_id
+        self.character_session["location"] = location_data
+        if self.current_location_id != previous_location_id:
+            self.location_node = None
+
+
+class InteractionContextResolver:
+    """
+    Собирает InteractionContext за два обращения к Redis: пакетное чтение сессии пользователя
+    и полей аккаунта, затем чтение сессии персонажа по полученному character_id.
+    Ключ сессии персонажа строится здесь, а не внутри Redis, поэтому каждая команда объявляет свои ключи.
+    Статические данные локаций берутся из StaticWorldGraph.
+    """
+    @inject.autoparams()
+    def __init__(self, redis_client: DiscordRedisClient, logger: logging.Logger):
+        self.redis_client = redis_client
+        self.logger = logger
+        self.logger.info(f"✅ {self.__class__.__name__} инициализирован.")
+
+    async def resolve(self, user_id: int, guild_id: int) -> InteractionContext:
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.hmget(
+                RedisKeys.ACTIVE_USER_SESSION_HASH.format(discord_id=user_id),
+                RedisKeys.FIELD_SESSION_ACCOUNT_ID, RedisKeys.FIELD_SESSION_CHARACTER_ID,
+            )
+            pipe.hmget(
+                RedisKeys.PLAYER_ACCOUNT_DATA_HASH.format(shard_id=guild_id, discord_user_id=user_id),
+                RedisKeys.FIELD_DISCORD_CHANNELS, RedisKeys.FIELD_MESSAGES,
+            )
+            (account_id_raw, character_id_raw), (channels_raw, messages_raw) = await pipe.execute()
+
+        context = InteractionContext(user_id=int(user_id), guild_id=int(guild_id))
+        context.account_id = int(account_id_raw) if account_id_raw else None
+        context.character_id = int(character_id_raw) if character_id_raw else None
+        context.discord_channels = _loads_or_none(channels_raw)
+        context.message_ids = _loads_or_none(messages_raw)
+        if context.character_id:
+            session_hash = await self.redis_client.hgetall(
+                RedisKeys.CHARACTER_SESSION_HASH.format(guild_id=guild_id, character_id=context.character_id)
+            )
+            if session_hash:
+                context.character_session = decode_character_session_hash(session_hash, context.character_id)
+
+        self.logger.debug(
+            "Контекст взаимодействия для %s: персонаж %s, локация %s.",
+            user_id, context.character_id, context.current_location_id,
+        )
+        return context
+
+    async def resolve_for_interaction(self, interaction: discord.Interaction) -> InteractionContext:
+        return await self.resolve(interaction.user.id, interaction.guild.id)
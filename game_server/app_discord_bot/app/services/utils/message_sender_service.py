@@ -1,14 +1,29 @@
 # game_server/app_discord_bot/app/services/utils/message_sender_service.py
+import asyncio
+from dataclasses import dataclass, field
 import discord
 import logging
 import inject
-from typing import Dict, Any, Optional, Type # Добавлено Type для type hinting ViewClass
+from typing import Dict, Any, List, Optional, Type, Union # Добавлено Type для type hinting ViewClass
 
 # Импорты для работы с Redis
 
+from game_server.app_discord_bot.config.discord_settings import MESSAGE_EDIT_COALESCE_WINDOW
 from game_server.app_discord_bot.storage.cache.managers.guild_config_manager import GuildConfigManager
 
 
+MessageableChannel = Union[discord.TextChannel, discord.Thread]
+
+
+@dataclass
+class _PendingMessageEdit:
+    """Последнее ещё не отправленное состояние сообщения и ожидающие его вызовы."""
+    channel: Optional[MessageableChannel] = None
+    edit_kwargs: Optional[Dict[str, Any]] = None
+    waiters: List[asyncio.Future] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+
+
 class MessageSenderService:
     """
     Сервис, отвечающий за отправку, редактирование и удаление сообщений Discord
@@ -22,8 +37,66 @@ class MessageSenderService:
     ):
         self.guild_config_manager = guild_config_manager
         self.logger = logger
+        self.coalesce_window = MESSAGE_EDIT_COALESCE_WINDOW
+        # message_id -> состояние, ожидающее отправки
+        self._pending_edits: Dict[int, _PendingMessageEdit] = {}
         self.logger.info("✨ MessageSenderService инициализирован.")
 
+    async def edit_message(self, channel: MessageableChannel, message_id: int, **edit_kwargs: Any) -> discord.Message:
+        """
+        Редактирует сообщение по ID без предварительного fetch_message (PartialMessage.edit):
+        один запрос к Discord API вместо двух. Исключения discord.py пробрасываются вызывающему.
+        """
+        return await channel.get_partial_message(int(message_id)).edit(**edit_kwargs)
+
+    async def edit_message_coalesced(self, channel: MessageableChannel, message_id: int, **edit_kwargs: Any) -> discord.Message:
+        """
+        Как edit_message, но частые правки одного сообщения склеиваются: пока предыдущая правка
+        выполняется (и ещё coalesce_window секунд после неё), новые вызовы лишь заменяют
+        отправляемое состояние. В Discord уходит только последнее состояние, а все склеенные
+        вызовы получают результат (или исключение) этой правки.
+        Первая правка после паузы отправляется сразу, без задержки.
+        """
+        message_id = int(message_id)
+        pending = self._pending_edits.get(message_id)
+        if pending is None:
+            pending = _PendingMessageEdit()
+            self._pending_edits[message_id] = pending
+        elif pending.edit_kwargs is not None:
+            self.logger.debug(f"Правка сообщения {message_id} склеена с более новой.")
+
+        pending.channel = channel
+        pending.edit_kwargs = edit_kwargs
+        waiter = asyncio.get_running_loop().create_future()
+        pending.waiters.append(waiter)
+        if pending.task is None:
+            pending.task = asyncio.create_task(self._flush_pending_edits(message_id, pending))
+        return await waiter
+
+    async def _flush_pending_edits(self, message_id: int, pending: _PendingMessageEdit) -> None:
+        try:
+            while pending.edit_kwargs is not None:
+                channel, edit_kwargs, waiters = pending.channel, pending.edit_kwargs, pending.waiters
+                pending.edit_kwargs, pending.waiters = None, []
+                try:
+                    result = await self.edit_message(channel, message_id, **edit_kwargs)
+                except Exception as e:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+                if pending.edit_kwargs is not None:
+                    # Идёт серия правок: даём ей накопиться и отправляем только последнее состояние.
+                    await asyncio.sleep(self.coalesce_window)
+        finally:
+            self._pending_edits.pop(message_id, None)
+            for waiter in pending.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+
     async def send_message_with_view(
         self,
         guild: discord.Guild,
@@ -115,13 +188,6 @@ class MessageSenderService:
             return None
 
         try:
-            # Получаем объект сообщения
-            message_to_edit = await target_channel.fetch_message(message_id)
-
-            if not message_to_edit:
-                self.logger.error(f"Сообщение с ID {message_id} не найдено в канале {channel_id} для редактирования.")
-                return None
-
             embed = discord.Embed(
                 title=embed_title,
                 description=embed_description,
@@ -132,7 +198,8 @@ class MessageSenderService:
             # Создаем экземпляр View, как и для отправки нового сообщения
             view_instance = view_class(bot_instance=bot_instance) 
             
-            edited_message = await message_to_edit.edit(embed=embed, view=view_instance)
+            # Редактируем по ID, без fetch_message: несуществующее сообщение даст discord.NotFound
+            edited_message = await self.edit_message(target_channel, message_id, embed=embed, view=view_instance)
             
             if edited_message:
                 self.logger.success(f"Сообщение {message_id} успешно отредактировано в канале {target_channel.name} ({target_channel.id}) на гильдии {guild.id}.")
@@ -172,14 +239,9 @@ class MessageSenderService:
             return False
 
         try:
-            message_to_delete = await target_channel.fetch_message(message_id)
-            if message_to_delete:
-                await message_to_delete.delete()
-                self.logger.success(f"Сообщение {message_id} успешно удалено из канала {target_channel.name} ({target_channel.id}) на гильдии {guild.id}.")
-                return True
-            else:
-                self.logger.warning(f"Сообщение с ID {message_id} не найдено в канале {channel_id} для удаления.")
-                return False
+            await target_channel.get_partial_message(int(message_id)).delete()
+            self.logger.success(f"Сообщение {message_id} успешно удалено из канала {target_channel.name} ({target_channel.id}) на гильдии {guild.id}.")
+            return True
 
         except discord.NotFound:
             self.logger.warning(f"Сообщение с ID {message_id} не найдено в канале {channel_id} (возможно, уже удалено).", exc_info=True)
@@ -4,11 +4,13 @@ import inject
 import discord
 import logging
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from game_server.app_discord_bot.storage.cache.interfaces.account_data_manager_interface import IAccountDataManager
 from game_server.app_discord_bot.storage.cache.interfaces.character_cache_manager_interface import ICharacterCacheDiscordManager
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
+from game_server.app_discord_bot.storage.cache.static_world_graph import StaticWorldGraph, WorldLocationNode
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContext, InteractionContextResolver
 
 class NavigationHelper:
     """
@@ -19,53 +21,72 @@ class NavigationHelper:
         self,
         character_cache_manager: ICharacterCacheDiscordManager,
         account_data_manager: IAccountDataManager,
+        context_resolver: InteractionContextResolver,
+        world_graph: StaticWorldGraph,
         logger: logging.Logger,
     ):
         self.character_cache_manager = character_cache_manager
         self.account_data_manager = account_data_manager
+        self.context_resolver = context_resolver
+        self.world_graph = world_graph
         self.logger = logger
 
-    async def get_current_location_details_for_user(self, user: discord.User) -> Dict[str, Any]:
+    async def get_current_location_details_for_user(self, user: discord.User, context: Optional[InteractionContext] = None) -> Dict[str, Any]:
         """
         Получает детали текущей локации для указанного пользователя.
 
-        1. Находит активного персонажа пользователя.
-        2. Определяет его current_location_id из кэша сессии.
-        3. Загружает и возвращает полные данные о локации из глобального кэша мира.
-        
         Args:
             user (discord.User): Пользователь, для которого нужно найти локацию.
+            context (InteractionContext): Уже разрешённый контекст взаимодействия.
 
         Returns:
-            Dict[str, Any]: Словарь с деталями текущей локации.
+            Dict[str, Any]: Словарь с деталями текущей локации (не изменять — разделяется между вызовами).
         
         Raises:
             ValueError: Если какой-либо из шагов не удался.
         """
-        self.logger.debug(f"Запрос деталей текущей локации для пользователя {user.name}")
+        node = await self.get_current_location_node(user, context)
+        return node.details
 
-        # 1. Получаем ID активного персонажа
-        character_id = await self.character_cache_manager.get_active_character_id(user.id)
-        if not character_id:
-            raise ValueError(f"Не найдена активная сессия персонажа для пользователя {user.id}.")
+    async def get_current_location_node(self, user: discord.User, context: Optional[InteractionContext] = None) -> WorldLocationNode:
+        """
+        Узел текущей локации пользователя.
 
-        # 2. Получаем ID локации из сессии персонажа
-        character_session = await self.character_cache_manager.get_character_session(character_id, user.guild.id)
-        if not character_session:
-            raise ValueError(f"Не найден кэш для сессии персонажа {character_id}.")
-        
-        location_block = character_session.get("location", {})
-        current_location_info = location_block.get("current", {})
-        location_id = current_location_info.get("location_id")
+        Активный персонаж и его сессия берутся из контекста взаимодействия
+        (если он не передан — разрешается одним запросом к Redis), статические данные
+        локации — из StaticWorldGraph в памяти процесса.
+        """
+        self.logger.debug(f"Запрос деталей текущей локации для пользователя {user.name}")
+
+        if context is None:
+            context = await self.context_resolver.resolve(user.id, user.guild.id)
 
+        context.require_session()
+        location_id = context.current_location_id
         if not location_id:
             raise ValueError("Ключ 'location.current.location_id' не найден в кэше сессии.")
-        
-        # 3. Получаем статические данные о локации
+
+        if context.location_node is None or context.location_node.location_id != str(location_id):
+            context.location_node = await self.get_location_node(location_id)
+        return context.location_node
+
+    async def get_location_node(self, location_id: str) -> WorldLocationNode:
+        """
+        Статические данные локации. Пока карта не загружена в память (или локации в ней нет),
+        читаются из глобального кэша мира в Redis.
+        """
+        node = self.world_graph.get(location_id)
+        if node is not None:
+            return node
+
+        self.logger.warning(
+            "Локация %s отсутствует в StaticWorldGraph (загружено: %s, версия %s). Читаем из Redis.",
+            location_id, len(self.world_graph), self.world_graph.version,
+        )
         location_details_json = await self.account_data_manager.get_hash_field(
             RedisKeys.GLOBAL_GAME_WORLD_DATA, str(location_id)
         )
         if not location_details_json:
             raise ValueError(f"Детали для локации ID {location_id} не найдены в глобальных данных мира.")
             
-        return json.loads(location_details_json)
\ No newline at end of file
+        return WorldLocationNode.from_dict(str(location_id), json.loads(location_details_json))
@@ -42,7 +42,8 @@ class RequestHelper:
         correlation_id: uuid.UUID,
         timeout: int = 60,
         headers: Optional[Dict[str, str]] = None,
-        discord_context: Optional[Dict[str, Any]] = None
+        discord_context: Optional[Dict[str, Any]] = None,
+        durable: bool = False
     ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
         
         self.logger.debug(f"RequestHelper: Вход в send_and_await_response. Correlation ID: {correlation_id}")
@@ -83,7 +84,7 @@ class RequestHelper:
 
             self.logger.debug(f"RequestHelper: HTTP-запрос отправлен. Ожидаем асинхронный ответ. Correlation ID: {correlation_id}")
 
-            response_future = await self.pending_requests_manager.create_request(correlation_id, request_context)
+            response_future = await self.pending_requests_manager.create_request(correlation_id, request_context, durable=durable)
             
             self.logger.debug(f"RequestHelper: Ожидаем результат Future для ID {correlation_id} с таймаутом {timeout}...")
             actual_response_payload, retrieved_context_from_future = await asyncio.wait_for(response_future, timeout=timeout)
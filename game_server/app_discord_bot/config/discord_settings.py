@@ -56,6 +56,17 @@ INITIAL_SHORT_PAUSE = float(os.getenv("INITIAL_SHORT_PAUSE", 0.1))
 RATE_LIMIT_PAUSE = int(os.getenv("RATE_LIMIT_PAUSE", 10))
 CREATION_TIMEOUT = int(os.getenv("CREATION_TIMEOUT", 60))
 MAX_RETRY_SLEEP = int(os.getenv("MAX_RETRY_SLEEP", 60))
+# Планировщик массовых операций (развёртывание/удаление лейаута)
+DISCORD_OPS_MAX_CONCURRENCY = int(os.getenv("DISCORD_OPS_MAX_CONCURRENCY", 8))
+DISCORD_OPS_BUCKET_CONCURRENCY = int(os.getenv("DISCORD_OPS_BUCKET_CONCURRENCY", 2))
+DISCORD_OPS_MAX_RETRIES = int(os.getenv("DISCORD_OPS_MAX_RETRIES", 5))
+# Окно склейки частых правок одного сообщения (клики по навигации): промежуточные состояния отбрасываются
+MESSAGE_EDIT_COALESCE_WINDOW = float(os.getenv("MESSAGE_EDIT_COALESCE_WINDOW", 0.3))
+# Ожидающие ответа запросы к бэкенду: таймаут и шаг колеса таймеров (сек).
+PENDING_REQUEST_TIMEOUT = float(os.getenv("PENDING_REQUEST_TIMEOUT", 60.0))
+PENDING_REQUEST_TICK_SECONDS = float(os.getenv("PENDING_REQUEST_TICK_SECONDS", 1.0))
+# Порт Prometheus exporter бота (scrape-цель discord_bot в prometheus.yml).
+DISCORD_BOT_METRICS_PORT = int(os.getenv("DISCORD_BOT_METRICS_PORT", 9102))
 
 
 BOT_NAME_FOR_GATEWAY = "test_ordobot_instance_1"
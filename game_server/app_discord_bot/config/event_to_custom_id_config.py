@@ -9,5 +9,9 @@ EVENT_TO_CUSTOM_ID_MAP = {
         # Шаблон для custom_id. В {} подставляются ключи из данных события.
         "custom_id_format": "cache:update_location:{location_id}",
     },
+    # Пакет изменённых сводок локаций; сами данные передаются обработчику вместе с событием.
+    "event.location.summaries": {
+        "custom_id_format": "cache:apply_location_summaries",
+    },
 
 }
\ No newline at end of file
@@ -12,16 +12,22 @@ from game_server.app_discord_bot.storage.cache.managers.game_world_data_manager
 from game_server.app_discord_bot.storage.cache.managers.guild_config_manager import GuildConfigManager
 from game_server.app_discord_bot.storage.cache.managers.player_session_manager import PlayerSessionManager
 from game_server.app_discord_bot.storage.cache.bot_cache_initializer import BotCache
+from game_server.app_discord_bot.storage.cache.guild_config_near_cache import GuildConfigNearCache
+from game_server.app_discord_bot.storage.cache.static_world_graph import StaticWorldGraph
 
 from game_server.app_discord_bot.storage.cache.interfaces.pending_request_manager_interface import IPendingRequestManager
 from game_server.app_discord_bot.storage.cache.managers.pending_request_manager import PendingRequestManager
 
 def configure_bot_cache(binder):
+    # Единый near-cache на процесс: его разделяют все экземпляры GuildConfigManager.
+    binder.bind_to_constructor(GuildConfigNearCache, GuildConfigNearCache)
     binder.bind_to_constructor(IPendingRequestManager, PendingRequestManager)
     binder.bind_to_constructor(IGuildConfigManager, GuildConfigManager)
     binder.bind_to_constructor(IPlayerSessionManager, PlayerSessionManager)    
     binder.bind_to_constructor(IAccountDataManager, AccountDataManager)
     binder.bind_to_constructor(IGameWorldDataManager, GameWorldDataManager)
+    # Статическая карта мира в памяти процесса (одна на бот).
+    binder.bind_to_constructor(StaticWorldGraph, StaticWorldGraph)
     binder.bind_to_constructor(ICharacterCacheDiscordManager, CharacterCacheDiscordManagerImpl)
     
     binder.bind_to_constructor(BotCache, BotCache)
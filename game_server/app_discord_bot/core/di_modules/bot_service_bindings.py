@@ -15,6 +15,7 @@ from game_server.app_discord_bot.app.services.game_modules.authentication.logic_
 from game_server.app_discord_bot.app.services.game_modules.authentication.logic_handlers.hub_registration_handler import HubRegistrationFlowHandler
 from game_server.app_discord_bot.app.services.game_modules.authentication.presentation_handlers.authentication_service import AuthenticationService
 from game_server.app_discord_bot.app.services.utils.cache_sync_manager import CacheSyncManager
+from game_server.app_discord_bot.app.services.utils.interaction_context import InteractionContextResolver
 from game_server.app_discord_bot.app.services.utils.interaction_response_manager import InteractionResponseManager
 from game_server.app_discord_bot.app.services.utils.message_sender_service import MessageSenderService
 from game_server.app_discord_bot.app.services.utils.navigation_helper import NavigationHelper
@@ -45,6 +46,7 @@ def configure_bot_services(binder, bot_instance: Any):
     binder.bind_to_constructor(RoleFinder, RoleFinder)
     binder.bind_to_constructor(GameWorldDataLoaderService, GameWorldDataLoaderService)
     binder.bind_to_constructor(InteractionResponseManager, InteractionResponseManager)
+    binder.bind_to_constructor(InteractionContextResolver, InteractionContextResolver)
     binder.bind_to_constructor(NavigationHelper, NavigationHelper)
     binder.bind_to_constructor(HubRegistrationFlowHandler, HubRegistrationFlowHandler)
     binder.bind_to_constructor(ShowFaqHandler, ShowFaqHandler)
@@ -17,7 +17,7 @@ from game_server.app_discord_bot.app.startup.cog_manager import CommandsManager
 
 # Импорты настроек бота
 from game_server.app_discord_bot.config.discord_settings import (
-    BOT_PREFIX, DISCORD_TOKEN,
+    BOT_PREFIX, DISCORD_TOKEN, DISCORD_BOT_METRICS_PORT,
 )
 
 # Импорты классов, которые будут инжектироваться в GameBot для доступа в setup_hook
@@ -28,11 +28,14 @@ from game_server.app_discord_bot.transport.http_client.http_manager import HTTPM
 from game_server.app_discord_bot.transport.websocket_client.ws_manager import WebSocketManager
 from game_server.app_discord_bot.transport.pending_requests import PendingRequestsManager
 from game_server.app_discord_bot.storage.cache.bot_cache_initializer import BotCache
+from game_server.app_discord_bot.storage.cache.guild_config_near_cache import GuildConfigNearCache
+from game_server.app_discord_bot.storage.cache.static_world_graph import StaticWorldGraph
 from game_server.app_discord_bot.app.services.utils.request_helper import RequestHelper
 from game_server.app_discord_bot.app.services.utils.cache_sync_manager import CacheSyncManager
 
 
 from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.utils.metrics import start_metrics_server
 import inject # 🔥 ДОБАВЛЕНО: Импортируем inject
 
 
@@ -43,6 +46,8 @@ class GameBot(commands.Bot):
     request_helper: Optional[RequestHelper]
     pending_requests_transport_manager: Optional[PendingRequestsManager]
     cache_manager: Optional[BotCache]
+    guild_config_near_cache: Optional[GuildConfigNearCache]
+    static_world_graph: Optional[StaticWorldGraph]
     sync_manager: Optional[CacheSyncManager]
     ui_initializer: Optional[UIInitializer] # 🔥 НОВОЕ: Добавляем тип для UIInitializer
 
@@ -61,6 +66,7 @@ class GameBot(commands.Bot):
         Идеальное место для инициализации DI-контейнера и получения основных сервисов.
         """
         logger.info("--- Запуск setup_hook ---")
+        start_metrics_server(DISCORD_BOT_METRICS_PORT)
         
         # Инициализация DI-контейнера, передаем экземпляр бота (self) для привязки
         # Это должно произойти до любого inject.instance(), чтобы зависимости были доступны
@@ -74,6 +80,10 @@ class GameBot(commands.Bot):
         self.request_helper = inject.instance(RequestHelper)
         self.sync_manager = inject.instance(CacheSyncManager)
         self.ws_manager = inject.instance(WebSocketManager) 
+        self.guild_config_near_cache = inject.instance(GuildConfigNearCache)
+        self.guild_config_near_cache.start()
+        self.static_world_graph = inject.instance(StaticWorldGraph)
+        self.static_world_graph.start()
         # self.ui_initializer = inject.instance(UIInitializer) # 🔥 НОВОЕ: Получаем UIInitializer
 
         logger.info("✅ Все основные менеджеры и сервисы успешно инициализированы через DI.")
@@ -138,6 +148,12 @@ class GameBot(commands.Bot):
         if self.ws_manager:
             await self.ws_manager.disconnect()
             logger.info("🔗 WebSocket менеджер остановлен.")
+
+        if getattr(self, 'guild_config_near_cache', None):
+            await self.guild_config_near_cache.stop()
+
+        if getattr(self, 'static_world_graph', None):
+            await self.static_world_graph.stop()
         
         await shutdown_bot_di_container()
         logger.info("🔗 Redis клиент и другие асинхронные зависимости закрыты.")
@@ -23,13 +23,20 @@ class RedisKeys:
     # ===================================================================
     # Хэш, содержащий все настройки для конкретной гильдии (Хаба или Игрового шарда).
     GUILD_CONFIG_HASH = "shard:{shard_type}:{guild_id}:config"
+    # Счётчик версии конфигурации; увеличивается при каждой записи в GUILD_CONFIG_HASH.
+    GUILD_CONFIG_VERSION = "shard:{shard_type}:{guild_id}:config:version"
+    # Pub/Sub канал, по которому экземпляры бота инвалидируют свои near-cache конфигураций.
+    GUILD_CONFIG_INVALIDATION_CHANNEL = "bot:guild_config:invalidation"
+    # Set Discord ID игроков, зарегистрированных на шарде.
+    # Заменяет JSON-список в поле FIELD_REGISTERED_PLAYER_IDS (старые списки переносятся при первом обращении).
+    GUILD_REGISTERED_PLAYERS_SET = "shard:{shard_type}:{guild_id}:registered_players"
 
     # --- Поля внутри GUILD_CONFIG_HASH ---
     FIELD_LAYOUT_CONFIG = "layout_config"
     FIELD_SYSTEM_ROLES = "system_roles"
     FIELD_REGISTRATION_MESSAGE_ID = "registration_message_id"
     FIELD_LOGIN_MESSAGE_ID = "login_message_id"
-    FIELD_REGISTERED_PLAYER_IDS = "registered_player_ids"
+    FIELD_REGISTERED_PLAYER_IDS = "registered_player_ids"  # Устарело: см. GUILD_REGISTERED_PLAYERS_SET
 
 
     # ===================================================================
@@ -82,6 +89,12 @@ class RedisKeys:
     # =================================================================== 
     
     GLOBAL_GAME_WORLD_DATA = "global:game_world_data"
+    # Счётчик версий статической карты: увеличивается при каждой полной перезаписи GLOBAL_GAME_WORLD_DATA.
+    GLOBAL_GAME_WORLD_DATA_VERSION = "global:game_world_data:version"
+    # Версия снимка карты на бэкенде, из которого собран GLOBAL_GAME_WORLD_DATA (для запроса только изменений).
+    GLOBAL_GAME_WORLD_DATA_SOURCE_VERSION = "global:game_world_data:source_version"
+    # Pub/Sub канал: {"version": N} после перезаписи статической карты.
+    GAME_WORLD_DATA_UPDATED_CHANNEL = "bot:game_world_data:updated"
     
     GLOBAL_GAME_WORLD_DYNAMIC_LOCATION_DATA = "global:game_world_data_dynamic:{location_id}" # <--- ДОБАВЛЕНО
 
@@ -8,5 +8,30 @@ class PendingRequestSettings:
 class AuthTokenSettings:
     """Настройки для AuthTokenManager."""
     DEFAULT_TTL_SECONDS = 43200 # 12 часов
-    
 
+
+class GuildConfigNearCacheSettings:
+    """Настройки для локального near-cache конфигураций гильдий."""
+    # Страховочный TTL на случай потерянного сообщения инвалидации.
+    ENTRY_TTL_SECONDS = 300  # 5 минут
+    # Таймаут ожидания одного сообщения из канала инвалидации. Меньше socket_timeout клиента,
+    # поэтому тишина в канале не считается обрывом соединения.
+    POLL_TIMEOUT_SECONDS = 1.0
+    # Пауза перед переподпиской на канал инвалидации после ошибки.
+    RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+
+class StaticWorldGraphSettings:
+    """Настройки in-process графа статической карты мира."""
+    # Страховочная сверка версии карты, если сообщение об обновлении было потеряно.
+    VERSION_CHECK_INTERVAL_SECONDS = 60.0
+    # Пауза перед переподпиской на канал обновлений после ошибки.
+    RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+
+class RedisBatchSettings:
+    """Настройки пакетных (pipeline/MULTI) операций менеджеров кэша."""
+    # Максимум элементов в одном pipeline: ограничивает размер ответа и время блокировки Redis.
+    PIPELINE_BATCH_SIZE = 500
+    # Подсказка COUNT для SSCAN/SCAN при обходе больших множеств.
+    SCAN_COUNT = 500
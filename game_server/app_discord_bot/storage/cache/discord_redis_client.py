@@ -2,10 +2,12 @@
 
 import json
 import logging
-from typing import Any, List, Optional, Union
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple, Union
 import redis.asyncio as aioredis
 
 from game_server.app_discord_bot.config.discord_settings import REDIS_BOT_LOCAL_PASSWORD, REDIS_BOT_LOCAL_POOL_SIZE, REDIS_BOT_LOCAL_URL
+from game_server.utils import redis_scan
+from game_server.utils.redis_scan import DEFAULT_SCAN_COUNT
 
 
 class DiscordRedisClient:
@@ -49,9 +51,12 @@ class DiscordRedisClient:
         """Создание Pub/Sub клиента для Redis (для внутренних нужд бота)."""
         return self.redis.pubsub()
 
-    def pipeline(self):
-        """Создание Redis-транзакции."""
-        return self.redis.pipeline()
+    def pipeline(self, transaction: bool = True):
+        """
+        Создание Redis-pipeline. По умолчанию команды выполняются транзакцией (MULTI/EXEC);
+        transaction=False — простой pipeline без атомарности, для пакетных чтений.
+        """
+        return self.redis.pipeline(transaction=transaction)
 
     async def unlink(self, key: str):
         """Асинхронное удаление ключа без блокировки."""
@@ -121,18 +126,57 @@ class DiscordRedisClient:
     async def get(self, key: str):
         return await self.redis.get(key)
 
-    async def delete(self, key: str):
-        await self.redis.delete(key)
+    async def delete(self, *keys: str) -> int:
+        """Удаляет один или несколько ключей одной командой. Возвращает число удалённых."""
+        if not keys:
+            return 0
+        return await self.redis.delete(*keys)
 
     async def exists(self, key: str):
         return bool(await self.redis.exists(key))
 
-    async def keys(self, pattern: str = "*"):
+    async def keys(self, pattern: str = "*", count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> List[str]:
         """
-        Используйте с осторожностью на больших базах данных.
-        Для продакшена предпочтительнее SCAN.
+        Ключи под паттерн через SCAN (KEYS блокирует сервер на время обхода всего пространства ключей).
+        Результат собирается в список; для больших выборок используйте scan_iter/scan_batches.
         """
-        return await self.redis.keys(pattern)
+        result: List[str] = []
+        async for batch in self.scan_batches(pattern, count=count, type_=type_):
+            result.extend(batch)
+        return result
+
+    async def scan_iter(self, pattern: str = "*", count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> AsyncIterator[str]:
+        """Курсорный обход ключей под паттерн (SCAN)."""
+        async for key in redis_scan.scan_keys(self.redis, match=pattern, count=count, type_=type_):
+            yield key
+
+    async def scan_batches(self, pattern: str = "*", count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> AsyncIterator[List[str]]:
+        """Ключи под паттерн пачками по одному шагу SCAN; type_ — фильтр по типу значения."""
+        async for batch in redis_scan.scan_key_batches(self.redis, match=pattern, count=count, type_=type_):
+            yield batch
+
+    async def hscan_iter(self, key: str, match: Optional[str] = None, count: int = DEFAULT_SCAN_COUNT) -> AsyncIterator[Tuple[str, str]]:
+        """Курсорный обход хэша (HSCAN) без загрузки всех полей одним HGETALL."""
+        async for items in redis_scan.hscan_batches(self.redis, key, match=match, count=count):
+            for field, value in items.items():
+                yield field, value
+
+    async def sscan_batches(self, key: str, match: Optional[str] = None, count: int = DEFAULT_SCAN_COUNT) -> AsyncIterator[List[str]]:
+        """Курсорный обход множества (SSCAN) пачками."""
+        async for members in redis_scan.sscan_batches(self.redis, key, match=match, count=count):
+            yield members
+
+    async def delete_by_pattern(self, pattern: str, count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> int:
+        """Удаляет ключи под паттерн: SCAN + UNLINK пачками. Возвращает число удалённых ключей."""
+        return await redis_scan.delete_matching(self.redis, pattern, count=count, type_=type_)
+
+    async def expire_by_pattern(self, pattern: str, ttl: int, count: int = DEFAULT_SCAN_COUNT, type_: Optional[str] = None) -> int:
+        """Выставляет TTL ключам под паттерн: SCAN + pipeline EXPIRE пачками."""
+        return await redis_scan.expire_matching(self.redis, pattern, ttl, count=count, type_=type_)
+
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Удаляет произвольное число ключей пачками (UNLINK), не собирая их в одну огромную команду."""
+        return await redis_scan.delete_keys(self.redis, keys)
 
     async def rpush(self, key: str, value):
         return await self.redis.rpush(key, value)
@@ -157,7 +201,7 @@ class DiscordRedisClient:
         """
         if use_lrange:
             return await self.redis.lrange(queue_name, 0, -1)
-        return await self.redis.keys(queue_name)
+        return await self.keys(queue_name)
 
     async def get_tick_tasks(self, queue_name: str):
         """
@@ -193,16 +237,28 @@ class DiscordRedisClient:
     async def sadd(self, key: str, *members):
         """Добавляет один или несколько элементов в множество (Set)."""
         if not members:
-            return
-        await self.redis.sadd(key, *members)
+            return 0
+        return await self.redis.sadd(key, *members)
 
     async def srem(self, key: str, *members):
         """Удаляет один или несколько элементов из множества (Set)."""
         if not members:
-            return
-        await self.redis.srem(key, *members)
+            return 0
+        return await self.redis.srem(key, *members)
         
 
+    async def sismember(self, key: str, member: str) -> bool:
+        """Проверяет принадлежность элемента множеству."""
+        return bool(await self.redis.sismember(key, member))
+
+    async def scard(self, key: str) -> int:
+        """Количество элементов множества."""
+        return await self.redis.scard(key)
+
+    async def sscan(self, key: str, cursor: int = 0, count: Optional[int] = None):
+        """Один шаг курсорного обхода множества. Возвращает (следующий курсор, элементы)."""
+        return await self.redis.sscan(key, cursor=cursor, count=count)
+
     async def set_with_ttl(self, key: str, value: str, ttl: int) -> None:
         """
         Устанавливает значение ключа с заданным временем жизни (TTL) в секундах.
@@ -0,0 +1,223 @@
+# game_server/app_discord_bot/storage/cache/guild_config_near_cache.py
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+import inject
+
+from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
+from game_server.app_discord_bot.storage.cache.constant.setting_manager import GuildConfigNearCacheSettings
+from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
+
+
+GuildConfigKey = Tuple[int, str]
+# (эпоха полного сброса, счётчик инвалидаций гильдии)
+GuildConfigGeneration = Tuple[int, int]
+
+
+@dataclass
+class GuildConfigEntry:
+    """
+    Декодированная конфигурация одной гильдии в памяти процесса.
+    version — значение счётчика GUILD_CONFIG_VERSION, прочитанное вместе с данными.
+    """
+    version: int
+    expires_at: float
+    fields: Dict[str, Any] = field(default_factory=dict)
+    # Поля, которых точно нет в Redis (кэшируем и отрицательный ответ).
+    missing_fields: Set[str] = field(default_factory=set)
+    # True, если fields содержит весь Hash (был прочитан через HGETALL).
+    complete: bool = False
+
+
+class GuildConfigNearCache:
+    """
+    Локальный (in-process) кэш конфигураций гильдий поверх Redis Hash.
+    Записи инвалидируются сообщениями из GUILD_CONFIG_INVALIDATION_CHANNEL, которые публикует
+    GuildConfigManager при каждой записи. Пока подписка не активна, кэш не отдаёт данные,
+    поэтому пропущенное сообщение не может оставить устаревшую конфигурацию.
+    Возвращаемые значения разделяются между вызовами и не должны изменяться вызывающим кодом.
+    """
+    @inject.autoparams()
+    def __init__(self, redis_client: DiscordRedisClient, logger: logging.Logger):
+        self.redis_client = redis_client
+        self.logger = logger
+        self.ttl_seconds = GuildConfigNearCacheSettings.ENTRY_TTL_SECONDS
+        self._entries: Dict[GuildConfigKey, GuildConfigEntry] = {}
+        # Счётчик локальных инвалидаций: чтение, начатое до инвалидации, не должно сохранить свой результат.
+        self._generations: Dict[GuildConfigKey, int] = {}
+        self._epoch = 0
+        self._listener_task: Optional[asyncio.Task] = None
+        self._is_listening = False
+        self.logger.info("✨ GuildConfigNearCache инициализирован.")
+
+    @staticmethod
+    def _key(guild_id: Any, shard_type: str) -> GuildConfigKey:
+        # guild_id приходит то как int, то как str — приводим к одному виду.
+        return int(guild_id), shard_type
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_listening
+
+    # --- Жизненный цикл ---
+
+    def start(self) -> None:
+        """Запускает фоновое прослушивание канала инвалидации."""
+        if self._listener_task and not self._listener_task.done():
+            return
+        self._listener_task = asyncio.create_task(self._listen_invalidations(), name="guild_config_near_cache")
+        self.logger.info("📡 GuildConfigNearCache: запущено прослушивание канала инвалидации.")
+
+    async def stop(self) -> None:
+        self._is_listening = False
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self.clear()
+        self.logger.info("🛑 GuildConfigNearCache остановлен.")
+
+    async def _listen_invalidations(self) -> None:
+        channel = RedisKeys.GUILD_CONFIG_INVALIDATION_CHANNEL
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                while True:
+                    # Опрос с таймаутом: listen() ждал бы сообщения дольше socket_timeout, и простой
+                    # канала оборачивался бы TimeoutError, переподпиской и сбросом кэша.
+                    message = await pubsub.get_message(timeout=GuildConfigNearCacheSettings.POLL_TIMEOUT_SECONDS)
+                    if message is None:
+                        continue
+                    message_type = message.get("type")
+                    if message_type == "subscribe":
+                        # Всё, что было в кэше до подписки, могло пропустить инвалидации.
+                        self.clear()
+                        self._is_listening = True
+                        self.logger.debug(f"GuildConfigNearCache подписан на '{channel}'.")
+                    elif message_type == "message":
+                        self._handle_invalidation_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ GuildConfigNearCache: подписка на '{channel}' прервана: {e}. Кэш сброшен.")
+            finally:
+                self._is_listening = False
+                self.clear()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(GuildConfigNearCacheSettings.RESUBSCRIBE_DELAY_SECONDS)
+
+    def _handle_invalidation_message(self, raw_data: Any) -> None:
+        try:
+            payload = json.loads(raw_data)
+            key = self._key(payload["guild_id"], payload["shard_type"])
+            version = int(payload.get("version") or 0)
+            fields = payload.get("fields")
+        except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+            self.logger.warning(f"⚠️ GuildConfigNearCache: некорректное сообщение инвалидации '{raw_data}': {e}. Кэш сброшен.")
+            self.clear()
+            return
+
+        entry = self._entries.get(key)
+        if entry is not None and version and entry.version >= version:
+            # Запись уже прочитана после этой модификации (например, своё же сообщение).
+            return
+        self.invalidate(key[0], key[1], fields)
+
+    # --- Чтение ---
+
+    def _get_live_entry(self, key: GuildConfigKey) -> Optional[GuildConfigEntry]:
+        if not self._is_listening:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return entry
+
+    def lookup_field(self, guild_id: int, shard_type: str, field_name: str) -> Tuple[bool, Any]:
+        """
+        Возвращает (найдено_в_кэше, значение). Отсутствующее в Redis поле тоже считается найденным со значением None.
+        """
+        entry = self._get_live_entry(self._key(guild_id, shard_type))
+        if entry is None:
+            return False, None
+        if field_name in entry.fields:
+            return True, entry.fields[field_name]
+        if entry.complete or field_name in entry.missing_fields:
+            return True, None
+        return False, None
+
+    def lookup_all(self, guild_id: int, shard_type: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        entry = self._get_live_entry(self._key(guild_id, shard_type))
+        if entry is None or not entry.complete:
+            return False, None
+        return True, (entry.fields or None)
+
+    def generation(self, guild_id: int, shard_type: str) -> GuildConfigGeneration:
+        """Снимок счётчика инвалидаций; передаётся в store_* после чтения из Redis."""
+        return self._epoch, self._generations.get(self._key(guild_id, shard_type), 0)
+
+    # --- Наполнение ---
+
+    def _prepare_entry(self, key: GuildConfigKey, version: int, generation: GuildConfigGeneration) -> Optional[GuildConfigEntry]:
+        if not self._is_listening or (self._epoch, self._generations.get(key, 0)) != generation:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version or entry.expires_at <= time.monotonic():
+            entry = GuildConfigEntry(version=version, expires_at=time.monotonic() + self.ttl_seconds)
+            self._entries[key] = entry
+        return entry
+
+    def store_field(self, guild_id: int, shard_type: str, field_name: str, value: Any, version: int, generation: GuildConfigGeneration) -> None:
+        entry = self._prepare_entry(self._key(guild_id, shard_type), version, generation)
+        if entry is None:
+            return
+        if value is None:
+            entry.missing_fields.add(field_name)
+        else:
+            entry.fields[field_name] = value
+
+    def store_all(self, guild_id: int, shard_type: str, fields: Dict[str, Any], version: int, generation: GuildConfigGeneration) -> None:
+        entry = self._prepare_entry(self._key(guild_id, shard_type), version, generation)
+        if entry is None:
+            return
+        entry.fields = fields
+        entry.missing_fields.clear()
+        entry.complete = True
+
+    # --- Инвалидация ---
+
+    def invalidate(self, guild_id: int, shard_type: str, fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Сбрасывает перечисленные поля гильдии или всю запись, если fields не заданы.
+        """
+        key = self._key(guild_id, shard_type)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        if fields is None:
+            self._entries.pop(key, None)
+            return
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        for field_name in fields:
+            entry.fields.pop(field_name, None)
+            entry.missing_fields.discard(field_name)
+        entry.complete = False
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
@@ -1,6 +1,6 @@
 # game_server/app_discord_bot/storage/cache/interfaces/account_data_manager_interface.py
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 class IAccountDataManager(ABC):
     """
@@ -35,6 +35,21 @@ class IAccountDataManager(ABC):
         Полностью удаляет хеш данных аккаунта из Redis, идентифицируемый по discord_user_id.
         """
         pass
+
+    @abstractmethod
+    async def get_account_data_bulk(self, shard_id: int, discord_user_ids: List[Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Извлекает данные нескольких аккаунтов шарда за один round trip на пачку.
+        :return: Словарь {discord_user_id (str): данные аккаунта или None}.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_account_data_bulk(self, shard_id: int, discord_user_ids: List[Any]) -> int:
+        """
+        Удаляет хеши данных нескольких аккаунтов шарда. Возвращает число удалённых ключей.
+        """
+        pass
     
     @abstractmethod
     async def get_account_id_by_discord_id(self, discord_user_id: int) -> Optional[int]:
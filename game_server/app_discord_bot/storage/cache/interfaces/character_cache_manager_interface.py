@@ -43,12 +43,28 @@ class ICharacterCacheDiscordManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_character_sessions_bulk(self, character_ids: List[int], guild_id: int) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Возвращает сессионные данные нескольких персонажей за один round trip на пачку.
+        Для персонажей без сессии значение — None.
+        """
+        pass
+
     @abstractmethod
     async def clear_login_session(self, user_id: int, guild_id: int) -> None:
         """
         Выполняет процедуру очистки кэша при выходе персонажа из игры.
         """
         pass
+
+    @abstractmethod
+    async def clear_login_sessions_bulk(self, user_ids: List[int], guild_id: int) -> Dict[int, int]:
+        """
+        Очищает сессии нескольких пользователей (например, при сносе шарда).
+        :return: Словарь {user_id: character_id} очищенных сессий.
+        """
+        pass
     
     @abstractmethod
     async def get_bulk_character_details(self, character_ids: List[int], guild_id: int) -> Dict[str, Dict[str, Any]]:
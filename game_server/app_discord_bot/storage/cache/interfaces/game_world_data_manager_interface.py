@@ -1,7 +1,7 @@
 # game_server/app_discord_bot/storage/cache/interfaces/game_world_data_manager_interface.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 class IGameWorldDataManager(ABC):
     """
@@ -36,6 +36,38 @@ class IGameWorldDataManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def replace_static_world_data(self, locations: Dict[str, str], source_version: Optional[int] = None) -> int:
+        """
+        Атомарно заменяет статическую карту мира ({location_id: JSON}), увеличивает её версию
+        и оповещает подписчиков. source_version — версия снимка на бэкенде. Возвращает новую версию.
+        """
+        pass
+
+    @abstractmethod
+    async def apply_static_world_delta(self, changed: Dict[str, str], removed: List[str], source_version: int) -> int:
+        """
+        Атомарно применяет к статической карте изменённые и удалённые локации, увеличивает её версию
+        и оповещает подписчиков. Возвращает новую версию.
+        """
+        pass
+
+    @abstractmethod
+    async def get_static_world_source_version(self) -> Optional[int]:
+        """Версия снимка бэкенда, из которого собрана карта в Redis (None, если неизвестна)."""
+        pass
+
+    @abstractmethod
+    async def get_static_world_snapshot(self) -> Tuple[int, Dict[str, str]]:
+        """
+        Возвращает (версия, {location_id: JSON}) статической карты, прочитанные согласованно.
+        """
+        pass
+
+    @abstractmethod
+    async def get_static_world_version(self) -> int:
+        pass
+
     @abstractmethod
     async def set_dynamic_location_data(self, location_id: str, data: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
         """
@@ -43,6 +75,14 @@ class IGameWorldDataManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def apply_dynamic_location_summaries(self, summaries: Dict[str, Tuple[bool, Dict[str, str]]]) -> List[str]:
+        """
+        Применяет пакет сводок локаций ({location_id: (full, поля)}) одной транзакцией.
+        Возвращает ID локаций, для которых пришли только изменения, а полной сводки в Redis не было.
+        """
+        pass
+
     @abstractmethod
     async def get_dynamic_location_data(self, location_id: str) -> Optional[Dict[str, Any]]:
         """
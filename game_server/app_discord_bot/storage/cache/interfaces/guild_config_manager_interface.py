@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List
 
 class IGuildConfigManager(ABC):
     """
@@ -21,6 +21,11 @@ class IGuildConfigManager(ABC):
         """Извлекает все поля и их значения из Hash конфигурации гильдии."""
         pass
 
+    @abstractmethod
+    async def get_all_fields_bulk(self, guild_ids: List[int], shard_type: str) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Извлекает конфигурации нескольких гильдий за один round trip на пачку."""
+        pass
+
     @abstractmethod
     async def delete_fields(self, guild_id: int, fields: List[str], shard_type: str) -> None:
         """Удаляет одно или несколько полей из Hash."""
@@ -32,8 +37,34 @@ class IGuildConfigManager(ABC):
         pass
     
     @abstractmethod
-    async def add_player_id_to_registered_list(self, guild_id: int, shard_type: str, player_discord_id: str) -> None:
+    async def add_player_id_to_registered_list(self, guild_id: int, shard_type: str, player_discord_id: str) -> bool:
         """
-        Атомарно добавляет Discord ID игрока в список зарегистрированных игроков для данного шарда.
+        Добавляет Discord ID игрока в реестр (Redis Set) зарегистрированных игроков шарда.
+        Возвращает True, если игрок добавлен впервые.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def remove_player_id_from_registered_list(self, guild_id: int, shard_type: str, player_discord_id: str) -> None:
+        """Удаляет Discord ID игрока из реестра шарда."""
+        pass
+
+    @abstractmethod
+    async def is_player_registered(self, guild_id: int, shard_type: str, player_discord_id: str) -> bool:
+        """Проверяет, зарегистрирован ли игрок на шарде."""
+        pass
+
+    @abstractmethod
+    async def count_registered_players(self, guild_id: int, shard_type: str) -> int:
+        """Количество зарегистрированных игроков шарда."""
+        pass
+
+    @abstractmethod
+    def iter_registered_player_ids(self, guild_id: int, shard_type: str) -> AsyncIterator[List[str]]:
+        """Курсорный обход реестра игроков шарда пачками Discord ID."""
+        pass
+
+    @abstractmethod
+    async def delete_registered_players(self, guild_id: int, shard_type: str) -> None:
+        """Удаляет реестр игроков шарда целиком."""
+        pass
@@ -1,15 +1,24 @@
 # Discord_API/core/app_cache_discord/interfaces/pending_request_manager_interface.py
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 
 class IPendingRequestManager(ABC):
     """Интерфейс для менеджера ожидающих запросов."""
 
     @abstractmethod
-    async def store_request(self, command_id: str, interaction_data: Dict[str, Any], ttl: int):
+    async def store_request(self, request_id: str, data: Dict[str, Any]) -> None:
+        """Сохраняет контекст запроса; срок хранения задаёт реализация."""
         pass
 
     @abstractmethod
-    async def retrieve_and_delete_request(self, command_id: str) -> Optional[Dict[str, Any]]:
-        pass
\ No newline at end of file
+    async def retrieve_and_delete_request(self, request_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def delete_request(self, request_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_requests(self, request_ids: List[str]) -> int:
+        pass
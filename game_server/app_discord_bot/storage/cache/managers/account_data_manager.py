@@ -8,6 +8,7 @@ from redis.asyncio import Redis # Убедитесь, что Redis импорт
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
 from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
 from game_server.app_discord_bot.storage.cache.interfaces.account_data_manager_interface import IAccountDataManager
+from game_server.app_discord_bot.storage.cache.redis_batch import iter_batches, run_pipelined
 
 class AccountDataManager(IAccountDataManager):
     """
@@ -106,6 +107,42 @@ class AccountDataManager(IAccountDataManager):
         except Exception as e:
             self.logger.error(f"Ошибка при удалении данных для Discord пользователя {discord_user_id} на шарде {shard_id}: {e}", exc_info=True)
 
+    async def get_account_data_bulk(self, shard_id: int, discord_user_ids: List[Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Извлекает данные нескольких аккаунтов шарда: один pipeline HGETALL на пачку.
+        """
+        def queue(pipe, discord_user_id: Any) -> None:
+            pipe.hgetall(self.PLAYER_DATA_KEY_PATTERN.format(shard_id=shard_id, discord_user_id=discord_user_id))
+
+        results = await run_pipelined(self.redis_client, list(discord_user_ids), queue)
+        accounts: Dict[str, Optional[Dict[str, Any]]] = {}
+        for discord_user_id, (all_data,) in zip(discord_user_ids, results):
+            if isinstance(all_data, Exception):
+                self.logger.error(f"Ошибка при получении данных Discord пользователя {discord_user_id} на шарде {shard_id}: {all_data}")
+                all_data = None
+            if not all_data:
+                accounts[str(discord_user_id)] = None
+                continue
+            parsed_data = {}
+            for field, value in all_data.items():
+                try:
+                    parsed_data[field] = json.loads(value)
+                except (json.JSONDecodeError, TypeError):
+                    parsed_data[field] = value
+            accounts[str(discord_user_id)] = parsed_data
+        return accounts
+
+    async def delete_account_data_bulk(self, shard_id: int, discord_user_ids: List[Any]) -> int:
+        """
+        Удаляет хеши данных нескольких аккаунтов шарда: одна команда DEL на пачку ключей.
+        """
+        deleted = 0
+        keys = [self.PLAYER_DATA_KEY_PATTERN.format(shard_id=shard_id, discord_user_id=uid) for uid in discord_user_ids]
+        for batch in iter_batches(keys):
+            deleted += int(await self.redis_client.delete(*batch) or 0)
+        self.logger.info(f"Удалены данные {deleted} аккаунтов шарда {shard_id} из Redis.")
+        return deleted
+
     async def get_account_id_by_discord_id(self, discord_user_id: int) -> Optional[int]:
         """
         Извлекает account_id из глобального Redis Hash (поле 'account_id') по Discord User ID.
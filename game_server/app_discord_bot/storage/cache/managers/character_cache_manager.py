@@ -8,6 +8,24 @@ from typing import List, Optional, Dict, Any
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
 from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
 from game_server.app_discord_bot.storage.cache.interfaces.character_cache_manager_interface import ICharacterCacheDiscordManager
+from game_server.app_discord_bot.storage.cache.redis_batch import run_pipelined
+
+def decode_character_session_hash(structured_hash: Dict[str, Any], character_id: int) -> Dict[str, Any]:
+    """
+    Собирает полный документ персонажа из хэша сессии, декодируя каждое поле из JSON.
+    """
+    reassembled_document = {}
+    for block_name, json_string in structured_hash.items():
+        try:
+            reassembled_document[block_name] = json.loads(json_string)
+        except (json.JSONDecodeError, TypeError):
+            # На случай, если какое-то поле не является JSON
+            reassembled_document[block_name] = json_string
+
+    # Добавляем ID обратно в документ для полноты
+    reassembled_document["_id"] = character_id
+    return reassembled_document
+
 
 class CharacterCacheDiscordManagerImpl(ICharacterCacheDiscordManager):
     """
@@ -51,21 +69,24 @@ class CharacterCacheDiscordManagerImpl(ICharacterCacheDiscordManager):
                 block_data_dict = character_data[block_name]
                 redis_hash_data[block_name] = json.dumps(block_data_dict)
         
-        if redis_hash_data:
-            await self._redis.hmset(char_session_key, redis_hash_data)
-            self._logger.info(f"Структурированный кэш персонажа {character_id} сохранен в {char_session_key}.")
-
-        # --- 2. Устанавливаем активную сессию (логика не изменилась) ---
+        # --- 2. Активная сессия и глобальный список онлайн ---
         active_session_key = RedisKeys.ACTIVE_USER_SESSION_HASH.format(discord_id=user_id)
         active_session_data = {
             RedisKeys.FIELD_SESSION_ACCOUNT_ID: str(account_id),
             RedisKeys.FIELD_SESSION_CHARACTER_ID: str(character_id)
         }
-        await self._redis.hmset(active_session_key, active_session_data)
-        self._logger.info(f"Установлена активная сессия для {user_id}: персонаж {character_id}, аккаунт {account_id}.")
 
-        # --- 3. Добавляем в глобальный список онлайн (логика не изменилась) ---
-        await self._redis.sadd(RedisKeys.GLOBAL_ONLINE_PLAYERS_SET, str(character_id))
+        # Все записи входа — одной транзакцией (MULTI/EXEC).
+        async with self._redis.pipeline() as pipe:
+            if redis_hash_data:
+                pipe.hset(char_session_key, mapping=redis_hash_data)
+            pipe.hset(active_session_key, mapping=active_session_data)
+            pipe.sadd(RedisKeys.GLOBAL_ONLINE_PLAYERS_SET, str(character_id))
+            await pipe.execute()
+
+        if redis_hash_data:
+            self._logger.info(f"Структурированный кэш персонажа {character_id} сохранен в {char_session_key}.")
+        self._logger.info(f"Установлена активная сессия для {user_id}: персонаж {character_id}, аккаунт {account_id}.")
         self._logger.info(f"Персонаж {character_id} добавлен в глобальный список онлайн.")
 
     async def get_active_character_id(self, user_id: int) -> Optional[int]:
@@ -86,53 +107,86 @@ class CharacterCacheDiscordManagerImpl(ICharacterCacheDiscordManager):
         if not structured_hash:
             return None
         
-        # Собираем полный документ, декодируя каждое поле из JSON
-        reassembled_document = {}
-        for block_name, json_string in structured_hash.items():
-            try:
-                reassembled_document[block_name] = json.loads(json_string)
-            except (json.JSONDecodeError, TypeError):
-                # На случай, если какое-то поле не является JSON
-                reassembled_document[block_name] = json_string
-        
-        # Добавляем ID обратно в документ для полноты
-        reassembled_document["_id"] = character_id
         # account_id можно будет получить из active_session, если потребуется
+        return decode_character_session_hash(structured_hash, character_id)
+
+    async def get_character_sessions_bulk(self, character_ids: List[int], guild_id: int) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Сессии нескольких персонажей: один pipeline HGETALL на пачку вместо запроса на каждого.
+        """
+        def queue(pipe, character_id: int) -> None:
+            pipe.hgetall(RedisKeys.CHARACTER_SESSION_HASH.format(guild_id=guild_id, character_id=character_id))
 
-        return reassembled_document
+        results = await run_pipelined(self._redis, list(character_ids), queue)
+        sessions: Dict[int, Optional[Dict[str, Any]]] = {}
+        for character_id, (structured_hash,) in zip(character_ids, results):
+            if isinstance(structured_hash, Exception):
+                self._logger.error(f"Ошибка при получении сессии персонажа {character_id}: {structured_hash}")
+                structured_hash = None
+            sessions[character_id] = decode_character_session_hash(structured_hash, character_id) if structured_hash else None
+        return sessions
 
     async def clear_login_session(self, user_id: int, guild_id: int) -> None:
-        # Этот метод не требует изменений
-        character_id = await self.get_active_character_id(user_id)
-        if not character_id:
+        cleared = await self.clear_login_sessions_bulk([user_id], guild_id)
+        if not cleared:
             self._logger.warning(f"Попытка выхода для {user_id}, но активная сессия не найдена.")
-            return
 
-        await self._redis.srem(RedisKeys.GLOBAL_ONLINE_PLAYERS_SET, str(character_id))
-        await self._redis.delete(RedisKeys.ACTIVE_USER_SESSION_HASH.format(discord_id=user_id))
-        await self._redis.delete(RedisKeys.CHARACTER_SESSION_HASH.format(guild_id=guild_id, character_id=character_id))
-        self._logger.info(f"Сессия для персонажа {character_id} (пользователь {user_id}) была полностью очищена.")
-        
-        
+    async def clear_login_sessions_bulk(self, user_ids: List[int], guild_id: int) -> Dict[int, int]:
+        """
+        Очищает сессии нескольких пользователей: один pipeline на чтение активных персонажей
+        и одна транзакция на удаление. Возвращает {user_id: character_id} очищенных сессий.
+        """
+        def queue_read(pipe, user_id: int) -> None:
+            pipe.hget(RedisKeys.ACTIVE_USER_SESSION_HASH.format(discord_id=user_id), RedisKeys.FIELD_SESSION_CHARACTER_ID)
+
+        read_results = await run_pipelined(self._redis, list(user_ids), queue_read)
+        active: Dict[int, int] = {
+            user_id: int(char_id_str)
+            for user_id, (char_id_str,) in zip(user_ids, read_results)
+            if char_id_str and not isinstance(char_id_str, Exception)
+        }
+        if not active:
+            return {}
+
+        def queue_clear(pipe, entry) -> None:
+            user_id, character_id = entry
+            pipe.srem(RedisKeys.GLOBAL_ONLINE_PLAYERS_SET, str(character_id))
+            pipe.delete(
+                RedisKeys.ACTIVE_USER_SESSION_HASH.format(discord_id=user_id),
+                RedisKeys.CHARACTER_SESSION_HASH.format(guild_id=guild_id, character_id=character_id),
+            )
+
+        await run_pipelined(self._redis, list(active.items()), queue_clear, transaction=True)
+        for user_id, character_id in active.items():
+            self._logger.info(f"Сессия для персонажа {character_id} (пользователь {user_id}) была полностью очищена.")
+        return active
+
     async def get_bulk_character_details(self, character_ids: List[int], guild_id: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Имена персонажей для списков: читается только блок 'core', одним pipeline на пачку.
+        """
+        def queue(pipe, player_id: int) -> None:
+            pipe.hget(RedisKeys.CHARACTER_SESSION_HASH.format(guild_id=guild_id, character_id=player_id), "core")
+
+        results = await run_pipelined(self._redis, list(character_ids), queue)
         players_details = {}
-        for player_id in character_ids:
-            player_id_str = str(player_id) 
+        for player_id, (core_json,) in zip(character_ids, results):
+            player_id_str = str(player_id)
+            if isinstance(core_json, Exception):
+                self._logger.error(f"Ошибка при массовом получении данных для ID {player_id_str}: {core_json}")
+                players_details[player_id_str] = {"name": f"Игрок #{player_id_str} (ошибка)"}
+                continue
+            if not core_json:
+                players_details[player_id_str] = {"name": f"Игрок #{player_id_str} (не в сети)"}
+                continue
             try:
-                session_data = await self.get_character_session(player_id, guild_id)
-                if not session_data:
-                    players_details[player_id_str] = {"name": f"Игрок #{player_id_str} (не в сети)"}
-                    continue
-
-                # ИСПРАВЛЕНИЕ 1: Убираем json.loads, так как 'core' - это уже словарь
-                core_data = session_data.get("core", {})
-
-                players_details[player_id_str] = {
-                    "name": core_data.get("name", f"Игрок #{player_id_str}")
-                }
-            except Exception as e:
-                # ИСПРАВЛЕНИЕ 2: Меняем self.logger на self._logger (или как он у вас называется)
+                core_data = json.loads(core_json) or {}
+            except (json.JSONDecodeError, TypeError) as e:
                 self._logger.error(f"Ошибка при массовом получении данных для ID {player_id_str}: {e}")
                 players_details[player_id_str] = {"name": f"Игрок #{player_id_str} (ошибка)"}
-        
-        return players_details
\ No newline at end of file
+                continue
+            players_details[player_id_str] = {
+                "name": core_data.get("name", f"Игрок #{player_id_str}")
+            }
+
+        return players_details
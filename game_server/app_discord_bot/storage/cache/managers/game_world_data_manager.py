@@ -5,7 +5,7 @@ from datetime import datetime
 import inject
 import redis.asyncio as redis
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from game_server.config.logging.logging_setup import app_logger as logger
 from game_server.app_discord_bot.storage.cache.interfaces.game_world_data_manager_interface import IGameWorldDataManager
@@ -60,6 +60,70 @@ class GameWorldDataManager(IGameWorldDataManager):
             logger.error(f"Ошибка Redis HGETALL для хеша '{key}': {e}", exc_info=True)
             return {}
 
+    async def replace_static_world_data(self, locations: Dict[str, str], source_version: Optional[int] = None) -> int:
+        """
+        Перезаписывает GLOBAL_GAME_WORLD_DATA одной транзакцией (DEL + HSET + INCR версии)
+        и публикует новую версию в GAME_WORLD_DATA_UPDATED_CHANNEL.
+        """
+        pipe = self._redis.pipeline()
+        pipe.delete(RedisKeys.GLOBAL_GAME_WORLD_DATA)
+        if locations:
+            pipe.hset(RedisKeys.GLOBAL_GAME_WORLD_DATA, mapping=locations)
+        if source_version:
+            pipe.set(RedisKeys.GLOBAL_GAME_WORLD_DATA_SOURCE_VERSION, source_version)
+        else:
+            pipe.delete(RedisKeys.GLOBAL_GAME_WORLD_DATA_SOURCE_VERSION)
+        pipe.incr(RedisKeys.GLOBAL_GAME_WORLD_DATA_VERSION)
+        results = await pipe.execute()
+        version = int(results[-1])
+
+        await self._publish_static_world_version(version)
+        logger.info(f"Redis: статическая карта мира перезаписана ({len(locations)} локаций), версия {version}.")
+        return version
+
+    async def apply_static_world_delta(self, changed: Dict[str, str], removed: List[str], source_version: int) -> int:
+        """
+        Применяет изменения карты одной транзакцией (HSET + HDEL + INCR версии)
+        и публикует новую версию в GAME_WORLD_DATA_UPDATED_CHANNEL.
+        """
+        pipe = self._redis.pipeline()
+        if changed:
+            pipe.hset(RedisKeys.GLOBAL_GAME_WORLD_DATA, mapping=changed)
+        if removed:
+            pipe.hdel(RedisKeys.GLOBAL_GAME_WORLD_DATA, *removed)
+        pipe.set(RedisKeys.GLOBAL_GAME_WORLD_DATA_SOURCE_VERSION, source_version)
+        pipe.incr(RedisKeys.GLOBAL_GAME_WORLD_DATA_VERSION)
+        results = await pipe.execute()
+        version = int(results[-1])
+
+        await self._publish_static_world_version(version)
+        logger.info(
+            f"Redis: к статической карте мира применены изменения (обновлено {len(changed)}, удалено {len(removed)}), версия {version}."
+        )
+        return version
+
+    async def get_static_world_source_version(self) -> Optional[int]:
+        raw = await self._redis.get(RedisKeys.GLOBAL_GAME_WORLD_DATA_SOURCE_VERSION)
+        return int(raw) if raw else None
+
+    async def _publish_static_world_version(self, version: int) -> None:
+        try:
+            await self._redis.publish(RedisKeys.GAME_WORLD_DATA_UPDATED_CHANNEL, json.dumps({"version": version}))
+        except Exception as e:
+            # Подписчики догонят версию при плановой сверке.
+            logger.warning(f"⚠️ Не удалось оповестить об обновлении карты мира (версия {version}): {e}")
+
+    async def get_static_world_snapshot(self) -> Tuple[int, Dict[str, str]]:
+        pipe = self._redis.pipeline()
+        pipe.get(RedisKeys.GLOBAL_GAME_WORLD_DATA_VERSION)
+        pipe.hgetall(RedisKeys.GLOBAL_GAME_WORLD_DATA)
+        version_raw, locations = await pipe.execute()
+        return int(version_raw or 0), locations or {}
+
+    async def get_static_world_version(self) -> int:
+        version_raw = await self._redis.get(RedisKeys.GLOBAL_GAME_WORLD_DATA_VERSION)
+        return int(version_raw or 0)
+
     # 🔥 НОВЫЕ МЕТОДЫ для работы с динамическими данными локаций (Redis String) 🔥
 
     # 🔥 ИСПРАВЛЕННЫЙ МЕТОД: используем HMSET для динамических данных
@@ -90,6 +154,36 @@ class GameWorldDataManager(IGameWorldDataManager):
         except Exception as e:
             logger.error(f"Ошибка при сохранении динамических данных для локации '{location_id}' в Redis: {e}", exc_info=True)
 
+    async def apply_dynamic_location_summaries(self, summaries: Dict[str, Tuple[bool, Dict[str, str]]]) -> List[str]:
+        """
+        Записывает пакет сводок локаций одной транзакцией. Значения полей уже сериализованы бэкендом.
+        Полная сводка заменяет хеш целиком; изменения дописываются в существующий хеш.
+        """
+        if not summaries:
+            return []
+        partial_ids: List[str] = []
+        pipe = self._redis.pipeline()
+        for location_id, (full, fields) in summaries.items():
+            hash_key = RedisKeys.GLOBAL_GAME_WORLD_DYNAMIC_LOCATION_DATA.format(location_id=location_id)
+            if full:
+                pipe.delete(hash_key)
+            else:
+                # EXISTS выполняется в той же транзакции до записи: видно, была ли полная сводка.
+                partial_ids.append(location_id)
+                pipe.exists(hash_key)
+            if fields:
+                pipe.hset(hash_key, mapping=fields)
+        results = await pipe.execute()
+
+        missing_ids: List[str] = []
+        result_index = 0
+        for location_id, (full, fields) in summaries.items():
+            if not full and not results[result_index]:
+                missing_ids.append(location_id)
+            result_index += 2 if fields else 1
+        logger.debug(f"Redis: применены сводки {len(summaries)} локаций (частичных: {len(partial_ids)}, без базы: {len(missing_ids)}).")
+        return missing_ids
+
     # 🔥 НОВЫЙ/ИСПРАВЛЕННЫЙ МЕТОД: получаем данные из Redis Hash
     async def get_dynamic_location_data(self, location_id: str) -> Optional[Dict[str, Any]]:
         """
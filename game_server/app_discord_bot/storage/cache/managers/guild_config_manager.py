@@ -1,24 +1,32 @@
 # game_server/app_discord_bot/storage/cache/managers/guild_config_manager.py
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Set, Tuple
 import inject
 
 from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
+from game_server.app_discord_bot.storage.cache.constant.setting_manager import RedisBatchSettings
 from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
+from game_server.app_discord_bot.storage.cache.guild_config_near_cache import GuildConfigNearCache
 from game_server.app_discord_bot.storage.cache.interfaces.guild_config_manager_interface import IGuildConfigManager
+from game_server.app_discord_bot.storage.cache.redis_batch import run_pipelined
 
 class GuildConfigManager(IGuildConfigManager):
     """
     Менеджер кэша для хранения конфигурации гильдий (шардов) в виде Redis Hash.
     Данные, хранящиеся здесь, являются постоянными.
+    Чтения обслуживаются локальным GuildConfigNearCache; каждая запись увеличивает версию
+    конфигурации и публикует сообщение инвалидации для всех экземпляров бота.
     """
     ALLOWED_SHARD_TYPES = {"hub", "game"}
     @inject.autoparams()
-    def __init__(self, redis_client: DiscordRedisClient, logger: logging.Logger):
+    def __init__(self, redis_client: DiscordRedisClient, near_cache: GuildConfigNearCache, logger: logging.Logger):
         self.redis_client = redis_client
+        self.near_cache = near_cache
         self.logger = logger
         self.KEY_PATTERN = RedisKeys.GUILD_CONFIG_HASH
+        # Шарды, для которых в этом процессе уже проверен перенос JSON-списка игроков в Set.
+        self._migrated_registries: Set[Tuple[int, str]] = set()
         self.logger.info("✨ GuildConfigManager (DI-ready) инициализирован.")
         
     async def _get_key(self, guild_id: int, shard_type: str) -> str:
@@ -27,6 +35,36 @@ class GuildConfigManager(IGuildConfigManager):
             raise ValueError(f"Недопустимый тип шарда: '{shard_type}'. Ожидается один из {GuildConfigManager.ALLOWED_SHARD_TYPES}.")
         return self.KEY_PATTERN.format(guild_id=guild_id, shard_type=shard_type)
 
+    @staticmethod
+    def _get_version_key(guild_id: int, shard_type: str) -> str:
+        return RedisKeys.GUILD_CONFIG_VERSION.format(guild_id=guild_id, shard_type=shard_type)
+
+    @staticmethod
+    def _get_registered_players_key(guild_id: int, shard_type: str) -> str:
+        return RedisKeys.GUILD_REGISTERED_PLAYERS_SET.format(guild_id=guild_id, shard_type=shard_type)
+
+    @staticmethod
+    def _decode_value(value: Optional[str]) -> Optional[Any]:
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return value
+
+    async def _publish_invalidation(self, guild_id: int, shard_type: str, version: int, fields: Optional[List[str]]) -> None:
+        """
+        Сбрасывает локальный near-cache и оповещает остальные экземпляры бота.
+        fields=None означает, что изменилась вся конфигурация.
+        """
+        self.near_cache.invalidate(guild_id, shard_type, fields)
+        message = json.dumps({"guild_id": guild_id, "shard_type": shard_type, "version": version, "fields": fields})
+        try:
+            await self.redis_client.publish(RedisKeys.GUILD_CONFIG_INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            # Другие экземпляры подхватят изменение по истечении TTL near-cache.
+            self.logger.warning(f"Не удалось опубликовать инвалидацию конфигурации гильдии {guild_id} ({shard_type}): {e}")
+
     async def set_field(self, guild_id: int, field_name: str, data: Any, shard_type: str):
         """
         Устанавливает значение поля в Hash конфигурации гильдии.
@@ -38,7 +76,11 @@ class GuildConfigManager(IGuildConfigManager):
         key = await self._get_key(guild_id, shard_type)
         try:
             value = json.dumps(data) if isinstance(data, (dict, list)) else data
-            await self.redis_client.hset(key, field_name, value)
+            async with self.redis_client.pipeline() as pipe:
+                pipe.hset(key, field_name, value)
+                pipe.incr(self._get_version_key(guild_id, shard_type))
+                _, version = await pipe.execute()
+            await self._publish_invalidation(guild_id, shard_type, version, [field_name])
             self.logger.debug(f"Поле '{field_name}' в Hash '{key}' установлено.")
         except Exception as e:
             self.logger.error(f"Ошибка при установке поля '{field_name}' в Hash '{key}': {e}", exc_info=True)
@@ -52,14 +94,19 @@ class GuildConfigManager(IGuildConfigManager):
         :return: Значение поля или None, если не найдено.
         """
         key = await self._get_key(guild_id, shard_type)
+        found, cached_value = self.near_cache.lookup_field(guild_id, shard_type, field_name)
+        if found:
+            return cached_value
         try:
-            value = await self.redis_client.hget(key, field_name)
-            if value:
-                try:
-                    return json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    return value
-            return None
+            generation = self.near_cache.generation(guild_id, shard_type)
+            # Версия читается в той же транзакции, что и данные, чтобы near-cache мог отбросить устаревшие инвалидации.
+            async with self.redis_client.pipeline() as pipe:
+                pipe.get(self._get_version_key(guild_id, shard_type))
+                pipe.hget(key, field_name)
+                raw_version, raw_value = await pipe.execute()
+            value = self._decode_value(raw_value)
+            self.near_cache.store_field(guild_id, shard_type, field_name, value, int(raw_version or 0), generation)
+            return value
         except Exception as e:
             self.logger.error(f"Ошибка при получении поля '{field_name}' из Hash '{key}': {e}", exc_info=True)
             return None
@@ -72,23 +119,63 @@ class GuildConfigManager(IGuildConfigManager):
         :return: Словарь всех полей и значений или None, если Hash не найден.
         """
         key = await self._get_key(guild_id, shard_type)
+        found, cached_data = self.near_cache.lookup_all(guild_id, shard_type)
+        if found:
+            return cached_data
         try:
-            all_data = await self.redis_client.hgetall(key)
-            if not all_data:
-                self.logger.warning(f"Конфигурация для гильдии {guild_id} (ключ {key}) не найдена в кэше.")
-                return None
-            
+            generation = self.near_cache.generation(guild_id, shard_type)
+            async with self.redis_client.pipeline() as pipe:
+                pipe.get(self._get_version_key(guild_id, shard_type))
+                pipe.hgetall(key)
+                raw_version, all_data = await pipe.execute()
+
             parsed_data = {}
-            for field, value in all_data.items():
+            for field, value in (all_data or {}).items():
                 try:
                     parsed_data[field] = json.loads(value) 
                 except (json.JSONDecodeError, TypeError):
                     parsed_data[field] = value
+            self.near_cache.store_all(guild_id, shard_type, parsed_data, int(raw_version or 0), generation)
+
+            if not parsed_data:
+                self.logger.warning(f"Конфигурация для гильдии {guild_id} (ключ {key}) не найдена в кэше.")
+                return None
             return parsed_data
         except Exception as e:
             self.logger.error(f"Ошибка при получении всех полей из Hash '{key}': {e}", exc_info=True)
             return None
 
+    async def get_all_fields_bulk(self, guild_ids: List[int], shard_type: str) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Конфигурации нескольких гильдий. Найденные в near-cache не читаются из Redis,
+        остальные читаются одним pipeline (версия + HGETALL) на пачку.
+        :return: Словарь {guild_id: конфигурация или None}.
+        """
+        configs: Dict[int, Optional[Dict[str, Any]]] = {}
+        misses = []
+        for guild_id in guild_ids:
+            await self._get_key(guild_id, shard_type)  # валидация shard_type
+            found, cached_data = self.near_cache.lookup_all(guild_id, shard_type)
+            if found:
+                configs[guild_id] = cached_data
+            else:
+                misses.append((guild_id, self.near_cache.generation(guild_id, shard_type)))
+        if not misses:
+            return configs
+
+        def queue(pipe, miss) -> None:
+            guild_id, _ = miss
+            pipe.get(self._get_version_key(guild_id, shard_type))
+            pipe.hgetall(self.KEY_PATTERN.format(guild_id=guild_id, shard_type=shard_type))
+
+        # Транзакция: версия и данные каждой гильдии читаются согласованно.
+        results = await run_pipelined(self.redis_client, misses, queue, transaction=True)
+        for (guild_id, generation), (raw_version, all_data) in zip(misses, results):
+            parsed_data = {field: self._decode_value(value) if value else value for field, value in (all_data or {}).items()}
+            self.near_cache.store_all(guild_id, shard_type, parsed_data, int(raw_version or 0), generation)
+            configs[guild_id] = parsed_data or None
+        return configs
+
     async def delete_fields(self, guild_id: int, fields: List[str], shard_type: str) -> None:
         """
         Удаляет одно или несколько полей из Hash конфигурации гильдии.
@@ -100,7 +187,11 @@ class GuildConfigManager(IGuildConfigManager):
             return
         key = await self._get_key(guild_id, shard_type)
         try:
-            await self.redis_client.hdel(key, *fields)
+            async with self.redis_client.pipeline() as pipe:
+                pipe.hdel(key, *fields)
+                pipe.incr(self._get_version_key(guild_id, shard_type))
+                _, version = await pipe.execute()
+            await self._publish_invalidation(guild_id, shard_type, version, list(fields))
             self.logger.info(f"Поля {fields} удалены из Hash '{key}'.")
         except Exception as e:
             self.logger.error(f"Ошибка при удалении полей {fields} из Hash '{key}': {e}", exc_info=True)
@@ -113,60 +204,102 @@ class GuildConfigManager(IGuildConfigManager):
         """
         key = await self._get_key(guild_id, shard_type)
         try:
-            await self.redis_client.delete(key)
+            # Счётчик версии не удаляется: он должен только расти, иначе near-cache примет старые данные за свежие.
+            async with self.redis_client.pipeline() as pipe:
+                pipe.delete(key, self._get_registered_players_key(guild_id, shard_type))
+                pipe.incr(self._get_version_key(guild_id, shard_type))
+                _, version = await pipe.execute()
+            await self._publish_invalidation(guild_id, shard_type, version, None)
             self.logger.info(f"Конфигурация (Hash) для гильдии {guild_id} (ключ '{key}') удалена из кэша.")
         except Exception as e:
             self.logger.error(f"Ошибка при удалении Hash '{key}': {e}", exc_info=True)
 
     # =========================================================================
-    # НОВЫЙ МЕТОД: Атомарное добавление ID игрока в список зарегистрированных
+    # Реестр зарегистрированных игроков шарда (Redis Set)
     # =========================================================================
-    async def add_player_id_to_registered_list(self, guild_id: int, shard_type: str, player_discord_id: str):
+    async def _ensure_registered_players_migrated(self, guild_id: int, shard_type: str) -> None:
         """
-        Атомарно добавляет Discord ID игрока в список зарегистрированных игроков для данного шарда,
-        используя Lua-скрипт для обеспечения безопасности в конкурентной среде.
+        Однократно переносит устаревший JSON-список FIELD_REGISTERED_PLAYER_IDS из Hash конфигурации в Set.
+        Перенос идемпотентен, поэтому параллельный запуск на нескольких экземплярах бота безопасен.
         """
+        registry = (int(guild_id), shard_type)
+        if registry in self._migrated_registries:
+            return
+
         key = await self._get_key(guild_id, shard_type)
         field = RedisKeys.FIELD_REGISTERED_PLAYER_IDS
-        
-        lua_script = """
-            local key = KEYS[1]
-            local field = ARGV[1]
-            local new_id = ARGV[2]
-
-            local current_json = redis.call('HGET', key, field)
-            local current_list = {}
-
-            -- Проверяем, есть ли что-то в current_json и декодируем
-            if current_json and current_json ~= '' then
-                current_list = cjson.decode(current_json)
-            end
-
-            local found = false
-            for i, v in ipairs(current_list) do
-                if v == new_id then
-                    found = true
-                    break
-                end
-            end
-
-            if not found then
-                table.insert(current_list, new_id)
-                redis.call('HSET', key, field, cjson.encode(current_list))
-                return 1 -- ID добавлен
-            else
-                return 0 -- ID уже был в списке
-            end
+        legacy_json = await self.redis_client.hget(key, field)
+        if legacy_json:
+            try:
+                legacy_ids = json.loads(legacy_json)
+            except (json.JSONDecodeError, TypeError):
+                legacy_ids = None
+            if not isinstance(legacy_ids, list):
+                self.logger.warning(f"Поле '{field}' гильдии {guild_id} ({shard_type}) не является JSON-списком, перенос пропущен.")
+                legacy_ids = []
+
+            async with self.redis_client.pipeline() as pipe:
+                if legacy_ids:
+                    pipe.sadd(self._get_registered_players_key(guild_id, shard_type), *[str(pid) for pid in legacy_ids])
+                pipe.hdel(key, field)
+                pipe.incr(self._get_version_key(guild_id, shard_type))
+                results = await pipe.execute()
+            await self._publish_invalidation(guild_id, shard_type, results[-1], [field])
+            self.logger.info(f"Список игроков гильдии {guild_id} ({shard_type}) перенесён в Set: {len(legacy_ids)} ID.")
+
+        self._migrated_registries.add(registry)
+
+    async def add_player_id_to_registered_list(self, guild_id: int, shard_type: str, player_discord_id: str) -> bool:
+        """
+        Добавляет Discord ID игрока в Set зарегистрированных игроков шарда (SADD, O(1)).
+        Возвращает True, если игрок добавлен впервые.
         """
-        
         try:
-            # 🔥 ИЗМЕНЕНО: Передаем ключи и аргументы как списки, как ожидает DiscordRedisClient.eval
-            result = await self.redis_client.eval(lua_script, keys=[key], args=[field, player_discord_id])
-
-            if result == 1:
-                self.logger.debug(f"Игрок {player_discord_id} успешно добавлен в список {field} для гильдии {guild_id}.")
+            await self._ensure_registered_players_migrated(guild_id, shard_type)
+            added = await self.redis_client.sadd(self._get_registered_players_key(guild_id, shard_type), str(player_discord_id))
+            if added:
+                self.logger.debug(f"Игрок {player_discord_id} успешно добавлен в реестр игроков гильдии {guild_id}.")
             else:
-                self.logger.debug(f"Игрок {player_discord_id} уже был в списке {field} для гильдии {guild_id}, пропущено добавление.")
+                self.logger.debug(f"Игрок {player_discord_id} уже был в реестре игроков гильдии {guild_id}, пропущено добавление.")
+            return bool(added)
         except Exception as e:
-            self.logger.error(f"Ошибка при выполнении Lua-скрипта для добавления игрока {player_discord_id} в список для гильдии {guild_id}: {e}", exc_info=True)
-            raise
\ No newline at end of file
+            self.logger.error(f"Ошибка при добавлении игрока {player_discord_id} в реестр гильдии {guild_id}: {e}", exc_info=True)
+            raise
+
+    async def remove_player_id_from_registered_list(self, guild_id: int, shard_type: str, player_discord_id: str) -> None:
+        """Удаляет Discord ID игрока из реестра шарда (SREM, O(1))."""
+        await self._ensure_registered_players_migrated(guild_id, shard_type)
+        await self.redis_client.srem(self._get_registered_players_key(guild_id, shard_type), str(player_discord_id))
+
+    async def is_player_registered(self, guild_id: int, shard_type: str, player_discord_id: str) -> bool:
+        await self._ensure_registered_players_migrated(guild_id, shard_type)
+        return await self.redis_client.sismember(self._get_registered_players_key(guild_id, shard_type), str(player_discord_id))
+
+    async def count_registered_players(self, guild_id: int, shard_type: str) -> int:
+        await self._ensure_registered_players_migrated(guild_id, shard_type)
+        return await self.redis_client.scard(self._get_registered_players_key(guild_id, shard_type))
+
+    async def iter_registered_player_ids(
+        self, guild_id: int, shard_type: str, count: int = RedisBatchSettings.SCAN_COUNT
+    ) -> AsyncIterator[List[str]]:
+        """
+        Курсорный обход реестра (SSCAN): отдаёт Discord ID пачками, не загружая весь Set в память.
+        Как и любой SSCAN, при изменении Set во время обхода элемент может быть выдан повторно.
+        """
+        await self._ensure_registered_players_migrated(guild_id, shard_type)
+        key = self._get_registered_players_key(guild_id, shard_type)
+        async for members in self.redis_client.sscan_batches(key, count=count):
+            yield [str(member) for member in members]
+
+    async def delete_registered_players(self, guild_id: int, shard_type: str) -> None:
+        """Удаляет реестр игроков шарда целиком (и устаревшее JSON-поле, если оно осталось)."""
+        key = await self._get_key(guild_id, shard_type)
+        field = RedisKeys.FIELD_REGISTERED_PLAYER_IDS
+        async with self.redis_client.pipeline() as pipe:
+            pipe.delete(self._get_registered_players_key(guild_id, shard_type))
+            pipe.hdel(key, field)
+            pipe.incr(self._get_version_key(guild_id, shard_type))
+            _, _, version = await pipe.execute()
+        self._migrated_registries.discard((int(guild_id), shard_type))
+        await self._publish_invalidation(guild_id, shard_type, version, [field])
+        self.logger.info(f"Реестр игроков гильдии {guild_id} ({shard_type}) удалён.")
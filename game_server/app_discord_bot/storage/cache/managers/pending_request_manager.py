@@ -2,11 +2,12 @@
 
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import inject
 
 from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
 from game_server.app_discord_bot.storage.cache.interfaces.pending_request_manager_interface import IPendingRequestManager
+from game_server.app_discord_bot.storage.cache.redis_batch import iter_batches
 
 class PendingRequestManager(IPendingRequestManager):
     """
@@ -35,9 +36,12 @@ class PendingRequestManager(IPendingRequestManager):
         """Извлекает и удаляет контекст запроса из Redis."""
         key = f"{self.KEY_PREFIX}:{request_id}"
         try:
-            data_str = await self.redis_client.get(key)
+            # GET и DEL одной транзакцией: один round trip, и запрос не может быть извлечён дважды.
+            async with self.redis_client.pipeline() as pipe:
+                pipe.get(key)
+                pipe.delete(key)
+                data_str, _ = await pipe.execute()
             if data_str:
-                await self.redis_client.delete(key) # Удаляем после извлечения
                 self.logger.debug(f"Запрос {request_id} извлечен и удален из кеша.")
                 return json.loads(data_str)
             self.logger.warning(f"Запрос {request_id} не найден в кеше или истек.")
@@ -56,4 +60,16 @@ class PendingRequestManager(IPendingRequestManager):
             await self.redis_client.delete(key)
             self.logger.debug(f"Запрос {request_id} удален из кеша (по таймауту).")
         except Exception as e:
-            self.logger.error(f"Ошибка при удалении запроса {request_id} из кеша: {e}", exc_info=True)
\ No newline at end of file
+            self.logger.error(f"Ошибка при удалении запроса {request_id} из кеша: {e}", exc_info=True)
+
+    async def delete_requests(self, request_ids: List[str]) -> int:
+        """Удаляет несколько запросов из кеша: одна команда DEL на пачку ключей."""
+        deleted = 0
+        try:
+            keys = [f"{self.KEY_PREFIX}:{request_id}" for request_id in request_ids]
+            for batch in iter_batches(keys):
+                deleted += int(await self.redis_client.delete(*batch) or 0)
+            self.logger.debug(f"Из кеша удалено {deleted} запросов из {len(request_ids)}.")
+        except Exception as e:
+            self.logger.error(f"Ошибка при пакетном удалении запросов из кеша: {e}", exc_info=True)
+        return deleted
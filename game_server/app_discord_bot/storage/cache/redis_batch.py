@@ -0,0 +1,54 @@
+# game_server/app_discord_bot/storage/cache/redis_batch.py
+
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, TypeVar
+
+from game_server.app_discord_bot.storage.cache.constant.setting_manager import RedisBatchSettings
+from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
+
+
+T = TypeVar("T")
+
+
+def iter_batches(items: Iterable[T], batch_size: int = RedisBatchSettings.PIPELINE_BATCH_SIZE) -> Iterator[List[T]]:
+    """Разбивает элементы на пачки не больше batch_size."""
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def run_pipelined(
+    redis_client: DiscordRedisClient,
+    items: Sequence[T],
+    queue_commands: Callable[[Any, T], None],
+    transaction: bool = False,
+    batch_size: int = RedisBatchSettings.PIPELINE_BATCH_SIZE,
+) -> List[List[Any]]:
+    """
+    Выполняет команды для множества элементов за один round trip на пачку.
+
+    queue_commands(pipe, item) ставит в pipeline команды одного элемента (любое их количество).
+    Возвращает по списку результатов на каждый элемент, в порядке items.
+    Без транзакции ошибка одной команды не прерывает пачку: её исключение
+    возвращается на месте результата, и вызывающий код решает, что с ним делать.
+    С transaction=True каждая пачка выполняется как MULTI/EXEC.
+    """
+    results: List[List[Any]] = []
+    for batch in iter_batches(items, batch_size):
+        async with redis_client.pipeline(transaction=transaction) as pipe:
+            command_counts = []
+            for item in batch:
+                queued_before = len(pipe)
+                queue_commands(pipe, item)
+                command_counts.append(len(pipe) - queued_before)
+            raw_results = await pipe.execute(raise_on_error=transaction)
+
+        position = 0
+        for count in command_counts:
+            results.append(list(raw_results[position:position + count]))
+            position += count
+    return results
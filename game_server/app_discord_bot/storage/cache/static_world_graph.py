@@ -0,0 +1,203 @@
+# game_server/app_discord_bot/storage/cache/static_world_graph.py
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import inject
+
+from game_server.app_discord_bot.storage.cache.constant.constant_key import RedisKeys
+from game_server.app_discord_bot.storage.cache.constant.setting_manager import StaticWorldGraphSettings
+from game_server.app_discord_bot.storage.cache.discord_redis_client import DiscordRedisClient
+from game_server.app_discord_bot.storage.cache.interfaces.game_world_data_manager_interface import IGameWorldDataManager
+
+
+def build_exit_fields(exits: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], ...]:
+    """Поля эмбеда навигации ("Доступные пути") для списка выходов локации."""
+    if not exits:
+        return ({
+            "name": "🚫 Путей нет",
+            "value": "Из этой локации нет явных выходов.",
+            "inline": False
+        },)
+
+    fields = [{
+        "name": "🗺️ Доступные пути:",
+        "value": "Вы можете пойти:",
+        "inline": False
+    }]
+    for i, exit_info in enumerate(exits):
+        label = exit_info.get("label", f"Путь {i+1}")
+        target_id = exit_info.get("target_location_id", "???")
+        fields.append({
+            "name": f"➡ {label}",
+            "value": f"(ID: {target_id})",
+            "inline": True
+        })
+    return tuple(fields)
+
+
+@dataclass(frozen=True)
+class WorldLocationNode:
+    """
+    Узел статической карты мира. Все поля разделяются между взаимодействиями
+    и не должны изменяться вызывающим кодом.
+    """
+    location_id: str
+    name: str
+    parent_id: Optional[str]
+    description_key: Optional[str]
+    unified_display_type: Optional[str]
+    specific_category: Optional[str]
+    exits: Tuple[Dict[str, Any], ...]
+    exit_target_ids: Tuple[str, ...]
+    embed_fields: Tuple[Dict[str, Any], ...]
+    # Исходный словарь локации (как в GLOBAL_GAME_WORLD_DATA) для кода, работающего с dict.
+    details: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, location_id: str, data: Dict[str, Any]) -> "WorldLocationNode":
+        exits = tuple(exit_info for exit_info in (data.get("exits") or []) if isinstance(exit_info, dict))
+        return cls(
+            location_id=str(data.get("location_id") or location_id),
+            name=data.get("name") or "Неизвестная локация",
+            parent_id=data.get("parent_id"),
+            description_key=data.get("description"),
+            unified_display_type=data.get("unified_display_type"),
+            specific_category=data.get("specific_category"),
+            exits=exits,
+            exit_target_ids=tuple(str(e["target_location_id"]) for e in exits if e.get("target_location_id")),
+            embed_fields=build_exit_fields(list(exits)),
+            details=data,
+        )
+
+
+class StaticWorldGraph:
+    """
+    Статическая карта мира в памяти процесса: location_id -> WorldLocationNode.
+    Загружается целиком из GLOBAL_GAME_WORLD_DATA и перезагружается, когда меняется
+    GLOBAL_GAME_WORLD_DATA_VERSION (сообщение в GAME_WORLD_DATA_UPDATED_CHANNEL или плановая сверка).
+    Чтение узлов не обращается к Redis.
+    """
+    @inject.autoparams()
+    def __init__(self, redis_client: DiscordRedisClient, game_world_data_manager: IGameWorldDataManager, logger: logging.Logger):
+        self.redis_client = redis_client
+        self.game_world_data_manager = game_world_data_manager
+        self.logger = logger
+        self._nodes: Dict[str, WorldLocationNode] = {}
+        self._version = 0
+        self._loaded = False
+        self._reload_lock = asyncio.Lock()
+        self._listener_task: Optional[asyncio.Task] = None
+        self.logger.info("✨ StaticWorldGraph инициализирован.")
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # --- Чтение ---
+
+    def get(self, location_id: Any) -> Optional[WorldLocationNode]:
+        return self._nodes.get(str(location_id))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def neighbours(self, location_id: Any) -> Tuple[str, ...]:
+        node = self.get(location_id)
+        return node.exit_target_ids if node else ()
+
+    # --- Загрузка ---
+
+    async def reload(self, force: bool = False) -> bool:
+        """
+        Перечитывает карту, если версия в Redis отличается от загруженной. Возвращает True при перезагрузке.
+        """
+        async with self._reload_lock:
+            version, raw_locations = await self.game_world_data_manager.get_static_world_snapshot()
+            if self._loaded and not force and version == self._version:
+                return False
+
+            nodes: Dict[str, WorldLocationNode] = {}
+            for location_id, raw_json in raw_locations.items():
+                try:
+                    nodes[str(location_id)] = WorldLocationNode.from_dict(str(location_id), json.loads(raw_json))
+                except (json.JSONDecodeError, TypeError, KeyError) as e:
+                    self.logger.error(f"❌ StaticWorldGraph: некорректные данные локации '{location_id}': {e}")
+
+            # Замена одним присваиванием: читатели видят либо старую, либо новую карту целиком.
+            self._nodes = nodes
+            self._version = version
+            self._loaded = bool(nodes)
+            self.logger.info(f"🗺️ StaticWorldGraph: загружено {len(nodes)} локаций (версия карты {version}).")
+            return True
+
+    async def _reload_if_newer(self, version: Optional[int]) -> None:
+        if version is not None and self._loaded and version <= self._version:
+            return
+        try:
+            await self.reload()
+        except Exception as e:
+            self.logger.error(f"❌ StaticWorldGraph: не удалось перезагрузить карту: {e}", exc_info=True)
+
+    # --- Жизненный цикл ---
+
+    def start(self) -> None:
+        """Запускает фоновое отслеживание версии карты (первая загрузка — сразу после подписки)."""
+        if self._listener_task and not self._listener_task.done():
+            return
+        self._listener_task = asyncio.create_task(self._listen_updates(), name="static_world_graph")
+        self.logger.info("📡 StaticWorldGraph: запущено отслеживание обновлений карты мира.")
+
+    async def stop(self) -> None:
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self.logger.info("🛑 StaticWorldGraph остановлен.")
+
+    async def _listen_updates(self) -> None:
+        channel = RedisKeys.GAME_WORLD_DATA_UPDATED_CHANNEL
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                while True:
+                    message = await pubsub.get_message(timeout=StaticWorldGraphSettings.VERSION_CHECK_INTERVAL_SECONDS)
+                    if message is None:
+                        # Тишина в канале: сверяем версию на случай потерянного сообщения.
+                        if await self.game_world_data_manager.get_static_world_version() != self._version or not self._loaded:
+                            await self._reload_if_newer(None)
+                        continue
+                    message_type = message.get("type")
+                    if message_type == "subscribe":
+                        # Обновления до подписки могли быть пропущены.
+                        await self._reload_if_newer(None)
+                    elif message_type == "message":
+                        await self._reload_if_newer(self._parse_version(message.get("data")))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"⚠️ StaticWorldGraph: подписка на '{channel}' прервана: {e}.")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(StaticWorldGraphSettings.RESUBSCRIBE_DELAY_SECONDS)
+
+    @staticmethod
+    def _parse_version(raw_data: Any) -> Optional[int]:
+        try:
+            return int(json.loads(raw_data).get("version"))
+        except (json.JSONDecodeError, TypeError, ValueError, AttributeError):
+            return None
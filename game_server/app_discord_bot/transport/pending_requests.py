@@ -1,16 +1,37 @@
 # game_server/app_discord_bot/transport/pending_requests.py
 
 import asyncio
+import math
 import uuid
 import logging
-from typing import Dict, Optional, Any, Tuple, Union
+from typing import Awaitable, Dict, List, Optional, Any, Set, Tuple, Union
 import inject
 
+from game_server.app_discord_bot.config.discord_settings import PENDING_REQUEST_TICK_SECONDS, PENDING_REQUEST_TIMEOUT
 from game_server.app_discord_bot.storage.cache.interfaces.pending_request_manager_interface import IPendingRequestManager
 
+
+class _PendingRecord:
+    """Ожидающий запрос: Future, контекст и позиция в колесе таймеров."""
+    __slots__ = ("future", "context", "deadline", "slot", "durable", "persist_task")
+
+    def __init__(self, future: asyncio.Future, context: Dict[str, Any], deadline: float, durable: bool):
+        self.future = future
+        self.context = context
+        self.deadline = deadline
+        self.slot = -1
+        self.durable = durable
+        self.persist_task: Optional[asyncio.Task] = None
+
+
 class PendingRequestsManager:
     """
     Управляет жизненным циклом асинхронных запросов...
+    Контекст запроса по умолчанию хранится только в памяти процесса. Для команд, которые должны
+    пережить перезапуск бота (durable=True), контекст дополнительно пишется в Redis в фоне (write-behind),
+    не задерживая отправку команды.
+    Таймауты обслуживает одно колесо таймеров с шагом PENDING_REQUEST_TICK_SECONDS
+    вместо отдельного call_later на каждый запрос.
     """
     @inject.autoparams()
     def __init__(
@@ -18,108 +39,207 @@ class PendingRequestsManager:
         redis_pending_request_manager: IPendingRequestManager,
         logger: logging.Logger
     ):
-        self._pending: Dict[uuid.UUID, asyncio.Future] = {}
-        self._timeout_handles: Dict[uuid.UUID, asyncio.Handle] = {}
+        self._pending: Dict[uuid.UUID, _PendingRecord] = {}
         self.redis_pending_request_manager = redis_pending_request_manager
         self.logger = logger
-        self._timeout = 60.0
-        self.logger.info(f"✨ PendingRequestsManager (transport) инициализирован. Таймаут: {self._timeout}с.")
+        self._timeout = PENDING_REQUEST_TIMEOUT
+        self._tick = PENDING_REQUEST_TICK_SECONDS
+        # Колесо покрывает весь таймаут; более дальние сроки перекладываются при обходе ячейки.
+        self._wheel: List[Set[uuid.UUID]] = [set() for _ in range(int(math.ceil(self._timeout / self._tick)) + 2)]
+        self._cursor = 0
+        self._cursor_time = 0.0
+        self._tick_handle: Optional[asyncio.TimerHandle] = None
+        self._background_tasks: Set[asyncio.Task] = set()
+        self.logger.info(f"✨ PendingRequestsManager (transport) инициализирован. Таймаут: {self._timeout}с, шаг колеса: {self._tick}с.")
 
-    async def create_request(self, request_id: Union[str, uuid.UUID], context_data: Dict[str, Any]) -> asyncio.Future:
+    @staticmethod
+    def _normalize_id(request_id: Union[str, uuid.UUID]) -> uuid.UUID:
+        return request_id if isinstance(request_id, uuid.UUID) else uuid.UUID(str(request_id))
+
+    async def create_request(
+        self,
+        request_id: Union[str, uuid.UUID],
+        context_data: Dict[str, Any],
+        durable: bool = False
+    ) -> asyncio.Future:
         """
-        Создает Future для ожидания ответа, сохраняет контекст в Redis и устанавливает таймаут.
+        Создает Future для ожидания ответа и ставит запрос в колесо таймаутов.
+        При durable=True контекст дополнительно сохраняется в Redis в фоне.
         """
-        if isinstance(request_id, str):
-            try:
-                request_id = uuid.UUID(request_id)
-            except ValueError:
-                self.logger.error(f"Получен невалидный строковый request_id в create_request: {request_id}")
-                raise
+        try:
+            request_id = self._normalize_id(request_id)
+        except ValueError:
+            self.logger.error(f"Получен невалидный строковый request_id в create_request: {request_id}")
+            raise
 
-        # 🔥 ИЗМЕНЕНО: Уровень логирования изменен на DEBUG
         self.logger.debug(f"PendingRequestsManager: create_request для ID: {request_id}")
-        if request_id in self._pending:
+        previous = self._pending.pop(request_id, None)
+        if previous is not None:
             self.logger.warning(f"Запрос с ID {request_id} уже существует в памяти. Перезапись.")
-        
-        future = asyncio.get_running_loop().create_future()
-        self._pending[request_id] = future
-        
-        await self.redis_pending_request_manager.store_request(str(request_id), context_data)
-        
-        handle = asyncio.get_running_loop().call_later(
-            self._timeout, self._timeout_request, request_id
-        )
-        self._timeout_handles[request_id] = handle
-        
-        self.logger.debug(f"Запланирован таймаут для ID: {request_id}.")
+            self._unschedule(request_id, previous)
 
-        return future
+        loop = asyncio.get_running_loop()
+        record = _PendingRecord(loop.create_future(), context_data, loop.time() + self._timeout, durable)
+        self._pending[request_id] = record
+        self._ensure_ticking(loop)
+        self._schedule(request_id, record)
+
+        if durable:
+            record.persist_task = self._spawn(
+                self.redis_pending_request_manager.store_request(str(request_id), context_data)
+            )
+
+        self.logger.debug(f"Запланирован таймаут для ID: {request_id}.")
+        return record.future
 
     async def resolve_request(self, request_id: uuid.UUID, response_payload: Any) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
-        Находит соответствующий Future, завершает его с полученными данными
-        и извлекает контекст из Redis.
+        Находит соответствующий Future и завершает его с полученными данными и контекстом запроса.
         """
-        # 🔥 ИЗМЕНЕНО: Уровень логирования изменен на DEBUG
         self.logger.debug(f"PendingRequestsManager: resolve_request для ID: {request_id}")
-        
-        if isinstance(request_id, str):
-            try:
-                request_id = uuid.UUID(request_id)
-            except ValueError:
-                self.logger.error(f"Получен невалидный строковый request_id: {request_id}")
-                return False, None
-
-        future = self._pending.pop(request_id, None)
-        handle = self._timeout_handles.pop(request_id, None) 
-        if handle:
-            handle.cancel()
-
-        context_data = None
-        if future and not future.done():
-            self.logger.debug(f"Future для ID {request_id} найден. Получение контекста из Redis.")
-            context_data = await self.redis_pending_request_manager.retrieve_and_delete_request(str(request_id))
-            future.set_result((response_payload, context_data))
-            self.logger.debug(f"Запрос с ID {request_id} успешно завершен.")
-            return True, context_data
-        elif future:
+
+        try:
+            request_id = self._normalize_id(request_id)
+        except ValueError:
+            self.logger.error(f"Получен невалидный строковый request_id: {request_id}")
+            return False, None
+
+        record = self._pending.pop(request_id, None)
+        if record is not None:
+            self._unschedule(request_id, record)
+            self._forget_persisted(request_id, record)
+            if not record.future.done():
+                record.future.set_result((response_payload, record.context))
+                self.logger.debug(f"Запрос с ID {request_id} успешно завершен.")
+                return True, record.context
             self.logger.warning(f"Попытка завершить уже завершенный Future для ID: {request_id}.")
-        else:
-            # 🔥 ИЗМЕНЕНО: Сообщение о неизвестном запросе лучше делать уровня INFO, чтобы его было видно
-            self.logger.info(f"Получен ответ для неизвестного или истекшего запроса с ID: {request_id}.")
-            await self.redis_pending_request_manager.delete_request(str(request_id))
-        
+            return False, None
+
+        # Ответ на запрос, которого нет в памяти: истёк или был отправлен до перезапуска бота.
+        # Durable-контекст в Redis при этом удаляется, чтобы не ждать TTL.
+        context_data = await self.redis_pending_request_manager.retrieve_and_delete_request(str(request_id))
+        if context_data is not None:
+            self.logger.info(f"Получен ответ на запрос {request_id}, отправленный до перезапуска бота. Контекст восстановлен из Redis.")
+            return False, context_data
+        self.logger.info(f"Получен ответ для неизвестного или истекшего запроса с ID: {request_id}.")
         return False, None
 
+    def remove_request(self, request_id: Union[str, uuid.UUID]) -> None:
+        """Снимает запрос без ответа (например, команду не удалось отправить)."""
+        try:
+            request_id = self._normalize_id(request_id)
+        except ValueError:
+            return
+        record = self._pending.pop(request_id, None)
+        if record is None:
+            return
+        self._unschedule(request_id, record)
+        self._forget_persisted(request_id, record)
+        if not record.future.done():
+            record.future.cancel()
+
     def _timeout_request(self, request_id: uuid.UUID):
         """Обработчик таймаута для запроса."""
-        # 🔥 ИЗМЕНЕНО: Таймаут - это важное событие, его уровень лучше поднять до WARNING
         self.logger.warning(f"PendingRequestsManager: сработал таймаут для ID: {request_id}.")
-        
-        future = self._pending.pop(request_id, None)
-        self._timeout_handles.pop(request_id, None)
 
-        if future and not future.done():
+        try:
+            request_id = self._normalize_id(request_id)
+        except ValueError:
+            return
+        record = self._pending.pop(request_id, None)
+        if record is None:
+            return
+        self._unschedule(request_id, record)
+        self._forget_persisted(request_id, record)
+
+        if not record.future.done():
             error = asyncio.TimeoutError(f"Ответ на запрос {request_id} не получен в течение {self._timeout}с.")
-            future.set_exception(error)
-            # Оставляем ошибку на уровне ERROR, это правильно
+            record.future.set_exception(error)
             self.logger.error(f"Тайм-аут для запроса с ID: {request_id}. Future помечен как исключение.")
-            asyncio.create_task(self.redis_pending_request_manager.delete_request(str(request_id)))
+
+    # --- Колесо таймеров ---
+
+    def _ensure_ticking(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._tick_handle is None:
+            # Колесо простаивало: отсчёт ячеек начинается с текущего момента.
+            self._cursor_time = loop.time()
+            self._tick_handle = loop.call_later(self._tick, self._on_tick)
+
+    def _schedule(self, request_id: uuid.UUID, record: _PendingRecord) -> None:
+        ticks = max(1, int(math.ceil((record.deadline - self._cursor_time) / self._tick)))
+        ticks = min(ticks, len(self._wheel) - 1)
+        record.slot = (self._cursor + ticks) % len(self._wheel)
+        self._wheel[record.slot].add(request_id)
+
+    def _unschedule(self, request_id: uuid.UUID, record: _PendingRecord) -> None:
+        if record.slot >= 0:
+            self._wheel[record.slot].discard(request_id)
+            record.slot = -1
+
+    def _on_tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # После задержки цикла событий обрабатываем все пропущенные ячейки.
+        while self._cursor_time + self._tick <= now:
+            self._cursor = (self._cursor + 1) % len(self._wheel)
+            self._cursor_time += self._tick
+            due, self._wheel[self._cursor] = self._wheel[self._cursor], set()
+            for request_id in due:
+                record = self._pending.get(request_id)
+                if record is None:
+                    continue
+                record.slot = -1
+                if record.deadline <= now:
+                    self._timeout_request(request_id)
+                else:
+                    self._schedule(request_id, record)
+
+        if self._pending:
+            delay = max(0.0, self._cursor_time + self._tick - loop.time())
+            self._tick_handle = loop.call_later(delay, self._on_tick)
+        else:
+            self._tick_handle = None
+
+    # --- Write-behind в Redis ---
+
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _forget_persisted(self, request_id: uuid.UUID, record: _PendingRecord) -> None:
+        if record.durable:
+            self._spawn(self._delete_persisted(request_id, record.persist_task))
+
+    async def _delete_persisted(self, request_id: uuid.UUID, persist_task: Optional[asyncio.Task]) -> None:
+        # Удаление не должно обогнать ещё не завершённую запись того же ключа.
+        if persist_task is not None and not persist_task.done():
+            try:
+                await persist_task
+            except Exception:
+                pass
+        await self.redis_pending_request_manager.delete_request(str(request_id))
 
     def clear_all_pending(self):
         """Отменяет все ожидающие запросы."""
         self.logger.info("Очистка всех ожидающих запросов.")
-        for future in self._pending.values():
-            if not future.done():
-                future.cancel("Manager is shutting down.")
+        for record in self._pending.values():
+            if not record.future.done():
+                record.future.cancel("Manager is shutting down.")
         self._pending.clear()
-        
-        for handle in self._timeout_handles.values():
-            handle.cancel()
-        self._timeout_handles.clear()
+
+        for slot in self._wheel:
+            slot.clear()
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
 
     async def shutdown(self):
         """Корректное завершение работы менеджера."""
         self.logger.info("PendingRequestsManager: Завершение работы...")
         self.clear_all_pending()
-        self.logger.info("PendingRequestsManager: Завершение работы завершено.")
\ No newline at end of file
+        # Durable-контексты остаются в Redis до ответа или TTL; дожидаемся незавершённых записей.
+        if self._background_tasks:
+            await asyncio.gather(*list(self._background_tasks), return_exceptions=True)
+        self.logger.info("PendingRequestsManager: Завершение работы завершено.")
@@ -4,6 +4,7 @@ import json
 import logging
 from typing import Any, Dict
 
+from game_server.config.logging.log_sampling import LogSampler
 from game_server.contracts.shared_models.websocket_base_models import WebSocketMessage
 # Для Prometheus: Определения метрик (примеры)
 # from prometheus_client import Counter # <--- Не забудьте установить prometheus_client
@@ -32,40 +33,41 @@ class WebSocketInboundDispatcher:
         self.logger = logger
         self.pending_requests = pending_requests_manager
         self.event_handler = event_handler
+        self._sampler = LogSampler(max_per_interval=5, interval_seconds=10.0)
    
         self.logger.debug("DEBUG: WebSocketInboundDispatcher инициализирован.")
 
     async def dispatch_message(self, text_data: str):
         """
         Обрабатывает и диспетчеризирует входящее текстовое сообщение WebSocket.
+        Вызывается на каждое сообщение, поэтому логирование ленивое и отсекается по уровню.
         """
-        self.logger.debug(f"DEBUG: Диспетчер обрабатывает входящее текстовое сообщение. Длина: {len(text_data)}")
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
             data = json.loads(text_data)
-            self.logger.debug(f"DEBUG: JSON полученного сообщения: {data}")
             message = WebSocketMessage.model_validate(data) #
-            self.logger.debug(f"DEBUG: Валидированное WebSocketMessage. Тип: {message.type}, CorrID: {message.correlation_id}")
+            if is_debug:
+                self.logger.debug("DEBUG: Входящее WebSocketMessage. Тип: %s, CorrID: %s, длина: %d", message.type, message.correlation_id, len(text_data))
             # WS_INBOUND_MESSAGES_PROCESSED.labels(type=message.type).inc() # Prometheus
 
             if message.type == "RESPONSE": #
-                self.logger.debug(f"DEBUG: Сообщение типа RESPONSE, CorrID: {message.correlation_id}")
-                
-
                 await self.pending_requests.resolve_request(message.correlation_id, message.model_dump())
                 
             elif message.type == "EVENT": #
-                self.logger.debug(f"DEBUG: Сообщение типа EVENT, CorrID: {message.correlation_id}")
                 # Здесь можно добавить более строгую валидацию payload, если необходимо, используя WebSocketEventPayload
                 await self.event_handler.handle_event(message.payload)
             elif message.type == "SYSTEM_COMMAND": #
-                self.logger.debug(f"DEBUG: Сообщение типа SYSTEM_COMMAND, CorrID: {message.correlation_id}")
+                pass
             elif message.type == "AUTH_CONFIRM": #
-                self.logger.warning(f"WSManager: AUTH_CONFIRM получен в диспетчере, хотя должен был быть обработан в цикле аутентификации. CorrID: {message.correlation_id}")
+                self.logger.warning("WSManager: AUTH_CONFIRM получен в диспетчере, хотя должен был быть обработан в цикле аутентификации. CorrID: %s", message.correlation_id)
             else:
-                self.logger.warning(f"WSManager: Неизвестный тип WebSocket сообщения: {message.type}. CorrID: {message.correlation_id}")
+                self._sampler.log(
+                    self.logger, logging.WARNING, "unknown_type",
+                    "WSManager: Неизвестный тип WebSocket сообщения: %s. CorrID: %s", message.type, message.correlation_id,
+                )
         except json.JSONDecodeError:
-            self.logger.warning(f"WSManager: Получено не-JSON сообщение: {text_data}")
+            self._sampler.log(self.logger, logging.WARNING, "not_json", "WSManager: Получено не-JSON сообщение: %.200s", text_data)
             # WS_INBOUND_PROCESSING_ERRORS.labels(error_type='json_decode_error').inc() # Prometheus
         except Exception as e:
-            self.logger.error(f"WSManager: Ошибка при обработке сообщения: {e}. Данные: {text_data}", exc_info=True)
-            # WS_INBOUND_PROCESSING_ERRORS.labels(error_type='general_processing_error').inc() # Prometheus
\ No newline at end of file
+            self.logger.error("WSManager: Ошибка при обработке сообщения: %s. Данные: %.500s", e, text_data, exc_info=True)
+            # WS_INBOUND_PROCESSING_ERRORS.labels(error_type='general_processing_error').inc() # Prometheus
@@ -51,7 +51,8 @@ class WebSocketManager:
         logger: logging.Logger,
         bot_cache: Optional[BotCache] = None
     ):
-        self.logger = logger
+        # Дочерний логгер модуля: уровень настраивается отдельно через LOG_MODULE_LEVELS.
+        self.logger = logger.getChild(__name__)
         self.logger.info("WSManager: Начинается инициализация __init__.")
         self.logger.debug("DEBUG: Инициализация WSManager запущена.")
 
@@ -170,18 +171,22 @@ class WebSocketManager:
                     }
                     await self._ws.send_str(json.dumps(auth_message))
                     self.logger.info("WSManager: Аутентификационные данные отправлены по WebSocket.")
-                    self.logger.debug(f"DEBUG: Отправленные аутентификационные данные: {auth_message}")
+                    self.logger.debug("DEBUG: Отправлены аутентификационные данные для бота '%s'.", self._bot_name)
 
                     self.logger.debug("DEBUG: Ожидаю сообщение подтверждения аутентификации от сервера.")
                     auth_confirm_msg = await asyncio.wait_for(ws.receive(), timeout=5)
-                    self.logger.debug(f"DEBUG: Получено сырое сообщение подтверждения аутентификации. Тип: {auth_confirm_msg.type}, Данные: {auth_confirm_msg.data}")
+                    self.logger.debug("DEBUG: Получено сырое сообщение подтверждения аутентификации. Тип: %s, Данные: %s", auth_confirm_msg.type, auth_confirm_msg.data)
                     
                     if auth_confirm_msg.type == aiohttp.WSMsgType.TEXT:
                         try:
                             confirm_data = json.loads(auth_confirm_msg.data)
-                            self.logger.debug(f"DEBUG: Получен JSON подтверждения аутентификации: {confirm_data}")
                             ws_response_message = WebSocketMessage.model_validate(confirm_data)
-                            self.logger.debug(f"DEBUG: Валидированное WebSocketMessage подтверждения: Тип={ws_response_message.type}, Статус={ws_response_message.payload.get('status') if ws_response_message.payload else 'Payload Missing'}")
+                            if self.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.debug(
+                                    "DEBUG: Валидированное WebSocketMessage подтверждения: Тип=%s, Статус=%s",
+                                    ws_response_message.type,
+                                    ws_response_message.payload.get('status') if ws_response_message.payload else 'Payload Missing',
+                                )
 
                             rpc_payload = ws_response_message.payload
                             
@@ -197,7 +202,7 @@ class WebSocketManager:
                             else:
                                 response_status_lower = None
 
-                            self.logger.debug(f"DEBUG: Статус аутентификации из RPC payload: '{response_status_lower}' (original: {response_status})")
+                            self.logger.debug("DEBUG: Статус аутентификации из RPC payload: '%s' (original: %s)", response_status_lower, response_status)
 
                             if ws_response_message.type == "AUTH_CONFIRM" and response_status_lower == "success":
                                 client_id_from_server = rpc_payload.get("data", {}).get("client_id")
@@ -235,12 +240,12 @@ class WebSocketManager:
                     self.logger.info("WSManager: Начало прослушивания сообщений.")
                     self.logger.debug("DEBUG: Вход в цикл прослушивания WebSocket сообщений.")
                     
+                    # Горячий цикл: никаких записей на каждое TEXT-сообщение, детали логирует диспетчер при DEBUG.
                     async for msg in ws:
-                        self.logger.debug(f"DEBUG: Получено WebSocket сообщение. Тип: {msg.type}.")
                         if msg.type == aiohttp.WSMsgType.TEXT:
                             await self._inbound_dispatcher.dispatch_message(msg.data)
                         elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE):
-                            self.logger.warning(f"WSManager: Соединение закрыто или произошла ошибка (тип: {msg.type}). Разрыв соединения.")
+                            self.logger.warning("WSManager: Соединение закрыто или произошла ошибка (тип: %s). Разрыв соединения.", msg.type)
                             break # Выход из внутреннего цикла, чтобы переподключиться
                         elif msg.type == aiohttp.WSMsgType.PING:
                             self.logger.debug("WSManager: Получен PING, отправляю PONG.")
@@ -248,7 +253,7 @@ class WebSocketManager:
                         elif msg.type == aiohttp.WSMsgType.PONG:
                             self.logger.debug("DEBUG: Получен PONG.")
                         else:
-                            self.logger.warning(f"WSManager: Получено неизвестное или необрабатываемое сообщение типа: {msg.type}")
+                            self.logger.warning("WSManager: Получено неизвестное или необрабатываемое сообщение типа: %s", msg.type)
             
             except asyncio.CancelledError:
                 self.logger.info("WSManager: Задача подключения отменена.")
@@ -289,7 +294,8 @@ class WebSocketManager:
                 else:
                     self.logger.info("WSManager: Менеджер отключен. Пропуск повторного подключения.")
 
-    async def send_command(self, command_type: str, command_payload: Dict, domain: str, discord_context: Dict) -> Tuple[Dict, Dict]:
+    async def send_command(self, command_type: str, command_payload: Dict, domain: str, discord_context: Dict, durable: bool = False) -> Tuple[Dict, Dict]:
+        """durable=True — контекст команды дублируется в Redis и переживает перезапуск бота."""
         self.logger.debug(f"Вызван send_command с command_type='{command_type}', domain='{domain}'.")
         if not self._ws or self._ws.closed:
             self.logger.error("Невозможно отправить команду: WebSocket соединение не установлено.")
@@ -298,14 +304,14 @@ class WebSocketManager:
         command_id = str(uuid.uuid4())
         self.logger.debug(f"Сгенерирован command_id: {command_id}")
 
-        # 1. Контекст для Redis
+        # 1. Контекст запроса
         request_context = discord_context.copy()
         request_context.update({
             "correlation_id": command_id,
             "command": command_type,
             "domain": domain
         })
-        self.logger.debug(f"Создан request_context для Redis: {request_context}")
+        self.logger.debug("Создан request_context: %s", request_context)
         
         # 2. "Обертка" команды
         command_wrapper_payload = WebSocketCommandFromClientPayload(
@@ -314,7 +320,8 @@ class WebSocketManager:
             domain=domain,
             payload=command_payload
         )
-        self.logger.debug(f"Создана 'обертка' команды (WebSocketCommandFromClientPayload): {command_wrapper_payload.model_dump()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Создана 'обертка' команды (WebSocketCommandFromClientPayload): %s", command_wrapper_payload.model_dump())
         
         # 3. Финальное сообщение
         message = WebSocketMessage(
@@ -322,10 +329,11 @@ class WebSocketManager:
             correlation_id=command_id,
             payload=command_wrapper_payload
         )
-        self.logger.debug(f"Сформировано финальное сообщение (WebSocketMessage) для отправки: {message.model_dump(mode='json')}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Сформировано финальное сообщение (WebSocketMessage) для отправки: %s", message.model_dump(mode='json'))
         
         # 4. Создание ожидания
-        future = await self.pending_requests.create_request(command_id, request_context)
+        future = await self.pending_requests.create_request(command_id, request_context, durable=durable)
         self.logger.debug(f"Создан Future в PendingRequestsManager для command_id: {command_id}")
         
         try:
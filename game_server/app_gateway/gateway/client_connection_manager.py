@@ -5,6 +5,7 @@ from typing import Dict, Any, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState # Убедитесь, что WebSocketState импортирован
 from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.utils.metrics import WS_ACTIVE_CONNECTIONS, WS_BYTES_SENT_TOTAL, WS_CONNECTION_EVENTS_TOTAL, WS_FRAMES_SENT_TOTAL
 
 class ClientConnectionManager:
     """
@@ -33,9 +34,13 @@ class ClientConnectionManager:
                     await old_websocket.close(code=1000, reason="New connection established for this client ID.")
                 except RuntimeError: # Может произойти, если соединение уже в процессе закрытия
                     pass
+            WS_ACTIVE_CONNECTIONS.labels(client_type=self.client_types.get(client_id, "unknown")).dec()
+            WS_CONNECTION_EVENTS_TOTAL.labels(client_type=self.client_types.get(client_id, "unknown"), event="replaced").inc()
         
         self.active_connections[client_id] = websocket
         self.client_types[client_id] = client_type
+        WS_ACTIVE_CONNECTIONS.labels(client_type=client_type).inc()
+        WS_CONNECTION_EVENTS_TOTAL.labels(client_type=client_type, event="connect").inc()
         logger.info(f"✅ Client ID {client_id} ({client_type}) подключен. Всего активных: {len(self.active_connections)}")
 
     def disconnect(self, client_id: str) -> None:
@@ -44,7 +49,9 @@ class ClientConnectionManager:
         """
         if client_id in self.active_connections:
             del self.active_connections[client_id]
-            del self.client_types[client_id]
+            client_type = self.client_types.pop(client_id, "unknown")
+            WS_ACTIVE_CONNECTIONS.labels(client_type=client_type).dec()
+            WS_CONNECTION_EVENTS_TOTAL.labels(client_type=client_type, event="disconnect").inc()
             logger.info(f"❌ Client ID {client_id} отключен. Всего активных: {len(self.active_connections)}")
         else:
             logger.warning(f"Попытка отключить неизвестный client_id: {client_id}")
@@ -58,15 +65,20 @@ class ClientConnectionManager:
         if websocket and websocket.client_state != WebSocketState.DISCONNECTED: # <--- ИЗМЕНЕНО
             try:
                 await websocket.send_text(message)
+                WS_FRAMES_SENT_TOTAL.labels(status="sent").inc()
+                WS_BYTES_SENT_TOTAL.inc(len(message))
                 return True
             except WebSocketDisconnect:
+                WS_FRAMES_SENT_TOTAL.labels(status="disconnected").inc()
                 logger.warning(f"Client ID {client_id} уже отключен при попытке отправить сообщение.")
                 self.disconnect(client_id) # Удаляем, так как соединение закрыто
                 return False
             except Exception as e:
+                WS_FRAMES_SENT_TOTAL.labels(status="error").inc()
                 logger.error(f"Ошибка отправки сообщения Client ID {client_id}: {e}", exc_info=True)
                 return False
         else:
+            WS_FRAMES_SENT_TOTAL.labels(status="no_connection").inc()
             logger.warning(f"WebSocket-соединение для Client ID {client_id} не найдено или закрыто.")
             self.disconnect(client_id) # Удаляем, если соединение неактивно
             return False
@@ -84,10 +96,14 @@ class ClientConnectionManager:
                     try:
                         await ws.send_text(message)
                         sent_count += 1
+                        WS_FRAMES_SENT_TOTAL.labels(status="sent").inc()
+                        WS_BYTES_SENT_TOTAL.inc(len(message))
                     except WebSocketDisconnect:
+                        WS_FRAMES_SENT_TOTAL.labels(status="disconnected").inc()
                         logger.warning(f"Client ID {client_id} ({client_type}) отключен при попытке отправить сообщение.")
                         disconnected_clients.append(client_id)
                     except Exception as e:
+                        WS_FRAMES_SENT_TOTAL.labels(status="error").inc()
                         logger.error(f"Ошибка отправки сообщения Client ID {client_id} ({client_type}): {e}", exc_info=True)
                 else:
                     disconnected_clients.append(client_id)
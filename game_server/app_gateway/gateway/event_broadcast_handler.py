@@ -1,13 +1,15 @@
 # game_server/app_gateway/gateway/event_broadcast_handler.py
 
 import asyncio
+import logging
 import msgpack
 import uuid # ✅ НУЖЕН для correlation_id
 from typing import Optional
 
 from aio_pika import IncomingMessage
 
-from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.config.logging.logging_setup import get_module_logger
+from game_server.config.logging.log_sampling import LogSampler
 from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessageBus
 from game_server.app_gateway.gateway.client_connection_manager import ClientConnectionManager
 from game_server.config.settings.rabbitmq.rabbitmq_names import Queues
@@ -28,7 +30,8 @@ class EventBroadcastHandler:
     ):
         self.message_bus = message_bus
         self.client_connection_manager = client_connection_manager
-        self.logger = logger
+        self.logger = get_module_logger(__name__)
+        self._sampler = LogSampler(max_per_interval=1, interval_seconds=5.0)
         self._listen_task: Optional[asyncio.Task] = None
         self.inbound_queue_name = Queues.GATEWAY_INBOUND_EVENTS
         self.logger.info("✅ EventBroadcastHandler (режим broadcast-to-all) инициализирован.")
@@ -57,11 +60,11 @@ class EventBroadcastHandler:
         try:
             async with message.process():
                 # --- ✅ ПРАВИЛЬНАЯ ОБРАБОТКА СООБЩЕНИЯ ---
-                self.logger.info("EventBroadcastHandler: Обработка входящего сообщения...")
                 event_data = msgpack.unpackb(message.body, raw=False)
                 routing_key = message.routing_key or "event.unknown"
-                self.logger.info(f"Получено событие '{routing_key}'")
-                self.logger.debug(f"Для рассылки всем: {event_data}")
+                is_debug = self.logger.isEnabledFor(logging.DEBUG)
+                if is_debug:
+                    self.logger.debug("Получено событие '%s' для рассылки всем: %s", routing_key, event_data)
                 
                 all_client_ids = list(self.client_connection_manager.active_connections.keys())
                 if not all_client_ids:
@@ -74,7 +77,6 @@ class EventBroadcastHandler:
                     type=routing_key,  # Тип события, например "event.location.updated"
                     payload=event_data # Данные события, например {"location_id": "201"}
                 )
-                self.logger.debug(f"Создан WebSocketEventPayload: {event_payload.model_dump()}")
 
                 # 2. Создаем "внешний конверт" WebSocketMessage
                 websocket_msg = WebSocketMessage(
@@ -84,10 +86,13 @@ class EventBroadcastHandler:
                 )
                 message_json = websocket_msg.model_dump_json()
 
-                # Рассылаем всем
-                self.logger.info(f"Рассылка события '{routing_key}' {len(all_client_ids)} клиентам.")
+                # Рассылаем всем; INFO-запись о рассылке ограничена по частоте для каждого типа события.
+                self._sampler.log(
+                    self.logger, logging.INFO, routing_key,
+                    "Рассылка события '%s' %d клиентам.", routing_key, len(all_client_ids),
+                )
                 for client_id in all_client_ids:
                     await self.client_connection_manager.send_message_to_client(client_id, message_json)
 
         except Exception as e:
-            self.logger.error(f"Ошибка при массовой рассылке события: {e}", exc_info=True)
\ No newline at end of file
+            self.logger.error("Ошибка при массовой рассылке события: %s", e, exc_info=True)
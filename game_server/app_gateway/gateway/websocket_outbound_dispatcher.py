@@ -2,12 +2,14 @@
 
 import asyncio
 import json
+import logging
 import msgpack
 from typing import Optional, Dict, Any
 
 from aio_pika import IncomingMessage
 
-from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.config.logging.logging_setup import get_module_logger
+from game_server.config.logging.log_sampling import LogSampler
 from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessageBus
 from game_server.app_gateway.gateway.client_connection_manager import ClientConnectionManager
 
@@ -28,7 +30,9 @@ class OutboundWebSocketDispatcher:
     ):
         self.message_bus = message_bus
         self.client_connection_manager = client_connection_manager
-        self.logger = logger
+        self.logger = get_module_logger(__name__)
+        # Предупреждения по отдельным сообщениям не должны заливать лог при массовом сбое.
+        self._sampler = LogSampler(max_per_interval=5, interval_seconds=10.0)
         self._listen_task: Optional[asyncio.Task] = None
         self.outbound_queue_name = Queues.GATEWAY_OUTBOUND_WS_MESSAGES
         self.logger.info("✅ OutboundWebSocketDispatcher инициализирован.")
@@ -53,40 +57,42 @@ class OutboundWebSocketDispatcher:
         """
         Колбэк, вызываемый при получении сообщения из RabbitMQ.
         Десериализует, находит адресата и отправляет сообщение по WebSocket.
+        Вызывается на каждое сообщение: тяжёлые отладочные дампы строятся только при включённом DEBUG.
         """
-        self.logger.info("OutboundDispatcher: Обработка входящего сообщения...")
         message_envelope: Optional[Dict[str, Any]] = None
         actual_websocket_message_data: Optional[Dict[str, Any]] = None
-        
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        self.logger.debug(f"OutboundDispatcher: Получено сырое сообщение. Body length: {len(message.body)}")
-        self.logger.debug(f"OutboundDispatcher: Сырое сообщение body (raw bytes): {message.body}")
+        if is_debug:
+            self.logger.debug("OutboundDispatcher: Получено сырое сообщение. Body length: %d", len(message.body))
 
         try:
             message_envelope = msgpack.unpackb(message.body, raw=False)
-            self.logger.debug(f"OutboundDispatcher: Сообщение MsgPack распаковано. Тип внешней обертки: {type(message_envelope)}. Содержимое (частично): {str(message_envelope)[:200]}")
 
             if not isinstance(message_envelope, dict) or 'payload' not in message_envelope:
-                self.logger.warning(f"Получено сообщение без ожидаемого поля 'payload' или не словарь. Сообщение: {message.body.decode(errors='ignore')[:200]}...")
+                self._sampler.log(
+                    self.logger, logging.WARNING, "invalid_envelope",
+                    "Получено сообщение без ожидаемого поля 'payload' или не словарь. Сообщение: %.200s...",
+                    message.body.decode(errors='ignore'),
+                )
                 await message.ack()
                 return
             
             actual_websocket_message_data = message_envelope['payload']
-            self.logger.debug(f"OutboundDispatcher: Извлечен фактический WebSocketMessage. Тип: {type(actual_websocket_message_data)}. Содержимое (частично): {str(actual_websocket_message_data)[:200]}")
+            if is_debug:
+                self.logger.debug("OutboundDispatcher: Извлечен WebSocketMessage (частично): %.200s", str(actual_websocket_message_data))
 
             websocket_msg = WebSocketMessage.model_validate(actual_websocket_message_data)
-            self.logger.info("OutboundDispatcher: Сообщение успешно валидировано как WebSocketMessage.")
 
             # Получаем client_id напрямую из websocket_msg
             target_client_id = websocket_msg.client_id
             
             if not target_client_id:
-                self.logger.warning(f"Сообщение (CorrID: {websocket_msg.correlation_id}) не может быть доставлено: отсутствует 'client_id' на верхнем уровне WebSocketMessage.")
+                self.logger.warning("Сообщение (CorrID: %s) не может быть доставлено: отсутствует 'client_id' на верхнем уровне WebSocketMessage.", websocket_msg.correlation_id)
                 await message.ack()
                 return
 
             message_json = websocket_msg.model_dump_json()
-            self.logger.info(f"OutboundDispatcher: Отправка JSON-сообщения клиенту {target_client_id}...")
 
             success = await self.client_connection_manager.send_message_to_client(
                 target_client_id,
@@ -94,12 +100,16 @@ class OutboundWebSocketDispatcher:
             )
 
             if success:
-                self.logger.debug(f"Ответ для клиента {target_client_id} (CorrID: {websocket_msg.correlation_id}) успешно отправлен.")
+                if is_debug:
+                    self.logger.debug("Ответ для клиента %s (CorrID: %s) успешно отправлен.", target_client_id, websocket_msg.correlation_id)
             else:
-                self.logger.warning(f"Не удалось отправить сообщение клиенту {target_client_id}. Соединение не найдено или закрыто.")
+                self._sampler.log(
+                    self.logger, logging.WARNING, "client_not_found",
+                    "Не удалось отправить сообщение клиенту %s. Соединение не найдено или закрыто.", target_client_id,
+                )
 
             await message.ack()
         except Exception as e:
-            msg_id = actual_websocket_message_data.get("correlation_id", "N/A") if actual_websocket_message_data else "N/A"
-            self.logger.error(f"Ошибка при обработке исходящего WebSocket-сообщения (CorrID: {msg_id}): {e}", exc_info=True)
+            msg_id = actual_websocket_message_data.get("correlation_id", "N/A") if isinstance(actual_websocket_message_data, dict) else "N/A"
+            self.logger.error("Ошибка при обработке исходящего WebSocket-сообщения (CorrID: %s): %s", msg_id, e, exc_info=True)
             await message.nack(requeue=False)
@@ -32,6 +32,7 @@ print("DEBUG: main.py - Logger import completed")
 # Используем функции из отдельного файла
 from game_server.app_gateway.gateway_dependencies import initialize_gateway_dependencies, shutdown_gateway_dependencies
 from game_server.config.settings_core import APP_VERSION
+from game_server.utils.metrics import mount_metrics_endpoint
 
 print("DEBUG: main.py - Gateway dependencies imports completed")
 
@@ -135,6 +136,9 @@ app = FastAPI(
     openapi_tags=tags_metadata
 )
 
+# Prometheus: метрики шины, хранилищ и WebSocket-соединений шлюза
+mount_metrics_endpoint(app)
+
 logger.info("Подключение REST роутеров...")
 for router_config in ROUTERS_CONFIG:
     app.include_router(
@@ -17,6 +17,7 @@ from game_server.app_gateway.rest_api_dependencies import get_client_connection_
 from game_server.config.settings.rabbitmq.rabbitmq_names import Exchanges, RoutingKeys, Queues
 from game_server.contracts.shared_models.base_responses import ResponseStatus
 from game_server.contracts.shared_models.websocket_base_models import WebSocketMessage, WebSocketResponsePayload
+from game_server.utils.tracing import trace_span
 
 logger.info("--- 🚀 Загружен унифицированный WebSocket-роутер (unified_ws.py) ---")
 
@@ -151,11 +152,16 @@ async def unified_websocket_endpoint(
 
                 logger.debug(f"Получена команда от {client_id}. Ключ: '{routing_key}'.")
 
-                await message_bus.publish(
-                    exchange_name=Exchanges.COMMANDS,
-                    routing_key=routing_key,
-                    message=actual_command_dto
-                )
+                # trace_id фиксируется здесь, чтобы DTO в сервисе и спаны всех звеньев имели один и тот же id.
+                trace_id = actual_command_dto.get('trace_id') or websocket_msg.trace_id or uuid.uuid4()
+                actual_command_dto['trace_id'] = str(trace_id)
+
+                with trace_span("ws.receive_command", trace_id=str(trace_id), command=command_name, client_type=client_type):
+                    await message_bus.publish(
+                        exchange_name=Exchanges.COMMANDS,
+                        routing_key=routing_key,
+                        message=actual_command_dto
+                    )
                 logger.info(f"Команда '{command_name}' от {client_id} опубликована в {Exchanges.COMMANDS} с ключом '{routing_key}'.")
 
     except WebSocketDisconnect:
@@ -5,6 +5,7 @@ ARQ_TASK_GENERATE_CHARACTER_BATCH: str = "game_server.Logic.ApplicationLogic.wor
 ARQ_TASK_PROCESS_ITEM_GENERATION_BATCH: str = "game_server.Logic.ApplicationLogic.world_orchestrator.workers.tasks.arq_item_generation.process_item_generation_batch_task"
 ARQ_TASK_GENERATE_WORLD_MAP: str = "game_server.Logic.ApplicationLogic.world_orchestrator.workers.tasks.arq_world_map_generation.generate_world_map_task"
 ARQ_TASK_AGGREGATE_LOCATION_STATE: str = "game_server.Logic.DomainLogic.arq_tasks.location_tasks.aggregate_location_state"
+ARQ_TASK_PROCESS_AUTO_LEVELING_BATCH: str = "game_server.Logic.ApplicationLogic.world_orchestrator.workers.tasks.arq_auto_leveling.process_auto_leveling_batch_task"
 
 
 
@@ -13,7 +14,8 @@ TASKS = [
     ARQ_TASK_GENERATE_CHARACTER_BATCH,
     ARQ_TASK_PROCESS_ITEM_GENERATION_BATCH,
     ARQ_TASK_GENERATE_WORLD_MAP,
-    ARQ_TASK_AGGREGATE_LOCATION_STATE
+    ARQ_TASK_AGGREGATE_LOCATION_STATE,
+    ARQ_TASK_PROCESS_AUTO_LEVELING_BATCH
 ]
 
 # === КЛЮЧИ, СВЯЗАННЫЕ С ФОНОВЫМИ ЗАДАЧАМИ (WORKERS) ===
@@ -22,6 +24,14 @@ TASKS = [
 # Шаблон для ключа, хранящего "тяжелые" данные для задачи (тип: Hash)
 KEY_TASK_BATCH_DATA = "task:batch_data:{batch_id}"
 
+# --- Планировщик периодических задач воркера (выбор лидера среди реплик) ---
+# Аренда лидера (тип: String "<владелец>:<fencing-токен>", с TTL)
+KEY_PERIODIC_LEASE = "scheduler:lease:{job}"
+# Счётчик выданных fencing-токенов (тип: String, INCR)
+KEY_PERIODIC_FENCE = "scheduler:fence:{job}"
+# Последний закреплённый тик: fence, slot, started_at (тип: Hash)
+KEY_PERIODIC_LAST_TICK = "scheduler:last_tick:{job}"
+
 # --- Статусы задач ---
 # Шаблон для ключа, хранящего статус выполнения задачи
 KEY_TASK_STATUS = "task:status:{task_id}"
@@ -32,5 +42,8 @@ KEY_ITEM_GENERATION_TASK = "task:generation:item:{batch_id}"
 # Шаблон для ключа задачи генерации персонажей
 KEY_CHARACTER_GENERATION_TASK = "task:generation:character:{batch_id}"
 
+# Шаблон для ключа батча автопрокачки (персонажи одного тика)
+KEY_AUTO_LEVELING_BATCH = "task:tick:auto_leveling:{batch_id}"
+
 # Очередь для воркера генерации предметов (если используется в ARQ)
 # ITEM_GENERATION_WORKER_QUEUE_NAME уже определена выше
\ No newline at end of file
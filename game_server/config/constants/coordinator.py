@@ -1,6 +1,8 @@
 # game_server\config\constants\coordinator.py
 from typing import Dict
 
+from .arq import ARQ_TASK_PROCESS_AUTO_LEVELING_BATCH, KEY_AUTO_LEVELING_BATCH
+
 # ======================================================================
 # --- КОНСТАНТЫ КООРДИНАТОРА ---
 # ======================================================================
@@ -15,7 +17,10 @@ COMMAND_PROCESS_AUTO_EXPLORING: str = "process_auto_exploring"
 # --- Маршрутизация задач к воркерам ---
 # Имена ARQ-функций для MessageBus (для команд координатора)
 ARQ_COMMAND_TASK_NAMES: Dict[str, str] = {
-    "auto_leveling": "process_auto_leveling_batch",
+    # Воркер регистрирует задачи под их полным путём (см. TASKS в constants/arq.py)
+    "auto_leveling": ARQ_TASK_PROCESS_AUTO_LEVELING_BATCH,
     "auto_exploring": "process_auto_exploring_batch"
 }
 
+# Шаблоны ключей Redis для батчей команд координатора
+AUTO_LEVELING_BATCH_KEY_TEMPLATE: str = KEY_AUTO_LEVELING_BATCH
@@ -37,4 +37,15 @@ LOCATION_CONNECTIONS_YAML_PATH: str = "game_server/Logic/ApplicationLogic/world_
 # --- Ключи для кэширования эталонного пула предметов ---
 # (Оставлены здесь до рефакторинга соответствующего менеджера)
 REDIS_KEY_ETALON_ITEM_POOL: str = "etalon_pool:items"
-REDIS_KEY_ETALON_ITEM_FINGERPRINT: str = "etalon_pool:items:fingerprint"
\ No newline at end of file
+REDIS_KEY_ETALON_ITEM_FINGERPRINT: str = "etalon_pool:items:fingerprint"
+
+# Построчные отпечатки справочников, по которым был построен закэшированный пул,
+# и отчёт о последнем (инкрементальном) перепланировании.
+REDIS_KEY_ETALON_ITEM_ROW_FINGERPRINTS: str = "etalon_pool:items:row_fingerprints"
+REDIS_KEY_ETALON_ITEM_PLAN_REPORT: str = "etalon_pool:items:plan_report"
+
+
+# --- Категории автосессий (AutoSession.active_category) ---
+# Используются коллектором автосессий как ключи очередей задач.
+REDIS_TASK_QUEUE_EXPLORATION: str = "exploration"
+REDIS_TASK_QUEUE_TRAINING: str = "training"
@@ -22,6 +22,10 @@ GAME_PREFIX = "game"
 # Пример: game:world:location_summary:201
 LOCATION_SUMMARY_HASH = f"{GAME_PREFIX}:world:location_summary:{{location_id}}"
 
+# Копия LOCATION_SUMMARY_HASH в том виде, в каком она последний раз отправлена клиентам.
+# Относительно неё считаются изменения для пакетной рассылки сводок.
+LOCATION_SUMMARY_PUSHED_HASH = f"{GAME_PREFIX}:world:location_summary_pushed:{{location_id}}"
+
 # --- ПОЛЯ ВНУТРИ ХЭША LOCATION_SUMMARY_HASH ---
 
 # Эти имена полей будут использоваться как в Redis, так и в коде Дискорд-бота.
@@ -44,6 +44,10 @@ from pathlib import Path
 # Путь к корневой директории с seed-файлами
 SEEDS_DIR = Path("game_server/database/seeds")
 
+# Скомпилированный снапшот сидов (см. game_server/utils/compile_seeds.py).
+# Если он собран из текущих YAML-файлов, предстарт не парсит YAML вовсе.
+SEED_SNAPSHOT_PATH = Path("game_server/database/seeds_compiled/seeds.snapshot.msgpack")
+
 # Словарь для переопределения первичных ключей для конкретных моделей.
 # Используется, когда PK не является стандартным 'id'.
 # Ключ - имя класса модели (Model.__name__), значение - имя колонки PK.
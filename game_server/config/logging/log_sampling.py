@@ -0,0 +1,54 @@
+# game_server/config/logging/log_sampling.py
+
+import logging
+import time
+from typing import Any, Dict, Tuple
+
+
+class LogSampler:
+    """
+    Ограничитель частоты однотипных записей для горячих путей (по записи на каждое сообщение).
+    По каждому ключу пропускает не более max_per_interval записей за interval_seconds;
+    сверх лимита — только каждую sample_every-ю (0 — ни одной). Количество отброшенных
+    записей дописывается к следующей пропущенной записи.
+    """
+    def __init__(self, max_per_interval: int = 10, interval_seconds: float = 1.0, sample_every: int = 0):
+        self.max_per_interval = max_per_interval
+        self.interval_seconds = interval_seconds
+        self.sample_every = sample_every
+        # {ключ: [начало окна, записано в окне, отброшено с последней записи, всего сверх лимита]}
+        self._windows: Dict[str, list] = {}
+
+    def allow(self, key: str) -> Tuple[bool, int]:
+        """Возвращает (писать ли запись, сколько записей было отброшено с прошлой пропущенной)."""
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval_seconds:
+            suppressed = window[2] if window else 0
+            self._windows[key] = [now, 1, 0, 0]
+            return True, suppressed
+
+        if window[1] < self.max_per_interval:
+            window[1] += 1
+        else:
+            window[3] += 1
+            if not self.sample_every or window[3] % self.sample_every:
+                window[2] += 1
+                return False, 0
+
+        suppressed, window[2] = window[2], 0
+        return True, suppressed
+
+    def log(self, logger: logging.Logger, level: int, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Аналог logger.log с ленивым форматированием: при выключенном уровне не делает ничего.
+        """
+        if not logger.isEnabledFor(level):
+            return
+        allowed, suppressed = self.allow(key)
+        if not allowed:
+            return
+        if suppressed:
+            msg = f"{msg} (пропущено похожих записей: %d)"
+            args = (*args, suppressed)
+        logger.log(level, msg, *args, **kwargs)
@@ -1,11 +1,15 @@
 # game_server/Logic/InfrastructureLogic/logging/logging_setup.py
 
 import os
+import atexit
+import copy
 import logging
+import queue
 import sys
 import colorlog
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import datetime # Импорт для обработки datetime, если нужно для логирования
+from typing import Dict
 
 
 # --- 1. Определение пользовательских уровней (из logging_config.py) ---
@@ -21,6 +25,26 @@ logging.Logger.success = success_log_method
 
 
 # --- 2. Конфигурация логгера (часть из logging_config.py) ---
+def _parse_level(value: str, default: int) -> int:
+    level = logging.getLevelName(value.strip().upper()) if value else default
+    return level if isinstance(level, int) else default
+
+
+def _parse_module_levels(value: str) -> Dict[str, int]:
+    """
+    Разбирает строку вида "game_server.app_gateway=WARNING,aio_pika=INFO" в {имя_логгера: уровень}.
+    """
+    levels: Dict[str, int] = {}
+    for item in (value or "").split(","):
+        name, _, level_name = item.partition("=")
+        if not name.strip() or not level_name.strip():
+            continue
+        level = logging.getLevelName(level_name.strip().upper())
+        if isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
 class LoggerConfig:
     def __init__(self):
         # Путь к корневой директории логов внутри контейнера
@@ -55,19 +79,34 @@ class LoggerConfig:
         self.exception_log_level = logging.ERROR # Логи EXCEPTION (который на самом деле ERROR) в exception_log_file
 
         self.sql_echo = os.getenv("SQL_ECHO", "False").lower() == "true"
+
+        # Уровень логгера отсекает записи ещё до форматирования и постановки в очередь.
+        # DEBUG включается явно через LOG_LEVEL=DEBUG.
+        self.app_log_level = _parse_level(os.getenv("LOG_LEVEL", "INFO"), logging.INFO)
+        # Уровни для отдельных модулей: LOG_MODULE_LEVELS="game_server.app_gateway=WARNING,aio_pika=INFO"
+        self.module_log_levels = _parse_module_levels(os.getenv("LOG_MODULE_LEVELS", ""))
+        # Запись в консоль и файлы выполняется фоновым потоком QueueListener, а не в event loop.
+        self.queue_enabled = os.getenv("LOG_QUEUE_ENABLED", "True").lower() == "true"
         
         # Получаем главный логгер приложения
         self.app_logger = logging.getLogger("game_server_app_logger") 
-        self.app_logger.setLevel(logging.DEBUG) # Устанавливаем общий уровень для логгера на самый низкий
+        self.app_logger.setLevel(self.app_log_level)
         # 🔥 ДОБАВЛЕНО: Настройка уровней логирования для Motor и PyMongo
         logging.getLogger('motor').setLevel(logging.INFO) # Или logging.DEBUG для более детальных логов
         logging.getLogger('pymongo').setLevel(logging.INFO) # Или logging.DEBUG для более детальных логов
                 
         self._disable_sqlalchemy_logs()
+        self._apply_module_levels()
 
     def get_logger(self):
         return self.app_logger
 
+    def _apply_module_levels(self):
+        # Имя применяется и к дочернему логгеру приложения (get_module_logger), и к стороннему логгеру с таким именем.
+        for name, level in self.module_log_levels.items():
+            self.app_logger.getChild(name).setLevel(level)
+            logging.getLogger(name).setLevel(level)
+
     def _disable_sqlalchemy_logs(self):
         sql_loggers = [
             "sqlalchemy",
@@ -117,6 +156,59 @@ def get_file_handler(path, level, max_size, backups):
     return file_handler
 
 
+_exception_formatter = logging.Formatter()
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    Кладёт запись в очередь, не форматируя её строкой по шаблону обработчиков.
+    В вызывающем потоке выполняется только подстановка аргументов сообщения и рендер traceback
+    (пока exc_info ещё актуален); форматирование и дисковый I/O выполняет поток QueueListener.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_log_listener: QueueListener | None = None
+
+
+def _build_handlers(config: LoggerConfig) -> list:
+    return [
+        # Добавляем консольный обработчик (для вывода в консоль Docker logs)
+        get_console_handler(config.console_log_level),
+        # 🔥 ВОССТАНОВЛЕНО: Добавляем отдельные файловые обработчики для каждого уровня логов
+        get_file_handler(config.debug_log_file, config.debug_log_level, config.max_file_size, config.backup_count),
+        get_file_handler(config.info_log_file, config.info_log_level, config.max_file_size, config.backup_count),
+        get_file_handler(config.warning_log_file, config.warning_log_level, config.max_file_size, config.backup_count),
+        get_file_handler(config.error_log_file, config.error_log_level, config.max_file_size, config.backup_count),
+        get_file_handler(config.critical_log_file, config.critical_log_level, config.max_file_size, config.backup_count),
+        get_file_handler(config.exception_log_file, config.exception_log_level, config.max_file_size, config.backup_count),
+    ]
+
+
+def stop_log_listener() -> None:
+    """Дожидается записи всех логов из очереди и останавливает фоновый поток."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def get_module_logger(name: str) -> logging.Logger:
+    """
+    Дочерний логгер приложения для модуля (обычно __name__).
+    Пишет в те же обработчики, но его уровень настраивается отдельно через LOG_MODULE_LEVELS.
+    """
+    return app_logger.getChild(name)
+
+
 # --- 4. Настройка логгера приложения (часть из logging_setup.py) ---
 config = LoggerConfig()
 app_logger = config.get_logger()
@@ -124,13 +216,15 @@ app_logger = config.get_logger()
 app_logger.propagate = False
 
 if not app_logger.handlers: 
-    # Добавляем консольный обработчик (для вывода в консоль Docker logs)
-    app_logger.addHandler(get_console_handler(config.console_log_level))
-
-    # 🔥 ВОССТАНОВЛЕНО: Добавляем отдельные файловые обработчики для каждого уровня логов
-    app_logger.addHandler(get_file_handler(config.debug_log_file, config.debug_log_level, config.max_file_size, config.backup_count))
-    app_logger.addHandler(get_file_handler(config.info_log_file, config.info_log_level, config.max_file_size, config.backup_count))
-    app_logger.addHandler(get_file_handler(config.warning_log_file, config.warning_log_level, config.max_file_size, config.backup_count))
-    app_logger.addHandler(get_file_handler(config.error_log_file, config.error_log_level, config.max_file_size, config.backup_count))
-    app_logger.addHandler(get_file_handler(config.critical_log_file, config.critical_log_level, config.max_file_size, config.backup_count))
-    app_logger.addHandler(get_file_handler(config.exception_log_file, config.exception_log_level, config.max_file_size, config.backup_count))
+    handlers = _build_handlers(config)
+    if config.queue_enabled:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        app_logger.addHandler(DeferredFormatQueueHandler(log_queue))
+        # respect_handler_level: каждый обработчик по-прежнему фильтрует записи по своему уровню.
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(stop_log_listener)
+    else:
+        for handler in handlers:
+            app_logger.addHandler(handler)
+
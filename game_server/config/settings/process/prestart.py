@@ -23,4 +23,7 @@ BASE_ROLL_RARITY_MODIFIER: Dict[int, int] = {
 }
 
 # Настройка размера батча для удаления сидов
-SEEDING_DELETION_BATCH_SIZE: int = 50
\ No newline at end of file
+SEEDING_DELETION_BATCH_SIZE: int = 50
+
+# Сколько YAML-файлов парсится одновременно в пуле потоков на предстарте
+YAML_PARSE_CONCURRENCY: int = 8
@@ -15,4 +15,12 @@ TICK_INTERVAL_MINUTES: int = 5
 
 # Настройки для периодических задач ARQ Worker
 PERIODIC_TASK_INTERVAL_SECONDS: int = 30 # Интервал между запусками периодической задачи (в секундах)
-PERIODIC_TASK_ERROR_INTERVAL_SECONDS: int = 5 # Интервал ожидания после ошибки в периодической задаче (в секундах)
\ No newline at end of file
+PERIODIC_TASK_ERROR_INTERVAL_SECONDS: int = 5 # Интервал ожидания после ошибки в периодической задаче (в секундах)
+PERIODIC_TASK_LEASE_TTL_SECONDS: int = 60 # Срок аренды лидера: периодическую задачу выполняет одна реплика воркера
+PERIODIC_TASK_OVERRUN_POLICY: str = "skip" # Тик дольше интервала: "skip" — пропустить границы, "catch_up" — догнать
+PERIODIC_TASK_MAX_CATCH_UP_TICKS: int = 3 # Сколько пропущенных тиков догоняется при политике "catch_up"
+
+# Рассылка сводок динамического состояния локаций клиентам
+LOCATION_SUMMARY_PUSH_WINDOW_SECONDS: float = 0.5 # Изменения локаций за это окно уходят одним событием
+LOCATION_SUMMARY_PUSH_MAX_BATCH: int = 200 # При таком числе изменённых локаций событие отправляется, не дожидаясь конца окна
+LOCATION_SUMMARY_PUSH_MAX_RETRY_DELAY_SECONDS: float = 30.0 # Потолок экспоненциальной задержки повторной отправки после ошибки
\ No newline at end of file
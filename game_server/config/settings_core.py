@@ -49,6 +49,9 @@ MONGO_HOST_CONTAINER = os.getenv("MONGO_HOST_CONTAINER", "mongo_db")
 # и orchestrator будут подключаться к MongoDB внутри Docker сети по имени сервиса.
 # Убедитесь, что 'mongo_db' соответствует имени сервиса MongoDB в вашем docker-compose.yml.
 MONGO_URI = f"mongodb://{MONGO_INITDB_ROOT_USERNAME}:{MONGO_INITDB_ROOT_PASSWORD}@{MONGO_HOST_CONTAINER}:{MONGO_PORT}/{MONGO_DB_NAME}?authSource=admin" # ДОБАВЛЕНО
+# Создание объявленных репозиториями индексов и проверка планов горячих запросов (explain) при старте.
+MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", "True").lower() in ("true", "1", "yes")
+MONGO_VERIFY_QUERY_PLANS = os.getenv("MONGO_VERIFY_QUERY_PLANS", "True").lower() in ("true", "1", "yes")
 
 # ===================================================================
 # ⚡️ КЭШ И ВРЕМЕННОЕ ХРАНИЛИЩЕ (Redis) - ЦЕНТРАЛЬНЫЙ СЕРВЕР
@@ -90,4 +93,22 @@ if not AMQP_URL:
 # if not AMQP_URL:
 #   raise ValueError("❌ Ошибка: переменная окружения AMQP_URL или необходимые переменные RabbitMQ не заданы!")
 
-GATEWAY_BOT_SECRET = os.getenv("GATEWAY_BOT_SECRET")
\ No newline at end of file
+GATEWAY_BOT_SECRET = os.getenv("GATEWAY_BOT_SECRET")
+# ===================================================================
+# 🔭 ТРАССИРОВКА (спаны команд между шлюзом, шиной и воркерами)
+# ===================================================================
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "False").lower() in ("true", "1", "yes")
+# Доля трасс, которые записываются (0.0 - 1.0). Решение принимается один раз в корне трассы.
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.05"))
+# "file" — JSON Lines в TRACE_EXPORT_PATH, "http" — пачки JSON в TRACE_COLLECTOR_URL.
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "file").lower()
+TRACE_EXPORT_PATH = os.getenv(
+    "TRACE_EXPORT_PATH",
+    os.path.join("/app/game_server/logs", f"{os.getenv('CONTAINER_ID', 'default_container')}_traces.jsonl"),
+)
+TRACE_COLLECTOR_URL = os.getenv("TRACE_COLLECTOR_URL")
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME") or os.getenv("CONTAINER_ID", "game_server")
+# ===================================================================
+# 📈 МЕТРИКИ (Prometheus exporter для процессов без FastAPI)
+# ===================================================================
+ARQ_WORKER_METRICS_PORT = int(os.getenv("ARQ_WORKER_METRICS_PORT", "9101"))
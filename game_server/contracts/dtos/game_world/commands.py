@@ -1,6 +1,7 @@
 # contracts/dtos/game_world/commands.py
 
 import uuid
+from typing import Optional
 from pydantic import Field
 
 # Импортируем BaseCommandDTO из новой общей папки
@@ -13,4 +14,6 @@ class GetWorldDataCommandDTO(BaseCommandDTO):
     """
     command: str = "get_world_data" # Command name that the backend will expect
     # correlation_id, trace_id, span_id, client_id - наследуются от BaseCommandDTO
+    # Версия снимка карты, которая уже есть у бота. Если задана, бэкенд отвечает только изменениями.
+    known_version: Optional[int] = None
 
@@ -1,6 +1,6 @@
 # contracts/dtos/game_world/results.py
 
-from typing import Dict
+from typing import Dict, List, Literal
 from pydantic import BaseModel
 
 # Импортируем WorldLocationDataDTO из data_models в этом же домене
@@ -11,6 +11,14 @@ class GetWorldDataResponseData(BaseModel):
     DTO for the response data to the command requesting the static game world skeleton.
     Contains a dictionary of all locations by their ID.
     Перенесено из game_server/common_contracts/dtos/game_world_dtos.py
+
+    mode:
+      - "full": locations содержит всю карту;
+      - "delta": locations содержит только изменённые после known_version локации, removed_location_ids — удалённые;
+      - "not_modified": у бота актуальная версия, данные не передаются.
     """
-    locations: Dict[str, WorldLocationDataDTO]
+    version: int = 0
+    mode: Literal["full", "delta", "not_modified"] = "full"
+    locations: Dict[str, WorldLocationDataDTO] = {}
+    removed_location_ids: List[str] = []
 
@@ -20,6 +20,7 @@ from game_server.Logic.InfrastructureLogic.messaging.rabbitmq_message_bus import
 # Импорт логгера
 from game_server.config.logging.logging_setup import app_logger as global_app_logger
 from game_server.config.provider import config
+from game_server.utils.metrics import create_mongo_command_listener
 from game_server.core.di_modules.auth_bindings import configure_auth_services
 from game_server.core.di_modules.cache_bindings import configure_cache_managers
 from game_server.core.di_modules.core_service_bindings import configure_core_services
@@ -71,7 +72,10 @@ async def initialize_di_container():
     _async_singletons_instances[CentralRedisClient] = central_redis_client_instance
 
     # 🔥 ИЗМЕНЕНО: Инициализация MongoDB клиента с AsyncIOMotorClient
-    mongo_client_instance = AsyncIOMotorClient(config.settings.core.MONGO_URI) # <--- ВОТ ГДЕ ОШИБКА БЫЛА!
+    mongo_client_instance = AsyncIOMotorClient(
+        config.settings.core.MONGO_URI,
+        event_listeners=[create_mongo_command_listener()], # Время каждой команды MongoDB в метриках
+    )
     _async_singletons_instances[AsyncIOMotorClient] = mongo_client_instance # Привязываем инстанс AsyncIOMotorClient
     mongo_db_instance = mongo_client_instance.get_database(config.settings.core.MONGO_DB_NAME) # Получаем объект базы данных
     _async_singletons_instances['mongo_database_obj'] = mongo_db_instance # Привязываем объект базы данных
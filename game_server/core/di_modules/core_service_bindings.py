@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from game_server.Logic.CoreServices.services.identifiers_servise import IdentifiersServise
 from game_server.Logic.CoreServices.services.random_service import RandomService
 from game_server.Logic.CoreServices.services.data_version_manager import DataVersionManager # 🔥 ДОБАВЛЕНО: Импорт DataVersionManager
+from game_server.Logic.CoreServices.services.location_graph_service import LocationGraphService
+from game_server.Logic.CoreServices.services.item_instance_bulk_service import ItemInstanceBulkService
 
 # Импорты зависимостей, которые нужны Core Services (теперь это фабрики репозиториев)
 from game_server.Logic.InfrastructureLogic.app_post.repository_groups.accounts.interfaces_accounts import IAccountInfoRepository
@@ -34,3 +36,9 @@ def configure_core_services(binder):
 
     # 🔥 ДОБАВЛЕНО: DataVersionManager теперь привязывается как обычный сервис
     binder.bind_to_constructor(DataVersionManager, DataVersionManager)
+
+    # Граф выходов между локациями (в памяти процесса, строится из связей в Redis)
+    binder.bind_to_constructor(LocationGraphService, LocationGraphService)
+
+    # Пакетные операции с экземплярами предметов со сквозной записью в кэш
+    binder.bind_to_constructor(ItemInstanceBulkService, ItemInstanceBulkService)
@@ -41,6 +41,7 @@ from game_server.Logic.ApplicationLogic.shared_logic.LocationStateManagement.Han
 from game_server.Logic.ApplicationLogic.shared_logic.LocationStateManagement.Handlers.get_location_summary_handler import GetLocationSummaryHandler
 from game_server.Logic.ApplicationLogic.shared_logic.LocationStateManagement.Handlers.remove_player_from_state_handler import RemovePlayerFromStateHandler
 from game_server.Logic.ApplicationLogic.shared_logic.LocationStateManagement.location_state_orchestrator import LocationStateOrchestrator
+from game_server.Logic.ApplicationLogic.shared_logic.LocationStateManagement.location_summary_push_coalescer import LocationSummaryPushCoalescer
 
 
 def configure_system_services(binder):
@@ -84,6 +85,7 @@ def configure_system_services(binder):
     binder.bind_to_constructor(AddPlayerToStateHandler, AddPlayerToStateHandler)
     binder.bind_to_constructor(RemovePlayerFromStateHandler, RemovePlayerFromStateHandler)
     binder.bind_to_constructor(GetLocationSummaryHandler, GetLocationSummaryHandler)
+    binder.bind_to_constructor(LocationSummaryPushCoalescer, LocationSummaryPushCoalescer)
         # ✅ НОВАЯ ПРИВЯЗКА: Регистрируем новый оркестратор
     binder.bind_to_constructor(CacheRequestOrchestrator, CacheRequestOrchestrator)
 
@@ -17,6 +17,7 @@ from game_server.game_services.command_center.auth_service_command.auth_service_
 
 # 🔥 ДОБАВЛЕНО: Импортируем роутер для проверок здоровья
 from game_server.game_services.healthcheck.auth_service_healthcheck_route import health_check_router
+from game_server.utils.metrics import mount_metrics_endpoint
 
 
 @asynccontextmanager
@@ -100,6 +101,8 @@ app = FastAPI(lifespan=lifespan)
 
 # Подключаем роутер для проверок здоровья
 app.include_router(health_check_router, prefix="/health")
+# Prometheus: метрики команд, шины и хранилищ сервиса
+mount_metrics_endpoint(app)
 
 # Добавьте пример роута для проверки работоспособности, если необходимо
 @app.get("/")
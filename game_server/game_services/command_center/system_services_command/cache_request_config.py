@@ -11,11 +11,17 @@ from game_server.contracts.dtos.game_commands.cache_request_commands import GetL
 # Импортируем сам класс обработчика, который мы создадим на следующем шаге
 
 
-# Карта, связывающая имя команды с DTO и классом-обработчиком
+# Карта, связывающая имя команды с DTO и классом-обработчиком.
+# memo_ttl_seconds (необязательно) — сколько секунд успешный результат отдаётся повторным запросам из памяти.
+# Одновременные одинаковые запросы объединяются в одно вычисление (см. CacheRequestOrchestrator);
+# и объединение, и память отдают только результаты вычислений, начатых не раньше timestamp запроса.
 CACHE_REQUEST_HANDLER_MAPPING: Dict[str, Dict[str, Any]] = {
     "get_location_summary": {
         "dto": GetLocationSummaryCommandDTO,
         "handler": GetLocationSummaryCommandHandler,
+        # Сводку запрашивают в ответ на событие об изменении локации, и все клиенты в локации спрашивают
+        # её почти одновременно. Правило свежести гарантирует, что ответ прочитан уже после отправки запроса.
+        "memo_ttl_seconds": 1,
     },
     # Сюда в будущем можно будет добавлять другие команды для работы с кэшем
 }
\ No newline at end of file
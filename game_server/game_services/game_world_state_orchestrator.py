@@ -16,6 +16,7 @@ from game_server.game_services.command_center.coordinator_command.coordinator_li
 # Импорты для инфраструктуры
 
 from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessageBus # Если нужен для типизации
+from game_server.utils.metrics import mount_metrics_endpoint
 
 
 
@@ -101,6 +102,9 @@ app = FastAPI(
     lifespan=lifespan_event_handler
 )
 
+# Prometheus: метрики шины и хранилищ оркестратора
+mount_metrics_endpoint(app)
+
 @app.get("/health", summary="Проверка состояния оркестратора")
 async def health_check():
     """Проверяет, что оркестратор запущен и отвечает."""
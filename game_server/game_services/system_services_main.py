@@ -12,6 +12,7 @@ from game_server.core.di_container import initialize_di_container, shutdown_di_c
 # Импортируем ОБА класса слушателей
 from game_server.game_services.command_center.system_services_command.system_services_cache_listener import CacheRequestCommandListener
 from game_server.game_services.command_center.system_services_command.system_services_listener import SystemServicesCommandListener
+from game_server.utils.metrics import mount_metrics_endpoint
 # ✅ НОВЫЙ ИМПОРТ
 
 
@@ -72,4 +73,7 @@ app = FastAPI(
     title="System Services Microservice",
     description="Handles system-level commands and operations.",
     lifespan=lifespan
-)
\ No newline at end of file
+)
+
+# Prometheus: метрики команд, шины и хранилищ сервиса
+mount_metrics_endpoint(app)
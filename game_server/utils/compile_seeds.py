@@ -0,0 +1,21 @@
+# game_server/utils/compile_seeds.py
+#
+# Шаг сборки: компилирует YAML-сиды в бинарный снапшот с заранее посчитанными хэшами таблиц.
+# Запуск из корня проекта:  python -m game_server.utils.compile_seeds
+
+import asyncio
+
+from game_server.Logic.ApplicationLogic.world_orchestrator.workers.load_kesh_database.load_seeds.seed_loader import SeedLoader
+from game_server.Logic.ApplicationLogic.world_orchestrator.workers.load_kesh_database.load_seeds.seed_snapshot import SeedSnapshotCompiler
+from game_server.Logic.CoreServices.utils.yaml_readers import YamlReader
+from game_server.config.logging.logging_setup import app_logger
+from game_server.database.models import models
+
+
+async def main():
+    loader = SeedLoader(logger=app_logger, yaml_reader=YamlReader())
+    compiler = SeedSnapshotCompiler(loader=loader, logger=app_logger)
+    await compiler.compile(models)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,12 +1,62 @@
 import time
+from typing import Any, Dict, Optional, Tuple
 from game_server.config.logging.logging_setup import app_logger as logger
-from prometheus_client import Histogram, Counter # Добавлен Counter для ошибок
+from prometheus_client import Histogram, Counter, Gauge, make_asgi_app, start_http_server # Добавлен Counter для ошибок
 import asyncio
 
+from game_server.utils.tracing import start_child_span
+
 # Инициализация Prometheus-метрики
 REQUEST_LATENCY = Histogram('request_latency_seconds', 'Время выполнения запроса', ['endpoint', 'status']) # Добавлена метка 'status'
 REQUEST_ERRORS_TOTAL = Counter('request_errors_total', 'Общее количество ошибок запросов', ['endpoint']) # Новая метрика для ошибок
 
+# --- Шина сообщений (RabbitMQ) ---
+BUS_PUBLISH_LATENCY = Histogram('bus_publish_latency_seconds', 'Время публикации сообщения в RabbitMQ', ['exchange'])
+BUS_MESSAGES_PUBLISHED_TOTAL = Counter('bus_messages_published_total', 'Количество опубликованных сообщений', ['exchange', 'status'])
+BUS_CONSUME_LATENCY = Histogram('bus_consume_latency_seconds', 'Время обработки полученного сообщения', ['queue', 'status'])
+BUS_QUEUE_LAG = Histogram(
+    'bus_queue_lag_seconds', 'Время от публикации сообщения до начала его обработки', ['queue'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+BUS_RPC_LATENCY = Histogram('bus_rpc_latency_seconds', 'Полное время RPC-вызова через RabbitMQ', ['queue', 'status'])
+
+# --- Оркестраторы команд ---
+COMMAND_LATENCY = Histogram('command_latency_seconds', 'Время обработки команды оркестратором', ['orchestrator', 'command', 'status'])
+COMMAND_ERRORS_TOTAL = Counter('command_errors_total', 'Количество команд, завершившихся ошибкой', ['orchestrator', 'command', 'code'])
+
+# --- Хранилища (Redis / MongoDB / PostgreSQL) ---
+STORAGE_CALL_LATENCY = Histogram(
+    'storage_call_latency_seconds', 'Время одного обращения к хранилищу', ['backend', 'operation'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+STORAGE_CALL_ERRORS_TOTAL = Counter('storage_call_errors_total', 'Количество ошибок обращений к хранилищу', ['backend', 'operation'])
+
+# --- Кэши ---
+CACHE_LOOKUPS_TOTAL = Counter('cache_lookups_total', 'Обращения к кэшу по результату (hit/miss)', ['cache', 'result'])
+
+# --- WebSocket (шлюз) ---
+WS_ACTIVE_CONNECTIONS = Gauge('ws_active_connections', 'Активные WebSocket-соединения', ['client_type'])
+WS_CONNECTION_EVENTS_TOTAL = Counter('ws_connection_events_total', 'Подключения и отключения WebSocket-клиентов', ['client_type', 'event'])
+WS_FRAMES_SENT_TOTAL = Counter('ws_frames_sent_total', 'Отправленные WebSocket-кадры по результату', ['status'])
+WS_BYTES_SENT_TOTAL = Counter('ws_bytes_sent_total', 'Объём отправленных WebSocket-сообщений (символы)')
+
+# --- Периодические задачи воркера (планировщик с выбором лидера) ---
+PERIODIC_TICK_LAG = Histogram(
+    'periodic_tick_lag_seconds', 'Задержка старта тика относительно границы расписания', ['job'],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+PERIODIC_TICK_DURATION = Histogram('periodic_tick_duration_seconds', 'Длительность тика периодической задачи', ['job'])
+PERIODIC_TICKS_TOTAL = Counter('periodic_ticks_total', 'Тики периодической задачи по результату', ['job', 'result'])
+PERIODIC_LEADER = Gauge('periodic_scheduler_leader', 'Является ли процесс лидером периодической задачи (1/0)', ['job'])
+
+# Заголовок AMQP с временем публикации (unix time, float) для расчёта задержки в очереди.
+PUBLISHED_AT_HEADER = "x-published-at"
+
+# Команды вне известного набора пишутся под одной меткой, чтобы не раздувать кардинальность.
+UNKNOWN_LABEL = "unknown"
+
+_SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "CREATE", "DROP", "ALTER", "TRUNCATE", "BEGIN", "COMMIT", "ROLLBACK"}
+
 
 def measure_time(endpoint_name):
     """
@@ -58,6 +108,175 @@ def measure_time(endpoint_name):
 
     return decorator
 
+def observe_command(orchestrator: str, command: str, started_at: float, status: str, error_code: Optional[str] = None) -> None:
+    """
+    Фиксирует время обработки команды оркестратором (started_at — значение time.perf_counter()).
+    status: "success" | "failure" | "error"; error_code увеличивает счётчик ошибок.
+    """
+    COMMAND_LATENCY.labels(orchestrator=orchestrator, command=command, status=status).observe(time.perf_counter() - started_at)
+    if error_code:
+        COMMAND_ERRORS_TOTAL.labels(orchestrator=orchestrator, command=command, code=error_code).inc()
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS_TOTAL.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def instrument_redis_client(client: Any, backend: str = "redis") -> Any:
+    """
+    Оборачивает execute_command и pipeline().execute экземпляра redis.asyncio.Redis,
+    чтобы каждая команда попадала в STORAGE_CALL_LATENCY с именем команды в качестве operation.
+    """
+    original_execute_command = client.execute_command
+    original_pipeline = client.pipeline
+
+    async def execute_command(*args, **options):
+        operation = args[0] if args else UNKNOWN_LABEL
+        if isinstance(operation, bytes):
+            operation = operation.decode(errors="ignore")
+        operation = str(operation).split(" ", 1)[0].upper()
+        span = start_child_span(f"{backend} {operation}")
+        started_at = time.perf_counter()
+        error = None
+        try:
+            return await original_execute_command(*args, **options)
+        except Exception as e:
+            error = e
+            STORAGE_CALL_ERRORS_TOTAL.labels(backend=backend, operation=operation).inc()
+            raise
+        finally:
+            STORAGE_CALL_LATENCY.labels(backend=backend, operation=operation).observe(time.perf_counter() - started_at)
+            if span is not None:
+                span.finish(error)
+
+    def pipeline(*args, **kwargs):
+        pipe = original_pipeline(*args, **kwargs)
+        original_pipe_execute = pipe.execute
+
+        async def execute(*exec_args, **exec_kwargs):
+            span = start_child_span(f"{backend} PIPELINE", commands=len(pipe))
+            started_at = time.perf_counter()
+            error = None
+            try:
+                return await original_pipe_execute(*exec_args, **exec_kwargs)
+            except Exception as e:
+                error = e
+                STORAGE_CALL_ERRORS_TOTAL.labels(backend=backend, operation="PIPELINE").inc()
+                raise
+            finally:
+                STORAGE_CALL_LATENCY.labels(backend=backend, operation="PIPELINE").observe(time.perf_counter() - started_at)
+                if span is not None:
+                    span.finish(error)
+
+        pipe.execute = execute
+        return pipe
+
+    client.execute_command = execute_command
+    client.pipeline = pipeline
+    return client
+
+
+def create_mongo_command_listener() -> Any:
+    """
+    Возвращает pymongo CommandListener, который пишет длительность каждой команды MongoDB.
+    Передаётся в AsyncIOMotorClient(event_listeners=[...]).
+    Спан команды создаётся, только если событие пришло в контексте записываемой трассы.
+    """
+    from pymongo import monitoring
+
+    class MongoCommandMetricsListener(monitoring.CommandListener):
+        def __init__(self):
+            self._spans: Dict[Tuple[int, Any], Any] = {}
+
+        def started(self, event):
+            span = start_child_span(f"mongo {event.command_name}", database=event.database_name)
+            if span is not None:
+                self._spans[(event.request_id, event.connection_id)] = span
+
+        def succeeded(self, event):
+            STORAGE_CALL_LATENCY.labels(backend="mongo", operation=event.command_name).observe(event.duration_micros / 1_000_000)
+            span = self._spans.pop((event.request_id, event.connection_id), None)
+            if span is not None:
+                span.finish()
+
+        def failed(self, event):
+            STORAGE_CALL_LATENCY.labels(backend="mongo", operation=event.command_name).observe(event.duration_micros / 1_000_000)
+            STORAGE_CALL_ERRORS_TOTAL.labels(backend="mongo", operation=event.command_name).inc()
+            span = self._spans.pop((event.request_id, event.connection_id), None)
+            if span is not None:
+                span.record_error(RuntimeError(str(event.failure)))
+                span.finish()
+
+    return MongoCommandMetricsListener()
+
+
+def instrument_sqlalchemy_engine(engine: Any) -> None:
+    """
+    Подписывается на события курсора AsyncEngine и пишет длительность каждого SQL-запроса.
+    operation — первое ключевое слово запроса (SELECT/INSERT/...).
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    def _operation(statement: Optional[str]) -> str:
+        keyword = statement.lstrip().split(None, 1)[0].upper() if statement and statement.strip() else UNKNOWN_LABEL
+        return keyword if keyword in _SQL_OPERATIONS else "OTHER"
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started_at", []).append(time.perf_counter())
+        conn.info.setdefault("trace_spans", []).append(start_child_span(f"postgres {_operation(statement)}"))
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("metrics_started_at")
+        if started:
+            STORAGE_CALL_LATENCY.labels(backend="postgres", operation=_operation(statement)).observe(time.perf_counter() - started.pop())
+        spans = conn.info.get("trace_spans")
+        span = spans.pop() if spans else None
+        if span is not None:
+            span.finish()
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        info = exception_context.connection.info if exception_context.connection is not None else {}
+        started = info.get("metrics_started_at")
+        if started:
+            started.pop()
+        spans = info.get("trace_spans")
+        span = spans.pop() if spans else None
+        if span is not None:
+            span.finish(exception_context.original_exception)
+        STORAGE_CALL_ERRORS_TOTAL.labels(backend="postgres", operation=_operation(exception_context.statement)).inc()
+
+
+def mount_metrics_endpoint(app: Any, path: str = "/metrics") -> None:
+    """Публикует метрики процесса в формате Prometheus на указанном пути FastAPI-приложения."""
+    app.mount(path, make_asgi_app())
+
+
+_metrics_server_port: Optional[int] = None
+
+
+def start_metrics_server(port: int) -> None:
+    """
+    Публикует метрики процесса без FastAPI (ARQ-воркер, Discord-бот): отдельный HTTP-сервер
+    prometheus_client в фоновом потоке. Повторный вызов в том же процессе ничего не делает.
+    """
+    global _metrics_server_port
+    if _metrics_server_port is not None:
+        return
+    try:
+        start_http_server(port)
+    except OSError as e:
+        # Занятый порт не должен останавливать сервис — теряются только метрики.
+        logger.error(f"❌ Не удалось запустить Prometheus exporter на порту {port}: {e}")
+        return
+    _metrics_server_port = port
+    logger.info(f"📈 Prometheus exporter запущен на порту {port}.")
+
+
 # Пример использования (для иллюстрации)
 # from prometheus_client import start_http_server
 # import random
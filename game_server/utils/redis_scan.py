@@ -0,0 +1,175 @@
+# game_server/utils/redis_scan.py
+
+"""
+Курсорный обход пространства ключей Redis (SCAN/HSCAN/SSCAN) вместо блокирующего KEYS.
+
+Функции работают с любым клиентом redis.asyncio (с decode_responses и без) и возвращают
+значения в том виде, в каком их отдаёт клиент. Используются CentralRedisClient (бэкенд)
+и DiscordRedisClient (бот).
+
+Как и любой SCAN, обход не даёт снимка: ключ, изменённый во время обхода, может быть
+выдан повторно или пропущен, поэтому операции над результатом должны быть идемпотентны.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+import redis.asyncio as redis_asyncio
+
+
+# Подсказка COUNT для одного шага курсора. Это не лимит ответа, а объём работы сервера за вызов.
+DEFAULT_SCAN_COUNT = 500
+# Ключей в одной команде UNLINK / одном pipeline EXPIRE.
+DEFAULT_KEY_BATCH_SIZE = 500
+
+KeyPattern = Union[str, bytes]
+
+
+async def scan_key_batches(
+    redis: redis_asyncio.Redis,
+    match: KeyPattern = "*",
+    count: int = DEFAULT_SCAN_COUNT,
+    type_: Optional[str] = None,
+) -> AsyncIterator[List[Any]]:
+    """
+    Отдаёт ключи, подходящие под match, пачками по одному шагу SCAN.
+    type_ — фильтр по типу значения ("string", "hash", "set", "list", "zset", "stream").
+    """
+    cursor = 0
+    while True:
+        cursor, keys = await redis.scan(cursor=cursor, match=match, count=count, _type=type_)
+        if keys:
+            yield list(keys)
+        if not cursor:
+            break
+
+
+async def scan_keys(
+    redis: redis_asyncio.Redis,
+    match: KeyPattern = "*",
+    count: int = DEFAULT_SCAN_COUNT,
+    type_: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """Поэлементный вариант scan_key_batches."""
+    async for batch in scan_key_batches(redis, match=match, count=count, type_=type_):
+        for key in batch:
+            yield key
+
+
+async def hscan_batches(
+    redis: redis_asyncio.Redis,
+    name: Any,
+    match: Optional[KeyPattern] = None,
+    count: int = DEFAULT_SCAN_COUNT,
+) -> AsyncIterator[Dict[Any, Any]]:
+    """Курсорный обход полей хэша (HSCAN): отдаёт словари поле -> значение."""
+    cursor = 0
+    while True:
+        cursor, items = await redis.hscan(name, cursor=cursor, match=match, count=count)
+        if items:
+            yield items
+        if not cursor:
+            break
+
+
+async def sscan_batches(
+    redis: redis_asyncio.Redis,
+    name: Any,
+    match: Optional[KeyPattern] = None,
+    count: int = DEFAULT_SCAN_COUNT,
+) -> AsyncIterator[List[Any]]:
+    """Курсорный обход множества (SSCAN): отдаёт списки элементов."""
+    cursor = 0
+    while True:
+        cursor, members = await redis.sscan(name, cursor=cursor, match=match, count=count)
+        if members:
+            yield list(members)
+        if not cursor:
+            break
+
+
+async def _rebatch(
+    keys: Union[Iterable[Any], AsyncIterable[Any]],
+    batch_size: int,
+) -> AsyncIterator[List[Any]]:
+    """Принимает ключи (или пачки ключей из scan_key_batches) и выравнивает их в пачки batch_size."""
+    batch: List[Any] = []
+
+    def _extend(item: Any) -> None:
+        if isinstance(item, (list, tuple, set)):
+            batch.extend(item)
+        else:
+            batch.append(item)
+
+    if isinstance(keys, AsyncIterable):
+        async for item in keys:
+            _extend(item)
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                del batch[:batch_size]
+    else:
+        for item in keys:
+            _extend(item)
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                del batch[:batch_size]
+    if batch:
+        yield batch
+
+
+async def delete_keys(
+    redis: redis_asyncio.Redis,
+    keys: Union[Iterable[Any], AsyncIterable[Any]],
+    batch_size: int = DEFAULT_KEY_BATCH_SIZE,
+    unlink: bool = True,
+) -> int:
+    """
+    Удаляет ключи пачками по batch_size, по одной команде на пачку.
+    По умолчанию UNLINK: память освобождается в фоне и не блокирует сервер на больших значениях.
+    Возвращает число удалённых ключей.
+    """
+    removed = 0
+    async for batch in _rebatch(keys, batch_size):
+        removed += await (redis.unlink(*batch) if unlink else redis.delete(*batch))
+    return removed
+
+
+async def expire_keys(
+    redis: redis_asyncio.Redis,
+    keys: Union[Iterable[Any], AsyncIterable[Any]],
+    ttl_seconds: int,
+    batch_size: int = DEFAULT_KEY_BATCH_SIZE,
+) -> int:
+    """Выставляет TTL ключам: один pipeline (без транзакции) на пачку. Возвращает число обновлённых ключей."""
+    updated = 0
+    async for batch in _rebatch(keys, batch_size):
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in batch:
+                pipe.expire(key, ttl_seconds)
+            results = await pipe.execute()
+        updated += sum(1 for result in results if result)
+    return updated
+
+
+async def delete_matching(
+    redis: redis_asyncio.Redis,
+    match: KeyPattern,
+    count: int = DEFAULT_SCAN_COUNT,
+    type_: Optional[str] = None,
+    batch_size: int = DEFAULT_KEY_BATCH_SIZE,
+) -> int:
+    """Удаляет все ключи под шаблон: SCAN + UNLINK пачками."""
+    return await delete_keys(redis, scan_key_batches(redis, match=match, count=count, type_=type_), batch_size=batch_size)
+
+
+async def expire_matching(
+    redis: redis_asyncio.Redis,
+    match: KeyPattern,
+    ttl_seconds: int,
+    count: int = DEFAULT_SCAN_COUNT,
+    type_: Optional[str] = None,
+    batch_size: int = DEFAULT_KEY_BATCH_SIZE,
+) -> int:
+    """Выставляет TTL всем ключам под шаблон: SCAN + EXPIRE пачками."""
+    return await expire_keys(
+        redis, scan_key_batches(redis, match=match, count=count, type_=type_), ttl_seconds, batch_size=batch_size
+    )
@@ -0,0 +1,416 @@
+# game_server/utils/tracing.py
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+import uuid
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from game_server.config.logging.logging_setup import app_logger as logger
+from game_server.config.settings_core import (
+    TRACE_COLLECTOR_URL,
+    TRACE_EXPORT_PATH,
+    TRACE_EXPORTER,
+    TRACE_SAMPLE_RATE,
+    TRACE_SERVICE_NAME,
+    TRACING_ENABLED,
+)
+
+
+# Заголовки AMQP, в которых трасса передаётся между сервисами.
+# Заголовки ставятся только у записываемых трасс: их наличие и есть решение о сэмплировании.
+TRACE_ID_HEADER = "x-trace-id"
+PARENT_SPAN_ID_HEADER = "x-parent-span-id"
+
+# Служебный kwarg задачи ARQ с контекстом трассы постановщика (снимается обёрткой trace_arq_job).
+TRACE_CONTEXT_KWARG = "_trace_context"
+
+
+class Span:
+    """
+    Один записываемый участок трассы. Создаётся только для сэмплированных трасс.
+    """
+    __slots__ = ("trace_id", "span_id", "parent_span_id", "name", "attributes", "status", "error",
+                 "_start_time", "_started_at", "_finished")
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._start_time = time.time()
+        self._started_at = time.perf_counter()
+        self._finished = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        if error is not None:
+            self.record_error(error)
+        tracer.export(self, time.perf_counter() - self._started_at)
+
+    def to_record(self, duration: float) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "service": tracer.service_name,
+            "start_time": self._start_time,
+            "duration_ms": round(duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Заглушка для несэмплированных участков и выключенной трассировки."""
+    __slots__ = ()
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_trace_span", default=None)
+
+
+class _SpanScope:
+    """Контекстный менеджер: делает спан текущим на время блока и закрывает его на выходе."""
+    __slots__ = ("_span", "_token")
+
+    def __init__(self, span: Span):
+        self._span = span
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current_span.reset(self._token)
+        self._span.finish(exc)
+        return False
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class BackgroundSpanExporter:
+    """
+    Отдаёт завершённые спаны фоновому потоку через ограниченную очередь,
+    чтобы запись на диск/в сеть не блокировала event loop. При переполнении спаны отбрасываются.
+    """
+    def __init__(self, max_queue_size: int = 10000, batch_size: int = 200, flush_interval_seconds: float = 1.0):
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def export(self, record: Dict[str, Any]) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name=f"{self.__class__.__name__}", daemon=True)
+            self._thread.start()
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Dict[str, Any]] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self._flush_interval_seconds)
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+                    while len(batch) < self._batch_size:
+                        item = self._queue.get_nowait()
+                        if item is None:
+                            stop = True
+                            break
+                        batch.append(item)
+            except queue.Empty:
+                pass
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    logger.warning(f"⚠️ Не удалось выгрузить {len(batch)} спанов: {e}")
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+
+class JsonLinesSpanExporter(BackgroundSpanExporter):
+    """Дописывает спаны в локальный файл, по одному JSON-объекту на строку."""
+    def __init__(self, path: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.path = path
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in batch))
+
+
+class HttpSpanExporter(BackgroundSpanExporter):
+    """Отправляет пачки спанов POST-запросом (JSON-массив) во внешний коллектор."""
+    def __init__(self, url: str, timeout_seconds: float = 2.0, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.url = url
+        self.timeout_seconds = timeout_seconds
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        body = json.dumps(batch, ensure_ascii=False, default=str).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            response.read()
+
+
+class Tracer:
+    """
+    Минимальный трассировщик: спаны с общим trace_id, вложенность через contextvars,
+    сэмплирование в корне трассы. При enabled=False все вызовы сводятся к одной проверке флага.
+    """
+    def __init__(self, enabled: bool, sample_rate: float, service_name: str, exporter: Optional[BackgroundSpanExporter]):
+        self.enabled = enabled and exporter is not None
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.service_name = service_name
+        self.exporter = exporter
+
+    def is_sampled(self, trace_id: str) -> bool:
+        """
+        Детерминированное решение по trace_id: все сервисы, начинающие трассу с одним и тем же
+        trace_id (например, из DTO команды), приходят к одному ответу.
+        """
+        if self.sample_rate >= 1.0:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        return zlib.crc32(trace_id.encode()) / 0x100000000 < self.sample_rate
+
+    def start_span(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        root: bool = False,
+        **attributes: Any,
+    ) -> Optional[Span]:
+        """
+        Открывает спан (без установки текущим). Возвращает None, если записывать нечего.
+        - trace_id + parent_span_id: продолжение уже сэмплированной трассы из другого сервиса;
+        - trace_id без родителя при активном спане: дочерний спан активного (trace_id из DTO
+          внутри уже записываемой трассы не должен порождать второй корень); если id трасс
+          различаются, id из DTO сохраняется в атрибуте linked_trace_id;
+        - trace_id без родителя и без активного спана: корень трассы с известным id, решение по is_sampled;
+        - root=True без trace_id: новая трасса, решение по sample_rate;
+        - иначе: дочерний спан текущей трассы, только если она записывается.
+        """
+        if not self.enabled:
+            return None
+        parent = _current_span.get()
+        if trace_id:
+            if parent_span_id is not None:
+                return Span(name, str(trace_id), parent_span_id, attributes)
+            if parent is not None:
+                if parent.trace_id != str(trace_id):
+                    attributes["linked_trace_id"] = str(trace_id)
+                return Span(name, parent.trace_id, parent.span_id, attributes)
+            if not self.is_sampled(str(trace_id)):
+                return None
+            return Span(name, str(trace_id), None, attributes)
+        if parent is not None:
+            return Span(name, parent.trace_id, parent.span_id, attributes)
+        if root and random.random() < self.sample_rate:
+            return Span(name, uuid.uuid4().hex, None, attributes)
+        return None
+
+    def export(self, span: Span, duration: float) -> None:
+        if self.exporter is not None:
+            self.exporter.export(span.to_record(duration))
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def _create_exporter() -> Optional[BackgroundSpanExporter]:
+    if not TRACING_ENABLED:
+        return None
+    if TRACE_EXPORTER == "http":
+        if not TRACE_COLLECTOR_URL:
+            logger.warning("⚠️ TRACE_EXPORTER=http, но TRACE_COLLECTOR_URL не задан. Трассировка отключена.")
+            return None
+        return HttpSpanExporter(TRACE_COLLECTOR_URL)
+    return JsonLinesSpanExporter(TRACE_EXPORT_PATH)
+
+
+tracer = Tracer(TRACING_ENABLED, TRACE_SAMPLE_RATE, TRACE_SERVICE_NAME, _create_exporter())
+if tracer.enabled:
+    atexit.register(tracer.shutdown)
+    logger.info(f"🔭 Трассировка включена: сэмплирование {tracer.sample_rate:.2%}, экспорт '{TRACE_EXPORTER}'.")
+
+
+# --- Публичный API ---
+
+def trace_span(name: str, trace_id: Optional[str] = None, parent_span_id: Optional[str] = None, root: bool = False, **attributes: Any):
+    """
+    Контекстный менеджер участка трассы: `with trace_span("db.query", table="x") as span: ...`.
+    Для несэмплированных трасс и выключенной трассировки возвращает общий no-op.
+    """
+    if not tracer.enabled:
+        return _NOOP_SCOPE
+    span = tracer.start_span(name, trace_id, parent_span_id, root, **attributes)
+    return _SpanScope(span) if span is not None else _NOOP_SCOPE
+
+
+def start_child_span(name: str, **attributes: Any) -> Optional[Span]:
+    """
+    Дочерний спан текущей трассы для хуков без блока with (события драйверов БД).
+    Вызывающий обязан вызвать span.finish(); None — если текущая трасса не записывается.
+    """
+    if not tracer.enabled:
+        return None
+    return tracer.start_span(name, **attributes)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get() if tracer.enabled else None
+
+
+def inject_trace_headers(headers: Dict[str, Any]) -> Dict[str, Any]:
+    """Дописывает в заголовки AMQP контекст текущего спана (если трасса записывается)."""
+    span = current_span()
+    if span is not None:
+        headers[TRACE_ID_HEADER] = span.trace_id
+        headers[PARENT_SPAN_ID_HEADER] = span.span_id
+    return headers
+
+
+def extract_trace_headers(headers: Optional[Dict[str, Any]]) -> tuple:
+    """Возвращает (trace_id, parent_span_id) из заголовков AMQP или (None, None)."""
+    if not headers:
+        return None, None
+    trace_id = headers.get(TRACE_ID_HEADER)
+    parent_span_id = headers.get(PARENT_SPAN_ID_HEADER)
+    if isinstance(trace_id, bytes):
+        trace_id = trace_id.decode()
+    if isinstance(parent_span_id, bytes):
+        parent_span_id = parent_span_id.decode()
+    return trace_id, parent_span_id
+
+
+def trace_context_kwargs() -> Dict[str, Any]:
+    """kwargs для enqueue_job, продолжающие текущую трассу в задаче ARQ."""
+    span = current_span()
+    if span is None:
+        return {}
+    return {TRACE_CONTEXT_KWARG: {"trace_id": span.trace_id, "span_id": span.span_id}}
+
+
+def trace_arq_job(coroutine: Callable, name: str) -> Callable:
+    """
+    Оборачивает функцию задачи ARQ: выполнение задачи записывается спаном "arq.job",
+    продолжающим трассу постановщика (через TRACE_CONTEXT_KWARG) или начинающим новую.
+    """
+    short_name = name.rsplit(".", 1)[-1]
+
+    @functools.wraps(coroutine)
+    async def traced_job(ctx: Dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        trace_context = kwargs.pop(TRACE_CONTEXT_KWARG, None) or {}
+        with trace_span(
+            f"arq.job {short_name}",
+            trace_id=trace_context.get("trace_id"),
+            parent_span_id=trace_context.get("span_id"),
+            root=True,
+            job_id=ctx.get("job_id"),
+            job_try=ctx.get("job_try"),
+        ):
+            return await coroutine(ctx, *args, **kwargs)
+
+    return traced_job
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Декоратор async-метода: вызов записывается дочерним спаном текущей трассы
+    (по умолчанию с именем "<Класс>.<метод>"). Вне записываемой трассы — прямой вызов.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled or _current_span.get() is None:
+                return await func(*args, **kwargs)
+            with trace_span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,94 @@
+# tests/app_discord_bot/fake_discord_http.py
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from discord import HTTPException
+
+from game_server.app_discord_bot.app.services.core_services.admin.discord_operation_scheduler import DiscordOperation
+
+
+@dataclass
+class FakeResponse:
+    """Минимум aiohttp.ClientResponse, который читает discord.HTTPException."""
+    status: int
+    reason: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class FakeCall:
+    """Один запрос к фейковому маршруту."""
+    key: str
+    bucket: str
+    started_at: float
+    finished_at: float
+    status: int
+
+
+class FakeDiscordHTTP:
+    """
+    Фейковый слой маршрутов Discord HTTP API для DiscordOperationScheduler.
+
+    Каждая операция — запрос к маршруту с rate-limit bucket'ом. Запрос длится latency секунд
+    и отвечает 200 либо следующим заранее заданным ответом (script): 429 с заголовками
+    Retry-After / X-RateLimit-Global, 403, 5xx. Слой записывает все запросы и максимальную
+    одновременность по bucket'ам и в целом.
+    """
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self.calls: List[FakeCall] = []
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self.max_in_flight: Dict[str, int] = defaultdict(int)
+        self.total_in_flight = 0
+        self.max_total_in_flight = 0
+        self.received_dependencies: Dict[str, Dict[str, Any]] = {}
+        self._scripts: Dict[str, Deque[Tuple[int, Dict[str, str]]]] = defaultdict(deque)
+
+    def script(self, key: str, status: int, headers: Optional[Dict[str, str]] = None, times: int = 1) -> None:
+        """Следующие times запросов операции key получат ответ status (до ответов 200)."""
+        for _ in range(times):
+            self._scripts[key].append((status, headers or {}))
+
+    def rate_limit(self, key: str, retry_after: float, is_global: bool = False, times: int = 1) -> None:
+        headers = {"Retry-After": str(retry_after)}
+        if is_global:
+            headers["X-RateLimit-Global"] = "true"
+        self.script(key, 429, headers, times)
+
+    def operation(self, key: str, bucket: str, depends_on: Tuple[str, ...] = (), latency: Optional[float] = None) -> DiscordOperation:
+        async def run(dep_results: Dict[str, Any]) -> Any:
+            return await self.request(key, bucket, dep_results, self.latency if latency is None else latency)
+        return DiscordOperation(key=key, run=run, bucket=bucket, depends_on=depends_on, description=key)
+
+    async def request(self, key: str, bucket: str, dep_results: Dict[str, Any], latency: float) -> Any:
+        self.received_dependencies[key] = dict(dep_results)
+        started_at = time.monotonic()
+        self.in_flight[bucket] += 1
+        self.total_in_flight += 1
+        self.max_in_flight[bucket] = max(self.max_in_flight[bucket], self.in_flight[bucket])
+        self.max_total_in_flight = max(self.max_total_in_flight, self.total_in_flight)
+        status, headers = self._scripts[key].popleft() if self._scripts[key] else (200, {})
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            self.in_flight[bucket] -= 1
+            self.total_in_flight -= 1
+            self.calls.append(FakeCall(key, bucket, started_at, time.monotonic(), status))
+        if status != 200:
+            raise HTTPException(FakeResponse(status=status, headers=headers), f"fake {status} for {key}")
+        return f"result:{key}"
+
+    # --- Выборки по журналу запросов ---
+
+    def calls_of(self, key: str) -> List[FakeCall]:
+        return [call for call in self.calls if call.key == key]
+
+    def first_start(self, key: str) -> float:
+        return min(call.started_at for call in self.calls_of(key))
+
+    def last_finish(self, key: str) -> float:
+        return max(call.finished_at for call in self.calls_of(key))
@@ -0,0 +1,235 @@
+# tests/app_discord_bot/test_discord_operation_scheduler.py
+
+import asyncio
+import logging
+import time
+
+import pytest
+from discord import HTTPException
+
+from game_server.app_discord_bot.app.services.core_services.admin.discord_operation_scheduler import (
+    DiscordOperation, DiscordOperationScheduler,
+)
+from tests.app_discord_bot.fake_discord_http import FakeDiscordHTTP
+
+
+GUILD_CHANNELS = "guild:1:channels"
+
+# Допуск на точность таймеров event loop.
+TIMER_SLACK = 0.01
+
+
+def make_scheduler(max_concurrency: int = 8, bucket_concurrency: int = 2, max_retries: int = 5) -> DiscordOperationScheduler:
+    return DiscordOperationScheduler(
+        logging.getLogger("test_discord_operation_scheduler"),
+        max_concurrency=max_concurrency,
+        bucket_concurrency=bucket_concurrency,
+        max_retries=max_retries,
+    )
+
+
+def run_plan(scheduler, operations, progress=None):
+    return asyncio.run(scheduler.run(operations, progress))
+
+
+# --- Порядок зависимостей ---
+
+def test_dependents_start_after_dependencies_and_receive_their_results():
+    http = FakeDiscordHTTP()
+    operations = [
+        http.operation("category", GUILD_CHANNELS),
+        http.operation("channel_a", GUILD_CHANNELS, depends_on=("category",)),
+        http.operation("channel_b", GUILD_CHANNELS, depends_on=("category",)),
+        http.operation("message_a", "channel:a", depends_on=("channel_a",)),
+        http.operation("summary", "channel:summary", depends_on=("channel_a", "channel_b")),
+    ]
+
+    report = run_plan(make_scheduler(), operations)
+
+    assert report.ok
+    assert set(report.results) == {op.key for op in operations}
+    for op in operations:
+        for dep in op.depends_on:
+            assert http.first_start(op.key) >= http.last_finish(dep)
+        assert http.received_dependencies[op.key] == {dep: f"result:{dep}" for dep in op.depends_on}
+
+
+def test_independent_operations_run_in_parallel():
+    http = FakeDiscordHTTP(latency=0.05)
+    operations = [http.operation(f"channel_{i}", f"channel:{i}") for i in range(6)]
+
+    started_at = time.monotonic()
+    report = run_plan(make_scheduler(max_concurrency=8), operations)
+
+    assert report.ok
+    assert http.max_total_in_flight == 6
+    assert time.monotonic() - started_at < 0.05 * 6
+
+
+def test_invalid_plans_are_rejected():
+    http = FakeDiscordHTTP()
+    scheduler = make_scheduler()
+
+    with pytest.raises(ValueError):
+        run_plan(scheduler, [http.operation("a", "b1"), http.operation("a", "b2")])
+    with pytest.raises(ValueError):
+        run_plan(scheduler, [http.operation("a", "b1", depends_on=("missing",))])
+    with pytest.raises(ValueError):
+        run_plan(scheduler, [http.operation("a", "b1", depends_on=("b",)), http.operation("b", "b1", depends_on=("a",))])
+    assert http.calls == []
+
+
+# --- 429 и Retry-After ---
+
+def test_rate_limited_operation_is_retried_after_retry_after():
+    http = FakeDiscordHTTP()
+    http.rate_limit("channel", retry_after=0.1)
+
+    report = run_plan(make_scheduler(), [http.operation("channel", GUILD_CHANNELS)])
+
+    assert report.ok
+    first, second = http.calls_of("channel")
+    assert (first.status, second.status) == (429, 200)
+    assert second.started_at - first.finished_at >= 0.1 - TIMER_SLACK
+
+
+def test_rate_limit_blocks_only_its_bucket():
+    http = FakeDiscordHTTP()
+    http.rate_limit("limited", retry_after=0.2)
+    operations = [
+        http.operation("limited", GUILD_CHANNELS),
+        # Стартует после 429 и должна дождаться разблокировки того же bucket'а.
+        http.operation("same_bucket", GUILD_CHANNELS, depends_on=("other_bucket",)),
+        http.operation("other_bucket", "channel:2"),
+    ]
+
+    report = run_plan(make_scheduler(), operations)
+
+    assert report.ok
+    blocked_until = http.calls_of("limited")[0].finished_at + 0.2
+    assert http.first_start("same_bucket") >= blocked_until - TIMER_SLACK
+    assert http.first_start("other_bucket") < blocked_until
+
+
+def test_global_rate_limit_blocks_every_bucket():
+    http = FakeDiscordHTTP()
+    http.rate_limit("limited", retry_after=0.2, is_global=True)
+    operations = [
+        http.operation("limited", GUILD_CHANNELS),
+        http.operation("other_bucket", "channel:2", depends_on=("trigger",)),
+        http.operation("trigger", "channel:3", latency=0.05),
+    ]
+
+    report = run_plan(make_scheduler(), operations)
+
+    assert report.ok
+    blocked_until = http.calls_of("limited")[0].finished_at + 0.2
+    assert http.first_start("other_bucket") >= blocked_until - TIMER_SLACK
+
+
+def test_rate_limited_operation_fails_after_max_retries():
+    http = FakeDiscordHTTP()
+    http.rate_limit("channel", retry_after=0.01, times=3)
+
+    report = run_plan(make_scheduler(max_retries=2), [http.operation("channel", GUILD_CHANNELS)])
+
+    assert isinstance(report.errors["channel"], HTTPException)
+    assert report.errors["channel"].status == 429
+    assert len(http.calls_of("channel")) == 3
+
+
+def test_server_errors_are_retried_and_client_errors_are_not():
+    http = FakeDiscordHTTP()
+    http.script("flaky", 502)
+    http.script("forbidden", 403)
+
+    report = run_plan(make_scheduler(), [http.operation("flaky", "channel:1"), http.operation("forbidden", "channel:2")])
+
+    assert "flaky" in report.results
+    assert [call.status for call in http.calls_of("flaky")] == [502, 200]
+    assert report.errors["forbidden"].status == 403
+    assert len(http.calls_of("forbidden")) == 1
+
+
+# --- Ограничения одновременности ---
+
+def test_bucket_concurrency_limits_requests_per_bucket():
+    http = FakeDiscordHTTP(latency=0.02)
+    operations = [http.operation(f"channel_{i}", GUILD_CHANNELS) for i in range(10)]
+    operations += [http.operation(f"message_{i}", "channel:1") for i in range(10)]
+
+    report = run_plan(make_scheduler(max_concurrency=8, bucket_concurrency=2), operations)
+
+    assert report.ok
+    assert http.max_in_flight[GUILD_CHANNELS] == 2
+    assert http.max_in_flight["channel:1"] == 2
+    assert http.max_total_in_flight == 4
+
+
+def test_max_concurrency_limits_requests_across_buckets():
+    http = FakeDiscordHTTP(latency=0.02)
+    operations = [http.operation(f"channel_{i}", f"channel:{i}") for i in range(12)]
+
+    report = run_plan(make_scheduler(max_concurrency=3, bucket_concurrency=2), operations)
+
+    assert report.ok
+    assert http.max_total_in_flight == 3
+
+
+# --- Ошибки и пропуск зависимых ---
+
+def test_dependents_of_failed_operation_are_skipped():
+    http = FakeDiscordHTTP()
+    http.script("category", 403)
+    operations = [
+        http.operation("category", GUILD_CHANNELS),
+        http.operation("channel", GUILD_CHANNELS, depends_on=("category",)),
+        http.operation("message", "channel:1", depends_on=("channel",)),
+        http.operation("independent", "channel:2"),
+        http.operation("after_independent", "channel:2", depends_on=("independent",)),
+    ]
+    statuses = {}
+
+    def progress(done, total, op, status):
+        statuses[op.key] = status
+
+    report = run_plan(make_scheduler(), operations, progress)
+
+    assert not report.ok
+    assert set(report.errors) == {"category"}
+    assert sorted(report.skipped) == ["channel", "message"]
+    assert set(report.results) == {"independent", "after_independent"}
+    assert http.calls_of("channel") == [] and http.calls_of("message") == []
+    assert statuses == {
+        "category": "failed", "channel": "skipped", "message": "skipped",
+        "independent": "done", "after_independent": "done",
+    }
+
+
+def test_operation_with_failed_and_successful_dependencies_is_skipped_once():
+    http = FakeDiscordHTTP()
+    http.script("broken", 404)
+    operations = [
+        http.operation("ok", "channel:1", latency=0.05),
+        http.operation("broken", "channel:2"),
+        http.operation("joined", "channel:3", depends_on=("ok", "broken")),
+    ]
+
+    report = run_plan(make_scheduler(), operations)
+
+    assert report.skipped == ["joined"]
+    assert http.calls_of("joined") == []
+    assert "ok" in report.results
+
+
+def test_non_http_errors_fail_the_operation_without_retry():
+    calls = []
+
+    async def broken(dep_results):
+        calls.append(dep_results)
+        raise RuntimeError("boom")
+
+    report = run_plan(make_scheduler(), [DiscordOperation(key="broken", run=broken, bucket="channel:1")])
+
+    assert isinstance(report.errors["broken"], RuntimeError)
+    assert len(calls) == 1
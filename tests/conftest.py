@@ -0,0 +1,20 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# Корень репозитория — чтобы пакет game_server импортировался при любом способе запуска pytest.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Обязательные переменные окружения настроек Discord-бота (discord_settings падает без них при импорте).
+# Обязательные переменные окружения настроек game_server (settings_core падает без них при импорте).
+# Реальные значения не нужны: тесты не обращаются ни к Discord, ни к бэкенду, ни к Redis.
+for _name, _value in {
+    "REDIS_PASSWORD": "test-password",
+    "GAME_SERVER_API": "http://localhost:8000",
+    "GATEWAY_BOT_SECRET": "test-secret",
+    "REDIS_BOT_LOCAL_URL": "redis://localhost:6379/0",
+    "DISCORD_TOKEN": "test-token",
+    "REGISTRATION_CHANNEL_ID": "1",
+}.items():
+    os.environ.setdefault(_name, _value)
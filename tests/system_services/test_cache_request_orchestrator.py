@@ -0,0 +1,129 @@
+# tests/system_services/test_cache_request_orchestrator.py
+
+import asyncio
+import logging
+
+import inject
+import pytest
+
+from game_server.Logic.ApplicationLogic.SystemServices.cache_request_orchestrator import CacheRequestOrchestrator
+from game_server.Logic.ApplicationLogic.SystemServices.handler_cache_requests.get_location_summary_handler import GetLocationSummaryCommandHandler
+from game_server.Logic.InfrastructureLogic.messaging.i_message_bus import IMessageBus
+from game_server.contracts.dtos.game_commands.cache_request_commands import (
+    GetLocationSummaryCommandDTO, GetLocationSummaryPayloadDTO, GetLocationSummaryResultDTO,
+)
+
+
+class FakeSummaryHandler:
+    """Обработчик сводки, который держит вычисление открытым, пока тест его не отпустит."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def process(self, command_dto):
+        self.calls.append(command_dto)
+        computation = len(self.calls)
+        await self.release.wait()
+        return GetLocationSummaryResultDTO(
+            correlation_id=command_dto.correlation_id,
+            client_id=command_dto.client_id,
+            success=True,
+            message="ok",
+            data={"location_id": command_dto.payload.location_id, "computation": computation},
+        )
+
+
+class FakeMessageBus:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, exchange_name, routing_key, message):
+        self.published.append(message)
+
+
+@pytest.fixture
+def orchestrator_factory():
+    def build(handler, bus):
+        inject.clear_and_configure(lambda binder: binder
+            .bind(logging.Logger, logging.getLogger("test_cache_request_orchestrator"))
+            .bind(IMessageBus, bus)
+            .bind(GetLocationSummaryCommandHandler, handler))
+        return CacheRequestOrchestrator()
+
+    yield build
+    inject.clear()
+
+
+def make_command(client_id: str, location_id: str = "loc-1") -> GetLocationSummaryCommandDTO:
+    return GetLocationSummaryCommandDTO(client_id=client_id, payload=GetLocationSummaryPayloadDTO(location_id=location_id))
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_identical_requests_share_one_handler_call(orchestrator_factory):
+    async def scenario():
+        handler, bus = FakeSummaryHandler(), FakeMessageBus()
+        orchestrator = orchestrator_factory(handler, bus)
+        commands = [make_command(f"client-{i}") for i in range(5)]
+
+        tasks = [asyncio.create_task(orchestrator.process_command(command)) for command in commands]
+        await settle()
+        handler.release.set()
+        await asyncio.gather(*tasks)
+        return handler, bus, commands
+
+    handler, bus, commands = asyncio.run(scenario())
+
+    assert len(handler.calls) == 1
+    assert sorted(message["client_id"] for message in bus.published) == sorted(c.client_id for c in commands)
+    by_client = {message["client_id"]: message for message in bus.published}
+    for command in commands:
+        response = by_client[command.client_id]
+        assert response["correlation_id"] == str(command.correlation_id)
+        assert response["payload"]["request_id"] == str(command.correlation_id)
+        assert response["payload"]["data"] == {"location_id": "loc-1", "computation": 1}
+
+
+def test_request_sent_after_computation_started_does_not_join_it(orchestrator_factory):
+    async def scenario():
+        handler, bus = FakeSummaryHandler(), FakeMessageBus()
+        orchestrator = orchestrator_factory(handler, bus)
+
+        early = asyncio.create_task(orchestrator.process_command(make_command("early")))
+        await settle()
+        # timestamp позднего запроса гарантированно позже начала уже идущего вычисления.
+        await asyncio.sleep(0.001)
+        late = asyncio.create_task(orchestrator.process_command(make_command("late")))
+        await settle()
+        handler.release.set()
+        await asyncio.gather(early, late)
+        return handler, bus
+
+    handler, bus = asyncio.run(scenario())
+
+    assert [call.client_id for call in handler.calls] == ["early", "late"]
+    by_client = {message["client_id"]: message for message in bus.published}
+    assert by_client["early"]["payload"]["data"]["computation"] == 1
+    assert by_client["late"]["payload"]["data"]["computation"] == 2
+
+
+def test_memoized_result_is_served_only_to_requests_sent_before_it_was_computed(orchestrator_factory):
+    async def scenario():
+        handler, bus = FakeSummaryHandler(), FakeMessageBus()
+        handler.release.set()
+        orchestrator = orchestrator_factory(handler, bus)
+
+        sent_before = make_command("sent-before")
+        await orchestrator.process_command(make_command("first"))
+        await orchestrator.process_command(sent_before)
+        await asyncio.sleep(0.001)
+        await orchestrator.process_command(make_command("sent-after"))
+        return handler
+
+    handler = asyncio.run(scenario())
+
+    assert [call.client_id for call in handler.calls] == ["first", "sent-after"]